@@ -14,6 +14,7 @@ from capstone_project_team_5.api.routes import (
     consent,
     educations,
     health,
+    jobs,
     portfolio,
     projects,
     resumes,
@@ -30,9 +31,17 @@ if TYPE_CHECKING:
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Initialize resources on startup and clean up on shutdown."""
     from capstone_project_team_5.data.db import init_db
+    from capstone_project_team_5.workflows.analysis_pipeline import (
+        get_shared_analysis_workers,
+        shutdown_shared_analysis_workers,
+    )
 
     init_db()
+    # One set of analysis worker pools serves every request
+    get_shared_analysis_workers()
+    projects.resume_analysis_jobs()
     yield
+    shutdown_shared_analysis_workers()
 
 
 app = FastAPI(
@@ -55,6 +64,7 @@ app.include_router(health.router)
 app.include_router(auth.router, prefix="/api")
 app.include_router(consent.router, prefix="/api")
 app.include_router(projects.router, prefix="/api")
+app.include_router(jobs.router, prefix="/api")
 app.include_router(skills.router, prefix="/api")
 app.include_router(skills.global_router, prefix="/api")
 app.include_router(portfolio.router, prefix="/api")
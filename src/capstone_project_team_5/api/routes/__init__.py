@@ -3,6 +3,7 @@
 from capstone_project_team_5.api.routes import (
     educations,
     health,
+    jobs,
     portfolio,
     projects,
     resumes,
@@ -13,6 +14,7 @@ from capstone_project_team_5.api.routes import (
 
 __all__ = [
     "health",
+    "jobs",
     "projects",
     "skills",
     "portfolio",
@@ -0,0 +1,93 @@
+"""Background analysis job routes for the API.
+
+Analysis jobs are created by ``POST /api/projects/analyze`` and
+``POST /api/projects/{id}/analyze`` with ``background=true``:
+
+- ``GET  /jobs/{job_id}``         — poll job status and per-project progress
+- ``POST /jobs/{job_id}/cancel``  — cancel a queued or running job
+"""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from capstone_project_team_5.api.dependencies import get_current_username
+from capstone_project_team_5.api.schemas.jobs import (
+    AnalysisJobProjectProgress,
+    AnalysisJobResponse,
+)
+from capstone_project_team_5.data.db import get_session
+from capstone_project_team_5.data.models import AnalysisJob, User
+from capstone_project_team_5.data.models.analysis_job import ITEM_QUEUED, ITEM_RUNNING
+from capstone_project_team_5.services.analysis_jobs import cancel_analysis_job, get_analysis_job
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+def job_to_response(job: AnalysisJob) -> AnalysisJobResponse:
+    """Build the API representation of a job and its per-project progress."""
+    projects = [AnalysisJobProjectProgress.model_validate(item) for item in job.projects]
+    return AnalysisJobResponse(
+        id=job.id,
+        status=job.status,
+        use_ai=job.use_ai,
+        force=job.force,
+        cancel_requested=job.cancel_requested,
+        error=job.error,
+        total=len(projects),
+        completed=sum(1 for item in projects if item.status not in (ITEM_QUEUED, ITEM_RUNNING)),
+        projects=projects,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
+def _get_owned_job_or_404(session: Session, job_id: int, username: str) -> AnalysisJob:
+    user = session.query(User).filter(User.username == username).first()
+    job = get_analysis_job(session, job_id, user.id) if user is not None else None
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Analysis job not found.",
+        )
+    return job
+
+
+@router.get(
+    "/{job_id}",
+    response_model=AnalysisJobResponse,
+    summary="Get analysis job",
+    description="Return the status and per-project progress of a background analysis job.",
+    responses={404: {"description": "Job not found"}},
+)
+def get_job(
+    job_id: int,
+    current_username: Annotated[str, Depends(get_current_username)],
+) -> AnalysisJobResponse:
+    with get_session() as session:
+        job = _get_owned_job_or_404(session, job_id, current_username)
+        return job_to_response(job)
+
+
+@router.post(
+    "/{job_id}/cancel",
+    response_model=AnalysisJobResponse,
+    summary="Cancel analysis job",
+    description=(
+        "Cancel a background analysis job. Queued jobs stop immediately; running jobs "
+        "finish the project in progress and skip the rest."
+    ),
+    responses={404: {"description": "Job not found"}},
+)
+def cancel_job(
+    job_id: int,
+    current_username: Annotated[str, Depends(get_current_username)],
+) -> AnalysisJobResponse:
+    with get_session() as session:
+        job = _get_owned_job_or_404(session, job_id, current_username)
+        cancel_analysis_job(session, job)
+        return job_to_response(job)
@@ -9,15 +9,19 @@ import html as _hl
 import json
 import re as _re
 import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
 
-from fastapi import APIRouter, HTTPException, Response, status
+from fastapi import APIRouter, Header, HTTPException, Response, status
 from fastapi.responses import HTMLResponse
+from sqlalchemy import case, func, select, update
 from sqlalchemy.orm import Session
 
 from capstone_project_team_5.api.schemas.portfolio import (
     PortfolioAddItemRequest,
     PortfolioCreateRequest,
     PortfolioEditRequest,
+    PortfolioItemBatchUpdateRequest,
     PortfolioItemResponse,
     PortfolioItemUpdateRequest,
     PortfolioReorderRequest,
@@ -36,7 +40,16 @@ from capstone_project_team_5.data.models import (
     Skill,
     User,
 )
-from capstone_project_team_5.services.project_thumbnail import has_project_thumbnail
+from capstone_project_team_5.services.portfolio_page_cache import (
+    etag_matches,
+    negotiate_coding,
+    page_etag,
+    portfolio_page_cache,
+)
+from capstone_project_team_5.services.project_thumbnail import (
+    get_projects_with_thumbnails,
+    get_thumbnail_storage_root,
+)
 
 router = APIRouter(prefix="/portfolio", tags=["portfolio"])
 
@@ -60,32 +73,85 @@ def _extract_markdown(content: str) -> str:
     return ""
 
 
-def _aggregate_commit_frequency(project_ids: list[int], session: Session) -> dict[str, int]:
-    """Aggregate commit_frequency across project IDs from their latest analyses.
+@dataclass(frozen=True, slots=True)
+class _PortfolioRenderData:
+    """Project data for every item of a portfolio page, loaded in bulk."""
 
-    Returns a ``{YYYY-MM-DD: count}`` mapping with all available dates.
+    projects: dict[int, Project]
+    # project_id -> (summary_text, parsed metrics) of the latest analysis
+    latest_analyses: dict[int, tuple[str | None, dict]]
+    skills: dict[int, list[dict]]
+    thumbnails: set[int]
+
+
+def _load_portfolio_render_data(project_ids: list[int], session: Session) -> _PortfolioRenderData:
+    """Load projects, latest analyses, skills and thumbnails for ``project_ids``.
+
+    Issues a fixed number of queries however many items the portfolio has;
+    the latest analysis per project is picked with a window function.
     """
     if not project_ids:
-        return {}
-
-    analyses = (
-        session.query(CodeAnalysis)
+        return _PortfolioRenderData({}, {}, {}, set())
+
+    ranked = (
+        session.query(
+            CodeAnalysis.project_id.label("project_id"),
+            CodeAnalysis.summary_text.label("summary_text"),
+            CodeAnalysis.metrics_json.label("metrics_json"),
+            func.row_number()
+            .over(
+                partition_by=CodeAnalysis.project_id,
+                order_by=(CodeAnalysis.created_at.desc(), CodeAnalysis.id.desc()),
+            )
+            .label("position"),
+        )
         .filter(CodeAnalysis.project_id.in_(project_ids))
-        .order_by(CodeAnalysis.project_id, CodeAnalysis.id.desc())
+        .subquery()
+    )
+    latest_analyses: dict[int, tuple[str | None, dict]] = {}
+    for project_id, summary_text, metrics_json in (
+        session.query(ranked.c.project_id, ranked.c.summary_text, ranked.c.metrics_json)
+        .filter(ranked.c.position == 1)
         .all()
+    ):
+        try:
+            metrics = json.loads(metrics_json or "{}")
+        except (json.JSONDecodeError, TypeError):
+            metrics = {}
+        latest_analyses[project_id] = (summary_text, metrics if isinstance(metrics, dict) else {})
+
+    projects = {
+        project.id: project
+        for project in session.query(Project).filter(Project.id.in_(project_ids)).all()
+    }
+
+    skills: dict[int, list[dict]] = {}
+    for project_id, name, skill_type in (
+        session.query(ProjectSkill.project_id, Skill.name, Skill.skill_type)
+        .join(Skill, ProjectSkill.skill_id == Skill.id)
+        .filter(ProjectSkill.project_id.in_(project_ids))
+        .order_by(Skill.name)
+        .all()
+    ):
+        skills.setdefault(project_id, []).append({"name": name, "type": str(skill_type)})
+
+    return _PortfolioRenderData(
+        projects=projects,
+        latest_analyses=latest_analyses,
+        skills=skills,
+        thumbnails=get_projects_with_thumbnails(project_ids),
     )
 
-    seen: set[int] = set()
+
+def _aggregate_commit_frequency(metrics_list: Iterable[dict]) -> dict[str, int]:
+    """Aggregate commit_frequency across the latest analysis metrics of each project.
+
+    Returns a ``{YYYY-MM-DD: count}`` mapping with all available dates.
+    """
     freq: dict[str, int] = {}
-    for analysis in analyses:
-        if analysis.project_id in seen:
-            continue
-        seen.add(analysis.project_id)
-        try:
-            metrics = json.loads(analysis.metrics_json or "{}")
-        except (json.JSONDecodeError, TypeError):
-            continue
-        cf = metrics.get("git", {}).get("commit_frequency", {})
+    for metrics in metrics_list:
+        git = metrics.get("git")
+        cf = git.get("commit_frequency", {}) if isinstance(git, dict) else {}
         if not isinstance(cf, dict):
             continue
         for date_str, count in cf.items():
@@ -497,6 +563,7 @@ def revoke_share_link(portfolio_id: int) -> Response:
             )
         portfolio.share_token = None
         session.flush()
+    portfolio_page_cache.discard(portfolio_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -519,52 +586,40 @@ def _render_portfolio_for_id(portfolio_id: int, session: Session) -> HTMLRespons
         .all()
     )
 
+    project_ids = list(dict.fromkeys(item.project_id for item in items if item.project_id))
+    data = _load_portfolio_render_data(project_ids, session)
+
     item_list: list[dict] = []
     for item in items:
         md = _extract_markdown(item.content)
         analysis_bullets: list[str] = []
         if not item.is_user_edited and item.project_id:
-            analysis = (
-                session.query(CodeAnalysis)
-                .filter(CodeAnalysis.project_id == item.project_id)
-                .order_by(CodeAnalysis.created_at.desc())
-                .first()
-            )
+            analysis = data.latest_analyses.get(item.project_id)
             if analysis:
-                if analysis.summary_text and analysis.summary_text.strip():
-                    md = analysis.summary_text.strip()
-                try:
-                    metrics = json.loads(analysis.metrics_json or "{}")
-                except Exception:
-                    metrics = {}
+                summary_text, metrics = analysis
+                if summary_text and summary_text.strip():
+                    md = summary_text.strip()
                 raw_bullets = metrics.get("ai_bullets") or metrics.get("resume_bullets") or []
                 if isinstance(raw_bullets, list):
                     analysis_bullets = [str(b) for b in raw_bullets if b][:6]
         thumbnail_url = (
             f"/api/projects/{item.project_id}/thumbnail"
-            if item.project_id and has_project_thumbnail(item.project_id)
+            if item.project_id in data.thumbnails
             else None
         )
-        # Fetch skills and project metadata for skill timeline + showcase ranking
+        # Skills and project metadata for skill timeline + showcase ranking
         item_skills: list[dict] = []
         importance_rank: int | None = None
         is_showcase_proj: bool = False
         start_date_str: str | None = None
         if item.project_id and not getattr(item, "is_text_block", False):
-            proj = session.query(Project).filter(Project.id == item.project_id).first()
+            proj = data.projects.get(item.project_id)
             if proj:
                 importance_rank = proj.importance_rank
                 is_showcase_proj = bool(proj.is_showcase)
                 if proj.start_date:
                     start_date_str = proj.start_date.strftime("%b %Y")
-            skill_rows = (
-                session.query(Skill)
-                .join(ProjectSkill, ProjectSkill.skill_id == Skill.id)
-                .filter(ProjectSkill.project_id == item.project_id)
-                .order_by(Skill.name)
-                .all()
-            )
-            item_skills = [{"name": s.name, "type": str(s.skill_type)} for s in skill_rows]
+            item_skills = data.skills.get(item.project_id, [])
         item_list.append(
             {
                 "title": item.title,
@@ -582,8 +637,9 @@ def _render_portfolio_for_id(portfolio_id: int, session: Session) -> HTMLRespons
         )
 
     # Aggregate commit frequency for the heatmap
-    project_ids = [item.project_id for item in items if item.project_id]
-    commit_freq = _aggregate_commit_frequency(project_ids, session)
+    commit_freq = _aggregate_commit_frequency(
+        metrics for _summary, metrics in data.latest_analyses.values()
+    )
 
     html = _render_portfolio_html(
         name=portfolio.name,
@@ -619,17 +675,78 @@ def preview_portfolio(portfolio_id: int) -> HTMLResponse:
         return response
 
 
+def _shared_portfolio_version(share_token: str, session: Session) -> tuple[int, str] | None:
+    """Return ``(portfolio_id, content_version)`` for a share token in one query.
+
+    The version changes whenever the rendered page could: portfolio metadata
+    (template, theme, description), item edits, additions, removals and
+    reorders, new and edited analyses, project and skill changes of its
+    projects, the owner's name, thumbnails, and the date (the heatmap ends
+    today). Counts catch removals and maximum IDs catch a removal followed by
+    an addition.
+    """
+    item_filter = PortfolioItem.portfolio_id == Portfolio.id
+    item_projects = select(PortfolioItem.project_id).where(item_filter)
+    row = session.execute(
+        select(
+            Portfolio.id,
+            Portfolio.updated_at,
+            User.username,
+            select(func.count(PortfolioItem.id)).where(item_filter).scalar_subquery(),
+            select(func.max(PortfolioItem.updated_at)).where(item_filter).scalar_subquery(),
+            select(func.count(CodeAnalysis.id))
+            .where(CodeAnalysis.project_id.in_(item_projects))
+            .scalar_subquery(),
+            select(func.max(CodeAnalysis.id))
+            .where(CodeAnalysis.project_id.in_(item_projects))
+            .scalar_subquery(),
+            select(func.max(CodeAnalysis.updated_at))
+            .where(CodeAnalysis.project_id.in_(item_projects))
+            .scalar_subquery(),
+            select(func.max(Project.updated_at))
+            .where(Project.id.in_(item_projects))
+            .scalar_subquery(),
+            select(func.count(ProjectSkill.id))
+            .where(ProjectSkill.project_id.in_(item_projects))
+            .scalar_subquery(),
+            select(func.max(ProjectSkill.id))
+            .where(ProjectSkill.project_id.in_(item_projects))
+            .scalar_subquery(),
+        )
+        .outerjoin(User, User.id == Portfolio.user_id)
+        .where(Portfolio.share_token == share_token)
+    ).first()
+    if row is None:
+        return None
+    try:
+        thumbnails_mtime = get_thumbnail_storage_root().stat().st_mtime_ns
+    except OSError:
+        thumbnails_mtime = 0
+    version = "|".join(
+        str(value) for value in (*row, thumbnails_mtime, datetime.date.today().isoformat())
+    )
+    return row[0], version
+
+
 @router.get(
     "/shared/{share_token}",
     response_class=HTMLResponse,
     summary="View a shared portfolio",
-    description="Public endpoint — renders a portfolio dashboard using a share token.",
+    description=(
+        "Public endpoint — renders a portfolio dashboard using a share token. Rendered "
+        "pages are cached until the portfolio changes; responses carry an ETag "
+        "(If-None-Match is answered with 304) and are gzip/brotli encoded on request."
+    ),
 )
-def get_shared_portfolio(share_token: str) -> HTMLResponse:
+def get_shared_portfolio(
+    share_token: str,
+    if_none_match: str | None = Header(default=None),
+    accept_encoding: str | None = Header(default=None),
+) -> Response:
     """Render a portfolio dashboard by share token (no auth required)."""
     with get_session() as session:
-        portfolio = session.query(Portfolio).filter(Portfolio.share_token == share_token).first()
-        if portfolio is None:
+        found = _shared_portfolio_version(share_token, session)
+        if found is None:
             return HTMLResponse(
                 content=_render_404_html(
                     title="Portfolio not found",
@@ -637,8 +754,29 @@ def get_shared_portfolio(share_token: str) -> HTMLResponse:
                 ),
                 status_code=404,
             )
-        response = _render_portfolio_for_id(portfolio.id, session)
-        return response  # type: ignore[return-value]
+        portfolio_id, version = found
+        coding = negotiate_coding(accept_encoding)
+        headers = {
+            "ETag": page_etag(portfolio_id, version, coding),
+            "Cache-Control": "public, no-cache",
+            "Vary": "Accept-Encoding",
+        }
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        page = portfolio_page_cache.get(portfolio_id, version)
+        if page is None:
+            rendered = _render_portfolio_for_id(portfolio_id, session)
+            if rendered is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Portfolio not found."
+                )
+            page = portfolio_page_cache.put(portfolio_id, version, rendered.body)
+
+    body, coding = page.negotiate(accept_encoding)
+    if coding is not None:
+        headers["Content-Encoding"] = coding
+    return Response(content=body, media_type="text/html; charset=utf-8", headers=headers)
 
 
 # ── Minimal 404 page ──────────────────────────────────────────────────────────
@@ -1275,20 +1413,102 @@ def list_portfolio_items(portfolio_id: int) -> list[PortfolioItemResponse]:
     description="Set display_order on each item according to the given ID list.",
 )
 def reorder_portfolio_items(portfolio_id: int, request: PortfolioReorderRequest) -> Response:
-    """Update display_order for each item based on position in item_ids."""
+    """Update display_order for each item based on position in item_ids.
+
+    Items are checked against the portfolio in one query and every changed
+    position is written by a single ``UPDATE ... CASE`` statement, so a
+    drag-and-drop move costs two statements however long the list is. IDs
+    outside the portfolio are ignored.
+    """
+    positions = {item_id: order for order, item_id in enumerate(request.item_ids)}
     with get_session() as session:
-        for order, item_id in enumerate(request.item_ids):
-            item = (
-                session.query(PortfolioItem)
-                .filter(PortfolioItem.id == item_id, PortfolioItem.portfolio_id == portfolio_id)
-                .first()
+        current = session.execute(
+            select(PortfolioItem.id, PortfolioItem.display_order).where(
+                PortfolioItem.portfolio_id == portfolio_id, PortfolioItem.id.in_(positions)
+            )
+        ).all()
+        changed = {
+            item_id: positions[item_id]
+            for item_id, display_order in current
+            if display_order != positions[item_id]
+        }
+        if changed:
+            session.execute(
+                update(PortfolioItem)
+                .where(PortfolioItem.id.in_(changed))
+                .values(
+                    display_order=case(changed, value=PortfolioItem.id),
+                    updated_at=datetime.datetime.now(datetime.UTC),
+                )
+                .execution_options(synchronize_session=False)
             )
-            if item is not None:
-                item.display_order = order
-        session.flush()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
+@router.patch(
+    "/{portfolio_id}/items",
+    response_model=list[PortfolioItemResponse],
+    summary="Update several portfolio items",
+    description=(
+        "Apply title, markdown and display_order changes to many items of a portfolio "
+        "in one request. Every item must belong to the portfolio; otherwise nothing "
+        "is changed."
+    ),
+)
+def batch_update_portfolio_items(
+    portfolio_id: int, request: PortfolioItemBatchUpdateRequest
+) -> list[PortfolioItemResponse]:
+    """Edit many portfolio items with one lookup and one flush."""
+    edits = {edit.id: edit for edit in request.items}
+    if len(edits) != len(request.items):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Each item may appear only once in a batch.",
+        )
+
+    with get_session() as session:
+        items = (
+            session.query(PortfolioItem)
+            .filter(PortfolioItem.portfolio_id == portfolio_id, PortfolioItem.id.in_(edits))
+            .all()
+        )
+        missing = sorted(edits.keys() - {item.id for item in items})
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Portfolio items not found: {', '.join(map(str, missing))}.",
+            )
+
+        for item in items:
+            edit = edits[item.id]
+            if edit.title is not None:
+                item.title = edit.title
+            if edit.markdown is not None:
+                item.content = json.dumps({"markdown": edit.markdown})
+                item.is_user_edited = True
+            if edit.display_order is not None:
+                item.display_order = edit.display_order
+        # The unit of work sends same-shaped UPDATEs together as one executemany.
+        session.flush()
+
+        by_id = {item.id: item for item in items}
+        return [
+            PortfolioItemResponse(
+                id=item.id,
+                project_id=item.project_id,
+                title=item.title,
+                markdown=_extract_markdown(item.content),
+                is_user_edited=bool(item.is_user_edited),
+                is_text_block=bool(item.is_text_block),
+                source_analysis_id=item.source_analysis_id,
+                portfolio_id=item.portfolio_id,
+                created_at=item.created_at,
+                updated_at=item.updated_at,
+            )
+            for item in (by_id[edit.id] for edit in request.items)
+        ]
+
+
 @router.delete(
     "/{portfolio_id}/items/{item_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -1422,6 +1642,7 @@ def delete_portfolio(portfolio_id: int) -> Response:
 
         session.delete(portfolio)
 
+    portfolio_page_cache.discard(portfolio_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import time
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Annotated, Any
 
+import anyio
 from fastapi import (
     APIRouter,
     Depends,
@@ -27,6 +30,8 @@ from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
 from capstone_project_team_5.api.dependencies import get_current_username
+from capstone_project_team_5.api.routes.jobs import job_to_response
+from capstone_project_team_5.api.schemas.jobs import AnalysisJobResponse
 from capstone_project_team_5.api.schemas.projects import (
     DEFAULT_LIMIT,
     MAX_LIMIT,
@@ -57,14 +62,26 @@ from capstone_project_team_5.data.models import (
     User,
     UserCodeAnalysis,
 )
+from capstone_project_team_5.data.models.analysis_job import ITEM_ANALYZED, ITEM_SKIPPED
 from capstone_project_team_5.models.upload import DetectedProject, InvalidZipError
+from capstone_project_team_5.services.analysis_jobs import (
+    enqueue_analysis_job,
+    get_analysis_job,
+)
+from capstone_project_team_5.services.analysis_jobs import (
+    resume_analysis_jobs as resume_pending_analysis_jobs,
+)
 from capstone_project_team_5.services.content_store import (
-    compute_project_file_count,
-    compute_project_fingerprint,
+    ProjectView,
+    build_project_scan,
+    discard_project_artifacts,
+    get_ingest_temp_root,
+    get_project_view,
     ingest_zip,
     load_analysis_cache,
-    load_manifest,
+    load_project_view,
     materialize_project_tree,
+    open_manifest,
     write_analysis_cache,
 )
 from capstone_project_team_5.services.project_thumbnail import (
@@ -76,8 +93,17 @@ from capstone_project_team_5.services.project_thumbnail import (
 )
 from capstone_project_team_5.services.skill_persistence import save_skills_to_db
 from capstone_project_team_5.services.upload import inspect_zip
-from capstone_project_team_5.services.upload_storage import get_upload_zip_path, store_upload_zip
-from capstone_project_team_5.workflows.analysis_pipeline import analyze_projects_structured
+from capstone_project_team_5.services.upload_storage import (
+    get_upload_temp_root,
+    get_upload_zip_path,
+    keep_upload_archives,
+    store_upload_zip,
+)
+from capstone_project_team_5.workflows.analysis_pipeline import (
+    AnalysisWorkers,
+    analyze_projects_structured,
+    get_shared_analysis_workers,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +112,27 @@ router = APIRouter(prefix="/projects", tags=["projects"])
 
 _score_config: ScoreConfig = ScoreConfig()
 
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+_DEFAULT_MAX_CONCURRENT_UPLOADS = 2
+_upload_limiter: anyio.CapacityLimiter | None = None
+
+
+def _get_upload_limiter() -> anyio.CapacityLimiter:
+    """Return the limiter bounding how many uploads are processed at once.
+
+    The limit comes from ``ZIP2JOB_MAX_CONCURRENT_UPLOADS``. Uploads beyond it
+    wait without occupying a worker thread. Created lazily because anyio
+    limiters must be constructed inside a running event loop.
+    """
+    global _upload_limiter
+    if _upload_limiter is None:
+        try:
+            limit = int(os.getenv("ZIP2JOB_MAX_CONCURRENT_UPLOADS", ""))
+        except ValueError:
+            limit = _DEFAULT_MAX_CONCURRENT_UPLOADS
+        _upload_limiter = anyio.CapacityLimiter(max(limit, 1))
+    return _upload_limiter
+
 
 def _project_to_summary(project: Project) -> ProjectSummary:
     has_thumbnail = has_project_thumbnail(project.id)
@@ -180,7 +227,7 @@ def _get_project_upload_ids(session: Session, project: Project) -> list[int]:
 def _ensure_manifests(session: Session, upload_ids: list[int]) -> None:
     uploads = _get_ordered_uploads(session, upload_ids)
     for upload in uploads:
-        if load_manifest(upload.id) is not None:
+        if open_manifest(upload.id) is not None:
             continue
         zip_path = get_upload_zip_path(upload.id, upload.filename)
         if not zip_path.exists():
@@ -197,25 +244,62 @@ def _ensure_manifests(session: Session, upload_ids: list[int]) -> None:
             ) from exc
 
 
+def _get_project_view(session: Session, project: Project, upload_ids: list[int]) -> ProjectView:
+    """Return the merged view of ``project``, touching manifests only on a miss."""
+    view = load_project_view(project.id, project.rel_path, upload_ids)
+    if view is None:
+        _ensure_manifests(session, upload_ids)
+        view = get_project_view(project.id, project.rel_path, upload_ids)
+    return view
+
+
 def _analyze_project_from_store(
-    project: Project, upload_ids: list[int], use_ai: bool, current_username: str | None = None
+    project: Project,
+    view: ProjectView,
+    use_ai: bool,
+    current_username: str | None = None,
+    workers: AnalysisWorkers | None = None,
 ) -> tuple[ProjectAnalysisResult, str]:
     consent_tool = _build_consent_tool(use_ai)
-    file_count = compute_project_file_count(project.rel_path, upload_ids)
+    upload_ids = list(view.upload_ids)
     detected = [
         DetectedProject(
             name=project.name,
             rel_path=project.rel_path,
             has_git_repo=project.has_git_repo,
-            file_count=file_count,
+            file_count=view.file_count,
         )
     ]
-    with TemporaryDirectory() as temp_dir:
-        extract_root = Path(temp_dir)
-        materialize_project_tree(project.rel_path, upload_ids, extract_root)
+    # Non-Git projects are analyzed straight from the object store; only Git
+    # projects need a checkout on disk for their history.
+    scan = (
+        None
+        if project.has_git_repo
+        else build_project_scan(project.rel_path, upload_ids, view=view)
+    )
+    if scan is not None:
         results = analyze_projects_structured(
-            extract_root, detected, consent_tool, current_user=current_username
+            Path(),
+            detected,
+            consent_tool,
+            current_user=current_username,
+            scans={project.rel_path: scan},
+            workers=workers,
         )
+    else:
+        # Materialize on the store's filesystem so objects can be hardlinked
+        temp_root = get_ingest_temp_root()
+        temp_root.mkdir(parents=True, exist_ok=True)
+        with TemporaryDirectory(prefix=f"project-{project.id}-", dir=temp_root) as temp_dir:
+            extract_root = Path(temp_dir)
+            materialize_project_tree(project.rel_path, upload_ids, extract_root, view=view)
+            results = analyze_projects_structured(
+                extract_root,
+                detected,
+                consent_tool,
+                current_user=current_username,
+                workers=workers,
+            )
     analysis_map = {(item["name"], item["rel_path"]): item for item in results}
     analysis = analysis_map.get((project.name, project.rel_path))
     if analysis is None:
@@ -224,8 +308,7 @@ def _analyze_project_from_store(
             detail="Project analysis failed.",
         )
     response = _analysis_to_response(project.id, analysis)
-    fingerprint = compute_project_fingerprint(project.rel_path, upload_ids)
-    return response, fingerprint
+    return response, view.fingerprint
 
 
 def _analysis_to_response(project_id: int, analysis: dict[str, Any]) -> ProjectAnalysisResult:
@@ -783,7 +866,10 @@ def delete_project(
         user = _get_user_or_404(session, current_username)
         project = _get_owned_project_or_404(session, project_id, user.id)
         session.delete(project)
-        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    # Shared objects and manifests are left for the storage garbage collector
+    discard_project_artifacts(project_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.post(
@@ -818,82 +904,135 @@ async def upload_project_zip(
     t_total = time.perf_counter()
     logger.info("[upload] ▶ started  file=%s", filename)
 
-    with TemporaryDirectory() as temp_dir:
+    # Stream next to the stored archives so keeping one is a rename, not a copy
+    temp_root = get_upload_temp_root()
+    temp_root.mkdir(parents=True, exist_ok=True)
+    with TemporaryDirectory(dir=temp_root) as temp_dir:
         temp_path = Path(temp_dir) / filename
-        chunk_size = 8192  # 8KB chunks
 
         t0 = time.perf_counter()
-        with temp_path.open("wb") as f:
-            while True:
-                chunk = await file.read(chunk_size)
-                if not chunk:
-                    break
-                f.write(chunk)
-        size_kb = temp_path.stat().st_size / 1024
+        size_bytes = await _stream_upload_to_disk(file, temp_path)
         logger.info(
-            "[upload] ✔ streamed to disk  %.1f KB  (%.3fs)", size_kb, time.perf_counter() - t0
+            "[upload] ✔ streamed to disk  %.1f KB  (%.3fs)",
+            size_bytes / 1024,
+            time.perf_counter() - t0,
         )
 
-        t0 = time.perf_counter()
-        try:
-            result, collab_flags, _project_dates = inspect_zip(temp_path)
-        except InvalidZipError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=str(exc),
-            ) from exc
-        logger.info(
-            "[upload] ✔ inspect_zip  projects=%d  files=%d  (%.3fs)",
-            len(result.projects),
-            result.file_count,
-            time.perf_counter() - t0,
+        # Inspection, storage, ingest and the database work are all blocking;
+        # run them on a worker thread so the event loop keeps serving requests.
+        return await anyio.to_thread.run_sync(
+            partial(
+                _process_uploaded_zip,
+                temp_path,
+                requested_mapping,
+                current_username,
+                t_total,
+            ),
+            limiter=_get_upload_limiter(),
         )
 
-        detected_names = [project.name for project in result.projects]
-        unknown_mapped_names = sorted(set(requested_mapping.keys()) - set(detected_names))
-        if unknown_mapped_names:
+
+async def _stream_upload_to_disk(file: UploadFile, destination: Path) -> int:
+    """Copy an uploaded file to *destination* without blocking the event loop.
+
+    Returns:
+        Number of bytes written.
+    """
+    size_bytes = 0
+    handle = await anyio.to_thread.run_sync(destination.open, "wb")
+    try:
+        while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+            await anyio.to_thread.run_sync(handle.write, chunk)
+            size_bytes += len(chunk)
+    finally:
+        await anyio.to_thread.run_sync(handle.close)
+    return size_bytes
+
+
+def _process_uploaded_zip(
+    temp_path: Path,
+    requested_mapping: dict[str, int],
+    current_username: str,
+    t_total: float,
+) -> ProjectUploadResponse:
+    """Inspect, store and ingest a streamed upload, then persist its projects.
+
+    Runs on a worker thread: every step here blocks (ZIP parsing, git
+    subprocesses, document parsing, disk writes and SQLAlchemy).
+    """
+    t0 = time.perf_counter()
+    try:
+        result, collab_flags, _project_dates = inspect_zip(temp_path)
+    except InvalidZipError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+    logger.info(
+        "[upload] ✔ inspect_zip  projects=%d  files=%d  (%.3fs)",
+        len(result.projects),
+        result.file_count,
+        time.perf_counter() - t0,
+    )
+
+    detected_names = [project.name for project in result.projects]
+    unknown_mapped_names = sorted(set(requested_mapping.keys()) - set(detected_names))
+    if unknown_mapped_names:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "message": (
+                    "project_mapping contains names that were not detected in this upload."
+                ),
+                "unknown_project_names": unknown_mapped_names,
+            },
+        )
+    with get_session() as session:
+        user = _get_user_or_404(session, current_username)
+        matches = (
+            _find_matching_owned_projects(session, detected_names, user.id)
+            if detected_names
+            else {}
+        )
+        ambiguous = {
+            name: ids
+            for name, ids in matches.items()
+            if len(ids) > 1 and name in detected_names and name not in requested_mapping
+        }
+        if ambiguous:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=status.HTTP_409_CONFLICT,
                 detail={
-                    "message": (
-                        "project_mapping contains names that were not detected in this upload."
-                    ),
-                    "unknown_project_names": unknown_mapped_names,
+                    "message": "Multiple existing projects match uploaded project names.",
+                    "candidates": ambiguous,
                 },
             )
-        with get_session() as session:
-            user = _get_user_or_404(session, current_username)
-            matches = (
-                _find_matching_owned_projects(session, detected_names, user.id)
-                if detected_names
-                else {}
-            )
-            ambiguous = {
-                name: ids
-                for name, ids in matches.items()
-                if len(ids) > 1 and name in detected_names and name not in requested_mapping
-            }
-            if ambiguous:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail={
-                        "message": "Multiple existing projects match uploaded project names.",
-                        "candidates": ambiguous,
-                    },
-                )
 
-            upload_record = UploadRecord(
-                user_id=user.id,
-                filename=result.filename,
-                size_bytes=result.size_bytes,
-                file_count=result.file_count,
-            )
-            session.add(upload_record)
-            session.flush()
+        upload_record = UploadRecord(
+            user_id=user.id,
+            filename=result.filename,
+            size_bytes=result.size_bytes,
+            file_count=result.file_count,
+        )
+        session.add(upload_record)
+        session.flush()
 
+        t0 = time.perf_counter()
+        try:
+            ingest_zip(temp_path, upload_record.id)
+        except Exception as exc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to store upload artifacts.",
+            ) from exc
+        logger.info("[upload] ✔ ingest_zip  (%.3fs)", time.perf_counter() - t0)
+
+        # The streamed file becomes the kept archive; otherwise the content
+        # store is the only copy and the temp file is discarded.
+        if keep_upload_archives():
             t0 = time.perf_counter()
             try:
-                store_upload_zip(upload_record.id, upload_record.filename, temp_path)
+                store_upload_zip(upload_record.id, upload_record.filename, temp_path, move=True)
             except OSError as exc:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -901,156 +1040,137 @@ async def upload_project_zip(
                 ) from exc
             logger.info("[upload] ✔ store_upload_zip  (%.3fs)", time.perf_counter() - t0)
 
-            t0 = time.perf_counter()
-            try:
-                ingest_zip(temp_path, upload_record.id)
-            except Exception as exc:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to store upload artifacts.",
-                ) from exc
-            logger.info("[upload] ✔ ingest_zip  (%.3fs)", time.perf_counter() - t0)
-
-            existing_match_ids = [
-                ids[0]
-                for name, ids in matches.items()
-                if len(ids) == 1 and name in detected_names and name not in requested_mapping
-            ]
-            existing_match_ids.extend(requested_mapping.values())
-            existing_projects: dict[int, Project] = {}
-            if existing_match_ids:
-                for project in (
-                    session.query(Project).filter(Project.id.in_(existing_match_ids)).all()
-                ):
-                    existing_projects[project.id] = project
-            missing_mapped_ids = sorted(
-                project_id
-                for project_id in set(requested_mapping.values())
-                if project_id not in existing_projects
+        existing_match_ids = [
+            ids[0]
+            for name, ids in matches.items()
+            if len(ids) == 1 and name in detected_names and name not in requested_mapping
+        ]
+        existing_match_ids.extend(requested_mapping.values())
+        existing_projects: dict[int, Project] = {}
+        if existing_match_ids:
+            for project in session.query(Project).filter(Project.id.in_(existing_match_ids)).all():
+                existing_projects[project.id] = project
+        missing_mapped_ids = sorted(
+            project_id
+            for project_id in set(requested_mapping.values())
+            if project_id not in existing_projects
+        )
+        if missing_mapped_ids:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "message": "project_mapping references unknown project IDs.",
+                    "unknown_project_ids": missing_mapped_ids,
+                },
             )
-            if missing_mapped_ids:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={
-                        "message": "project_mapping references unknown project IDs.",
-                        "unknown_project_ids": missing_mapped_ids,
-                    },
-                )
-
-            updated_projects: list[Project] = []
-            new_projects: list[Project] = []
-            upload_actions: list[dict[str, Any]] = []
-            for detected_project in result.projects:
-                mapped_project_id = requested_mapping.get(detected_project.name)
-                if mapped_project_id is not None:
-                    match_ids = [mapped_project_id]
-                else:
-                    match_ids = matches.get(detected_project.name, [])
-                    if len(match_ids) == 1:
-                        existing = existing_projects.get(match_ids[0])
-                        if existing is None:
-                            match_ids = []
-
-                if not match_ids:
-                    new_project = Project(
-                        upload_id=upload_record.id,
-                        name=detected_project.name,
-                        rel_path=detected_project.rel_path,
-                        has_git_repo=detected_project.has_git_repo,
-                        file_count=detected_project.file_count,
-                        is_collaborative=collab_flags.get(detected_project.rel_path, False),
-                    )
-                    session.add(new_project)
-                    new_projects.append(new_project)
-                    upload_actions.append(
-                        {
-                            "project": new_project,
-                            "project_name": detected_project.name,
-                            "action": "created",
-                            "merged_into_project_id": None,
-                        }
-                    )
-                    continue
 
-                existing = existing_projects[match_ids[0]]
-                existing.file_count += detected_project.file_count
-                session.add(
-                    ArtifactSource(
-                        project_id=existing.id,
-                        upload_id=upload_record.id,
-                        artifact_count=detected_project.file_count,
-                    )
-                )
-                upload_ids = {existing.upload_id, upload_record.id}
-                upload_ids.update(source.upload_id for source in existing.artifact_sources)
-                ordered_upload_ids = [
-                    upload.id for upload in _get_ordered_uploads(session, list(upload_ids))
-                ]
-                _ensure_manifests(session, ordered_upload_ids)
-                existing.file_count = compute_project_file_count(
-                    existing.rel_path, ordered_upload_ids
+        updated_projects: list[Project] = []
+        new_projects: list[Project] = []
+        upload_actions: list[dict[str, Any]] = []
+        for detected_project in result.projects:
+            mapped_project_id = requested_mapping.get(detected_project.name)
+            if mapped_project_id is not None:
+                match_ids = [mapped_project_id]
+            else:
+                match_ids = matches.get(detected_project.name, [])
+                if len(match_ids) == 1:
+                    existing = existing_projects.get(match_ids[0])
+                    if existing is None:
+                        match_ids = []
+
+            if not match_ids:
+                new_project = Project(
+                    upload_id=upload_record.id,
+                    name=detected_project.name,
+                    rel_path=detected_project.rel_path,
+                    has_git_repo=detected_project.has_git_repo,
+                    file_count=detected_project.file_count,
+                    is_collaborative=collab_flags.get(detected_project.rel_path, False),
                 )
-                existing.updated_at = datetime.now(UTC)
-                updated_projects.append(existing)
+                session.add(new_project)
+                new_projects.append(new_project)
                 upload_actions.append(
                     {
-                        "project": existing,
+                        "project": new_project,
                         "project_name": detected_project.name,
-                        "action": "merged",
-                        "merged_into_project_id": existing.id,
+                        "action": "created",
+                        "merged_into_project_id": None,
                     }
                 )
+                continue
 
-            session.flush()
-            projects = sorted(new_projects + updated_projects, key=lambda project: project.id)
-            actions = [
-                ProjectUploadAction(
-                    project_id=int(action["project"].id),
-                    project_name=str(action["project_name"]),
-                    action=str(action["action"]),
-                    merged_into_project_id=action["merged_into_project_id"],
+            existing = existing_projects[match_ids[0]]
+            existing.file_count += detected_project.file_count
+            session.add(
+                ArtifactSource(
+                    project_id=existing.id,
+                    upload_id=upload_record.id,
+                    artifact_count=detected_project.file_count,
                 )
-                for action in upload_actions
+            )
+            upload_ids = {existing.upload_id, upload_record.id}
+            upload_ids.update(source.upload_id for source in existing.artifact_sources)
+            ordered_upload_ids = [
+                upload.id for upload in _get_ordered_uploads(session, list(upload_ids))
             ]
-            created_count = sum(1 for action in actions if action.action == "created")
-            merged_count = sum(1 for action in actions if action.action == "merged")
+            _ensure_manifests(session, ordered_upload_ids)
+            existing.file_count = get_project_view(
+                existing.id, existing.rel_path, ordered_upload_ids
+            ).file_count
+            existing.updated_at = datetime.now(UTC)
+            updated_projects.append(existing)
+            upload_actions.append(
+                {
+                    "project": existing,
+                    "project_name": detected_project.name,
+                    "action": "merged",
+                    "merged_into_project_id": existing.id,
+                }
+            )
 
-        logger.info(
-            "[upload] ✔ done  created=%d merged=%d  total=%.3fs",
-            created_count,
-            merged_count,
-            time.perf_counter() - t_total,
-        )
-        return ProjectUploadResponse(
-            upload_id=upload_record.id,
-            filename=upload_record.filename,
-            size_bytes=upload_record.size_bytes,
-            file_count=upload_record.file_count,
-            created_at=upload_record.created_at,
-            projects=[_project_to_summary(project) for project in projects],
-            actions=actions,
-            created_count=created_count,
-            merged_count=merged_count,
-        )
+        session.flush()
+        projects = sorted(new_projects + updated_projects, key=lambda project: project.id)
+        actions = [
+            ProjectUploadAction(
+                project_id=int(action["project"].id),
+                project_name=str(action["project_name"]),
+                action=str(action["action"]),
+                merged_into_project_id=action["merged_into_project_id"],
+            )
+            for action in upload_actions
+        ]
+        created_count = sum(1 for action in actions if action.action == "created")
+        merged_count = sum(1 for action in actions if action.action == "merged")
+
+    logger.info(
+        "[upload] ✔ done  created=%d merged=%d  total=%.3fs",
+        created_count,
+        merged_count,
+        time.perf_counter() - t_total,
+    )
+    return ProjectUploadResponse(
+        upload_id=upload_record.id,
+        filename=upload_record.filename,
+        size_bytes=upload_record.size_bytes,
+        file_count=upload_record.file_count,
+        created_at=upload_record.created_at,
+        projects=[_project_to_summary(project) for project in projects],
+        actions=actions,
+        created_count=created_count,
+        merged_count=merged_count,
+    )
 
 
-@router.post(
-    "/{project_id}/analyze",
-    response_model=ProjectAnalysisResult,
-    summary="Analyze a project",
-    description="Analyze a persisted project and update its importance score.",
-    responses={
-        400: {"description": "Project cannot be analyzed"},
-        404: {"description": "Project not found"},
-        409: {"description": "Stored upload archive not found"},
-    },
-)
-def analyze_project(
-    project_id: int,
-    current_username: Annotated[str, Depends(get_current_username)],
-    use_ai: bool = False,
-    force: bool = False,
-) -> ProjectAnalysisResult:
+def _run_project_analysis(
+    project_id: int, current_username: str, use_ai: bool, force: bool
+) -> tuple[ProjectAnalysisResult, bool]:
+    """Analyze one owned project and persist the results.
+
+    Shared by the synchronous endpoint and background analysis jobs.
+
+    Returns:
+        Tuple of (analysis result, whether it came from the analysis cache).
+    """
     # Phase 1: load project data and handle cache — close session before running
     # analysis so we don't hold a SQLite shared lock that would prevent
     # save_code_analysis_to_db (which opens its own session) from writing.
@@ -1070,11 +1190,9 @@ def analyze_project(
                 detail="Upload record not found.",
             )
 
-        _ensure_manifests(session, upload_ids)
-
-        fingerprint = compute_project_fingerprint(project.rel_path, upload_ids)
+        view = _get_project_view(session, project, upload_ids)
         cached = load_analysis_cache(project.id)
-        if not force and cached and cached.get("fingerprint") == fingerprint:
+        if not force and cached and cached.get("fingerprint") == view.fingerprint:
             payload = cached.get("payload")
             if isinstance(payload, dict):
                 cached_response = ProjectAnalysisResult(**payload)
@@ -1085,13 +1203,15 @@ def analyze_project(
                     cached_response.practices,
                 )
                 _ensure_user_analysis_link(session, project.id, current_username)
-                return cached_response
+                return cached_response, True
+        # A stored view may outlive its manifests; analysis reads the objects.
+        _ensure_manifests(session, upload_ids)
         # expire_on_commit=False means project attributes survive session close
 
     # Phase 2: run analysis with no session open so save_code_analysis_to_db
     # can acquire its own write lock without contention.
     response, fingerprint = _analyze_project_from_store(
-        project, upload_ids, use_ai, current_username=current_username
+        project, view, use_ai, current_username=current_username
     )
 
     # Phase 3: persist results in a fresh session (can now see the CodeAnalysis
@@ -1147,22 +1267,113 @@ def analyze_project(
         _ensure_user_analysis_link(session, project_id, current_username)
 
     write_analysis_cache(project_id, fingerprint, response.model_dump())
-    return response
+    return response, False
+
+
+def _analyze_project_job(
+    project_id: int, current_username: str, use_ai: bool, force: bool
+) -> tuple[str, str | None]:
+    """Run one project of a background analysis job.
+
+    Returns:
+        Tuple of (project status, skip or failure reason).
+    """
+    try:
+        _, from_cache = _run_project_analysis(project_id, current_username, use_ai, force)
+    except HTTPException as exc:
+        return ITEM_SKIPPED, str(exc.detail) if exc.detail else "Project analysis failed."
+    if from_cache:
+        return ITEM_SKIPPED, "Merged content fingerprint unchanged."
+    return ITEM_ANALYZED, None
+
+
+def resume_analysis_jobs() -> int:
+    """Reschedule analysis jobs left queued or running by a previous process."""
+    return resume_pending_analysis_jobs(_analyze_project_job)
+
+
+def _queue_analysis_job(
+    user_id: int, project_ids: list[int], use_ai: bool, force: bool
+) -> AnalysisJobResponse:
+    job_id = enqueue_analysis_job(
+        user_id, project_ids, _analyze_project_job, use_ai=use_ai, force=force
+    )
+    with get_session() as session:
+        job = get_analysis_job(session, job_id, user_id)
+        return job_to_response(job)
+
+
+@router.post(
+    "/{project_id}/analyze",
+    response_model=ProjectAnalysisResult | AnalysisJobResponse,
+    summary="Analyze a project",
+    description=(
+        "Analyze a persisted project and update its importance score. With "
+        "``background=true`` the analysis is queued and a job is returned (202) "
+        "that can be polled via ``GET /api/jobs/{job_id}``."
+    ),
+    responses={
+        202: {"description": "Analysis queued", "model": AnalysisJobResponse},
+        400: {"description": "Project cannot be analyzed"},
+        404: {"description": "Project not found"},
+        409: {"description": "Stored upload archive not found"},
+    },
+)
+def analyze_project(
+    project_id: int,
+    response: Response,
+    current_username: Annotated[str, Depends(get_current_username)],
+    use_ai: bool = False,
+    force: bool = False,
+    background: bool = False,
+) -> ProjectAnalysisResult | AnalysisJobResponse:
+    if background:
+        with get_session() as session:
+            user = _get_user_or_404(session, current_username)
+            _get_owned_project_or_404(session, project_id, user.id)
+            user_id = user.id
+        response.status_code = status.HTTP_202_ACCEPTED
+        return _queue_analysis_job(user_id, [project_id], use_ai, force)
+
+    result, _ = _run_project_analysis(project_id, current_username, use_ai, force)
+    return result
 
 
 @router.post(
     "/analyze",
-    response_model=ProjectsAnalyzeAllResponse,
+    response_model=ProjectsAnalyzeAllResponse | AnalysisJobResponse,
     summary="Analyze all projects",
-    description="Analyze all persisted projects and update their importance scores.",
+    description=(
+        "Analyze all persisted projects and update their importance scores. With "
+        "``background=true`` the projects are queued as one job and the job is "
+        "returned (202) so per-project progress can be polled via "
+        "``GET /api/jobs/{job_id}``."
+    ),
+    responses={202: {"description": "Analysis queued", "model": AnalysisJobResponse}},
 )
 def analyze_all_projects(
+    response: Response,
     current_username: Annotated[str, Depends(get_current_username)],
     use_ai: bool = False,
     force: bool = False,
-) -> ProjectsAnalyzeAllResponse:
+    background: bool = False,
+) -> ProjectsAnalyzeAllResponse | AnalysisJobResponse:
+    if background:
+        with get_session() as session:
+            user = _get_user_or_404(session, current_username)
+            user_id = user.id
+            project_ids = [
+                project_id
+                for (project_id,) in _owned_project_query(session, user.id)
+                .with_entities(Project.id)
+                .order_by(Project.upload_id, Project.id)
+            ]
+        response.status_code = status.HTTP_202_ACCEPTED
+        return _queue_analysis_job(user_id, project_ids, use_ai, force)
+
     analyzed: list[ProjectAnalysisResult] = []
     skipped: list[ProjectAnalysisSkipped] = []
+    pending: list[tuple[Project, ProjectView]] = []
 
     with get_session() as session:
         user = _get_user_or_404(session, current_username)
@@ -1193,15 +1404,14 @@ def analyze_all_projects(
                 continue
 
             try:
-                _ensure_manifests(session, upload_ids)
+                view = _get_project_view(session, project, upload_ids)
             except HTTPException as exc:
                 reason = str(exc.detail) if exc.detail else "Project analysis failed."
                 skipped.append(ProjectAnalysisSkipped(project_id=project.id, reason=reason))
                 continue
 
-            fingerprint = compute_project_fingerprint(project.rel_path, upload_ids)
             cached = load_analysis_cache(project.id)
-            if not force and cached and cached.get("fingerprint") == fingerprint:
+            if not force and cached and cached.get("fingerprint") == view.fingerprint:
                 payload = cached.get("payload")
                 if isinstance(payload, dict):
                     try:
@@ -1224,24 +1434,49 @@ def analyze_all_projects(
                         continue
 
             try:
-                response, fingerprint = _analyze_project_from_store(project, upload_ids, use_ai)
-                project.importance_score = response.importance_score
-                project.user_role = response.user_role
-                project.user_contribution_percentage = response.user_contribution_percentage
-                save_skills_to_db(session, project.id, response.tools, response.practices)
-                write_analysis_cache(project.id, fingerprint, response.model_dump())
-                analyzed.append(response)
+                _ensure_manifests(session, upload_ids)
             except HTTPException as exc:
                 reason = str(exc.detail) if exc.detail else "Project analysis failed."
                 skipped.append(ProjectAnalysisSkipped(project_id=project.id, reason=reason))
-            except Exception as exc:
-                skipped.append(
-                    ProjectAnalysisSkipped(
-                        project_id=project.id,
-                        reason=f"Project analysis failed: {exc!s}",
-                    )
-                )
-        session.flush()
+                continue
+            pending.append((project, view))
+
+    # Projects are independent, so analyze them concurrently with no session
+    # open (save_code_analysis_to_db writes through its own sessions). The
+    # worker pools are shared by all requests for the lifetime of the app.
+    workers = get_shared_analysis_workers()
+
+    def analyze_pending(
+        item: tuple[Project, ProjectView],
+    ) -> tuple[ProjectAnalysisResult | None, str | None, str | None]:
+        """Return ``(result, fingerprint, error)``; ``error`` is set when analysis failed."""
+        project, view = item
+        try:
+            result, fingerprint = _analyze_project_from_store(
+                project, view, use_ai, workers=workers
+            )
+        except HTTPException as exc:
+            return None, None, str(exc.detail) if exc.detail else "Project analysis failed."
+        except Exception as exc:
+            return None, None, f"Project analysis failed: {exc!s}"
+        return result, fingerprint, None
+
+    outcomes = workers.map(analyze_pending, pending)
+
+    with get_session() as session:
+        for (project, _view), (result, fingerprint, error) in zip(pending, outcomes, strict=True):
+            if result is None or fingerprint is None:
+                reason = error or "Project analysis failed."
+                skipped.append(ProjectAnalysisSkipped(project_id=project.id, reason=reason))
+                continue
+            stored = session.get(Project, project.id)
+            if stored is not None:
+                stored.importance_score = result.importance_score
+                stored.user_role = result.user_role
+                stored.user_contribution_percentage = result.user_contribution_percentage
+            save_skills_to_db(session, project.id, result.tools, result.practices)
+            write_analysis_cache(project.id, fingerprint, result.model_dump())
+            analyzed.append(result)
 
     return ProjectsAnalyzeAllResponse(analyzed=analyzed, skipped=skipped)
 
@@ -0,0 +1,42 @@
+"""Pydantic schemas for background analysis job responses."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+JobStatus = Literal["queued", "running", "completed", "failed", "cancelled"]
+JobProjectStatus = Literal["queued", "running", "analyzed", "skipped", "failed", "cancelled"]
+
+
+class AnalysisJobProjectProgress(BaseModel):
+    """Progress of one project within an analysis job."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    project_id: int
+    status: JobProjectStatus
+    reason: str | None
+    started_at: datetime | None
+    finished_at: datetime | None
+
+
+class AnalysisJobResponse(BaseModel):
+    """Status and per-project progress of a background analysis job."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    status: JobStatus
+    use_ai: bool
+    force: bool
+    cancel_requested: bool
+    error: str | None
+    total: int
+    completed: int
+    projects: list[AnalysisJobProjectProgress]
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
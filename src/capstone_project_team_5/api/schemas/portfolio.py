@@ -53,6 +53,21 @@ class PortfolioReorderRequest(BaseModel):
     item_ids: list[int]
 
 
+class PortfolioItemBatchEdit(BaseModel):
+    """Changes to one item in a batch update; omitted fields are left unchanged."""
+
+    id: int
+    title: str | None = None
+    markdown: str | None = None
+    display_order: int | None = None
+
+
+class PortfolioItemBatchUpdateRequest(BaseModel):
+    """Request body for editing several portfolio items at once."""
+
+    items: list[PortfolioItemBatchEdit]
+
+
 class PortfolioCreateRequest(BaseModel):
     """Request body for creating a new portfolio for a user."""
 
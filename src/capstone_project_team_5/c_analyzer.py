@@ -10,8 +10,10 @@ from __future__ import annotations
 
 import re
 from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 from capstone_project_team_5.constants.c_analysis_constants import (
     ALGORITHM_PATTERNS,
@@ -29,6 +31,13 @@ from capstone_project_team_5.constants.c_analysis_constants import (
     MODERN_CPP_FEATURES,
     POLYMORPHISM_INDICATORS,
 )
+from capstone_project_team_5.project_scan import ProjectScan, is_project_dir
+
+# Per-file statistics cached by content hash; bump when their format changes
+_FILE_CACHE_NAMESPACE = "c-v1"
+
+# CFileStats fields held as sets (stored as sorted lists in the cache)
+_SET_FIELDS = ("library_usage", "design_patterns", "data_structures", "algorithms_used")
 
 
 @dataclass
@@ -426,7 +435,9 @@ class CFileAnalyzer:
         return features
 
     @staticmethod
-    def analyze_file(file_path: Path, root: Path | None = None) -> CFileStats | None:
+    def analyze_file(
+        file_path: Path, root: Path | None = None, scan: ProjectScan | None = None
+    ) -> CFileStats | None:
         """Analyze a single C/C++ file.
 
         Assumes the caller has already validated that this is a C/C++ file.
@@ -434,12 +445,21 @@ class CFileAnalyzer:
         Args:
             file_path: Path to the C/C++ file (pre-validated).
             root: Optional root directory for relative path calculation.
+            scan: Optional scan the file belongs to; its contents are read
+                through the scan instead of from disk.
 
         Returns:
             CFileStats object with analysis results, or None if file cannot be read.
         """
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
+            if scan is not None:
+                content_stats = scan.cached_result(
+                    file_path, _FILE_CACHE_NAMESPACE, CFileAnalyzer._summarize_source
+                )
+            else:
+                content_stats = CFileAnalyzer._summarize_content(
+                    file_path.read_text(encoding="utf-8", errors="ignore")
+                )
         except Exception:
             return None
 
@@ -452,6 +472,30 @@ class CFileAnalyzer:
         else:
             rel_path = file_path.name
 
+        for name in _SET_FIELDS:
+            content_stats[name] = set(content_stats[name])
+
+        return CFileStats(
+            file_path=rel_path,
+            is_header=CFileAnalyzer._is_header_file(file_path),
+            **content_stats,
+        )
+
+    @staticmethod
+    def _summarize_source(data: bytes) -> dict[str, Any]:
+        return CFileAnalyzer._summarize_content(data.decode("utf-8", errors="ignore"))
+
+    @staticmethod
+    def _summarize_content(content: str) -> dict[str, Any]:
+        """Compute the content-derived CFileStats fields of one file.
+
+        Args:
+            content: Source text of the file.
+
+        Returns:
+            JSON-serializable mapping of CFileStats field names to values, with
+            set fields as sorted lists.
+        """
         # Remove comments and count them
         clean_content, comment_lines = CFileAnalyzer._remove_comments(content)
 
@@ -460,134 +504,67 @@ class CFileAnalyzer:
 
         # Count lines of code (non-empty, non-comment lines)
         lines = [line for line in clean_content.split("\n") if line.strip()]
-        lines_of_code = len(lines)
-        total_lines = len(content.split("\n"))
-
-        # Analyze code
-        stats = CFileStats(
-            file_path=rel_path,
-            is_header=CFileAnalyzer._is_header_file(file_path),
-            lines_of_code=lines_of_code,
-            total_lines=total_lines,
-            comment_lines=comment_lines,
-            function_count=CFileAnalyzer._count_functions(clean_content),
-            struct_count=CFileAnalyzer._count_structs(clean_content),
-            class_count=CFileAnalyzer._count_classes(clean_content),
-            include_count=len(includes),
-            includes=includes,
-            has_main=CFileAnalyzer._has_main_function(clean_content),
-            complexity_score=CFileAnalyzer._calculate_complexity(clean_content),
-            uses_pointers=CFileAnalyzer._detect_pointers(clean_content),
-            uses_memory_management=CFileAnalyzer._detect_memory_management(clean_content),
-            uses_concurrency=CFileAnalyzer._detect_concurrency(clean_content),
-            uses_error_handling=CFileAnalyzer._detect_error_handling(clean_content),
-            library_usage=CFileAnalyzer._detect_libraries(includes),
-        )
 
         # Detect OOP and advanced features
         oop_features = CFileAnalyzer._detect_oop_features(clean_content)
-        stats.uses_inheritance = oop_features["inheritance"]
-        stats.uses_polymorphism = oop_features["polymorphism"]
-        stats.uses_templates = oop_features["templates"]
-        stats.uses_lambda = oop_features["lambda"]
-        stats.uses_modern_cpp = oop_features["modern_cpp"]
-        stats.design_patterns = oop_features["design_patterns"]
-        stats.data_structures = oop_features["data_structures"]
-        stats.algorithms_used = oop_features["algorithms"]
 
-        return stats
+        return {
+            "lines_of_code": len(lines),
+            "total_lines": len(content.split("\n")),
+            "comment_lines": comment_lines,
+            "function_count": CFileAnalyzer._count_functions(clean_content),
+            "struct_count": CFileAnalyzer._count_structs(clean_content),
+            "class_count": CFileAnalyzer._count_classes(clean_content),
+            "include_count": len(includes),
+            "includes": includes,
+            "has_main": CFileAnalyzer._has_main_function(clean_content),
+            "complexity_score": CFileAnalyzer._calculate_complexity(clean_content),
+            "uses_pointers": CFileAnalyzer._detect_pointers(clean_content),
+            "uses_memory_management": CFileAnalyzer._detect_memory_management(clean_content),
+            "uses_concurrency": CFileAnalyzer._detect_concurrency(clean_content),
+            "uses_error_handling": CFileAnalyzer._detect_error_handling(clean_content),
+            "library_usage": sorted(CFileAnalyzer._detect_libraries(includes)),
+            "uses_inheritance": oop_features["inheritance"],
+            "uses_polymorphism": oop_features["polymorphism"],
+            "uses_templates": oop_features["templates"],
+            "uses_lambda": oop_features["lambda"],
+            "uses_modern_cpp": oop_features["modern_cpp"],
+            "design_patterns": sorted(oop_features["design_patterns"]),
+            "data_structures": sorted(oop_features["data_structures"]),
+            "algorithms_used": sorted(oop_features["algorithms"]),
+        }
 
     @staticmethod
-    def analyze_project(project_root: Path | str) -> CProjectSummary:
+    def analyze_project(
+        project_root: Path | str, scan: ProjectScan | None = None
+    ) -> CProjectSummary:
         """Analyze all C/C++ files in a project directory.
 
         Args:
             project_root: Path to the project root directory.
+            scan: Optional pre-built scan of the project; avoids walking it again.
 
         Returns:
             CProjectSummary with aggregated statistics.
         """
         root = Path(project_root)
-        summary = CProjectSummary()
 
-        if not root.exists() or not root.is_dir():
-            return summary
+        if not is_project_dir(root, scan):
+            return CProjectSummary()
 
         # Find all C/C++ files (by extension)
-        c_files = [f for f in root.rglob("*") if f.is_file() and f.suffix in ALL_C_EXTENSIONS]
-
-        # Analyze each file
-        all_includes: Counter[str] = Counter()
-
-        for file_path in c_files:
-            stats = CFileAnalyzer.analyze_file(file_path, root)
-            if stats is None:
-                continue
-
-            summary.file_stats.append(stats)
-            summary.total_files += 1
-
-            if stats.is_header:
-                summary.header_files += 1
-            else:
-                summary.source_files += 1
-
-            summary.total_lines_of_code += stats.lines_of_code
-            summary.total_functions += stats.function_count
-            summary.total_structs += stats.struct_count
-            summary.total_classes += stats.class_count
-
-            if stats.has_main:
-                summary.has_main = True
-
-            summary.uses_pointers = summary.uses_pointers or stats.uses_pointers
-            summary.uses_memory_management = (
-                summary.uses_memory_management or stats.uses_memory_management
-            )
-            summary.uses_concurrency = summary.uses_concurrency or stats.uses_concurrency
-            summary.uses_error_handling = summary.uses_error_handling or stats.uses_error_handling
-
-            summary.libraries_used.update(stats.library_usage)
-
-            # Aggregate OOP and advanced features
-            summary.uses_inheritance = summary.uses_inheritance or stats.uses_inheritance
-            summary.uses_polymorphism = summary.uses_polymorphism or stats.uses_polymorphism
-            summary.uses_templates = summary.uses_templates or stats.uses_templates
-            summary.uses_lambda = summary.uses_lambda or stats.uses_lambda
-            summary.uses_modern_cpp = summary.uses_modern_cpp or stats.uses_modern_cpp
-            summary.design_patterns.update(stats.design_patterns)
-            summary.data_structures.update(stats.data_structures)
-            summary.algorithms_used.update(stats.algorithms_used)
-
-            # Track include usage
-            for include in stats.includes:
-                all_includes[include] += 1
-
-        # Calculate averages
-        if summary.total_files > 0:
-            total_complexity = sum(stat.complexity_score for stat in summary.file_stats)
-            summary.avg_complexity = total_complexity / summary.total_files
-
-            # Calculate OOP score (0-10)
-            oop_score = 0
-            if summary.total_classes > 0:
-                oop_score += 2
-            if summary.uses_inheritance:
-                oop_score += 2
-            if summary.uses_polymorphism:
-                oop_score += 2
-            if summary.uses_templates:
-                oop_score += 1
-            if summary.uses_modern_cpp:
-                oop_score += 1
-            if len(summary.design_patterns) > 0:
-                oop_score += 2
-            summary.oop_score = min(oop_score, 10)
-
-        # Get most common includes
-        summary.common_includes = all_includes.most_common(10)
+        if scan is not None:
+            c_files = [
+                scan.absolute_path(entry)
+                for entry in scan.iter_files(suffixes=ALL_C_EXTENSIONS)
+                if Path(entry.name).suffix in ALL_C_EXTENSIONS
+            ]
+        else:
+            c_files = [f for f in root.rglob("*") if f.is_file() and f.suffix in ALL_C_EXTENSIONS]
 
-        return summary
+        # Analyze each file and merge the per-file statistics
+        file_stats = (CFileAnalyzer.analyze_file(file_path, root, scan) for file_path in c_files)
+        return _summarize_files(stats for stats in file_stats if stats is not None)
 
     @staticmethod
     def generate_summary_text(summary: CProjectSummary) -> str:
@@ -684,16 +661,17 @@ class CFileAnalyzer:
         return "\n".join(lines)
 
 
-def analyze_c_project(project_root: Path | str) -> CProjectSummary:
+def analyze_c_project(project_root: Path | str, scan: ProjectScan | None = None) -> CProjectSummary:
     """Analyze a C/C++ project and return summary statistics.
 
     Args:
         project_root: Path to the project root directory.
+        scan: Optional pre-built scan of the project root.
 
     Returns:
         CProjectSummary with analysis results.
     """
-    return CFileAnalyzer.analyze_project(project_root)
+    return CFileAnalyzer.analyze_project(project_root, scan)
 
 
 def analyze_c_files(files: list[Path], root: Path | None = None) -> CProjectSummary:
@@ -706,17 +684,26 @@ def analyze_c_files(files: list[Path], root: Path | None = None) -> CProjectSumm
         files: List of C/C++ file paths (pre-validated).
         root: Optional root directory for relative path calculation.
 
+    Returns:
+        CProjectSummary with aggregated statistics.
+    """
+    file_stats = (CFileAnalyzer.analyze_file(file_path, root) for file_path in files)
+    return _summarize_files(stats for stats in file_stats if stats is not None)
+
+
+def _summarize_files(file_stats: Iterable[CFileStats]) -> CProjectSummary:
+    """Merge per-file statistics into a project summary.
+
+    Args:
+        file_stats: Statistics of every analyzed file.
+
     Returns:
         CProjectSummary with aggregated statistics.
     """
     summary = CProjectSummary()
     all_includes: Counter[str] = Counter()
 
-    for file_path in files:
-        stats = CFileAnalyzer.analyze_file(file_path, root)
-        if stats is None:
-            continue
-
+    for stats in file_stats:
         summary.file_stats.append(stats)
         summary.total_files += 1
 
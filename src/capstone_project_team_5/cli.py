@@ -11,9 +11,10 @@ from zipfile import ZipFile
 from capstone_project_team_5.collab_detect import CollabDetector
 from capstone_project_team_5.consent_tool import ConsentTool
 from capstone_project_team_5.contribution_metrics import ContributionMetrics
-from capstone_project_team_5.file_walker import DirectoryWalker
+from capstone_project_team_5.file_walker import DirectoryWalker, WalkResult
 from capstone_project_team_5.models import InvalidZipError
 from capstone_project_team_5.models.upload import DetectedProject
+from capstone_project_team_5.project_scan import ProjectScan
 from capstone_project_team_5.services import (
     get_project_uploads,
     incremental_upload_zip,
@@ -25,7 +26,8 @@ from capstone_project_team_5.services.bullet_generator import (
 from capstone_project_team_5.services.code_analysis_persistence import (
     save_code_analysis_to_db,
 )
-from capstone_project_team_5.services.project_analysis import ProjectAnalysis, analyze_project
+from capstone_project_team_5.services.content_store import get_file_result_cache
+from capstone_project_team_5.services.project_analysis import ProjectAnalysis
 from capstone_project_team_5.services.ranking import update_project_ranks
 from capstone_project_team_5.utils import display_upload_result, prompt_for_zip_file
 from capstone_project_team_5.workflows import analysis_pipeline
@@ -109,6 +111,7 @@ def _display_project_analyses(
     analyzed = 0
     project_scores: list[tuple[str, str, float, dict[str, float]]] = []
 
+    targets: list[tuple[DetectedProject, Path, WalkResult]] = []
     for project in projects:
         project_path = _resolve_project_path(extract_root, project.rel_path)
         if project_path is None or not project_path.is_dir():
@@ -118,9 +121,23 @@ def _display_project_analyses(
             walk_result = DirectoryWalker.walk(project_path)
         except ValueError:
             continue
+        targets.append((project, project_path, walk_result))
+
+    # Run the unified (CPU-heavy) analysis for every project up front and in
+    # parallel; output below is still printed one project at a time, in order.
+    with analysis_pipeline.AnalysisWorkers(None if len(targets) > 1 else 1) as workers:
+        analyses = workers.map(
+            lambda target: workers.analyze(
+                target[1],
+                consent_tool,
+                ProjectScan.build(target[1], file_cache=get_file_result_cache()),
+            ),
+            targets,
+        )
 
-        # Run unified analysis once (includes language detection, skills, C++ analyzer, etc.)
-        analysis = analyze_project(project_path, consent_tool)
+    for (project, project_path, walk_result), analysis in zip(targets, analyses, strict=True):
+        if analysis is None:
+            continue
         language = analysis.language
         framework = analysis.framework
         tools = analysis.tools
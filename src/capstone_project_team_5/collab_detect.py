@@ -1,9 +1,11 @@
+from io import BytesIO
 from pathlib import Path
 
 from docx import Document
 from pypdf import PdfReader
 
-from capstone_project_team_5.utils.git import is_git_repo, run_git
+from capstone_project_team_5.project_scan import ProjectScan
+from capstone_project_team_5.utils.git import GitHistory, is_git_repo, run_git
 
 
 class CollabDetector:
@@ -13,7 +15,9 @@ class CollabDetector:
     """
 
     @staticmethod
-    def collaborator_summary(root: Path) -> tuple[int, set[str]]:
+    def collaborator_summary(
+        root: Path, scan: ProjectScan | None = None, history: GitHistory | None = None
+    ) -> tuple[int, set[str]]:
         """
         Returns a summary of collaboration for the given project.
         Returns the number of collaborators found and their identities
@@ -21,20 +25,27 @@ class CollabDetector:
 
         Args:
             root: Project root directory.
+            scan: Optional pre-built scan of the project. Virtual scans are
+                never treated as Git repositories.
+            history: Optional pre-loaded Git history of the project. When given,
+                the project is known to be a repository and authors are read
+                from it instead of running git.
 
         Returns:
             tuple: Number of collaborators and their identities.
         """
 
-        if is_git_repo(path=root):
-            git_authors = CollabDetector._git_authors(root=root)
+        if history is not None or (
+            (scan is None or not scan.is_virtual) and is_git_repo(path=root)
+        ):
+            git_authors = CollabDetector._git_authors(root=root, history=history)
             return len(git_authors), git_authors
 
-        doc_authors = CollabDetector._document_authors(root=root)
+        doc_authors = CollabDetector._document_authors(root=root, scan=scan)
         if doc_authors:
             return len(doc_authors), doc_authors
 
-        ownership_ids = CollabDetector._file_ownership(root=root)
+        ownership_ids = CollabDetector._file_ownership(root=root, scan=scan)
         if ownership_ids:
             str_uids = {str(uid) for uid in ownership_ids}
             return len(str_uids), str_uids
@@ -69,12 +80,14 @@ class CollabDetector:
         return f"👥 {num} {plural} detected: {names_list}"
 
     @staticmethod
-    def number_of_collaborators(root: Path) -> int:
+    def number_of_collaborators(root: Path, scan: ProjectScan | None = None) -> int:
         """
         Scans a given project directory and returns the number of contributors.
 
         Args:
             root: Project root directory.
+            scan: Optional pre-built scan of the project. Virtual scans are
+                never treated as Git repositories.
 
         Returns:
             int: Count of found contributors.
@@ -82,17 +95,18 @@ class CollabDetector:
 
         # sequential fallback for each method
 
-        authors = CollabDetector._git_authors(root)
+        if scan is None or not scan.is_virtual:
+            authors = CollabDetector._git_authors(root)
 
-        if len(authors) > 1:
-            return len(authors)
+            if len(authors) > 1:
+                return len(authors)
 
-        authors = CollabDetector._file_ownership(root)
+        authors = CollabDetector._file_ownership(root, scan)
 
         if len(authors) > 1:
             return len(authors)
 
-        authors = CollabDetector._document_authors(root)
+        authors = CollabDetector._document_authors(root, scan)
 
         if len(authors) > 1:
             return len(authors)
@@ -100,26 +114,28 @@ class CollabDetector:
         return 1
 
     @staticmethod
-    def is_collaborative(root: Path) -> bool:
+    def is_collaborative(root: Path, scan: ProjectScan | None = None) -> bool:
         """
         Uses multiple methods to distinguish if a project
         appears to be a collaborative project or not.
 
         Args:
             root: Project root directory.
+            scan: Optional pre-built scan of the project.
 
         Returns:
             boolean: Returns True if the project appears to be collaborative else False.
         """
-        return CollabDetector.number_of_collaborators(root) > 1
+        return CollabDetector.number_of_collaborators(root, scan) > 1
 
     @staticmethod
-    def _git_authors(root: Path) -> set[str]:
+    def _git_authors(root: Path, history: GitHistory | None = None) -> set[str]:
         """
         Returns the set of authors working on a project if root is a git repository.
 
         Args:
             root: Project root directory.
+            history: Optional pre-loaded Git history of the project.
 
         Returns:
             set[str]: Returns set of author names.
@@ -128,6 +144,11 @@ class CollabDetector:
         ignore_list = {"github-classroom[bot]", "dependabot[bot]", "GitHub"}
         authors: set[str] = set()
 
+        if history is not None:
+            # Same identities as ``git shortlog -sc --all``: committers on every ref.
+            committers = {history.committers[i].strip() for i in history.commit_indices("--all")}
+            return {name for name in committers if name and name not in ignore_list}
+
         # check if root is a repo
         if not is_git_repo(path=root):
             return authors
@@ -166,13 +187,15 @@ class CollabDetector:
         return authors
 
     @staticmethod
-    def _file_ownership(root: Path) -> set[int]:
+    def _file_ownership(root: Path, scan: ProjectScan | None = None) -> set[int]:
         """
         Scans all files under the root directory and returns a set of unique ID's
         representing ownership.
 
         Args:
             root: Project root directory.
+            scan: Optional pre-built scan of the project. Virtual scans carry no
+                ownership information and yield an empty set.
 
         Returns:
             set[int]: Sets of unique ID's representing ownership contributions.
@@ -181,10 +204,14 @@ class CollabDetector:
         uids: set[int] = set()
         gids: set[int] = set()
 
-        for file_path in root.rglob("*"):
-            if not file_path.is_file():
-                continue
+        if scan is not None:
+            if scan.is_virtual:
+                return uids
+            candidates = [scan.absolute_path(entry) for entry in scan.files]
+        else:
+            candidates = [path for path in root.rglob("*") if path.is_file()]
 
+        for file_path in candidates:
             try:
                 stat_info = file_path.stat()
                 uids.add(stat_info.st_uid)
@@ -203,22 +230,28 @@ class CollabDetector:
             return uids or gids
 
     @staticmethod
-    def _document_authors(root: Path) -> set[str]:
+    def _document_authors(root: Path, scan: ProjectScan | None = None) -> set[str]:
         """
         Scans document files (.docx, .pdf) under the root folder
         and returns a set of unique authors found in the file metadata.
+
+        When ``scan`` is given, documents are taken from its index and read
+        through it rather than from the filesystem.
         """
 
         authors: set[str] = set()
         ignore_list = {"Unknown", None, "python-docx"}
 
-        for file_path in root.rglob("*"):
-            if not file_path.is_file():
-                continue
+        if scan is not None:
+            candidates = [scan.absolute_path(entry) for entry in scan.with_suffix(".docx", ".pdf")]
+        else:
+            candidates = [path for path in root.rglob("*") if path.is_file()]
 
+        for file_path in candidates:
             try:
+                source = BytesIO(scan.read_bytes(file_path)) if scan is not None else file_path
                 if file_path.suffix.lower() == ".docx":
-                    doc: Document = Document(file_path)
+                    doc: Document = Document(source)
                     properties = doc.core_properties
 
                     if properties and properties.author not in ignore_list:
@@ -232,7 +265,7 @@ class CollabDetector:
                         authors.add(properties.last_modified_by.strip())
 
                 elif file_path.suffix.lower() == ".pdf":
-                    reader = PdfReader(file_path)
+                    reader = PdfReader(source)
                     info = reader.metadata
                     if info and info.author and info.author not in ignore_list:
                         authors.add(info.author.strip())
@@ -1,19 +1,29 @@
 from __future__ import annotations
 
-import re
 from collections import Counter
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from capstone_project_team_5.constants.contribution_metrics_constants import (
     CONTRIBUTION_CATEGORIES,
     SKIP_DIRS,
 )
 from capstone_project_team_5.utils.git import (
+    GitHistory,
     is_git_repo,
     list_changed_files,
     list_commit_dates,
 )
+from capstone_project_team_5.utils.path_classifier import PathClassifier, PathRule
+
+if TYPE_CHECKING:
+    from capstone_project_team_5.project_scan import ProjectScan
+
+_CONTRIBUTION_CLASSIFIER = PathClassifier(
+    (PathRule(category, tuple(patterns)) for category, patterns in CONTRIBUTION_CATEGORIES.items()),
+    ignore_case=True,
+)
 
 
 class ContributionMetrics:
@@ -92,7 +102,9 @@ class ContributionMetrics:
         return f"Metrics {source}: {metrics_str}"
 
     @staticmethod
-    def get_project_duration(root: Path) -> tuple[timedelta, str]:
+    def get_project_duration(
+        root: Path, scan: ProjectScan | None = None, history: GitHistory | None = None
+    ) -> tuple[timedelta, str]:
         """
         Returns project duration for the given project, choosing
         between Git-based or filesystem-based analysis depending
@@ -100,6 +112,9 @@ class ContributionMetrics:
 
         Args:
             root: Project root directory.
+            scan: Optional pre-built scan of the project, used for non-Git projects.
+                Virtual scans are never treated as Git repositories.
+            history: Optional pre-loaded Git history; implies a Git project.
 
         Returns:
             Tuple: Project duration and formatted string.
@@ -107,10 +122,10 @@ class ContributionMetrics:
 
         # Sequential fallback, test for Git repo first
 
-        if is_git_repo(root):
-            return ContributionMetrics._get_git_project_duration(root=root)
+        if history is not None or ((scan is None or not scan.is_virtual) and is_git_repo(root)):
+            return ContributionMetrics._get_git_project_duration(root=root, history=history)
 
-        return ContributionMetrics._get_non_git_project_duration(root=root)
+        return ContributionMetrics._get_non_git_project_duration(root=root, scan=scan)
 
     @staticmethod
     def get_project_dates(root: Path) -> tuple[date | None, date | None]:
@@ -129,7 +144,9 @@ class ContributionMetrics:
         return start_dt.date(), end_dt.date()
 
     @staticmethod
-    def get_project_contribution_metrics(root: Path) -> tuple[dict[str, int], str]:
+    def get_project_contribution_metrics(
+        root: Path, scan: ProjectScan | None = None, history: GitHistory | None = None
+    ) -> tuple[dict[str, int], str]:
         """
         Returns contribution metrics (e.g., code vs test vs design vs document)
         for the given project, choosing between Git-based or filesystem-based
@@ -137,6 +154,9 @@ class ContributionMetrics:
 
         Args:
             root: Project root directory.
+            scan: Optional pre-built scan of the project, used for non-Git projects.
+                Virtual scans are never treated as Git repositories.
+            history: Optional pre-loaded Git history; implies a Git project.
 
         Returns:
             tuple[dict[str, int], str] Dict with contribution type and frequency and their source.
@@ -144,17 +164,19 @@ class ContributionMetrics:
 
         # Sequential fallback, test for Git repo first.
 
-        if is_git_repo(root):
-            metrics = ContributionMetrics._get_git_contribution_metrics(root=root)
+        if history is not None or ((scan is None or not scan.is_virtual) and is_git_repo(root)):
+            metrics = ContributionMetrics._get_git_contribution_metrics(root=root, history=history)
             source = "based on Git commits"
         else:
-            metrics = ContributionMetrics._get_non_git_contribution_metrics(root=root)
+            metrics = ContributionMetrics._get_non_git_contribution_metrics(root=root, scan=scan)
             source = "based on file counts"
 
         return metrics, source
 
     @staticmethod
-    def _get_git_project_duration(root: Path, dates: bool = False) -> tuple:
+    def _get_git_project_duration(
+        root: Path, dates: bool = False, history: GitHistory | None = None
+    ) -> tuple:
         """
         Returns the duration between the initial and
         most recent commit for the given Git project,
@@ -163,6 +185,7 @@ class ContributionMetrics:
         Args:
             root: Project root directory.
             dates: If true returns start and end date tuple.
+            history: Optional pre-loaded Git history to read commit dates from.
 
         Returns:
             Tuple: Project duration and formatted string, OR
@@ -170,8 +193,11 @@ class ContributionMetrics:
         """
 
         try:
-            commit_dates = list_commit_dates(root, rev_range="--all")
+            commit_dates = list_commit_dates(root, rev_range="--all", history=history)
         except RuntimeError:
+            commit_dates = []
+
+        if not commit_dates:
             if dates:
                 return None, None
             return timedelta(0), "Failed running command."
@@ -187,7 +213,9 @@ class ContributionMetrics:
         )
 
     @staticmethod
-    def _get_non_git_project_duration(root: Path) -> tuple[timedelta, str]:
+    def _get_non_git_project_duration(
+        root: Path, scan: ProjectScan | None = None
+    ) -> tuple[timedelta, str]:
         """
         Returns the duration between the initial and
         most recent commit for the given non-Git project,
@@ -195,11 +223,30 @@ class ContributionMetrics:
 
         Args:
             root: Project root directory.
+            scan: Optional pre-built scan of the project. When given, the
+                timestamps recorded during the scan are used instead of
+                re-walking and re-statting every file.
 
         Returns:
             Tuple: Project duration and formatted string.
         """
 
+        if scan is not None:
+            timestamps = [
+                datetime.fromtimestamp(value, tz=UTC)
+                for entry in scan.iter_files(skip_dirs=SKIP_DIRS)
+                if not entry.name.startswith(".") and entry.name.lower() not in SKIP_DIRS
+                for value in (entry.ctime, entry.mtime)
+                if value
+            ]
+
+            if not timestamps:
+                return timedelta(0), "No files found."
+
+            return ContributionMetrics._format_project_duration(
+                start_time=min(timestamps), end_time=max(timestamps)
+            )
+
         all_files = [
             f
             for f in root.rglob("*")
@@ -248,26 +295,28 @@ class ContributionMetrics:
         Classifies a file path into a category (code, test, design, document, etc.)
         based on regex patterns defined in CONTRIBUTION_CATEGORIES.
         """
-        for category, patterns in CONTRIBUTION_CATEGORIES.items():
-            if any(re.search(pattern, filepath, re.IGNORECASE) for pattern in patterns):
-                return category
-        return "other"
+        return _CONTRIBUTION_CLASSIFIER.classify(filepath) or "other"
 
     @staticmethod
-    def _get_git_contribution_metrics(root: Path) -> dict[str, int]:
+    def _get_git_contribution_metrics(
+        root: Path, history: GitHistory | None = None
+    ) -> dict[str, int]:
         """
         Analyzes Git commit history to classify contributions
         by activity type.
 
         Args:
             root: Project root directory.
+            history: Optional pre-loaded Git history to read changed files from.
 
         Returns:
             dict[str, int] Contribution type with frequency.
         """
 
         try:
-            files_changed = list_changed_files(root, all=True, include_merges=False)
+            files_changed = list_changed_files(
+                root, all=True, include_merges=False, history=history
+            )
         except RuntimeError:
             return {}
 
@@ -280,19 +329,30 @@ class ContributionMetrics:
         return dict(category_counts)
 
     @staticmethod
-    def _get_non_git_contribution_metrics(root: Path) -> dict[str, int]:
+    def _get_non_git_contribution_metrics(
+        root: Path, scan: ProjectScan | None = None
+    ) -> dict[str, int]:
         """
         Finds contribution frequency for non-Git
         project types.
 
         Args:
             root: Project root directory.
+            scan: Optional pre-built scan of the project.
 
         Returns:
             dict[str, int] Contribution type with frequency.
         """
         category_counts = Counter()
 
+        if scan is not None:
+            for entry in scan.iter_files(skip_dirs=SKIP_DIRS):
+                if entry.name.lower() in SKIP_DIRS:
+                    continue
+                category = ContributionMetrics._get_file_category(str(Path(entry.rel_path)))
+                category_counts[category] += 1
+            return dict(category_counts)
+
         all_files = [
             f
             for f in root.rglob("*")
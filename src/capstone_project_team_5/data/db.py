@@ -65,6 +65,7 @@ def _ensure_tables_created() -> None:
     """Ensure all ORM tables are created (called automatically on first engine access)."""
     # Import ORM models so their metadata is registered on Base before create_all.
     from capstone_project_team_5.data.models import (  # noqa: F401
+        analysis_job,
         artifact_source,
         code_analysis,
         consent_record,
@@ -115,6 +116,24 @@ def _run_migrations() -> None:
         with _engine.begin() as conn:
             conn.execute(text("ALTER TABLE upload_records ADD COLUMN user_id INTEGER"))
 
+    # --- code_analyses table ---
+    analysis_cols = [c["name"] for c in inspector.get_columns("code_analyses")]
+    if "updated_at" not in analysis_cols:
+        with _engine.begin() as conn:
+            conn.execute(text("ALTER TABLE code_analyses ADD COLUMN updated_at DATETIME"))
+            conn.execute(text("UPDATE code_analyses SET updated_at = created_at"))
+
+    # --- analysis_jobs table ---
+    job_cols = [c["name"] for c in inspector.get_columns("analysis_jobs")]
+    job_migrations = [
+        ("worker_id", "ALTER TABLE analysis_jobs ADD COLUMN worker_id TEXT"),
+        ("lease_expires_at", "ALTER TABLE analysis_jobs ADD COLUMN lease_expires_at DATETIME"),
+    ]
+    for col, stmt in job_migrations:
+        if col not in job_cols:
+            with _engine.begin() as conn:
+                conn.execute(text(stmt))
+
     # --- portfolios / portfolio_items tables ---
     portfolio_migrations = [
         "ALTER TABLE portfolios ADD COLUMN share_token TEXT UNIQUE",
@@ -13,11 +13,14 @@ This package provides SQLAlchemy ORM models representing database tables:
 - Education: User educational history
 - WorkExperience: User work history
 - Portfolio: Collection of portfolio items for a user
+- AnalysisJob: Queued background analysis of one or more projects
+- AnalysisJobProject: Per-project progress within an analysis job
 
 All models inherit from the shared Base declarative class defined in data.db.
 """
 
 from capstone_project_team_5.data.db import Base
+from capstone_project_team_5.data.models.analysis_job import AnalysisJob, AnalysisJobProject
 from capstone_project_team_5.data.models.artifact_source import ArtifactSource
 from capstone_project_team_5.data.models.code_analysis import CodeAnalysis
 from capstone_project_team_5.data.models.consent_record import ConsentRecord
@@ -35,6 +38,8 @@ from capstone_project_team_5.data.models.work_experience import WorkExperience
 
 __all__ = [
     "Base",
+    "AnalysisJob",
+    "AnalysisJobProject",
     "ArtifactSource",
     "CodeAnalysis",
     "ConsentRecord",
@@ -0,0 +1,109 @@
+"""ORM models for analysis jobs and the per-project progress of each job."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from capstone_project_team_5.data.db import Base
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+ITEM_QUEUED = "queued"
+ITEM_RUNNING = "running"
+ITEM_ANALYZED = "analyzed"
+ITEM_SKIPPED = "skipped"
+ITEM_FAILED = "failed"
+ITEM_CANCELLED = "cancelled"
+
+
+class AnalysisJob(Base):
+    """A queued or running batch of project analyses.
+
+    Attributes:
+        id: Auto-incrementing primary key.
+        user_id: Foreign key to the user who requested the analysis.
+        status: One of ``queued``, ``running``, ``completed``, ``failed`` or
+            ``cancelled``.
+        use_ai: Whether AI-generated bullets were requested.
+        force: Whether cached analyses should be ignored.
+        cancel_requested: Set when the user cancels; checked between projects.
+        error: Failure message when the job itself could not run.
+        worker_id: Worker process running the job, while it is running.
+        lease_expires_at: UTC timestamp after which a running job is
+            considered abandoned by its worker and may be requeued.
+        created_at: UTC timestamp of when the job was queued.
+        started_at: UTC timestamp of when a worker claimed the job.
+        finished_at: UTC timestamp of when the job reached a final status.
+    """
+
+    __tablename__ = "analysis_jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    status: Mapped[str] = mapped_column(String, nullable=False, default=JOB_QUEUED, index=True)
+    use_ai: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    force: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    cancel_requested: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    worker_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    projects: Mapped[list[AnalysisJobProject]] = relationship(
+        "AnalysisJobProject",
+        back_populates="job",
+        cascade="all, delete-orphan",
+        order_by="AnalysisJobProject.position",
+    )
+
+
+class AnalysisJobProject(Base):
+    """Progress of a single project within an analysis job.
+
+    Attributes:
+        id: Auto-incrementing primary key.
+        job_id: Foreign key to the owning AnalysisJob.
+        project_id: Project to analyze.
+        position: Processing order within the job.
+        status: One of ``queued``, ``running``, ``analyzed``, ``skipped``,
+            ``failed`` or ``cancelled``.
+        reason: Why the project was skipped or failed, if it was.
+        started_at: UTC timestamp of when analysis of this project began.
+        finished_at: UTC timestamp of when analysis of this project ended.
+    """
+
+    __tablename__ = "analysis_job_projects"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    job_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("analysis_jobs.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    project_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    position: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    status: Mapped[str] = mapped_column(String, nullable=False, default=ITEM_QUEUED)
+    reason: Mapped[str | None] = mapped_column(Text, nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    job: Mapped[AnalysisJob] = relationship("AnalysisJob", back_populates="projects")
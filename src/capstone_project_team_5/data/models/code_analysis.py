@@ -29,6 +29,7 @@ class CodeAnalysis(Base):
         metrics_json: JSON string containing language-specific metrics.
         summary_text: Human-readable summary of the analysis.
         created_at: UTC timestamp of when the analysis was performed.
+        updated_at: UTC timestamp of when the analysis was last modified.
     """
 
     __tablename__ = "code_analyses"
@@ -46,5 +47,11 @@ class CodeAnalysis(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+    )
 
     project: Mapped[Project] = relationship("Project", back_populates="code_analyses")
@@ -4,6 +4,8 @@ import json
 from collections.abc import Iterable
 from pathlib import Path
 
+from capstone_project_team_5.project_scan import ProjectScan, is_project_dir
+
 try:
     import tomllib
 except ModuleNotFoundError:
@@ -14,17 +16,20 @@ class LanguageFrameworkDetector:
     """Detector for primary language and framework."""
 
     @staticmethod
-    def _read_text(path: Path) -> str:
-        """Read file text, tolerating failures.
+    def _read_text(scan: ProjectScan, rel_path: str) -> str:
+        """Read a scanned file's text, tolerating failures.
 
         Args:
-            path: Path to the file to read.
+            scan: Project scan index.
+            rel_path: Path of the file relative to the scan root.
 
         Returns:
-            File contents or an empty string when unreadable.
+            File contents or an empty string when missing or unreadable.
         """
+        if not scan.has_file(rel_path):
+            return ""
         try:
-            return path.read_text(encoding="utf-8", errors="ignore")
+            return scan.read_text(rel_path)
         except Exception:
             return ""
 
@@ -43,17 +48,17 @@ class LanguageFrameworkDetector:
         return any(needle.lower() in lowered for needle in needles)
 
     @staticmethod
-    def _from_pyproject(root: Path) -> tuple[str | None, str | None]:
+    def _from_pyproject(scan: ProjectScan) -> tuple[str | None, str | None]:
         """Detect Python framework from `pyproject.toml`.
 
         Args:
-            root: Project root directory.
+            scan: Project scan index.
 
         Returns:
             Tuple of detected language (or None) and framework (or None).
         """
-        pyproject = root / "pyproject.toml"
-        if not pyproject.exists():
+        pyproject = "pyproject.toml"
+        if not scan.has_file(pyproject):
             return None, None
 
         language: str | None = "Python"
@@ -62,7 +67,7 @@ class LanguageFrameworkDetector:
         deps: set[str] = set()
         try:
             if tomllib is not None:
-                data = tomllib.loads(LanguageFrameworkDetector._read_text(pyproject))
+                data = tomllib.loads(LanguageFrameworkDetector._read_text(scan, pyproject))
                 project = data.get("project", {})
                 for key in ("dependencies",):
                     values = project.get(key) or []
@@ -71,7 +76,7 @@ class LanguageFrameworkDetector:
                         name = name.split("<")[0].split(">")[0].split("=")[0]
                         deps.add(name.lower())
         except Exception:
-            content = LanguageFrameworkDetector._read_text(pyproject)
+            content = LanguageFrameworkDetector._read_text(scan, pyproject)
             for marker in ("fastapi", "django", "flask", "streamlit", "typer"):
                 if marker in content.lower():
                     deps.add(marker)
@@ -91,21 +96,20 @@ class LanguageFrameworkDetector:
         return language, framework
 
     @staticmethod
-    def _from_requirements(root: Path) -> tuple[str | None, str | None]:
+    def _from_requirements(scan: ProjectScan) -> tuple[str | None, str | None]:
         """Detect Python framework from requirements files.
 
         Args:
-            root: Project root directory.
+            scan: Project scan index.
 
         Returns:
             Tuple of detected language (or None) and framework (or None).
         """
         for fname in ("requirements.txt", "requirements-dev.txt"):
-            path = root / fname
-            if not path.exists():
+            if not scan.has_file(fname):
                 continue
 
-            content = LanguageFrameworkDetector._read_text(path)
+            content = LanguageFrameworkDetector._read_text(scan, fname)
             if not content:
                 continue
 
@@ -125,30 +129,27 @@ class LanguageFrameworkDetector:
         return None, None
 
     @staticmethod
-    def _from_package_json(root: Path) -> tuple[str | None, str | None]:
+    def _from_package_json(scan: ProjectScan) -> tuple[str | None, str | None]:
         """Detect JS/TS language and framework from `package.json`.
 
         Args:
-            root: Project root directory.
+            scan: Project scan index.
 
         Returns:
             Tuple of detected language (or None) and framework (or None).
         """
-        pkg = root / "package.json"
-        project_root = root
+        pkg = "package.json"
+        project_prefix = ""
 
-        if not pkg.exists():
-            nested = next(root.rglob("package.json"), None)
-            if nested is None:
+        if not scan.has_file(pkg):
+            nested = scan.named("package.json")
+            if not nested:
                 return None, None
-            pkg = nested
-            project_root = nested.parent
-
-        if not pkg.exists():
-            return None, None
+            pkg = nested[0].rel_path
+            project_prefix = pkg[: -len("package.json")]
 
         try:
-            data = json.loads(LanguageFrameworkDetector._read_text(pkg) or "{}")
+            data = json.loads(LanguageFrameworkDetector._read_text(scan, pkg) or "{}")
         except json.JSONDecodeError:
             data = {}
 
@@ -162,8 +163,9 @@ class LanguageFrameworkDetector:
         language: str | None = (
             "TypeScript"
             if any(
-                f.endswith(".ts") or f.endswith(".tsx")
-                for f in (p.name for p in project_root.rglob("*.ts*"))
+                entry.rel_path.startswith(project_prefix)
+                and (entry.name.endswith(".ts") or entry.name.endswith(".tsx"))
+                for entry in scan.with_suffix(".ts", ".tsx")
             )
             else "JavaScript"
         )
@@ -185,91 +187,89 @@ class LanguageFrameworkDetector:
                 break
 
         if framework is None and (
-            (project_root / "src-tauri" / "tauri.conf.json").exists()
-            or (project_root / "tauri.conf.json").exists()
+            scan.has_file(f"{project_prefix}src-tauri/tauri.conf.json")
+            or scan.has_file(f"{project_prefix}tauri.conf.json")
         ):
             framework = "Tauri"
 
         return language, framework
 
     @staticmethod
-    def _from_rust(root: Path) -> tuple[str | None, str | None]:
+    def _from_rust(scan: ProjectScan) -> tuple[str | None, str | None]:
         """Detect Rust and Tauri from Cargo manifests.
 
         Args:
-            root: Project root directory.
+            scan: Project scan index.
 
         Returns:
             Tuple of detected language (or None) and framework (or None).
         """
-        cargo = root / "Cargo.toml"
-        if not cargo.exists():
+        cargo = "Cargo.toml"
+        if not scan.has_file(cargo):
             return None, None
 
         language: str | None = "Rust"
         framework: str | None = None
-        content = LanguageFrameworkDetector._read_text(cargo)
+        content = LanguageFrameworkDetector._read_text(scan, cargo)
         if LanguageFrameworkDetector._contains_any(content, ("tauri",)):
             framework = "Tauri"
         return language, framework
 
     @staticmethod
-    def _from_go(root: Path) -> tuple[str | None, str | None]:
+    def _from_go(scan: ProjectScan) -> tuple[str | None, str | None]:
         """Detect Go from `go.mod` presence.
 
         Args:
-            root: Project root directory.
+            scan: Project scan index.
 
         Returns:
             Tuple of detected language (or None) and framework (or None).
         """
-        if (root / "go.mod").exists():
+        if scan.has_file("go.mod"):
             return "Go", None
         return None, None
 
     @staticmethod
-    def _from_dotnet(root: Path) -> tuple[str | None, str | None]:
+    def _from_dotnet(scan: ProjectScan) -> tuple[str | None, str | None]:
         """Detect .NET/C# projects and ASP.NET Core.
 
         Args:
-            root: Project root directory.
+            scan: Project scan index.
 
         Returns:
             Tuple of detected language (or None) and framework (or None).
         """
-        csproj = next(root.glob("*.csproj"), None)
-        if csproj is None:
+        if not any("/" not in entry.rel_path for entry in scan.with_suffix(".csproj")):
             return None, None
         language: str | None = "C#"
         framework: str | None = None
-        program = root / "Program.cs"
-        if program.exists():
-            content = LanguageFrameworkDetector._read_text(program)
+        if scan.has_file("Program.cs"):
+            content = LanguageFrameworkDetector._read_text(scan, "Program.cs")
             if LanguageFrameworkDetector._contains_any(content, ("WebApplication.CreateBuilder",)):
                 framework = ".NET ASP.NET Core"
         return language, framework
 
     @staticmethod
-    def _from_java(root: Path) -> tuple[str | None, str | None]:
+    def _from_java(scan: ProjectScan) -> tuple[str | None, str | None]:
         """Detect Java projects and Spring Boot markers.
 
         Args:
-            root: Project root directory.
+            scan: Project scan index.
 
         Returns:
             Tuple of detected language (or None) and framework (or None).
         """
         if (
-            (root / "pom.xml").exists()
-            or (root / "build.gradle").exists()
-            or (root / "build.gradle.kts").exists()
+            scan.has_file("pom.xml")
+            or scan.has_file("build.gradle")
+            or scan.has_file("build.gradle.kts")
         ):
             language: str | None = "Java"
             framework: str | None = None
             content = (
-                LanguageFrameworkDetector._read_text(root / "pom.xml")
-                + LanguageFrameworkDetector._read_text(root / "build.gradle")
-                + LanguageFrameworkDetector._read_text(root / "build.gradle.kts")
+                LanguageFrameworkDetector._read_text(scan, "pom.xml")
+                + LanguageFrameworkDetector._read_text(scan, "build.gradle")
+                + LanguageFrameworkDetector._read_text(scan, "build.gradle.kts")
             )
             if LanguageFrameworkDetector._contains_any(
                 content, ("spring-boot-starter", "springframework")
@@ -279,72 +279,77 @@ class LanguageFrameworkDetector:
         return None, None
 
     @staticmethod
-    def _from_php(root: Path) -> tuple[str | None, str | None]:
+    def _from_php(scan: ProjectScan) -> tuple[str | None, str | None]:
         """Detect PHP projects and Laravel markers.
 
         Args:
-            root: Project root directory.
+            scan: Project scan index.
 
         Returns:
             Tuple of detected language (or None) and framework (or None).
         """
-        if (root / "composer.json").exists():
+        if scan.has_file("composer.json"):
             language: str | None = "PHP"
             framework: str | None = None
-            if (root / "artisan").exists():
+            if scan.has_file("artisan"):
                 framework = "Laravel"
             return language, framework
         return None, None
 
     @staticmethod
-    def _from_ruby(root: Path) -> tuple[str | None, str | None]:
+    def _from_ruby(scan: ProjectScan) -> tuple[str | None, str | None]:
         """Detect Ruby projects and Rails markers.
 
         Args:
-            root: Project root directory.
+            scan: Project scan index.
 
         Returns:
             Tuple of detected language (or None) and framework (or None).
         """
-        if (root / "Gemfile").exists():
+        if scan.has_file("Gemfile"):
             language: str | None = "Ruby"
             framework: str | None = None
-            if (root / "bin" / "rails").exists() or (root / "config" / "application.rb").exists():
+            if scan.has_file("bin/rails") or scan.has_file("config/application.rb"):
                 framework = "Rails"
             return language, framework
         return None, None
 
     @staticmethod
-    def _from_c_cpp(root: Path) -> tuple[str | None, str | None]:
+    def _from_c_cpp(scan: ProjectScan) -> tuple[str | None, str | None]:
         """Detect C/C++ projects and CMake.
 
         Args:
-            root: Project root directory.
+            scan: Project scan index.
 
         Returns:
             Tuple of detected language (or None) and framework (or None).
         """
-        if (root / "CMakeLists.txt").exists():
+        if scan.has_file("CMakeLists.txt"):
             return "C/C++", "CMake"
-        for ext in (".c", ".cpp", ".cc", ".h", ".hpp"):
-            if next(root.rglob(f"*{ext}"), None) is not None:
-                return "C/C++", None
+        if scan.has_suffix(".c", ".cpp", ".cc", ".h", ".hpp"):
+            return "C/C++", None
         return None, None
 
 
-def identify_language_and_framework(project_root: Path | str) -> tuple[str, str | None]:
+def identify_language_and_framework(
+    project_root: Path | str, scan: ProjectScan | None = None
+) -> tuple[str, str | None]:
     """Identify the primary language and framework for a project.
 
     Args:
         project_root: Path to the project directory.
+        scan: Optional pre-built scan of ``project_root``; built on demand if omitted.
 
     Returns:
         Tuple of (language, framework). Returns ("Unknown", None) if undetermined.
     """
     root = Path(project_root)
-    if not root.exists() or not root.is_dir():
+    if not is_project_dir(root, scan):
         return "Unknown", None
 
+    if scan is None:
+        scan = ProjectScan.build(root)
+
     detectors = (
         LanguageFrameworkDetector._from_pyproject,
         LanguageFrameworkDetector._from_requirements,
@@ -359,16 +364,16 @@ def identify_language_and_framework(project_root: Path | str) -> tuple[str, str
     )
 
     for det in detectors:
-        language, framework = det(root)
+        language, framework = det(scan)
         if language is not None:
             return language, framework
 
     # As a final fallback, infer by file extensions
-    if next(root.rglob("*.py"), None) is not None:
+    if scan.has_suffix(".py"):
         return "Python", None
-    if next(root.rglob("*.ts"), None) is not None or next(root.rglob("*.tsx"), None) is not None:
+    if scan.has_suffix(".ts", ".tsx"):
         return "TypeScript", None
-    if next(root.rglob("*.js"), None) is not None:
+    if scan.has_suffix(".js"):
         return "JavaScript", None
 
     return "Unknown", None
@@ -0,0 +1,67 @@
+"""Content-addressed cache of per-file analysis results.
+
+Analyzers reduce each source file to a small JSON summary and merge the
+summaries into their project-level results. Summaries are stored under the
+file's SHA-256 and a namespace naming the analyzer and the version of its
+summary format, so identical content is parsed once no matter which project or
+upload it belongs to: re-analyzing a project after an incremental upload only
+parses the files whose content changed.
+
+Bump an analyzer's namespace version whenever its per-file summary changes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class FileResultCache:
+    """Per-file analysis summaries stored as ``<root>/<namespace>/<hash[:2]>/<hash>.json``.
+
+    The cache is best effort: unreadable entries count as misses and failed
+    writes are only logged. It holds nothing but its root, so scans carrying
+    it can still be sent to worker processes.
+    """
+
+    root: Path
+
+    def _entry_path(self, namespace: str, content_hash: str) -> Path:
+        return self.root / namespace / content_hash[:2] / f"{content_hash}.json"
+
+    def get(self, namespace: str, content_hash: str) -> dict[str, Any] | None:
+        """Return the summary stored for ``content_hash``, or None on a miss."""
+        entry_path = self._entry_path(namespace, content_hash)
+        try:
+            result = json.loads(entry_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable file result %s", entry_path, exc_info=True)
+            return None
+        return result if isinstance(result, dict) else None
+
+    def put(self, namespace: str, content_hash: str, result: dict[str, Any]) -> None:
+        """Store the summary of ``content_hash``; concurrent writers are safe."""
+        entry_path = self._entry_path(namespace, content_hash)
+        temp_path: Path | None = None
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=entry_path.parent, suffix=".tmp", delete=False
+            ) as handle:
+                temp_path = Path(handle.name)
+                json.dump(result, handle, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temp_path, entry_path)
+        except (OSError, TypeError, ValueError):
+            logger.warning("Could not cache file result %s", entry_path, exc_info=True)
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
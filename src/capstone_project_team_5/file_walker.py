@@ -8,6 +8,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from capstone_project_team_5.project_scan import ProjectScan
 
 
 @dataclass
@@ -133,6 +137,43 @@ class DirectoryWalker:
 
         return result
 
+    @staticmethod
+    def from_scan(
+        scan: ProjectScan,
+        ignore_patterns: set[str] | None = None,
+    ) -> WalkResult:
+        """Build a WalkResult from an existing project scan without re-walking.
+
+        Args:
+            scan: Pre-built scan of the directory.
+            ignore_patterns: Optional set of patterns to ignore. If None, uses defaults.
+
+        Returns:
+            WalkResult containing the scanned files that survive ``ignore_patterns``.
+        """
+        if ignore_patterns is None:
+            ignore_patterns = DirectoryWalker._get_default_ignore_patterns()
+
+        result = WalkResult(root=scan.root, ignore_patterns=ignore_patterns)
+
+        for entry in scan.files:
+            parts = entry.parts
+            if any(pattern in parts for pattern in ignore_patterns):
+                continue
+
+            absolute_path = scan.absolute_path(entry)
+            result.files.append(
+                FileInfo(
+                    path=str(Path(entry.rel_path)),
+                    absolute_path=absolute_path,
+                    name=entry.name,
+                    size_bytes=entry.size_bytes,
+                )
+            )
+            result.total_size_bytes += entry.size_bytes
+
+        return result
+
     @staticmethod
     def get_summary(result: WalkResult) -> dict[str, int]:
         """Get a summary dictionary from walk result.
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import tree_sitter_java as tsjava
 from tree_sitter import Language, Node, Parser, Tree
@@ -14,17 +15,29 @@ from capstone_project_team_5.constants.java_analyzer_constants import (
     SKIP_DIRS,
 )
 
+if TYPE_CHECKING:
+    from capstone_project_team_5.project_scan import ProjectScan
+
+# Per-file summaries cached by content hash; bump when their format changes
+_FILE_CACHE_NAMESPACE = "java-v1"
+
+# Per-file result fields merged into the project result
+_SUMMED_FIELDS = ("methods_count", "classes_count", "lines_of_code")
+_FLAG_FIELDS = ("uses_recursion", "uses_bfs", "uses_dfs")
+
 
 class JavaAnalyzer:
     """Analyzes Java source code using Tree-sitter for structural patterns."""
 
-    def __init__(self, project_root: Path | str) -> None:
+    def __init__(self, project_root: Path | str, scan: ProjectScan | None = None) -> None:
         """Initialize the analyzer with a Java project root directory.
 
         Args:
             project_root: Path to the Java project root directory
+            scan: Optional pre-built scan of the project; avoids walking it again
         """
         self.project_root = Path(project_root)
+        self.scan = scan
         self.parser: Parser | None = None
         self.result = {
             "data_structures": set(),
@@ -73,6 +86,13 @@ class JavaAnalyzer:
         Returns:
             List of paths to Java files
         """
+        if self.scan is not None:
+            return [
+                self.scan.absolute_path(entry)
+                for entry in self.scan.iter_files(suffixes=(".java",), skip_dirs=SKIP_DIRS)
+                if entry.name.endswith(".java")
+            ]
+
         java_files = []
         for root, dirs, files in os.walk(self.project_root):
             # Filter out directories to skip (in-place modification)
@@ -391,6 +411,9 @@ class JavaAnalyzer:
     def _analyze_file(self, file_path: Path) -> bool:
         """Analyze a single Java file and aggregate results.
 
+        With a scan carrying a file cache, a file whose content was analyzed
+        before is merged from its cached summary instead of being parsed.
+
         Args:
             file_path: Path to the Java file
 
@@ -398,11 +421,85 @@ class JavaAnalyzer:
             True if successful, False otherwise
         """
         try:
-            source_code = file_path.read_bytes()
+            if self.scan is not None:
+                summary = self.scan.cached_result(
+                    file_path, _FILE_CACHE_NAMESPACE, self._summarize_file
+                )
+            else:
+                summary = self._summarize_file(file_path.read_bytes())
         except (OSError, PermissionError):
             # File cannot be read, skip it entirely
             return False
 
+        if not summary.get("parsed"):
+            # Parsing failed, skip file
+            return False
+
+        self._merge_file_summary(summary)
+        self.result["files_analyzed"] += 1
+        return True
+
+    def _summarize_file(self, source_code: bytes) -> dict:
+        """Analyze one file's source into a JSON-serializable summary.
+
+        The tree passes accumulate into ``self.result``, so it is swapped for a
+        fresh per-file result while they run.
+
+        Args:
+            source_code: Java source code as bytes
+
+        Returns:
+            Per-file result; ``{"parsed": False}`` if parsing failed
+        """
+        project_result = self.result
+        self.result = {
+            "data_structures": set(),
+            "oop_principles": dict.fromkeys(project_result["oop_principles"], False),
+            "methods_count": 0,
+            "classes_count": 0,
+            "lines_of_code": 0,
+            "uses_recursion": False,
+            "uses_bfs": False,
+            "uses_dfs": False,
+            "coding_patterns": set(),
+            "imports": [],
+        }
+        try:
+            if not self._analyze_source(source_code):
+                return {"parsed": False}
+            file_result = self.result
+        finally:
+            self.result = project_result
+
+        return {
+            **file_result,
+            "parsed": True,
+            "data_structures": sorted(file_result["data_structures"]),
+            "coding_patterns": sorted(file_result["coding_patterns"]),
+        }
+
+    def _merge_file_summary(self, summary: dict) -> None:
+        """Fold one file's summary into the project result."""
+        for key in _SUMMED_FIELDS:
+            self.result[key] += summary[key]
+        for key in _FLAG_FIELDS:
+            self.result[key] = self.result[key] or summary[key]
+        for principle, present in summary["oop_principles"].items():
+            if present:
+                self.result["oop_principles"][principle] = True
+        self.result["data_structures"].update(summary["data_structures"])
+        self.result["coding_patterns"].update(summary["coding_patterns"])
+        self.result["imports"].extend(summary["imports"])
+
+    def _analyze_source(self, source_code: bytes) -> bool:
+        """Run all tree passes over one file's source, accumulating into ``self.result``.
+
+        Args:
+            source_code: Java source code as bytes
+
+        Returns:
+            True if successful, False if parsing failed
+        """
         tree = self._parse_code(source_code)
         if tree is None:
             # Parsing failed, skip file
@@ -431,7 +528,6 @@ class JavaAnalyzer:
         # Clear method bodies for this file to free memory
         self.current_method_bodies.clear()
 
-        self.result["files_analyzed"] += 1
         return True
 
     def analyze(self) -> dict[str, bool | int | list[str] | dict[str, bool] | str]:
@@ -455,12 +551,13 @@ class JavaAnalyzer:
             }
             On error: {"error": str}
         """
-        # Check if project root exists
-        if not self.project_root.exists():
-            return {"error": f"Project root does not exist: {self.project_root}"}
+        # Check if project root exists (virtual scans have no directory on disk)
+        if self.scan is None or not self.scan.is_virtual:
+            if not self.project_root.exists():
+                return {"error": f"Project root does not exist: {self.project_root}"}
 
-        if not self.project_root.is_dir():
-            return {"error": f"Project root is not a directory: {self.project_root}"}
+            if not self.project_root.is_dir():
+                return {"error": f"Project root is not a directory: {self.project_root}"}
 
         # Initialize parser
         if not self._initialize_parser():
@@ -495,6 +592,7 @@ class JavaAnalyzer:
 
 def analyze_java_project(
     project_root: Path | str,
+    scan: ProjectScan | None = None,
 ) -> dict[str, bool | int | list[str] | dict[str, bool] | str]:
     """Analyze all Java source files in a project directory.
 
@@ -503,6 +601,7 @@ def analyze_java_project(
 
     Args:
         project_root: Path to the Java project root directory
+        scan: Optional pre-built scan of the project root
 
     Returns:
         Dictionary with analysis results:
@@ -530,4 +629,4 @@ def analyze_java_project(
         Note: total_files >= files_analyzed. The difference indicates files that
         could not be parsed or read (e.g., permission errors, invalid syntax).
     """
-    return JavaAnalyzer(project_root).analyze()
+    return JavaAnalyzer(project_root, scan).analyze()
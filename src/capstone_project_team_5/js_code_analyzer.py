@@ -3,10 +3,12 @@ import os
 import re
 from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import esprima
+from esprima.nodes import Node
 
 from capstone_project_team_5.constants.js_ts_analysis_constants import (
     FEATURE_PATTERNS,
@@ -14,6 +16,86 @@ from capstone_project_team_5.constants.js_ts_analysis_constants import (
 )
 from capstone_project_team_5.constants.skill_detection_constants import SKIP_DIRS
 
+if TYPE_CHECKING:
+    from capstone_project_team_5.project_scan import ProjectScan
+
+# Per-file AST metrics cached by content hash; bump when their format changes.
+# TypeScript files are stripped before parsing, so they get their own namespace.
+_JS_FILE_CACHE_NAMESPACE = "js-ast-v1"
+_TS_FILE_CACHE_NAMESPACE = "ts-ast-v1"
+
+_DEFAULT_MAX_FILE_CHARS = 512 * 1024
+# Files averaging longer lines than this are minified bundles
+_MINIFIED_LINE_LENGTH = 500
+_MINIFIED_NAME = re.compile(r"[.-]min\.[cm]?js$")
+# An import or export declaration (not a dynamic import() or import.meta)
+_MODULE_SYNTAX = re.compile(r"^[ \t]*(?:import[\s{*'\"]|export\s)", re.MULTILINE)
+
+# Node types that add a branch to the complexity of the functions containing them
+_BRANCH_NODE_TYPES = frozenset(
+    {
+        "IfStatement",
+        "ConditionalExpression",
+        "WhileStatement",
+        "ForStatement",
+        "ForInStatement",
+        "ForOfStatement",
+        "CatchClause",
+        "SwitchCase",
+    }
+)
+_FUNCTION_NODE_TYPES = frozenset(
+    {"FunctionDeclaration", "FunctionExpression", "ArrowFunctionExpression"}
+)
+_EXPORT_NODE_TYPES = frozenset(
+    {"ExportNamedDeclaration", "ExportDefaultDeclaration", "ExportAllDeclaration"}
+)
+
+# TypeScript stripping rules, applied in order: (substrings a match needs,
+# pattern, replacement)
+_TYPESCRIPT_STRIP_RULES: tuple[tuple[tuple[str, ...], re.Pattern[str], str], ...] = (
+    # Remove import type statements
+    (
+        ("import", "type", "from"),
+        re.compile(r'import\s+type\s+.*?from\s+[\'"][^\'"]+[\'"];?'),
+        "",
+    ),
+    # Remove type-only imports
+    (
+        ("import", "type", "from"),
+        re.compile(r'import\s*\{\s*type\s+[^}]+\}\s*from\s+[\'"][^\'"]+[\'"];?'),
+        "",
+    ),
+    # Remove interface declarations
+    (("interface",), re.compile(r"interface\s+\w+\s*\{[^}]*\}", re.DOTALL), ""),
+    # Remove type aliases
+    (("type", "="), re.compile(r"type\s+\w+\s*=\s*[^;]+;"), ""),
+    # Remove generic type parameters from function/class declarations
+    (("<",), re.compile(r"<[A-Z]\w*(?:\s*,\s*[A-Z]\w*)*>(?=\s*\()"), ""),
+    # Remove return type annotations: ): Type {
+    (("):",), re.compile(r"\):\s*\w+(?:\[\])?(?:\s*\|\s*\w+)*\s*\{"), ") {"),
+    # Remove parameter type annotations: (param: Type)
+    ((":",), re.compile(r":\s*\w+(?:\[\])?(?:\s*\|\s*\w+)*(?=\s*[,\)])"), ""),
+    # Remove variable type annotations: const x: Type =
+    ((":", "="), re.compile(r":\s*\w+(?:\[\])?(?:\s*\|\s*\w+)*(?=\s*=)"), ""),
+    # Remove type assertions: as Type
+    (("as",), re.compile(r"\s+as\s+\w+"), ""),
+    # Remove angle bracket type assertions: <Type>
+    (("<", ">"), re.compile(r"<\w+>"), ""),
+    # Remove readonly, public, private, protected modifiers
+    ((), re.compile(r"\b(readonly|public|private|protected)\s+"), ""),
+    # Remove implements clause
+    (("implements",), re.compile(r"\s+implements\s+\w+(?:\s*,\s*\w+)*"), ""),
+)
+
+
+def _resolve_max_file_chars() -> int:
+    """Return the largest file to parse, from ``ZIP2JOB_JS_AST_MAX_FILE_CHARS``."""
+    try:
+        return max(int(os.getenv("ZIP2JOB_JS_AST_MAX_FILE_CHARS", "")), 0)
+    except ValueError:
+        return _DEFAULT_MAX_FILE_CHARS
+
 
 @dataclass
 class JSProjectSummary:
@@ -64,12 +146,55 @@ class ASTMetrics:
     design_patterns: set[str] = field(default_factory=set)
     uses_promises: bool = False
 
+    def merge(self, other: "ASTMetrics") -> None:
+        """Add another file's metrics to these."""
+
+        self.function_count += other.function_count
+        self.class_count += other.class_count
+        self.import_count += other.import_count
+        self.export_count += other.export_count
+        self.async_function_count += other.async_function_count
+        self.arrow_function_count += other.arrow_function_count
+        self.complexity_scores.extend(other.complexity_scores)
+        self.custom_hooks.update(other.custom_hooks)
+        self.design_patterns.update(other.design_patterns)
+        self.uses_promises = self.uses_promises or other.uses_promises
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serializable form of the metrics."""
+
+        return {
+            "function_count": self.function_count,
+            "class_count": self.class_count,
+            "import_count": self.import_count,
+            "export_count": self.export_count,
+            "async_function_count": self.async_function_count,
+            "arrow_function_count": self.arrow_function_count,
+            "complexity_scores": list(self.complexity_scores),
+            "custom_hooks": sorted(self.custom_hooks),
+            "design_patterns": sorted(self.design_patterns),
+            "uses_promises": self.uses_promises,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ASTMetrics":
+        """Rebuild metrics from ``to_dict`` output."""
+
+        return cls(
+            **{
+                **data,
+                "custom_hooks": set(data["custom_hooks"]),
+                "design_patterns": set(data["design_patterns"]),
+            }
+        )
+
 
 class ASTAnalyzer:
     """Handles AST-based code analysis for JavaScript/TypeScript."""
 
     def __init__(self):
         self.metrics = ASTMetrics()
+        self.max_file_chars = _resolve_max_file_chars()
 
     def analyze_file(self, code: str, file_path: str) -> None:
         """
@@ -80,182 +205,151 @@ class ASTAnalyzer:
             file_path: Path to the file (for context)
         """
 
-        if file_path.endswith((".ts", ".tsx")):
-            code = self._strip_typescript_syntax(code)
-
-        try:
-            ast = esprima.parseModule(code, {"jsx": True, "tolerant": True})
-            ast_dict = ast.toDict()
-            self._traverse(ast_dict)
-
-        except Exception:
-            # Fallback to script mode if module fails
-            try:
-                ast = esprima.parseScript(code, {"jsx": True, "tolerant": True})
-                ast_dict = ast.toDict()
-                self._traverse(ast_dict)
+        self.metrics.merge(self.summarize_file(code, file_path))
 
-            except Exception:
-                # If parsing fails completely, skip this file
-                pass
-
-    def _strip_typescript_syntax(self, code: str) -> str:
+    def summarize_file(self, code: str, file_path: str) -> ASTMetrics:
         """
-        Basic TypeScript syntax stripping for parsing.
+        Analyze a single file's AST without touching the accumulated metrics.
 
-        Note: This is a best-effort approach. Complex TypeScript may still fail to parse.
+        Args:
+            code: Source code content
+            file_path: Path to the file (for context)
+
+        Returns:
+            ASTMetrics of this file alone.
         """
 
-        # Remove import type statements
-        code = re.sub(r'import\s+type\s+.*?from\s+[\'"][^\'"]+[\'"];?', "", code)
+        project_metrics = self.metrics
+        self.metrics = ASTMetrics()
+        try:
+            self._parse_and_traverse(code, file_path)
+            return self.metrics
+        finally:
+            self.metrics = project_metrics
 
-        # Remove type-only imports
-        code = re.sub(r'import\s*\{\s*type\s+[^}]+\}\s*from\s+[\'"][^\'"]+[\'"];?', "", code)
+    def should_parse(self, code: str, file_path: str) -> bool:
+        """Return whether a file is worth parsing.
 
-        # Remove interface declarations
-        code = re.sub(r"interface\s+\w+\s*\{[^}]*\}", "", code, flags=re.DOTALL)
+        Files over ``max_file_chars`` and minified bundles are left out: they
+        take the longest to parse and are rarely code the author wrote.
+        """
 
-        # Remove type aliases
-        code = re.sub(r"type\s+\w+\s*=\s*[^;]+;", "", code)
+        if len(code) > self.max_file_chars or _MINIFIED_NAME.search(file_path):
+            return False
+        return len(code) <= _MINIFIED_LINE_LENGTH * (code.count("\n") + 1)
 
-        # Remove generic type parameters from function/class declarations
-        code = re.sub(r"<[A-Z]\w*(?:\s*,\s*[A-Z]\w*)*>(?=\s*\()", "", code)
+    def _parse_and_traverse(self, code: str, file_path: str) -> None:
+        """Parse a file and collect its metrics into ``self.metrics``."""
 
-        # Remove return type annotations: ): Type {
-        code = re.sub(r"\):\s*\w+(?:\[\])?(?:\s*\|\s*\w+)*\s*\{", ") {", code)
+        if not self.should_parse(code, file_path):
+            return
 
-        # Remove parameter type annotations: (param: Type)
-        code = re.sub(r":\s*\w+(?:\[\])?(?:\s*\|\s*\w+)*(?=\s*[,\)])", "", code)
+        if file_path.endswith((".ts", ".tsx")):
+            code = self._strip_typescript_syntax(code)
 
-        # Remove variable type annotations: const x: Type =
-        code = re.sub(r":\s*\w+(?:\[\])?(?:\s*\|\s*\w+)*(?=\s*=)", "", code)
+        # Only code with import/export declarations needs module mode; parsing
+        # everything else as a script avoids a second parse when it fails
+        parse = esprima.parseModule if _MODULE_SYNTAX.search(code) else esprima.parseScript
+        try:
+            tree = parse(code, {"jsx": True, "tolerant": True})
+        except Exception:
+            # If parsing fails, skip this file
+            return
+        self._traverse(tree)
 
-        # Remove type assertions: as Type
-        code = re.sub(r"\s+as\s+\w+", "", code)
+    def _strip_typescript_syntax(self, code: str) -> str:
+        """
+        Basic TypeScript syntax stripping for parsing.
 
-        # Remove angle bracket type assertions: <Type>
-        code = re.sub(r"<\w+>", "", code)
+        Note: This is a best-effort approach. Complex TypeScript may still fail to parse.
+        """
 
-        # Remove readonly, public, private, protected modifiers
-        code = re.sub(r"\b(readonly|public|private|protected)\s+", "", code)
+        for required, pattern, replacement in _TYPESCRIPT_STRIP_RULES:
+            # A substring check is much cheaper than a regex scan that cannot match
+            if all(literal in code for literal in required):
+                code = pattern.sub(replacement, code)
+        return code
 
-        # Remove implements clause
-        code = re.sub(r"\s+implements\s+\w+(?:\s*,\s*\w+)*", "", code)
+    def _traverse(self, root: Node) -> None:
+        """Collect metrics from esprima's node objects.
 
-        return code
+        A function's complexity counts the branches anywhere inside it, nested
+        functions included, so its score is completed once the traversal
+        leaves its subtree.
+        """
 
-    def _traverse(self, node: Any, parent: Any = None) -> None:
-        """Recursively traverse AST nodes."""
+        metrics = self.metrics
+        branches = 0
+        # Nodes to visit, or (score index, branches on entry) when leaving a function
+        stack: list[Any] = [root]
+        while stack:
+            node = stack.pop()
+            if type(node) is tuple:
+                index, entry_branches = node
+                metrics.complexity_scores[index] += branches - entry_branches
+                continue
 
-        if not isinstance(node, dict) or "type" not in node:
-            return
+            node_type = node.type
 
-        node_type = node["type"]
-
-        # Count functions
-        if node_type in ("FunctionDeclaration", "FunctionExpression"):
-            self.metrics.function_count += 1
-            complexity = self._calculate_complexity(node)
-            self.metrics.complexity_scores.append(complexity)
-
-            if node.get("async"):
-                self.metrics.async_function_count += 1
-
-            # Detect custom React hooks
-            func_name = node.get("id", {}).get("name", "")
-            if func_name.startswith("use") and len(func_name) > 3 and func_name[3].isupper():
-                self.metrics.custom_hooks.add(func_name)
-
-        elif node_type == "ArrowFunctionExpression":
-            self.metrics.arrow_function_count += 1
-            self.metrics.function_count += 1
-            complexity = self._calculate_complexity(node)
-            self.metrics.complexity_scores.append(complexity)
-
-            if node.get("async"):
-                self.metrics.async_function_count += 1
-
-        elif node_type == "ClassDeclaration":
-            self.metrics.class_count += 1
-            self._detect_class_patterns(node)
-
-        elif node_type in ("ImportDeclaration", "ImportExpression"):
-            self.metrics.import_count += 1
-
-        elif node_type in (
-            "ExportNamedDeclaration",
-            "ExportDefaultDeclaration",
-            "ExportAllDeclaration",
-        ):
-            self.metrics.export_count += 1
-
-        elif node_type == "CallExpression":
-            self._detect_call_patterns(node)
-            self._detect_promise_usage(node)
-
-        # Traverse children
-        for _key, value in node.items():
-            if isinstance(value, dict):
-                self._traverse(value, node)
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict):
-                        self._traverse(item, node)
-
-    def _calculate_complexity(self, func_node: dict) -> int:
-        """Calculate cyclomatic complexity of a function."""
-
-        complexity = 1
-
-        def count_complexity(node):
-            nonlocal complexity
-
-            if not isinstance(node, dict):
-                return
-
-            node_type = node.get("type")
-
-            if (
-                node_type
-                in (
-                    "IfStatement",
-                    "ConditionalExpression",
-                    "WhileStatement",
-                    "ForStatement",
-                    "ForInStatement",
-                    "ForOfStatement",
-                    "CatchClause",
-                    "SwitchCase",
-                )
-                or node_type == "LogicalExpression"
-                and node.get("operator") in ("&&", "||")
+            if node_type in _BRANCH_NODE_TYPES or (
+                node_type == "LogicalExpression" and node.operator in ("&&", "||")
             ):
-                complexity += 1
-
-            for value in node.values():
-                if isinstance(value, dict):
-                    count_complexity(value)
+                branches += 1
+
+            # Count functions
+            elif node_type in _FUNCTION_NODE_TYPES:
+                metrics.function_count += 1
+                stack.append((len(metrics.complexity_scores), branches))
+                metrics.complexity_scores.append(1)
+
+                if node.isAsync:
+                    metrics.async_function_count += 1
+
+                if node_type == "ArrowFunctionExpression":
+                    metrics.arrow_function_count += 1
+                else:
+                    # Detect custom React hooks
+                    func_name = (node.id.name if node.id is not None else None) or ""
+                    if (
+                        func_name.startswith("use")
+                        and len(func_name) > 3
+                        and func_name[3].isupper()
+                    ):
+                        metrics.custom_hooks.add(func_name)
+
+            elif node_type == "ClassDeclaration":
+                metrics.class_count += 1
+                self._detect_class_patterns(node)
+
+            elif node_type in ("ImportDeclaration", "ImportExpression"):
+                metrics.import_count += 1
+
+            elif node_type in _EXPORT_NODE_TYPES:
+                metrics.export_count += 1
+
+            elif node_type == "CallExpression":
+                self._detect_call_patterns(node)
+                self._detect_promise_usage(node)
+
+            # Traverse children, in source order
+            children = []
+            for value in vars(node).values():
+                if isinstance(value, Node):
+                    children.append(value)
                 elif isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, dict):
-                            count_complexity(item)
-
-        count_complexity(func_node)
-        return complexity
+                    children.extend(item for item in value if isinstance(item, Node))
+            children.reverse()
+            stack.extend(children)
 
-    def _detect_class_patterns(self, class_node: dict) -> None:
+    def _detect_class_patterns(self, class_node: Node) -> None:
         """Detect design patterns in class structure."""
 
-        body = class_node.get("body", {})
-        class_body = body.get("body", [])
-
         method_names = set()
         has_get_instance = False
 
-        for item in class_body:
-            if item.get("type") == "MethodDefinition":
-                key = item.get("key", {})
-                name = key.get("name", "")
+        for item in class_node.body.body:
+            if item.type == "MethodDefinition":
+                name = item.key.name or ""
                 method_names.add(name)
 
                 if name in ("getInstance", "instance"):
@@ -267,39 +361,40 @@ class ASTAnalyzer:
         if any(name.startswith("create") for name in method_names):
             self.metrics.design_patterns.add("Factory Pattern")
 
-    def _detect_call_patterns(self, call_node: dict) -> None:
+    def _detect_call_patterns(self, call_node: Node) -> None:
         """Detect patterns in function calls."""
 
-        callee = call_node.get("callee", {})
+        callee = call_node.callee
 
-        if callee.get("type") == "MemberExpression":
-            prop = callee.get("property", {})
-            method_name = prop.get("name", "")
+        if callee.type == "MemberExpression":
+            method_name = callee.property.name or ""
 
             if method_name in ("addEventListener", "on", "subscribe", "observe"):
                 self.metrics.design_patterns.add("Observer Pattern")
             elif method_name in ("map", "filter", "reduce"):
                 self.metrics.design_patterns.add("Functional Programming Pattern")
 
-    def _detect_promise_usage(self, call_node: dict) -> None:
+    def _detect_promise_usage(self, call_node: Node) -> None:
         """Detect Promise usage patterns."""
 
-        callee = call_node.get("callee", {})
+        callee = call_node.callee
 
         # new Promise()
-        if callee.get("name") == "Promise":
+        if callee.name == "Promise":
             self.metrics.uses_promises = True
 
         # .then(), .catch(), .finally()
-        if callee.get("type") == "MemberExpression":
-            prop = callee.get("property", {})
-            method_name = prop.get("name", "")
+        if callee.type == "MemberExpression":
+            method_name = callee.property.name or ""
             if method_name in ("then", "catch", "finally"):
                 self.metrics.uses_promises = True
 
 
 def analyze_js_project(
-    project_path: Path, language: str, framework: str | None
+    project_path: Path,
+    language: str,
+    framework: str | None,
+    scan: "ProjectScan | None" = None,
 ) -> JSProjectSummary:
     """
     Analyze a JS/TS project and return unified summary.
@@ -311,6 +406,7 @@ def analyze_js_project(
         project_path: Path to the project directory
         language: Detected language (JavaScript/TypeScript)
         framework: Detected framework (React/Vue/etc.)
+        scan: Optional pre-built scan of the project directory
 
     Returns:
         JSProjectSummary with all analysis data
@@ -318,13 +414,13 @@ def analyze_js_project(
 
     existing_content = {"language": language, "framework": framework}
 
-    analyzer = JSTSAnalyzer(str(project_path), existing_content)
+    analyzer = JSTSAnalyzer(str(project_path), existing_content, scan)
     results = analyzer.analyze()
 
     summary = JSProjectSummary()
 
     # Basic metrics
-    summary.total_files = _count_js_files(project_path)
+    summary.total_files = _count_js_files(project_path, scan)
     summary.total_lines_of_code = _count_lines_of_code(analyzer.all_code_content)
 
     # AST-based metrics
@@ -417,12 +513,19 @@ def analyze_js_project(
     return summary
 
 
-def _count_js_files(project_path: Path) -> int:
+def _count_js_files(project_path: Path, scan: "ProjectScan | None" = None) -> int:
     """Count JS/TS files in project."""
 
     extensions = {".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"}
     count = 0
 
+    if scan is not None:
+        return sum(
+            1
+            for entry in scan.iter_files(suffixes=extensions, skip_dirs=SKIP_DIRS)
+            if Path(entry.name).suffix in extensions
+        )
+
     for _root, dirs, files in os.walk(project_path):
         dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
         count += sum(1 for f in files if Path(f).suffix in extensions)
@@ -444,16 +547,23 @@ class JSTSAnalyzer:
     Uses both AST analysis and pattern matching for comprehensive results.
     """
 
-    def __init__(self, project_path: str, existing_content: dict):
+    def __init__(
+        self,
+        project_path: str,
+        existing_content: dict,
+        scan: "ProjectScan | None" = None,
+    ):
         """
         Initialize analyzer with project path and existing detection results.
 
         Args:
             project_path: Root directory of the JS/TS project.
             existing_content: Dict containing language, framework from detection.
+            scan: Optional pre-built scan of the project; avoids walking it again.
         """
 
         self.project_path = Path(project_path)
+        self.scan = scan
         self.context = existing_content
         self.package_jsons = []
         self.merged_dependencies = {}
@@ -504,8 +614,15 @@ class JSTSAnalyzer:
     def _load_package_json(self):
         """Load and parse all package.json files in the project."""
 
-        package_files = list(self.project_path.rglob("package.json"))
-        package_files = [f for f in package_files if "node_modules" not in f.parts]
+        if self.scan is not None:
+            package_files = [
+                self.scan.absolute_path(entry)
+                for entry in self.scan.iter_files(suffixes=(".json",))
+                if entry.name == "package.json"
+            ]
+        else:
+            package_files = list(self.project_path.rglob("package.json"))
+            package_files = [f for f in package_files if "node_modules" not in f.parts]
 
         if not package_files:
             return
@@ -515,47 +632,89 @@ class JSTSAnalyzer:
 
         for package_path in package_files:
             try:
-                with open(package_path, encoding="utf-8") as f:
-                    pkg_data = json.load(f)
-                    deps = pkg_data.get("dependencies", {})
-                    dev_deps = pkg_data.get("devDependencies", {})
+                pkg_data = json.loads(self._read_text(package_path))
+                deps = pkg_data.get("dependencies", {})
+                dev_deps = pkg_data.get("devDependencies", {})
 
-                    all_deps.update(deps)
-                    all_dev_deps.update(dev_deps)
+                all_deps.update(deps)
+                all_dev_deps.update(dev_deps)
 
-                    self.package_jsons.append(
-                        {"path": str(package_path.relative_to(self.project_path)), "data": pkg_data}
-                    )
+                self.package_jsons.append(
+                    {"path": str(package_path.relative_to(self.project_path)), "data": pkg_data}
+                )
             except (OSError, json.JSONDecodeError):
                 continue
 
         self.merged_dependencies = {"dependencies": all_deps, "devDependencies": all_dev_deps}
 
-    def _load_and_analyze_code(self):
-        """Load all JS/TS code and perform AST analysis."""
+    def _read_text(self, file_path: Path) -> str:
+        """Read a project file, through the scan when one was provided."""
 
-        code_extensions = {".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"}
-        code_files = []
+        if self.scan is not None:
+            return self.scan.read_text(file_path)
+        with open(file_path, encoding="utf-8", errors="ignore") as f:
+            return f.read()
+
+    def _iter_code_files(self, code_extensions: set[str]):
+        """Yield JS/TS source files, from the scan index when one was provided."""
+
+        if self.scan is not None:
+            for entry in self.scan.iter_files(suffixes=code_extensions, skip_dirs=SKIP_DIRS):
+                if Path(entry.name).suffix in code_extensions:
+                    yield self.scan.absolute_path(entry)
+            return
 
         for root, dirs, files in os.walk(self.project_path):
             dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
 
             for file in files:
                 if Path(file).suffix in code_extensions:
-                    file_path = Path(root) / file
-                    try:
-                        with open(file_path, encoding="utf-8", errors="ignore") as f:
-                            code_content = f.read()
-                            code_files.append(code_content)
-
-                            # Perform AST analysis on each file
-                            if self.ast_analyzer:
-                                self.ast_analyzer.analyze_file(code_content, str(file_path))
-                    except Exception:
-                        continue
+                    yield Path(root) / file
+
+    def _load_and_analyze_code(self):
+        """Load all JS/TS code and perform AST analysis."""
+
+        code_extensions = {".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"}
+        code_files = []
+
+        for file_path in self._iter_code_files(code_extensions):
+            try:
+                if self.scan is None:
+                    code_content = self._read_text(file_path)
+                    code_files.append(code_content)
+
+                    # Perform AST analysis on each file
+                    if self.ast_analyzer:
+                        self.ast_analyzer.analyze_file(code_content, str(file_path))
+                    continue
+
+                data = self.scan.read_bytes(file_path)
+                code = data.decode("utf-8", errors="ignore")
+                code_files.append(code)
+
+                # Reuse the file's cached AST metrics when its content was seen before.
+                # Skipped files are not cached, since the size limit is configurable.
+                if self.ast_analyzer and self.ast_analyzer.should_parse(code, str(file_path)):
+                    namespace = (
+                        _TS_FILE_CACHE_NAMESPACE
+                        if file_path.suffix in (".ts", ".tsx")
+                        else _JS_FILE_CACHE_NAMESPACE
+                    )
+                    summary = self.scan.cached_result(
+                        file_path, namespace, partial(self._summarize_ast, str(file_path)), data
+                    )
+                    self.ast_analyzer.metrics.merge(ASTMetrics.from_dict(summary))
+            except Exception:
+                continue
 
         self.all_code_content = "\n".join(code_files)
 
+    def _summarize_ast(self, file_path: str, data: bytes) -> dict:
+        """Return the JSON form of one file's AST metrics."""
+
+        code = data.decode("utf-8", errors="ignore")
+        return self.ast_analyzer.summarize_file(code, file_path).to_dict()
+
     def _extract_tech_stack(self) -> dict:
         """Extract technology stack from package.json."""
 
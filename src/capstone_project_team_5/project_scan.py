@@ -0,0 +1,467 @@
+"""Single-pass project scan index.
+
+Walking a project tree is the dominant cost of analysis on large uploads, and
+every detector used to do its own traversal. ``ProjectScan`` walks the tree
+once (pruning only VCS metadata and ``node_modules``) and records the
+metadata the detectors and analyzers need, so they can filter an in-memory
+list instead of touching the filesystem again.
+
+A scan does not have to come from a directory on disk: ``from_zip`` indexes
+the members of an open archive and ``from_files`` wraps any other store (such
+as the content-addressed artifact store). These "virtual" scans read file
+contents through a reader callback, so non-Git projects can be analyzed
+without writing the archive back out to a temporary directory.
+
+A scan may also carry a ``FileResultCache``. Analyzers then look up each
+file's summary by content hash (known up front for store-backed scans, hashed
+from the bytes otherwise) and only parse files they have not seen before.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Any
+from zipfile import ZipFile
+
+from capstone_project_team_5.file_result_cache import FileResultCache
+
+# Directories pruned while scanning (compared case-insensitively). Only what no
+# consumer ever reads is pruned here; each consumer narrows the index further
+# with its own skip set through ``iter_files(skip_dirs=...)``.
+DEFAULT_SCAN_SKIP_DIRS: frozenset[str] = frozenset({".git", ".hg", ".svn", "node_modules"})
+
+# Reads the raw bytes of a file given its path relative to the scan root
+FileReader = Callable[[str], bytes]
+
+
+def _normalize_skip_dirs(skip_dirs: Iterable[str] | None) -> frozenset[str]:
+    if skip_dirs is None:
+        return DEFAULT_SCAN_SKIP_DIRS
+    return frozenset(name.lower() for name in skip_dirs)
+
+
+def _normalize_member_path(name: str) -> str | None:
+    """Return a safe POSIX path for an archive member, or None for directories."""
+    normalized = name.replace("\\", "/").lstrip("/")
+    if not normalized or normalized.endswith("/"):
+        return None
+    parts = [part for part in normalized.split("/") if part]
+    if any(part in {"..", "."} for part in parts):
+        return None
+    return "/".join(parts)
+
+
+def _is_pruned(rel_path: str, skip: frozenset[str]) -> bool:
+    return any(part.lower() in skip for part in rel_path.split("/")[:-1])
+
+
+def _zip_member_reader(archive: ZipFile, members: Mapping[str, str]) -> FileReader:
+    return lambda rel_path: archive.read(members[rel_path])
+
+
+def is_project_dir(root: Path, scan: ProjectScan | None = None) -> bool:
+    """Return True if ``root`` can be analyzed.
+
+    Virtual scans have no directory on disk, so their root always counts as
+    present; otherwise ``root`` must be an existing directory.
+    """
+    if scan is not None and scan.is_virtual:
+        return True
+    return root.is_dir()
+
+
+@dataclass(frozen=True, slots=True)
+class ScannedFile:
+    """Metadata captured for a single file during a project scan.
+
+    Attributes:
+        rel_path: POSIX-style path relative to the scan root.
+        name: File name.
+        suffix: Lower-cased file extension (including the dot).
+        size_bytes: Size of the file in bytes.
+        mtime: Last modification timestamp.
+        ctime: Creation timestamp (birth time when available, else ctime).
+        content_hash: SHA-256 of the contents when known without reading them.
+    """
+
+    rel_path: str
+    name: str
+    suffix: str
+    size_bytes: int
+    mtime: float
+    ctime: float
+    content_hash: str | None = None
+
+    @property
+    def parts(self) -> tuple[str, ...]:
+        """Path segments of ``rel_path`` (directories followed by the file name)."""
+        return tuple(self.rel_path.split("/"))
+
+    @property
+    def dir_parts(self) -> tuple[str, ...]:
+        """Directory segments of ``rel_path`` (excluding the file name)."""
+        return tuple(self.rel_path.split("/")[:-1])
+
+
+@dataclass
+class ProjectScan:
+    """In-memory index of the files in a project tree.
+
+    Attributes:
+        root: Directory that was scanned.
+        files: Files found, sorted by relative path.
+        skip_dirs: Lower-cased directory names pruned during the scan.
+        reader: Callback returning a file's bytes by relative path. When unset,
+            files are read from disk under ``root``.
+        file_cache: Optional cache of per-file analysis summaries used by
+            ``cached_result``.
+    """
+
+    root: Path
+    files: list[ScannedFile] = field(default_factory=list)
+    skip_dirs: frozenset[str] = DEFAULT_SCAN_SKIP_DIRS
+    reader: FileReader | None = field(default=None, repr=False)
+    file_cache: FileResultCache | None = field(default=None, repr=False)
+    _by_path: dict[str, ScannedFile] = field(default_factory=dict, init=False, repr=False)
+    _by_suffix: dict[str, list[ScannedFile]] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._by_path = {entry.rel_path: entry for entry in self.files}
+        self._by_suffix = {}
+        for entry in self.files:
+            self._by_suffix.setdefault(entry.suffix, []).append(entry)
+
+    @classmethod
+    def build(
+        cls,
+        root: Path | str,
+        skip_dirs: Iterable[str] | None = None,
+        file_cache: FileResultCache | None = None,
+    ) -> ProjectScan:
+        """Walk ``root`` once and return the resulting index.
+
+        Args:
+            root: Project root directory.
+            skip_dirs: Directory names to prune (case-insensitive). Defaults to
+                ``DEFAULT_SCAN_SKIP_DIRS``.
+            file_cache: Optional cache of per-file analysis summaries.
+
+        Returns:
+            ProjectScan for the directory. Missing or non-directory roots yield an
+            empty scan.
+        """
+        root_path = Path(root)
+        skip = _normalize_skip_dirs(skip_dirs)
+        files: list[ScannedFile] = []
+
+        if root_path.is_dir():
+            for dirpath, dirnames, filenames in os.walk(root_path):
+                dirnames[:] = [name for name in dirnames if name.lower() not in skip]
+                rel_dir = os.path.relpath(dirpath, root_path)
+                prefix = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+
+                for filename in filenames:
+                    try:
+                        stat = os.stat(os.path.join(dirpath, filename))
+                    except OSError:
+                        continue
+
+                    created_at = getattr(stat, "st_birthtime", None)
+                    files.append(
+                        ScannedFile(
+                            rel_path=prefix + filename,
+                            name=filename,
+                            suffix=PurePosixPath(filename).suffix.lower(),
+                            size_bytes=stat.st_size,
+                            mtime=stat.st_mtime,
+                            ctime=created_at if created_at is not None else stat.st_ctime,
+                        )
+                    )
+
+        files.sort(key=lambda entry: entry.rel_path)
+        return cls(root=root_path, files=files, skip_dirs=skip, file_cache=file_cache)
+
+    @classmethod
+    def from_files(
+        cls,
+        root: Path | str,
+        files: Mapping[str, tuple[int, float]],
+        reader: FileReader,
+        skip_dirs: Iterable[str] | None = None,
+        hashes: Mapping[str, str] | None = None,
+        file_cache: FileResultCache | None = None,
+    ) -> ProjectScan:
+        """Index files held outside the filesystem.
+
+        Args:
+            root: Nominal project root, used only to label paths.
+            files: Mapping of relative POSIX path to ``(size_bytes, timestamp)``.
+            reader: Callback returning the bytes of a file by relative path.
+            skip_dirs: Directory names to prune (case-insensitive). Defaults to
+                ``DEFAULT_SCAN_SKIP_DIRS``.
+            hashes: Optional mapping of relative path to the SHA-256 of its
+                contents, when the store already knows it.
+            file_cache: Optional cache of per-file analysis summaries.
+
+        Returns:
+            Virtual ProjectScan whose reads go through ``reader``.
+        """
+        skip = _normalize_skip_dirs(skip_dirs)
+        entries = [
+            ScannedFile(
+                rel_path=rel_path,
+                name=rel_path.rpartition("/")[2],
+                suffix=PurePosixPath(rel_path).suffix.lower(),
+                size_bytes=size,
+                mtime=timestamp,
+                ctime=timestamp,
+                content_hash=hashes.get(rel_path) if hashes else None,
+            )
+            for rel_path, (size, timestamp) in files.items()
+            if not _is_pruned(rel_path, skip)
+        ]
+        entries.sort(key=lambda entry: entry.rel_path)
+        return cls(
+            root=Path(root), files=entries, skip_dirs=skip, reader=reader, file_cache=file_cache
+        )
+
+    @classmethod
+    def from_zip(
+        cls,
+        archive: ZipFile,
+        prefix: str = "",
+        skip_dirs: Iterable[str] | None = None,
+    ) -> ProjectScan:
+        """Index the members of an open archive below ``prefix``.
+
+        The archive must stay open for as long as the scan is read from.
+
+        Args:
+            archive: Open ZIP archive.
+            prefix: Member directory to treat as the project root ("" for the
+                whole archive).
+            skip_dirs: Directory names to prune (case-insensitive). Defaults to
+                ``DEFAULT_SCAN_SKIP_DIRS``.
+
+        Returns:
+            Virtual ProjectScan reading members straight from the archive.
+        """
+        prefix = prefix.strip("/")
+        return cls.from_zip_projects(archive, [prefix], skip_dirs)[prefix]
+
+    @classmethod
+    def from_zip_projects(
+        cls,
+        archive: ZipFile,
+        prefixes: Iterable[str],
+        skip_dirs: Iterable[str] | None = None,
+    ) -> dict[str, ProjectScan]:
+        """Index several project directories of an archive in one pass.
+
+        Each member is matched against its own ancestor directories, so the
+        cost is linear in the size of the namelist however many projects are
+        requested. Nested projects each see the members below them.
+
+        Args:
+            archive: Open ZIP archive.
+            prefixes: Member directories to index ("" for the whole archive).
+            skip_dirs: Directory names to prune (case-insensitive). Defaults to
+                ``DEFAULT_SCAN_SKIP_DIRS``.
+
+        Returns:
+            Mapping of stripped prefix to its virtual ProjectScan.
+        """
+        wanted = {prefix.strip("/") for prefix in prefixes}
+        members: dict[str, dict[str, str]] = {prefix: {} for prefix in wanted}
+        files: dict[str, dict[str, tuple[int, float]]] = {prefix: {} for prefix in wanted}
+
+        for info in archive.infolist():
+            normalized = _normalize_member_path(info.filename)
+            if normalized is None:
+                continue
+
+            matches = [("", normalized)] if "" in wanted else []
+            slash = normalized.find("/")
+            while slash != -1:
+                if normalized[:slash] in wanted:
+                    matches.append((normalized[:slash], normalized[slash + 1 :]))
+                slash = normalized.find("/", slash + 1)
+            if not matches:
+                continue
+
+            try:
+                timestamp = time.mktime((*info.date_time, 0, 0, -1))
+            except (OverflowError, ValueError):
+                timestamp = 0.0
+            for prefix, rel_path in matches:
+                members[prefix][rel_path] = info.filename
+                files[prefix][rel_path] = (info.file_size, timestamp)
+
+        archive_root = Path(Path(archive.filename or "archive.zip").name)
+        return {
+            prefix: cls.from_files(
+                archive_root.joinpath(*prefix.split("/")) if prefix else archive_root,
+                files[prefix],
+                _zip_member_reader(archive, members[prefix]),
+                skip_dirs,
+            )
+            for prefix in wanted
+        }
+
+    @property
+    def is_virtual(self) -> bool:
+        """True when file contents are served by ``reader`` rather than the disk."""
+        return self.reader is not None
+
+    @property
+    def total_size_bytes(self) -> int:
+        """Total size of all scanned files in bytes."""
+        return sum(entry.size_bytes for entry in self.files)
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def __iter__(self) -> Iterator[ScannedFile]:
+        return iter(self.files)
+
+    def absolute_path(self, entry: ScannedFile | str) -> Path:
+        """Return the on-disk path for a scanned file."""
+        rel_path = entry.rel_path if isinstance(entry, ScannedFile) else entry
+        return self.root.joinpath(*rel_path.split("/"))
+
+    def relative_path(self, path: ScannedFile | Path | str) -> str:
+        """Return the POSIX path relative to the scan root for any file reference."""
+        if isinstance(path, ScannedFile):
+            return path.rel_path
+        if isinstance(path, Path):
+            return path.relative_to(self.root).as_posix()
+        return path
+
+    def get(self, rel_path: str) -> ScannedFile | None:
+        """Return the entry for ``rel_path`` if it was scanned."""
+        return self._by_path.get(rel_path)
+
+    def has_file(self, rel_path: str) -> bool:
+        """Return True if ``rel_path`` exists in the scan."""
+        return rel_path in self._by_path
+
+    def with_suffix(self, *suffixes: str) -> list[ScannedFile]:
+        """Return files whose lower-cased extension is one of ``suffixes``."""
+        # Suffixes differing only in case (".c" and ".C") share one bucket
+        wanted = dict.fromkeys(suffix.lower() for suffix in suffixes)
+        matches: list[ScannedFile] = []
+        for suffix in wanted:
+            matches.extend(self._by_suffix.get(suffix, ()))
+        if len(wanted) > 1:
+            matches.sort(key=lambda entry: entry.rel_path)
+        return matches
+
+    def has_suffix(self, *suffixes: str) -> bool:
+        """Return True if any file has one of ``suffixes``."""
+        return any(self._by_suffix.get(suffix.lower()) for suffix in suffixes)
+
+    def named(self, name: str) -> list[ScannedFile]:
+        """Return every file called ``name``, shallowest first."""
+        matches = [entry for entry in self.files if entry.name == name]
+        matches.sort(key=lambda entry: (entry.rel_path.count("/"), entry.rel_path))
+        return matches
+
+    def iter_files(
+        self,
+        suffixes: Iterable[str] | None = None,
+        skip_dirs: Iterable[str] | None = None,
+    ) -> Iterator[ScannedFile]:
+        """Iterate scanned files, optionally narrowed further.
+
+        Args:
+            suffixes: Only yield files with these extensions (case-insensitive).
+            skip_dirs: Directory names to exclude (case-insensitive). Names already
+                pruned by the scan are not re-checked.
+
+        Yields:
+            Matching ScannedFile entries in path order.
+        """
+        entries = self.with_suffix(*suffixes) if suffixes is not None else self.files
+        extra_skip = (
+            {name.lower() for name in skip_dirs} - self.skip_dirs if skip_dirs is not None else None
+        )
+
+        for entry in entries:
+            if extra_skip and any(part.lower() in extra_skip for part in entry.dir_parts):
+                continue
+            yield entry
+
+    def read_bytes(self, entry: ScannedFile | Path | str) -> bytes:
+        """Read the raw contents of a scanned file.
+
+        ``entry`` may be a ScannedFile, a path relative to the root, or a path
+        produced by ``absolute_path``.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        if self.reader is None:
+            if isinstance(entry, Path):
+                return entry.read_bytes()
+            return self.absolute_path(entry).read_bytes()
+
+        rel_path = self.relative_path(entry)
+        try:
+            return self.reader(rel_path)
+        except KeyError as exc:
+            raise FileNotFoundError(rel_path) from exc
+
+    def read_text(self, entry: ScannedFile | Path | str) -> str:
+        """Read a scanned file as UTF-8 text, ignoring decode errors."""
+        return self.read_bytes(entry).decode("utf-8", errors="ignore")
+
+    def cached_result(
+        self,
+        entry: ScannedFile | Path | str,
+        namespace: str,
+        summarize: Callable[[bytes], dict[str, Any]],
+        data: bytes | None = None,
+    ) -> dict[str, Any]:
+        """Return ``summarize(contents)`` for a file, reusing ``file_cache`` when set.
+
+        Files whose hash the scan already knows are not read at all on a cache
+        hit; others are read (or ``data`` is used) and hashed first.
+
+        Args:
+            entry: File to summarize, as accepted by ``read_bytes``.
+            namespace: Analyzer name and summary version, e.g. ``"python-v1"``.
+            summarize: Builds the JSON-serializable summary from the raw bytes.
+            data: The file's contents when the caller has already read them.
+
+        Raises:
+            OSError: If the file has to be read and cannot be.
+        """
+        if self.file_cache is None:
+            return summarize(data if data is not None else self.read_bytes(entry))
+
+        scanned = entry if isinstance(entry, ScannedFile) else self.get(self.relative_path(entry))
+        content_hash = scanned.content_hash if scanned is not None else None
+        if content_hash is not None:
+            cached = self.file_cache.get(namespace, content_hash)
+            if cached is not None:
+                return cached
+
+        if data is None:
+            data = self.read_bytes(entry)
+        if content_hash is None:
+            content_hash = hashlib.sha256(data).hexdigest()
+            cached = self.file_cache.get(namespace, content_hash)
+            if cached is not None:
+                return cached
+
+        result = summarize(data)
+        self.file_cache.put(namespace, content_hash, result)
+        return result
@@ -4,27 +4,458 @@ from __future__ import annotations
 
 import ast
 import json
+import logging
+import multiprocessing
 import os
+import pickle
 import re
-from collections import defaultdict
+import threading
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from capstone_project_team_5.constants.skill_detection_constants import SKIP_DIRS
 
+if TYPE_CHECKING:
+    from capstone_project_team_5.project_scan import ProjectScan
+
+logger = logging.getLogger(__name__)
+
+# Per-file summaries are cached under this namespace; bump it when they change.
+_FILE_CACHE_NAMESPACE = "python-v2"
+# Below this many files, starting worker processes costs more than it saves
+_MIN_FILES_FOR_PROCESSES = 200
+# Batches each analysis splits its files into, per worker process
+_TASKS_PER_WORKER = 4
+
+# Substrings the project-level detectors look for; each file records the ones it contains
+_CODE_MARKERS = (
+    "from collections",
+    "deque",
+    "Counter",
+    "defaultdict",
+    "OrderedDict",
+    "namedtuple",
+    "sorted(",
+    ".sort(",
+    ".find(",
+    ".index(",
+    "dp[",
+)
+# Looked for in the lowercased code
+_LOWERCASE_CODE_MARKERS = (
+    "memo",
+    "def get_",
+    "def post_",
+    "async def",
+    "class ",
+    "__init__",
+    "import threading",
+    "import multiprocessing",
+)
+_IMPORT_PATTERN = re.compile(r"^\s*import\s+([a-zA-Z0-9_\.]+)")
+_FROM_IMPORT_PATTERN = re.compile(r"^\s*from\s+([a-zA-Z0-9_\.]+)")
+
+# Each of these adds one to the complexity of every function containing it
+_BRANCH_NODES = (
+    ast.If,
+    ast.For,
+    ast.AsyncFor,
+    ast.While,
+    ast.With,
+    ast.AsyncWith,
+    ast.Try,
+    ast.BoolOp,
+    ast.IfExp,
+    ast.comprehension,
+)
+# Built-in data structures by literal or comprehension, and by constructor name
+_STRUCTURE_NODES = {
+    ast.List: "list",
+    ast.ListComp: "list",
+    ast.Dict: "dict",
+    ast.DictComp: "dict",
+    ast.Set: "set",
+    ast.SetComp: "set",
+    ast.Tuple: "tuple",
+}
+_STRUCTURE_CONSTRUCTORS = frozenset({"list", "dict", "set", "tuple"})
+
+
+def _resolve_file_workers() -> int:
+    """Return the process count from ``ZIP2JOB_PYTHON_ANALYSIS_WORKERS``.
+
+    Defaults to the number of CPUs; ``1`` summarizes files in-process.
+    """
+    try:
+        return max(int(os.getenv("ZIP2JOB_PYTHON_ANALYSIS_WORKERS", "")), 1)
+    except ValueError:
+        return os.cpu_count() or 1
+
+
+@dataclass(slots=True)
+class _PythonTotals:
+    """Per-file summaries reduced into the facts the project detectors need."""
+
+    files_analyzed: int = 0
+    lines_of_code: int = 0
+    imports: set[str] = field(default_factory=set)
+    markers: set[str] = field(default_factory=set)
+    lowercase_markers: set[str] = field(default_factory=set)
+    classes: dict[str, list[str]] = field(default_factory=dict)
+    class_methods: defaultdict[str, list[str]] = field(default_factory=lambda: defaultdict(list))
+    inheritance: bool = False
+    encapsulation: bool = False
+    abstraction: bool = False
+    classes_count: int = 0
+    methods_count: int = 0
+    complexity_total: int = 0
+    complexity_max: int = 0
+    data_structures: set[str] = field(default_factory=set)
+    recursion: bool = False
+    design_patterns: set[str] = field(default_factory=set)
+
+    def add(self, summary: dict) -> None:
+        """Merge one file's summary."""
+        self.files_analyzed += 1
+        self.lines_of_code += summary["lines_of_code"]
+        self.imports.update(summary["imports"])
+        self.markers.update(summary["markers"])
+        self.lowercase_markers.update(summary["lowercase_markers"])
+        if not summary["parsed"]:
+            return
+
+        self.classes.update(summary["classes"])
+        for cname, methods in summary["class_methods"].items():
+            self.class_methods[cname].extend(methods)
+        self.inheritance = self.inheritance or summary["inheritance"]
+        self.encapsulation = self.encapsulation or summary["encapsulation"]
+        self.abstraction = self.abstraction or summary["abstraction"]
+        self.classes_count += summary["classes_count"]
+        self.methods_count += summary["methods_count"]
+        self.complexity_total += summary["complexity_total"]
+        self.complexity_max = max(self.complexity_max, summary["complexity_max"])
+        self.data_structures.update(summary["data_structures"])
+        self.recursion = self.recursion or summary["recursion"]
+        self.design_patterns.update(summary["design_patterns"])
+
+
+@dataclass(slots=True)
+class _ClassFacts:
+    """One class's contribution to its file summary."""
+
+    name: str
+    bases: list[str]
+    # (depth, preorder index) orders classes the way ``ast.walk`` yields them
+    position: tuple[int, int]
+    methods: list[str] = field(default_factory=list)
+    instance_attribute: bool = False
+    strategy_attribute: bool = False
+    instance_accessor: bool = False
+    uses_strategy: bool = False
+
+
+class _SummaryVisitor:
+    """Collects the AST facts of one file in a single traversal.
+
+    Handlers are looked up by node type in ``_handlers`` and may return a
+    callback that runs once the node's subtree has been visited. Enclosing
+    classes and functions are tracked on stacks; facts about a subtree
+    (branches for complexity, ``raise NotImplementedError`` in a method, ...)
+    are counters compared on entering and leaving it. The traversal keeps its
+    own stack, like ``ast.walk``, so deeply nested expressions that parse do
+    not hit the recursion limit.
+    """
+
+    def __init__(self) -> None:
+        self.classes: list[_ClassFacts] = []
+        self.complexities: list[int] = []
+        self.data_structures: set[str] = set()
+        self.design_patterns: set[str] = set()
+        self.inheritance = False
+        self.encapsulation = False
+        self.abstraction = False
+        self.recursion = False
+        self._class_names: list[str] = []
+        # Names of the enclosing (non-async) functions, for recursion
+        self._function_names: list[str] = []
+        # Names called in each enclosing function, for factories
+        self._called: list[set[str]] = []
+        # Methods defined directly in a class body, by node id, until visited
+        self._method_owners: dict[int, _ClassFacts] = {}
+        self._branches = 0
+        self._not_implemented_raises = 0
+        self._instance_returns = 0
+        self._builder_steps = 0
+        # Names strategy attributes are read from, e.g. "self" for self.strategy
+        self._strategy_reads: list[str] = []
+
+    def summarize(self, tree: ast.AST) -> dict:
+        """Visit ``tree`` and return its facts in the file summary format."""
+        handlers = self._handlers
+        # (node, depth) to visit, or (callback, -1) to run on leaving a node
+        stack: list[tuple[Any, int]] = [(tree, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth < 0:
+                node()
+                continue
+            handler = handlers.get(type(node))
+            if handler is not None:
+                on_leave = handler(self, node, depth)
+                if on_leave is not None:
+                    stack.append((on_leave, -1))
+            children = [(child, depth + 1) for child in ast.iter_child_nodes(node)]
+            children.reverse()
+            stack.extend(children)
+
+        classes: dict[str, list[str]] = {}
+        class_methods: dict[str, list[str]] = {}
+        for facts in sorted(self.classes, key=lambda facts: facts.position):
+            if facts.methods:
+                class_methods.setdefault(facts.name, []).extend(facts.methods)
+            classes[facts.name] = facts.bases
+
+        return {
+            "classes": classes,
+            "class_methods": class_methods,
+            "inheritance": self.inheritance,
+            "encapsulation": self.encapsulation,
+            "abstraction": self.abstraction,
+            "classes_count": len(self.classes),
+            "methods_count": len(self.complexities),
+            "complexity_total": sum(self.complexities),
+            "complexity_max": max(self.complexities, default=0),
+            "data_structures": sorted(self.data_structures),
+            "recursion": self.recursion,
+            "design_patterns": sorted(self.design_patterns),
+        }
+
+    def _enter_class(self, node: ast.ClassDef, depth: int) -> Callable[[], None]:
+        bases = [base.id for base in node.bases if isinstance(base, ast.Name)]
+        if bases:
+            self.inheritance = True
+        facts = _ClassFacts(node.name, bases, (depth, len(self.classes)))
+        self.classes.append(facts)
+
+        observer_attribute = subscribe_method = notify_method = call_method = False
+        for statement in node.body:
+            if isinstance(statement, ast.Assign):
+                for target in statement.targets:
+                    if isinstance(target, ast.Name):
+                        target_name = target.id.lower()
+                    elif isinstance(target, ast.Attribute):
+                        target_name = target.attr.lower()
+                    else:
+                        continue
+                    facts.instance_attribute |= "instance" in target_name
+                    facts.strategy_attribute |= "strategy" in target_name
+                    observer_attribute |= "observer" in target_name
+            elif isinstance(statement, ast.FunctionDef):
+                facts.methods.append(statement.name)
+                self._method_owners[id(statement)] = facts
+                for decorator in statement.decorator_list:
+                    if (
+                        isinstance(decorator, ast.Name)
+                        and decorator.id == "abstractmethod"
+                        or isinstance(decorator, ast.Attribute)
+                        and decorator.attr == "abstractmethod"
+                    ):
+                        self.abstraction = True
+                method_name = statement.name.lower()
+                subscribe_method |= method_name in {"subscribe", "attach", "register"}
+                notify_method |= method_name.startswith("notify")
+                call_method |= statement.name == "__call__"
+
+        if observer_attribute and subscribe_method and notify_method:
+            self.design_patterns.add("Observer")
+        class_name = node.name.lower()
+        if call_method and ("decorator" in class_name or "wrapper" in class_name):
+            self.design_patterns.add("Decorator")
+
+        self._class_names.append(node.name)
+
+        def leave() -> None:
+            self._class_names.pop()
+            if facts.instance_attribute and facts.instance_accessor:
+                self.design_patterns.add("Singleton")
+            if facts.strategy_attribute and facts.uses_strategy:
+                self.design_patterns.add("Strategy")
+
+        return leave
+
+    def _enter_function(
+        self, node: ast.FunctionDef | ast.AsyncFunctionDef, depth: int
+    ) -> Callable[[], None]:
+        owner = self._method_owners.pop(id(node), None)
+        is_async = isinstance(node, ast.AsyncFunctionDef)
+        is_builder = not is_async and node.name == "build"
+        is_classmethod = owner is not None and any(
+            isinstance(decorator, ast.Name) and decorator.id == "classmethod"
+            for decorator in node.decorator_list
+        )
+        branches = self._branches
+        not_implemented_raises = self._not_implemented_raises
+        instance_returns = self._instance_returns
+        builder_steps = self._builder_steps
+        strategy_reads = len(self._strategy_reads)
+        called: set[str] = set()
+        self._called.append(called)
+        if not is_async:
+            self._function_names.append(node.name)
+
+        def leave() -> None:
+            self.complexities.append(1 + self._branches - branches)
+            self._called.pop()
+            # A factory constructs (calls) at least two different things
+            if len(called) >= 2:
+                self.design_patterns.add("Factory")
+            elif self._called:
+                self._called[-1].update(called)
+            if not is_async:
+                self._function_names.pop()
+            if is_builder and self._builder_steps > builder_steps:
+                self.design_patterns.add("Builder")
+            if owner is None:
+                return
+            if self._not_implemented_raises > not_implemented_raises:
+                self.abstraction = True
+            if is_classmethod and self._instance_returns > instance_returns:
+                owner.instance_accessor = True
+            if any(name in {"self", owner.name} for name in self._strategy_reads[strategy_reads:]):
+                owner.uses_strategy = True
+
+        return leave
+
+    def _count_branch(self, node: ast.AST, depth: int) -> None:
+        self._branches += 1
+
+    def _add_structure(self, node: ast.AST, depth: int) -> None:
+        self.data_structures.add(_STRUCTURE_NODES[type(node)])
+
+    def _visit_call(self, node: ast.Call, depth: int) -> None:
+        func = node.func
+        if isinstance(func, ast.Name):
+            if func.id in _STRUCTURE_CONSTRUCTORS:
+                self.data_structures.add(func.id)
+            if self._called:
+                self._called[-1].add(func.id)
+            if func.id in self._function_names:
+                self.recursion = True
+        elif (
+            isinstance(func, ast.Attribute)
+            and isinstance(func.value, ast.Name)
+            and func.value.id == "self"
+        ):
+            # Fluent builder step, e.g. self.set_name(...)
+            self._builder_steps += 1
+
+    def _visit_return(self, node: ast.Return, depth: int) -> None:
+        value = node.value
+        if isinstance(value, ast.Call):
+            self._builder_steps += 1
+        elif (
+            isinstance(value, ast.Attribute)
+            and isinstance(value.value, ast.Name)
+            and value.attr.lower().endswith("instance")
+        ):
+            self._instance_returns += 1
+
+    def _visit_raise(self, node: ast.Raise, depth: int) -> None:
+        exc = node.exc
+        if isinstance(exc, ast.Call):
+            exc = exc.func
+        if isinstance(exc, ast.Name) and exc.id == "NotImplementedError":
+            self._not_implemented_raises += 1
+
+    def _visit_assign(self, node: ast.Assign, depth: int) -> None:
+        if not self._class_names:
+            return
+        for target in node.targets:
+            # Private attributes (self._x, cls._x, ClassName._x), not __dunder__
+            if (
+                isinstance(target, ast.Attribute)
+                and target.attr.startswith("_")
+                and not (target.attr.startswith("__") and target.attr.endswith("__"))
+                and isinstance(target.value, ast.Name)
+                and (target.value.id in {"self", "cls"} or target.value.id in self._class_names)
+            ):
+                self.encapsulation = True
+
+    def _visit_attribute(self, node: ast.Attribute, depth: int) -> None:
+        if isinstance(node.value, ast.Name) and "strategy" in node.attr.lower():
+            self._strategy_reads.append(node.value.id)
+
+    _handlers: ClassVar[dict[type[ast.AST], Callable[..., Callable[[], None] | None]]] = {
+        ast.ClassDef: _enter_class,
+        ast.FunctionDef: _enter_function,
+        ast.AsyncFunctionDef: _enter_function,
+        ast.Call: _visit_call,
+        ast.Return: _visit_return,
+        ast.Raise: _visit_raise,
+        ast.Assign: _visit_assign,
+        ast.Attribute: _visit_attribute,
+        **dict.fromkeys(_BRANCH_NODES, _count_branch),
+        **dict.fromkeys(_STRUCTURE_NODES, _add_structure),
+    }
+
+
+_summary_pool: ProcessPoolExecutor | None = None
+_summary_pool_lock = threading.Lock()
+
+
+def _get_summary_pool() -> ProcessPoolExecutor:
+    """Return the process pool shared by every analysis, creating it on first use.
+
+    The pool is sized by ``_resolve_file_workers`` once, so concurrent
+    analyses of large projects share those processes instead of each
+    starting their own.
+    """
+    global _summary_pool
+    with _summary_pool_lock:
+        if _summary_pool is None:
+            # Spawn rather than fork: callers (the API, the TUI) run threads.
+            _summary_pool = ProcessPoolExecutor(
+                max_workers=_resolve_file_workers(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _summary_pool
+
+
+def _discard_summary_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop ``pool`` after a failure so the next analysis starts a fresh one."""
+    global _summary_pool
+    with _summary_pool_lock:
+        if _summary_pool is pool:
+            _summary_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _summarize_batch(
+    project_path: Path, scan: ProjectScan | None, file_paths: list[Path]
+) -> list[dict | None]:
+    """Worker entry point: summarize ``file_paths`` in order."""
+    analyzer = PythonAnalyzer(project_path, scan)
+    return [analyzer._summarize_file(file_path) for file_path in file_paths]
+
 
 class PythonAnalyzer:
     """Analyzes Python source code for OOP features, tech stack, and metrics."""
 
-    def __init__(self, project_path: str | Path) -> None:
+    def __init__(self, project_path: str | Path, scan: ProjectScan | None = None) -> None:
         """Initialize the analyzer with a Python project root directory.
 
         Args:
             project_path: Path to the Python project root directory
+            scan: Optional pre-built scan of the project; avoids walking it again
         """
         self.project_path = Path(project_path)
-        self.all_code_content = ""
+        self.scan = scan
         self.imports = set()
-        self.ast_trees = []
+        self.totals = _PythonTotals()
         self.file_count = 0
         self.files_analyzed = 0
 
@@ -47,12 +478,13 @@ class PythonAnalyzer:
             }
             On error: {"error": str}
         """
-        # Validate project path
-        if not self.project_path.exists():
-            return {"error": f"Project root does not exist: {self.project_path}"}
+        # Validate project path (virtual scans have no directory on disk)
+        if self.scan is None or not self.scan.is_virtual:
+            if not self.project_path.exists():
+                return {"error": f"Project root does not exist: {self.project_path}"}
 
-        if not self.project_path.is_dir():
-            return {"error": f"Project root is not a directory: {self.project_path}"}
+            if not self.project_path.is_dir():
+                return {"error": f"Project root is not a directory: {self.project_path}"}
 
         try:
             self._load_code_and_ast()
@@ -93,74 +525,178 @@ class PythonAnalyzer:
     # LOAD CODE
     # ---------------------------------------------------------
 
-    def _load_code_and_ast(self) -> None:
-        """Load Python source code and parse AST in a single filesystem walk."""
-        code_files: list[str] = []
-        trees: list[ast.AST] = []
-        self.file_count = 0
-        self.files_analyzed = 0
+    def _iter_python_files(self) -> Iterator[Path]:
+        """Yield every ``.py`` file, from the scan index when one was provided."""
+        if self.scan is not None:
+            for entry in self.scan.iter_files(suffixes=(".py",), skip_dirs=SKIP_DIRS):
+                if entry.name.endswith(".py"):
+                    yield self.scan.absolute_path(entry)
+            return
 
         for root, dirs, files in os.walk(self.project_path):
             dirs[:] = [directory for directory in dirs if directory not in SKIP_DIRS]
 
             for file_name in files:
-                if not file_name.endswith(".py"):
-                    continue
+                if file_name.endswith(".py"):
+                    yield Path(root) / file_name
 
-                self.file_count += 1
-                file_path = Path(root) / file_name
-
-                try:
-                    code = file_path.read_text(encoding="utf-8", errors="ignore")
-                except Exception:
-                    continue
+    def _load_code_and_ast(self) -> None:
+        """Summarize every Python file and reduce the summaries into ``totals``.
 
-                code_files.append(code)
-                self.files_analyzed += 1
+        Each file is read, parsed and summarized on its own, so neither its
+        source nor its AST outlives its summary. Large projects are spread
+        over worker processes (see ``_resolve_file_workers``). With a scan
+        carrying a file cache, files whose content was summarized before are
+        not parsed again.
+        """
+        file_paths = list(self._iter_python_files())
+        self.file_count = len(file_paths)
+
+        workers = min(_resolve_file_workers(), self.file_count // _MIN_FILES_FOR_PROCESSES)
+        if workers > 1 and self._can_use_processes():
+            pool = _get_summary_pool()
+            try:
+                self._reduce(self._summarize_in_processes(pool, file_paths, workers))
+                return
+            except Exception:
+                logger.warning(
+                    "Worker processes failed for %s; summarizing in-process",
+                    self.project_path,
+                    exc_info=True,
+                )
+                _discard_summary_pool(pool)
+        self._reduce(map(self._summarize_file, file_paths))
+
+    def _reduce(self, summaries: Iterable[dict | None]) -> None:
+        """Merge file summaries, in file order, into fresh ``totals``."""
+        self.totals = _PythonTotals()
+        for summary in summaries:
+            if summary is not None:
+                self.totals.add(summary)
+        self.files_analyzed = self.totals.files_analyzed
+        self.imports = self.totals.imports
+
+    def _can_use_processes(self) -> bool:
+        """True unless already in a worker process or the scan cannot be pickled."""
+        # Projects analyzed in worker processes are already spread over cores
+        if multiprocessing.parent_process() is not None:
+            return False
+        if self.scan is None or self.scan.reader is None:
+            return True
+        try:
+            pickle.dumps(self.scan.reader)
+        except Exception:
+            # e.g. archive-backed scans that read through an open ZipFile
+            return False
+        return True
 
-                try:
-                    trees.append(ast.parse(code, filename=str(file_path)))
-                except Exception:
-                    continue
+    def _summarize_in_processes(
+        self, pool: ProcessPoolExecutor, file_paths: list[Path], workers: int
+    ) -> Iterator[dict | None]:
+        """Yield file summaries in order, computed on the shared process pool.
 
-        self.all_code_content = "\n".join(code_files)
-        self.ast_trees = trees
+        Files are split into ``workers * _TASKS_PER_WORKER`` contiguous batches.
+        Each batch carries only its own slice of the scan, and at most
+        ``workers`` batches are in flight beyond the one being merged.
+        """
+        batch_size = -(-len(file_paths) // (workers * _TASKS_PER_WORKER))
+        pending: deque[Future[list[dict | None]]] = deque()
+        for start in range(0, len(file_paths), batch_size):
+            batch = file_paths[start : start + batch_size]
+            pending.append(
+                pool.submit(_summarize_batch, self.project_path, self._scan_slice(batch), batch)
+            )
+            if len(pending) > workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+    def _scan_slice(self, file_paths: list[Path]) -> ProjectScan | None:
+        """Return the scan narrowed to ``file_paths``, to keep batches small."""
+        if self.scan is None:
+            return None
+        entries = [self.scan.get(self.scan.relative_path(path)) for path in file_paths]
+        return replace(self.scan, files=[entry for entry in entries if entry is not None])
+
+    def _summarize_file(self, file_path: Path) -> dict | None:
+        """Read and summarize one file; None when it cannot be read."""
+        try:
+            if self.scan is not None:
+                return self.scan.cached_result(
+                    file_path, _FILE_CACHE_NAMESPACE, self._summarize_source
+                )
+            return self._summarize_source(file_path.read_bytes())
+        except OSError:
+            return None
 
     def _load_code_content(self) -> None:
         """Load all Python source code from the project directory."""
         # Kept for backward compatibility.
-        if not self.all_code_content or not self.ast_trees:
+        if not self.totals.files_analyzed:
             self._load_code_and_ast()
 
+    def _summarize_source(self, data: bytes) -> dict:
+        return self._summarize_code(data.decode("utf-8", errors="ignore"))
+
+    def _summarize_code(self, code: str) -> dict:
+        """Reduce one file to the facts the project-level detectors merge.
+
+        Returns:
+            JSON-serializable summary. Line, import and marker counts cover
+            every file; the AST facts are left out (``"parsed": False``) for
+            files that do not parse.
+        """
+        lines_of_code = 0
+        imports: set[str] = set()
+        for line in code.splitlines():
+            stripped = line.strip()
+            # Skip empty lines and comments
+            if stripped and not stripped.startswith("#"):
+                lines_of_code += 1
+            for pattern in (_IMPORT_PATTERN, _FROM_IMPORT_PATTERN):
+                match = pattern.match(line)
+                if match:
+                    imports.add(match.group(1).split(".")[0])
+
+        code_lower = code.lower()
+        summary = {
+            "lines_of_code": lines_of_code,
+            "imports": sorted(imports),
+            "markers": [marker for marker in _CODE_MARKERS if marker in code],
+            "lowercase_markers": [
+                marker for marker in _LOWERCASE_CODE_MARKERS if marker in code_lower
+            ],
+            "parsed": False,
+        }
+
+        try:
+            tree = ast.parse(code)
+            summary.update(_SummaryVisitor().summarize(tree), parsed=True)
+        except Exception:
+            summary["parsed"] = False
+        return summary
+
     # ---------------------------------------------------------
     # IMPORT PARSING
     # ---------------------------------------------------------
 
     def _extract_imports(self) -> None:
-        """Extract import statements using regex."""
-        imports = set()
-
-        for line in self.all_code_content.splitlines():
-            m1 = re.match(r"^\s*import\s+([a-zA-Z0-9_\.]+)", line)
-            m2 = re.match(r"^\s*from\s+([a-zA-Z0-9_\.]+)", line)
+        """Collect the top-level modules imported by any file.
 
-            if m1:
-                imports.add(m1.group(1).split(".")[0])
-            if m2:
-                imports.add(m2.group(1).split(".")[0])
-
-        self.imports = imports
+        Imports are matched per line with regexes when files are summarized.
+        """
+        self.imports = self.totals.imports
 
     # ---------------------------------------------------------
     # AST PARSING
     # ---------------------------------------------------------
 
     def _parse_ast(self) -> None:
-        """Ensure AST trees are available for all Python files.
+        """Ensure AST summaries are available for all Python files.
 
         This method reuses the combined loader to avoid an extra filesystem walk.
         """
-        if not self.ast_trees:
+        if not self.totals.files_analyzed:
             self._load_code_and_ast()
 
     # ---------------------------------------------------------
@@ -174,41 +710,21 @@ class PythonAnalyzer:
             Dictionary with total_files, files_analyzed, lines_of_code,
             classes_count, and methods_count.
         """
-        lines_of_code = 0
-        classes_count: int = 0
-        methods_count: int = 0
-        function_complexities: list[int] = []
-
-        # Count LOC from all code content
-        for line in self.all_code_content.splitlines():
-            stripped = line.strip()
-            # Skip empty lines and comments
-            if stripped and not stripped.startswith("#"):
-                lines_of_code += 1
-
-        # Count classes and methods from AST
-        for tree in self.ast_trees:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    classes_count += 1
-                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    methods_count += 1
-                    function_complexities.append(self._calculate_function_complexity(node))
+        totals = self.totals
+        methods_count = totals.methods_count
 
         avg_function_complexity = 0.0
-        max_function_complexity = 0
-        if function_complexities:
-            max_function_complexity = max(function_complexities)
-            avg_function_complexity = sum(function_complexities) / len(function_complexities)
+        if methods_count:
+            avg_function_complexity = totals.complexity_total / methods_count
 
         return {
             "total_files": self.file_count,
             "files_analyzed": self.files_analyzed,
-            "lines_of_code": lines_of_code,
-            "classes_count": classes_count,
+            "lines_of_code": totals.lines_of_code,
+            "classes_count": totals.classes_count,
             "methods_count": methods_count,
             "avg_function_complexity": avg_function_complexity,
-            "max_function_complexity": max_function_complexity,
+            "max_function_complexity": totals.complexity_max,
         }
 
     # ---------------------------------------------------------
@@ -222,75 +738,9 @@ class PythonAnalyzer:
             Dictionary with OOP analysis including classes, inheritance,
             encapsulation, polymorphism, and abstraction detection.
         """
-        classes = {}
-        inheritance = False
-        encapsulation = False
+        totals = self.totals
         polymorphism = False
-        abstraction = False
-        method_map = defaultdict(list)
-
-        for tree in self.ast_trees:
-            for node in ast.walk(tree):
-                if not isinstance(node, ast.ClassDef):
-                    continue
-
-                cname = node.name
-
-                # Inheritance detection
-                bases = [base.id for base in node.bases if isinstance(base, ast.Name)]
-                if bases:
-                    inheritance = True
-
-                # Encapsulation detection (private attributes)
-                for sub in ast.walk(node):
-                    if isinstance(sub, ast.Assign):
-                        for tgt in sub.targets:
-                            # Only consider attribute assignments, e.g., self._x
-                            if isinstance(tgt, ast.Attribute):
-                                attr_name = tgt.attr
-
-                                # Must start with _ but not __dunder__
-                                if not attr_name.startswith("_"):
-                                    continue
-                                if attr_name.startswith("__") and attr_name.endswith("__"):
-                                    continue
-
-                                val = tgt.value
-                                # self._x, cls._x, ClassName._x
-                                if isinstance(val, ast.Name) and val.id in {"self", "cls", cname}:
-                                    encapsulation = True
-
-                # Abstraction detection (abstract methods)
-                for sub in node.body:
-                    if isinstance(sub, ast.FunctionDef):
-                        # Check for @abstractmethod decorator
-                        for dec in sub.decorator_list:
-                            is_abstract = (
-                                isinstance(dec, ast.Name)
-                                and dec.id == "abstractmethod"
-                                or isinstance(dec, ast.Attribute)
-                                and dec.attr == "abstractmethod"
-                            )
-                            if is_abstract:
-                                abstraction = True
-
-                        # Check for raise NotImplementedError
-                        for stmt in ast.walk(sub):
-                            if isinstance(stmt, ast.Raise):
-                                if isinstance(stmt.exc, ast.Name):
-                                    if stmt.exc.id == "NotImplementedError":
-                                        abstraction = True
-                                elif (
-                                    isinstance(stmt.exc, ast.Call)
-                                    and isinstance(stmt.exc.func, ast.Name)
-                                    and stmt.exc.func.id == "NotImplementedError"
-                                ):
-                                    abstraction = True
-
-                        # Collect methods for polymorphism detection
-                        method_map[cname].append(sub.name)
-
-                classes[cname] = bases
+        method_map = totals.class_methods
 
         # Polymorphism: same method names in different classes
         cls_names = list(method_map.keys())
@@ -300,42 +750,13 @@ class PythonAnalyzer:
                     polymorphism = True
 
         return {
-            "classes": classes,
-            "inheritance": inheritance,
-            "encapsulation": encapsulation,
+            "classes": dict(totals.classes),
+            "inheritance": totals.inheritance,
+            "encapsulation": totals.encapsulation,
             "polymorphism": polymorphism,
-            "abstraction": abstraction,
+            "abstraction": totals.abstraction,
         }
 
-    # ---------------------------------------------------------
-    # COMPLEXITY ANALYSIS
-    # ---------------------------------------------------------
-
-    def _calculate_function_complexity(self, node: ast.AST) -> int:
-        """Approximate cyclomatic complexity for a single function.
-
-        This is a lightweight estimate based on common branching constructs.
-        """
-        complexity = 1
-        for child in ast.walk(node):
-            if isinstance(
-                child,
-                (
-                    ast.If,
-                    ast.For,
-                    ast.AsyncFor,
-                    ast.While,
-                    ast.With,
-                    ast.AsyncWith,
-                    ast.Try,
-                    ast.BoolOp,
-                    ast.IfExp,
-                    ast.comprehension,
-                ),
-            ):
-                complexity += 1
-        return complexity
-
     # ---------------------------------------------------------
     # DATA STRUCTURES DETECTION
     # ---------------------------------------------------------
@@ -347,43 +768,16 @@ class PythonAnalyzer:
             Sorted list of detected data structures.
         """
         structures: set[str] = set()
-        code = self.all_code_content
+        markers = self.totals.markers
 
         # Check for collections module structures
-        if "collections" in self.imports or "from collections" in code:
-            if "deque" in code:
-                structures.add("deque")
-            if "Counter" in code:
-                structures.add("Counter")
-            if "defaultdict" in code:
-                structures.add("defaultdict")
-            if "OrderedDict" in code:
-                structures.add("OrderedDict")
-            if "namedtuple" in code:
-                structures.add("namedtuple")
-
-        # Use AST to detect built-in data structures to avoid string-based
-        # false positives (for example, indexing versus literal lists).
-        for tree in self.ast_trees:
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.List, ast.ListComp)):
-                    structures.add("list")
-                elif isinstance(node, (ast.Dict, ast.DictComp)):
-                    structures.add("dict")
-                elif isinstance(node, (ast.Set, ast.SetComp)):
-                    structures.add("set")
-                elif isinstance(node, ast.Tuple):
-                    structures.add("tuple")
-                elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
-                    function_name = node.func.id
-                    if function_name == "list":
-                        structures.add("list")
-                    elif function_name == "dict":
-                        structures.add("dict")
-                    elif function_name == "set":
-                        structures.add("set")
-                    elif function_name == "tuple":
-                        structures.add("tuple")
+        if "collections" in self.imports or "from collections" in markers:
+            for name in ("deque", "Counter", "defaultdict", "OrderedDict", "namedtuple"):
+                if name in markers:
+                    structures.add(name)
+
+        # Built-in data structures come from the per-file AST summaries
+        structures.update(self.totals.data_structures)
 
         # Check for heapq
         if "heapq" in self.imports:
@@ -402,32 +796,22 @@ class PythonAnalyzer:
             Sorted list of detected algorithms.
         """
         algorithms = set()
+        markers = self.totals.markers
 
         # Detect recursion
-        for tree in self.ast_trees:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    func_name = node.name
-                    # Check if function calls itself
-                    for sub in ast.walk(node):
-                        if (
-                            isinstance(sub, ast.Call)
-                            and isinstance(sub.func, ast.Name)
-                            and sub.func.id == func_name
-                        ):
-                            algorithms.add("Recursion")
-                            break
+        if self.totals.recursion:
+            algorithms.add("Recursion")
 
         # Detect sorting
-        if "sorted(" in self.all_code_content or ".sort(" in self.all_code_content:
+        if "sorted(" in markers or ".sort(" in markers:
             algorithms.add("Sorting")
 
         # Detect searching
-        if ".find(" in self.all_code_content or ".index(" in self.all_code_content:
+        if ".find(" in markers or ".index(" in markers:
             algorithms.add("Searching")
 
         # Detect dynamic programming patterns
-        if "memo" in self.all_code_content.lower() or "dp[" in self.all_code_content:
+        if "memo" in self.totals.lowercase_markers or "dp[" in markers:
             algorithms.add("Dynamic Programming")
 
         return sorted(list(algorithms))
@@ -442,169 +826,7 @@ class PythonAnalyzer:
         Returns:
             Sorted list of detected design patterns.
         """
-        patterns: set[str] = set()
-
-        for tree in self.ast_trees:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    if self._is_singleton_class(node):
-                        patterns.add("Singleton")
-                    if self._is_observer_class(node):
-                        patterns.add("Observer")
-                    if self._is_strategy_class(node):
-                        patterns.add("Strategy")
-                    if self._is_decorator_class(node):
-                        patterns.add("Decorator")
-                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    if self._is_factory_function(node):
-                        patterns.add("Factory")
-                    if self._is_builder_function(node):
-                        patterns.add("Builder")
-
-        return sorted(list(patterns))
-
-    def _is_singleton_class(self, class_node: ast.ClassDef) -> bool:
-        """Heuristic detection of a Singleton-style class."""
-        has_instance_attribute = False
-        has_classmethod_accessor = False
-
-        for statement in class_node.body:
-            if isinstance(statement, ast.Assign):
-                for target in statement.targets:
-                    if (
-                        isinstance(target, ast.Name)
-                        and "instance" in target.id.lower()
-                        or isinstance(target, ast.Attribute)
-                        and "instance" in target.attr.lower()
-                    ):
-                        has_instance_attribute = True
-
-        for statement in class_node.body:
-            if not isinstance(statement, ast.FunctionDef):
-                continue
-
-            decorator_names = {
-                decorator.id
-                for decorator in statement.decorator_list
-                if isinstance(decorator, ast.Name)
-            }
-            if "classmethod" not in decorator_names:
-                continue
-
-            for inner in ast.walk(statement):
-                if (
-                    isinstance(inner, ast.Return)
-                    and isinstance(inner.value, ast.Attribute)
-                    and isinstance(inner.value.value, ast.Name)
-                    and inner.value.attr.lower().endswith("instance")
-                ):
-                    has_classmethod_accessor = True
-                    break
-
-        return has_instance_attribute and has_classmethod_accessor
-
-    def _is_factory_function(self, function_node: ast.AST) -> bool:
-        """Heuristic detection of a factory function.
-
-        Marks a function as a factory when it conditionally constructs
-        different types (multiple constructor calls).
-        """
-        constructor_names: set[str] = set()
-        for child in ast.walk(function_node):
-            if isinstance(child, ast.Call) and isinstance(child.func, ast.Name):
-                constructor_names.add(child.func.id)
-        return len(constructor_names) >= 2
-
-    def _is_builder_function(self, function_node: ast.AST) -> bool:
-        """Heuristic detection of a builder-style `build` function."""
-        if not isinstance(function_node, ast.FunctionDef):
-            return False
-
-        if function_node.name != "build":
-            return False
-
-        returns_constructed_object = False
-        fluent_calls = False
-
-        for child in ast.walk(function_node):
-            if isinstance(child, ast.Return) and isinstance(child.value, ast.Call):
-                returns_constructed_object = True
-            if (
-                isinstance(child, ast.Call)
-                and isinstance(child.func, ast.Attribute)
-                and isinstance(child.func.value, ast.Name)
-                and child.func.value.id == "self"
-            ):
-                fluent_calls = True
-
-        return returns_constructed_object or fluent_calls
-
-    def _is_observer_class(self, class_node: ast.ClassDef) -> bool:
-        """Heuristic detection of an Observer-style class."""
-        has_observers_attribute = False
-        has_subscribe_method = False
-        has_notify_method = False
-
-        for statement in class_node.body:
-            if isinstance(statement, ast.Assign):
-                for target in statement.targets:
-                    if (
-                        isinstance(target, ast.Name)
-                        and "observer" in target.id.lower()
-                        or isinstance(target, ast.Attribute)
-                        and "observer" in target.attr.lower()
-                    ):
-                        has_observers_attribute = True
-            elif isinstance(statement, ast.FunctionDef):
-                method_name = statement.name.lower()
-                if method_name in {"subscribe", "attach", "register"}:
-                    has_subscribe_method = True
-                if method_name.startswith("notify"):
-                    has_notify_method = True
-
-        return has_observers_attribute and has_subscribe_method and has_notify_method
-
-    def _is_strategy_class(self, class_node: ast.ClassDef) -> bool:
-        """Heuristic detection of a Strategy-style class."""
-        has_strategy_attribute = False
-        uses_strategy_attribute = False
-
-        for statement in class_node.body:
-            if isinstance(statement, ast.Assign):
-                for target in statement.targets:
-                    if (
-                        isinstance(target, ast.Name)
-                        and "strategy" in target.id.lower()
-                        or isinstance(target, ast.Attribute)
-                        and "strategy" in target.attr.lower()
-                    ):
-                        has_strategy_attribute = True
-
-        for statement in class_node.body:
-            if not isinstance(statement, ast.FunctionDef):
-                continue
-
-            for child in ast.walk(statement):
-                if (
-                    isinstance(child, ast.Attribute)
-                    and isinstance(child.value, ast.Name)
-                    and child.value.id in {"self", class_node.name}
-                    and "strategy" in child.attr.lower()
-                ):
-                    uses_strategy_attribute = True
-
-        return has_strategy_attribute and uses_strategy_attribute
-
-    def _is_decorator_class(self, class_node: ast.ClassDef) -> bool:
-        """Heuristic detection of a Decorator-style class (GoF pattern)."""
-        class_name_lower = class_node.name.lower()
-        has_wrapper_name = "decorator" in class_name_lower or "wrapper" in class_name_lower
-        has_call_method = any(
-            isinstance(statement, ast.FunctionDef) and statement.name == "__call__"
-            for statement in class_node.body
-        )
-
-        return has_wrapper_name and has_call_method
+        return sorted(self.totals.design_patterns)
 
     # ---------------------------------------------------------
     # TECH STACK DETECTION
@@ -655,7 +877,7 @@ class PythonAnalyzer:
     # ---------------------------------------------------------
 
     def _detect_features(self) -> list[str]:
-        code = self.all_code_content.lower()
+        code = self.totals.lowercase_markers
         features = []
 
         if "def get_" in code or "def post_" in code:
@@ -728,7 +950,7 @@ class PythonAnalyzer:
         return sorted(list(skills))
 
 
-def analyze_python_project(project_root: Path | str) -> dict:
+def analyze_python_project(project_root: Path | str, scan: ProjectScan | None = None) -> dict:
     """Analyze a Python project and return comprehensive analysis results.
 
     This is the main entry point for Python project analysis, providing a
@@ -736,6 +958,7 @@ def analyze_python_project(project_root: Path | str) -> dict:
 
     Args:
         project_root: Path to the Python project root directory
+        scan: Optional pre-built scan of the project root
 
     Returns:
         Dictionary with analysis results:
@@ -768,7 +991,7 @@ def analyze_python_project(project_root: Path | str) -> dict:
         ...     print(f"Found {result['classes_count']} classes")
     """
     try:
-        analyzer = PythonAnalyzer(project_root)
+        analyzer = PythonAnalyzer(project_root, scan)
         result = analyzer.analyze()
 
         # Check for error
@@ -17,12 +17,7 @@ from capstone_project_team_5.utils.file_patterns import (
     is_infrastructure_file,
     is_initialization_file,
 )
-from capstone_project_team_5.utils.git import (
-    AuthorContribution,
-    get_commit_type_counts,
-    get_weekly_activity,
-    run_git,
-)
+from capstone_project_team_5.utils.git import AuthorContribution, GitHistory
 
 
 @dataclass
@@ -53,6 +48,7 @@ def detect_user_role(
     current_user: str | None,
     author_contributions: list[AuthorContribution],
     collaborator_count: int,
+    history: GitHistory | None = None,
 ) -> UserRole | None:
     """Detect user's role based on contribution patterns.
 
@@ -64,6 +60,8 @@ def detect_user_role(
         current_user: Current user's Git identity (name or email)
         author_contributions: List of all author contributions from Git
         collaborator_count: Total number of collaborators detected
+        history: Pre-loaded Git history of the project. When omitted it is
+            loaded on demand for the specialized-role heuristics.
 
     Returns:
         UserRole object with detected role, or None if detection fails
@@ -109,6 +107,7 @@ def detect_user_role(
         user_contrib=user_contrib,
         contribution_pct=contribution_pct,
         base_role=base_role,
+        history=history,
     )
 
     # Generate human-readable justification
@@ -135,64 +134,77 @@ def _detect_specialized_role(
     user_contrib: AuthorContribution,
     contribution_pct: float,
     base_role: str,
+    history: GitHistory | None = None,
 ) -> tuple[str, str | None]:
     """Detect specialized roles through additional repository signals.
 
+    Every heuristic reads the same in-memory ``history`` so the repository
+    is only walked once, however many signals are checked.
+
     Returns:
         tuple of (resolved_role, optional_reason)
     """
     if base_role == ProjectRole.SOLO_DEVELOPER.value:
         return base_role, None
 
+    if history is None:
+        history = _load_history(project_path)
+
     # Highest-priority specialized signal first.
-    if _is_project_creator(project_path, current_user):
+    if _is_project_creator(history, current_user):
         return ProjectRole.PROJECT_CREATOR.value, "identified as earliest project author"
 
-    if _is_tech_lead(project_path, current_user, user_contrib.commits, contribution_pct):
+    if _is_tech_lead(history, current_user, user_contrib.commits, contribution_pct):
         return (
             ProjectRole.TECH_LEAD.value,
             "high concentration of infrastructure and architecture changes",
         )
 
-    if _is_security_lead(project_path, current_user, user_contrib.commits, contribution_pct):
+    if _is_security_lead(history, current_user, user_contrib.commits, contribution_pct):
         return (
             ProjectRole.SECURITY_LEAD.value,
             "security-focused changes dominate contribution profile",
         )
 
-    if _is_documentation_lead(project_path, current_user, user_contrib.commits, contribution_pct):
+    if _is_documentation_lead(history, current_user, user_contrib.commits, contribution_pct):
         return (
             ProjectRole.DOCUMENTATION_LEAD.value,
             "documentation changes dominate contribution profile",
         )
 
-    if _is_maintainer(project_path, current_user, user_contrib.commits):
+    if _is_maintainer(history, current_user, user_contrib.commits):
         return ProjectRole.MAINTAINER.value, "consistent maintenance activity over time"
 
     return base_role, None
 
 
-def _is_project_creator(project_path: Path, current_user: str) -> bool:
+def _load_history(project_path: Path) -> GitHistory | None:
+    """Load the Git history of ``project_path``, or None if it is not readable."""
+    try:
+        return GitHistory.load(project_path)
+    except RuntimeError:
+        return None
+
+
+def _is_project_creator(history: GitHistory | None, current_user: str) -> bool:
     """Heuristic for project creator role.
 
     Requires earliest detected author match and evidence of setup-file authorship.
     """
-    try:
-        earliest_author = run_git(
-            project_path, "log", "--reverse", "--format=%an", "--max-count=1"
-        ).strip()
-        if not earliest_author or not _matches_user(earliest_author, current_user):
-            return False
-
-        early_files = _get_early_commit_files(project_path, commit_limit=25)
-        init_file_count = count_matches(early_files, is_initialization_file)
-        return init_file_count > 0
-    except RuntimeError:
+    if history is None:
         return False
 
+    earliest = history.earliest_commits(1)
+    if not earliest or not _matches_user(history.authors[earliest[0]], current_user):
+        return False
+
+    early_files = _get_early_commit_files(history, commit_limit=25)
+    init_file_count = count_matches(early_files, is_initialization_file)
+    return init_file_count > 0
+
 
 def _is_tech_lead(
-    project_path: Path,
+    history: GitHistory | None,
     current_user: str,
     user_commits: int,
     contribution_pct: float,
@@ -201,7 +213,7 @@ def _is_tech_lead(
     if user_commits < 3 or contribution_pct < 15.0:
         return False
 
-    files = _get_user_changed_files(project_path, current_user)
+    files = _get_user_changed_files(history, current_user)
     if not files:
         return False
 
@@ -213,21 +225,21 @@ def _is_tech_lead(
     return infra_count >= 3 and infra_ratio >= 0.35 and docs_count >= 1
 
 
-def _is_maintainer(project_path: Path, current_user: str, user_commits: int) -> bool:
+def _is_maintainer(history: GitHistory | None, current_user: str, user_commits: int) -> bool:
     """Heuristic for maintainer role using sustained activity and maintenance commits."""
     if user_commits < 6:
         return False
 
-    active_week_count = _get_active_week_count(project_path, current_user)
+    active_week_count = _get_active_week_count(history, current_user)
     if active_week_count < 6:
         return False
 
-    maintenance_commit_ratio = _get_maintenance_commit_ratio(project_path, current_user)
+    maintenance_commit_ratio = _get_maintenance_commit_ratio(history, current_user)
     return maintenance_commit_ratio >= 0.3
 
 
 def _is_security_lead(
-    project_path: Path,
+    history: GitHistory | None,
     current_user: str,
     user_commits: int,
     contribution_pct: float,
@@ -236,7 +248,7 @@ def _is_security_lead(
     if user_commits < 3 or contribution_pct < 12.0:
         return False
 
-    files = _get_user_changed_files(project_path, current_user)
+    files = _get_user_changed_files(history, current_user)
     if not files:
         return False
 
@@ -271,7 +283,7 @@ def _is_security_lead(
 
 
 def _is_documentation_lead(
-    project_path: Path,
+    history: GitHistory | None,
     current_user: str,
     user_commits: int,
     contribution_pct: float,
@@ -280,7 +292,7 @@ def _is_documentation_lead(
     if user_commits < 3 or contribution_pct < 10.0:
         return False
 
-    files = _get_user_changed_files(project_path, current_user)
+    files = _get_user_changed_files(history, current_user)
     if not files:
         return False
 
@@ -291,47 +303,29 @@ def _is_documentation_lead(
     return docs_count >= 4 and docs_count > code_count and (docs_count / len(files)) >= 0.5
 
 
-def _get_early_commit_files(project_path: Path, commit_limit: int = 25) -> list[str]:
+def _get_early_commit_files(history: GitHistory | None, commit_limit: int = 25) -> list[str]:
     """Get file paths touched in the earliest commits of the repository."""
-    try:
-        output = run_git(
-            project_path,
-            "log",
-            "--reverse",
-            "--name-only",
-            "--pretty=format:",
-            f"--max-count={commit_limit}",
-        )
-        return [line.strip() for line in output.splitlines() if line.strip()]
-    except RuntimeError:
+    if history is None:
         return []
+    return history.changed_files(history.earliest_commits(commit_limit))
 
 
-def _get_user_changed_files(project_path: Path, current_user: str) -> list[str]:
+def _get_user_changed_files(history: GitHistory | None, current_user: str) -> list[str]:
     """Get file paths touched by the current user."""
-    try:
-        output = run_git(
-            project_path,
-            "log",
-            "--name-only",
-            "--pretty=format:",
-            f"--author={current_user}",
-            "--no-merges",
-        )
-        return [line.strip() for line in output.splitlines() if line.strip()]
-    except RuntimeError:
+    if history is None:
         return []
+    return history.changed_files(
+        history.commit_indices("HEAD", include_merges=False, author=current_user)
+    )
 
 
-def _get_active_week_count(project_path: Path, current_user: str, weeks: int = 12) -> int:
+def _get_active_week_count(history: GitHistory | None, current_user: str, weeks: int = 12) -> int:
     """Count number of active weeks with at least one commit for the user."""
-    try:
-        activity = get_weekly_activity(project_path, weeks=weeks)
-    except RuntimeError:
+    if history is None:
         return 0
 
     author_weeks: list[int] = []
-    for author, counts in activity.items():
+    for author, counts in history.weekly_activity(weeks).items():
         if _matches_user(author, current_user):
             author_weeks = counts
             break
@@ -339,18 +333,16 @@ def _get_active_week_count(project_path: Path, current_user: str, weeks: int = 1
     return sum(1 for count in author_weeks if count > 0)
 
 
-def _get_maintenance_commit_ratio(project_path: Path, current_user: str) -> float:
+def _get_maintenance_commit_ratio(history: GitHistory | None, current_user: str) -> float:
     """Return ratio of maintenance-style commits for user.
 
     Maintenance commits are: fix, chore, docs, refactor.
     """
-    try:
-        type_counts = get_commit_type_counts(project_path)
-    except RuntimeError:
+    if history is None:
         return 0.0
 
     user_counts: dict[str, int] = {}
-    for author, counts in type_counts.items():
+    for author, counts in history.commit_type_counts().items():
         if _matches_user(author, current_user):
             user_counts = counts
             break
@@ -14,12 +14,19 @@ contributors work on, enabling detection of specialized roles like:
 
 from __future__ import annotations
 
+import re
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
 from capstone_project_team_5.constants.roles import DIRECTORY_PATTERNS, FILE_CATEGORIES
-from capstone_project_team_5.utils.git import AuthorContribution, run_git
+from capstone_project_team_5.utils.git import AuthorContribution, GitHistory
+from capstone_project_team_5.utils.path_classifier import PathClassifier, PathRule
+
+_MODELS_BACKEND_EXTENSIONS = {".py", ".go", ".java", ".rb", ".php", ".rs", ".kt", ".js", ".ts"}
+_MODELS_ML_EXTENSIONS = {".h5", ".hdf5", ".pkl", ".pickle", ".pt", ".pth", ".onnx", ".joblib"}
+_SQL_DATA_DIRECTORIES = ["data/", "datasets/", "notebooks/", "analytics/"]
 
 
 @dataclass
@@ -69,67 +76,85 @@ class UserRoleType:
 def get_user_file_contributions(
     repo_path: Path,
     user_name: str,
+    *,
+    history: GitHistory | None = None,
 ) -> list[FileContribution]:
     """Get detailed file-level contributions for a specific user.
 
     Args:
         repo_path: Path to the Git repository
         user_name: Git username to analyze
+        history: Pre-loaded Git history; loaded from ``repo_path`` when omitted
 
     Returns:
         List of FileContribution objects for the user
     """
 
-    try:
-        output = run_git(
-            repo_path, "log", "--numstat", "--pretty=format:%H", f"--author={user_name}"
-        )
-    except RuntimeError:
-        return []
+    if history is None:
+        try:
+            history = GitHistory.load(repo_path, "HEAD")
+        except RuntimeError:
+            return []
 
     file_stats: dict[str, FileContribution] = {}
 
-    for line in output.splitlines():
-        line = line.strip()
+    # Binary files carry no line counts and are skipped by ``numstat``
+    for entry in history.numstat(history.commit_indices("HEAD", author=user_name)):
+        if entry.path not in file_stats:
+            file_stats[entry.path] = FileContribution(
+                path=entry.path, commits=0, added=0, deleted=0
+            )
 
-        if not line:
-            continue
+        file_stats[entry.path].commits += 1
+        file_stats[entry.path].added += entry.added
+        file_stats[entry.path].deleted += entry.deleted
 
-        # If commit hash ignore
-        if len(line) == 40 and all(c in "0123456789abcdef" for c in line):
-            continue
+    return list(file_stats.values())
 
-        # Parse numstat line: added\tdeleted\tpath
-        parts = line.split("\t")
-        if len(parts) != 3:
-            continue
 
-        added_str, deleted_str, path = parts
+def _role_rules() -> list[PathRule]:
+    """Return the rules of :func:`categorize_file` in the order they apply."""
 
-        # Skip binary files
-        if added_str == "-" or deleted_str == "-":
-            continue
+    def any_of(fragments: Iterable[str]) -> str:
+        return "|".join(re.escape(fragment) for fragment in sorted(fragments))
 
-        try:
-            added = int(added_str)
-            deleted = int(deleted_str)
-        except ValueError:
-            continue
+    def with_suffix(extensions: Iterable[str]) -> str:
+        # A dotted name stem followed by one of the extensions, like ``Path.suffix``
+        return rf"[^/]\.(?:{any_of(extension[1:] for extension in extensions)})\Z"
 
-        # Aggregate by file path
-        if path not in file_stats:
-            file_stats[path] = FileContribution(path=path, commits=0, added=0, deleted=0)
+    rules = [
+        PathRule("testing", (any_of(FILE_CATEGORIES["testing"]),)),
+        # Handle ambiguous models directory by file extension
+        PathRule("backend", (rf"models/.*{with_suffix(_MODELS_BACKEND_EXTENSIONS)}",)),
+        PathRule("data", (rf"models/.*{with_suffix(_MODELS_ML_EXTENSIONS)}",)),
+        # Handle SQL files based on directory context
+        PathRule("data", (rf"(?:{any_of(_SQL_DATA_DIRECTORIES)}).*{with_suffix({'.sql'})}",)),
+        PathRule("backend", (with_suffix({".sql"}),)),
+    ]
+    rules.extend(
+        PathRule(category, (any_of(patterns),)) for category, patterns in DIRECTORY_PATTERNS.items()
+    )
+    rules.extend(
+        PathRule(
+            category,
+            suffixes=frozenset(entry for entry in entries if entry.startswith(".")),
+            names=frozenset(entries),
+        )
+        for category, entries in FILE_CATEGORIES.items()
+        if category != "testing"
+    )
+    return rules
 
-        file_stats[path].commits += 1
-        file_stats[path].added += added
-        file_stats[path].deleted += deleted
 
-    return list(file_stats.values())
+_ROLE_CLASSIFIER = PathClassifier(_role_rules(), ignore_case=True)
 
 
 def categorize_file(file_path: str) -> str | None:
     """Determine the category of a file based on its path and extension.
 
+    Test markers come first, then ``models/`` and SQL files by extension and
+    directory, then directory patterns, then the extension or file name.
+
     Args:
         file_path: Path to the file
 
@@ -137,48 +162,7 @@ def categorize_file(file_path: str) -> str | None:
         Category string or None if unclassified
     """
 
-    path_lower = file_path.lower()
-    suffix = Path(file_path).suffix.lower()
-
-    for test_pattern in FILE_CATEGORIES["testing"]:
-        if test_pattern in path_lower:
-            return "testing"
-
-    # Handle ambiguous models directory by file extension
-    if "models/" in path_lower or "/models/" in path_lower:
-        backend_extensions = {".py", ".go", ".java", ".rb", ".php", ".rs", ".kt", ".js", ".ts"}
-        ml_extensions = {".h5", ".hdf5", ".pkl", ".pickle", ".pt", ".pth", ".onnx", ".joblib"}
-
-        if suffix in backend_extensions:
-            return "backend"
-        elif suffix in ml_extensions:
-            return "data"
-
-    # Handle SQL files based on directory context
-    if suffix == ".sql":
-        if any(d in path_lower for d in ["data/", "datasets/", "notebooks/", "analytics/"]):
-            return "data"
-        return "backend"
-
-    # Check directory patterns first
-    for category, patterns in DIRECTORY_PATTERNS.items():
-        for pattern in patterns:
-            if pattern in path_lower:
-                return category
-
-    # Check for test file first
-    for test_pattern in FILE_CATEGORIES["testing"]:
-        if test_pattern in path_lower:
-            return "testing"
-
-    # Check each category
-    for category, extensions in FILE_CATEGORIES.items():
-        if category == "testing":  # Already handled above
-            continue
-        if suffix in extensions or Path(file_path).name in extensions:
-            return category
-
-    return None
+    return _ROLE_CLASSIFIER.classify(file_path)
 
 
 def analyze_file_categories(file_contributions: list[FileContribution]) -> dict[str, CategoryStats]:
@@ -334,7 +318,10 @@ def detect_specialized_role(
 
 
 def detect_enhanced_user_role(
-    project_path: Path, current_user: str | None, author_contributions: list[AuthorContribution]
+    project_path: Path,
+    current_user: str | None,
+    author_contributions: list[AuthorContribution],
+    history: GitHistory | None = None,
 ) -> UserRoleType | None:
     """Main entry point for enhanced role detection.
 
@@ -345,6 +332,7 @@ def detect_enhanced_user_role(
         project_path: Path to the project repository
         current_user: Current user's Git identity
         author_contributions: List of all author contributions
+        history: Pre-loaded Git history of the project, if available
 
     Returns:
         UserRoleType or None if detection fails
@@ -367,6 +355,7 @@ def detect_enhanced_user_role(
     file_contributions = get_user_file_contributions(
         project_path,
         current_user,
+        history=history,
     )
 
     if not file_contributions:
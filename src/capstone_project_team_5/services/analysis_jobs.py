@@ -0,0 +1,367 @@
+"""Background queue and worker pool for project analysis jobs.
+
+Jobs are stored in the application database (``analysis_jobs`` and
+``analysis_job_projects``), which doubles as the queue: workers claim the
+oldest queued job with a conditional UPDATE, so a job is only ever run by
+one worker and queued work survives a restart. The worker pool is a small
+thread pool sized by ``ZIP2JOB_ANALYSIS_WORKERS`` (default 2).
+
+A claimed job records the ID of the process running it and a lease of
+``ZIP2JOB_ANALYSIS_JOB_LEASE_SECONDS`` (default 300). A heartbeat thread renews
+the leases of this process's jobs and requeues running jobs whose lease has
+expired, so a job abandoned by a crashed process is picked up again while jobs
+still owned by a live process (another instance, or an overlapping deploy) are
+left alone.
+
+The analysis of an individual project is supplied by the caller as a
+``ProjectAnalysisHandler`` so this module stays independent of the API layer.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import Session, selectinload
+
+from capstone_project_team_5.data.db import get_session
+from capstone_project_team_5.data.models import AnalysisJob, AnalysisJobProject, User
+from capstone_project_team_5.data.models.analysis_job import (
+    ITEM_CANCELLED,
+    ITEM_FAILED,
+    ITEM_QUEUED,
+    ITEM_RUNNING,
+    JOB_CANCELLED,
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+)
+
+logger = logging.getLogger(__name__)
+
+ProjectAnalysisHandler = Callable[[int, str, bool, bool], tuple[str, str | None]]
+"""Analyze one project: ``(project_id, username, use_ai, force) -> (status, reason)``.
+
+``status`` is one of the final item statuses (``analyzed``, ``skipped`` or
+``failed``). Exceptions raised by the handler mark the project as failed.
+"""
+
+_DEFAULT_WORKERS = 2
+_DEFAULT_LEASE_SECONDS = 300.0
+
+_WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_heartbeat: threading.Thread | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared worker pool, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            try:
+                workers = int(os.getenv("ZIP2JOB_ANALYSIS_WORKERS", ""))
+            except ValueError:
+                workers = _DEFAULT_WORKERS
+            _executor = ThreadPoolExecutor(
+                max_workers=max(workers, 1), thread_name_prefix="analysis-job"
+            )
+        return _executor
+
+
+def _resolve_lease_seconds() -> float:
+    """Return the job lease length from ``ZIP2JOB_ANALYSIS_JOB_LEASE_SECONDS``."""
+    try:
+        return max(float(os.getenv("ZIP2JOB_ANALYSIS_JOB_LEASE_SECONDS", "")), 1.0)
+    except ValueError:
+        return _DEFAULT_LEASE_SECONDS
+
+
+def _lease_deadline() -> datetime:
+    return datetime.now(UTC) + timedelta(seconds=_resolve_lease_seconds())
+
+
+def _start_heartbeat(handler: ProjectAnalysisHandler) -> None:
+    """Start the thread that renews this process's leases, once per process."""
+    global _heartbeat
+    with _executor_lock:
+        if _heartbeat is not None:
+            return
+        _heartbeat = threading.Thread(
+            target=_heartbeat_loop, args=(handler,), name="analysis-job-heartbeat", daemon=True
+        )
+        _heartbeat.start()
+
+
+def _heartbeat_loop(handler: ProjectAnalysisHandler) -> None:
+    interval = _resolve_lease_seconds() / 3
+    while True:
+        time.sleep(interval)
+        try:
+            with get_session() as session:
+                session.execute(
+                    update(AnalysisJob)
+                    .where(AnalysisJob.worker_id == _WORKER_ID, AnalysisJob.status == JOB_RUNNING)
+                    .values(lease_expires_at=_lease_deadline())
+                )
+                requeued = _requeue_expired_jobs(session)
+        except Exception:
+            logger.warning("Could not renew analysis job leases", exc_info=True)
+            continue
+        executor = _get_executor()
+        for _ in range(requeued):
+            executor.submit(_run_next_job, handler)
+
+
+def _requeue_expired_jobs(session: Session) -> int:
+    """Return running jobs whose lease has expired to the queue; return how many."""
+    now = datetime.now(UTC)
+    expired = or_(AnalysisJob.lease_expires_at.is_(None), AnalysisJob.lease_expires_at < now)
+    job_ids = session.scalars(
+        select(AnalysisJob.id).where(AnalysisJob.status == JOB_RUNNING, expired)
+    ).all()
+    requeued = 0
+    for job_id in job_ids:
+        # Conditional, so a lease renewed in the meantime keeps its job
+        claimed = session.execute(
+            update(AnalysisJob)
+            .where(AnalysisJob.id == job_id, AnalysisJob.status == JOB_RUNNING, expired)
+            .values(status=JOB_QUEUED, worker_id=None, lease_expires_at=None)
+        ).rowcount
+        if not claimed:
+            continue
+        session.execute(
+            update(AnalysisJobProject)
+            .where(AnalysisJobProject.job_id == job_id, AnalysisJobProject.status == ITEM_RUNNING)
+            .values(status=ITEM_QUEUED, started_at=None)
+        )
+        requeued += 1
+    if requeued:
+        logger.info("Requeued %d analysis jobs whose worker stopped renewing its lease", requeued)
+    return requeued
+
+
+def enqueue_analysis_job(
+    user_id: int,
+    project_ids: Sequence[int],
+    handler: ProjectAnalysisHandler,
+    *,
+    use_ai: bool = False,
+    force: bool = False,
+) -> int:
+    """Persist a new job for ``project_ids`` and schedule it on the worker pool.
+
+    Args:
+        user_id: ID of the user requesting the analysis.
+        project_ids: Projects to analyze, in processing order.
+        handler: Callable that analyzes a single project.
+        use_ai: Whether AI-generated bullets were requested.
+        force: Whether cached analyses should be ignored.
+
+    Returns:
+        The ID of the queued job.
+    """
+    with get_session() as session:
+        job = AnalysisJob(user_id=user_id, status=JOB_QUEUED, use_ai=use_ai, force=force)
+        job.projects = [
+            AnalysisJobProject(project_id=project_id, position=position, status=ITEM_QUEUED)
+            for position, project_id in enumerate(project_ids)
+        ]
+        session.add(job)
+        session.flush()
+        job_id = job.id
+
+    _start_heartbeat(handler)
+    _get_executor().submit(_run_next_job, handler)
+    return job_id
+
+
+def get_analysis_job(session: Session, job_id: int, user_id: int) -> AnalysisJob | None:
+    """Return the job with its per-project progress if it belongs to ``user_id``."""
+    return session.scalar(
+        select(AnalysisJob)
+        .options(selectinload(AnalysisJob.projects))
+        .where(AnalysisJob.id == job_id, AnalysisJob.user_id == user_id)
+    )
+
+
+def cancel_analysis_job(session: Session, job: AnalysisJob) -> None:
+    """Request cancellation of ``job``.
+
+    A job that has not started yet is cancelled immediately. A running job
+    finishes the project it is working on and then stops; its remaining
+    projects are marked as cancelled.
+    """
+    if job.status not in (JOB_QUEUED, JOB_RUNNING):
+        return
+
+    job.cancel_requested = True
+    if job.status == JOB_QUEUED:
+        claimed = session.execute(
+            update(AnalysisJob)
+            .where(AnalysisJob.id == job.id, AnalysisJob.status == JOB_QUEUED)
+            .values(status=JOB_CANCELLED, cancel_requested=True, finished_at=datetime.now(UTC))
+        ).rowcount
+        if claimed:
+            _cancel_remaining(session, job.id)
+    session.flush()
+    session.refresh(job)
+
+
+def resume_analysis_jobs(handler: ProjectAnalysisHandler) -> int:
+    """Requeue abandoned jobs and schedule every queued job.
+
+    Only running jobs whose lease has expired are requeued; jobs of a live
+    worker keep running there. Jobs whose lease runs out later are requeued
+    by the heartbeat started here.
+
+    Args:
+        handler: Callable that analyzes a single project.
+
+    Returns:
+        Number of jobs scheduled.
+    """
+    _start_heartbeat(handler)
+    with get_session() as session:
+        _requeue_expired_jobs(session)
+        pending = len(
+            session.scalars(select(AnalysisJob.id).where(AnalysisJob.status == JOB_QUEUED)).all()
+        )
+
+    executor = _get_executor()
+    for _ in range(pending):
+        executor.submit(_run_next_job, handler)
+    return pending
+
+
+def _cancel_remaining(session: Session, job_id: int) -> None:
+    session.execute(
+        update(AnalysisJobProject)
+        .where(AnalysisJobProject.job_id == job_id, AnalysisJobProject.status == ITEM_QUEUED)
+        .values(status=ITEM_CANCELLED, finished_at=datetime.now(UTC))
+    )
+
+
+def _claim_next_job() -> int | None:
+    """Atomically move the oldest queued job to ``running`` and return its ID."""
+    while True:
+        with get_session() as session:
+            job_id = session.scalar(
+                select(AnalysisJob.id)
+                .where(AnalysisJob.status == JOB_QUEUED)
+                .order_by(AnalysisJob.id)
+                .limit(1)
+            )
+            if job_id is None:
+                return None
+            claimed = session.execute(
+                update(AnalysisJob)
+                .where(AnalysisJob.id == job_id, AnalysisJob.status == JOB_QUEUED)
+                .values(
+                    status=JOB_RUNNING,
+                    started_at=datetime.now(UTC),
+                    worker_id=_WORKER_ID,
+                    lease_expires_at=_lease_deadline(),
+                )
+            ).rowcount
+        if claimed:
+            return job_id
+        # Another worker claimed it first; try the next one.
+
+
+def _run_next_job(handler: ProjectAnalysisHandler) -> None:
+    """Worker entry point: claim one queued job and process its projects."""
+    job_id = _claim_next_job()
+    if job_id is None:
+        return
+
+    try:
+        _process_job(job_id, handler)
+    except Exception as exc:
+        logger.exception("Analysis job %s failed", job_id)
+        with get_session() as session:
+            session.execute(
+                update(AnalysisJob)
+                .where(AnalysisJob.id == job_id)
+                .values(
+                    status=JOB_FAILED,
+                    error=str(exc),
+                    finished_at=datetime.now(UTC),
+                    lease_expires_at=None,
+                )
+            )
+            _cancel_remaining(session, job_id)
+
+
+def _process_job(job_id: int, handler: ProjectAnalysisHandler) -> None:
+    with get_session() as session:
+        job = session.get(AnalysisJob, job_id)
+        if job is None:
+            return
+        user = session.get(User, job.user_id)
+        username = user.username if user is not None else ""
+        use_ai, force = job.use_ai, job.force
+        item_ids = session.scalars(
+            select(AnalysisJobProject.id)
+            .where(
+                AnalysisJobProject.job_id == job_id,
+                AnalysisJobProject.status == ITEM_QUEUED,
+            )
+            .order_by(AnalysisJobProject.position)
+        ).all()
+
+    for item_id in item_ids:
+        with get_session() as session:
+            owner, cancelled = session.execute(
+                select(AnalysisJob.worker_id, AnalysisJob.cancel_requested).where(
+                    AnalysisJob.id == job_id
+                )
+            ).one()
+            if owner != _WORKER_ID:
+                # The lease lapsed and another worker has taken the job over
+                logger.warning("Analysis job %s was requeued; stopping here", job_id)
+                return
+            if cancelled:
+                break
+            item = session.get(AnalysisJobProject, item_id)
+            if item is None or item.status != ITEM_QUEUED:
+                continue
+            item.status = ITEM_RUNNING
+            item.started_at = datetime.now(UTC)
+            project_id = item.project_id
+
+        try:
+            item_status, reason = handler(project_id, username, use_ai, force)
+        except Exception as exc:
+            logger.exception("Analysis of project %s in job %s failed", project_id, job_id)
+            item_status, reason = ITEM_FAILED, f"Project analysis failed: {exc!s}"
+
+        with get_session() as session:
+            session.execute(
+                update(AnalysisJobProject)
+                .where(AnalysisJobProject.id == item_id)
+                .values(status=item_status, reason=reason, finished_at=datetime.now(UTC))
+            )
+
+    with get_session() as session:
+        job = session.get(AnalysisJob, job_id)
+        if job is None:
+            return
+        if job.cancel_requested:
+            _cancel_remaining(session, job_id)
+            job.status = JOB_CANCELLED
+        else:
+            job.status = JOB_COMPLETED
+        job.finished_at = datetime.now(UTC)
+        job.lease_expires_at = None
@@ -0,0 +1,324 @@
+"""Mark-and-sweep garbage collection for stored upload artifacts.
+
+Uploads leave a manifest and objects in the content store, an archive under
+the upload storage root, and per-project caches. Deleting projects only
+removes database rows, so this module reclaims whatever is no longer
+referenced:
+
+- Roots are the uploads still referenced by a project (directly or through an
+  artifact source) and the projects that still exist.
+- Mark: every object named by a root upload's manifest is referenced; the
+  reference count of an object is the number of such manifests.
+- Sweep: manifests and archives of unreferenced uploads, caches of deleted
+  projects, objects without references and the per-file analysis results of
+  those objects are removed.
+- Expire: cached Git histories are keyed by repository lineage rather than by
+  project, so they are removed once unused for ``ZIP2JOB_GIT_CACHE_MAX_AGE_SECONDS``
+  (default 30 days, never less than the grace period).
+
+Anything newer than the grace period (``ZIP2JOB_GC_GRACE_SECONDS``, default one
+hour) is kept, so uploads still being committed are never collected. The sweep
+runs under the exclusive ``store_lock``, which ingest holds shared, making it
+safe to run while uploads are ingested. A dry run changes nothing on disk, not
+even legacy manifests, and only takes the lock shared.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import re
+import shutil
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from capstone_project_team_5.services.content_store import (
+    get_analysis_cache_root,
+    get_file_result_cache,
+    get_ingest_temp_root,
+    get_manifests_root,
+    get_objects_root,
+    get_project_views_root,
+    open_manifest,
+    store_lock,
+)
+from capstone_project_team_5.services.git_cache import get_git_cache_root
+from capstone_project_team_5.services.upload_storage import (
+    get_upload_storage_root,
+    get_upload_temp_root,
+)
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_GRACE_SECONDS = 3600.0
+_DEFAULT_GIT_CACHE_MAX_AGE_SECONDS = 30 * 24 * 3600.0
+_MANIFEST_NAME = re.compile(r"^(\d+)\.(?:manifest|json)$")
+_PROJECT_FILE_NAME = re.compile(r"^project_(\d+)\.(?:json|tmp)$")
+_OBJECT_NAME = re.compile(r"^[0-9a-f]{64}$")
+_FILE_RESULT_NAME = re.compile(r"^([0-9a-f]{64})\.json$")
+
+
+@dataclass(slots=True)
+class GarbageCollectionReport:
+    """Outcome of one collection.
+
+    Attributes:
+        dry_run: Whether garbage was only counted, not removed.
+        manifests_removed: Manifests of unreferenced uploads.
+        upload_archives_removed: Stored archives of unreferenced uploads.
+        project_files_removed: Cached analyses and views of deleted projects.
+        objects_referenced: Distinct objects referenced by live manifests.
+        objects_removed: Objects without references.
+        file_results_removed: Per-file analysis results of unreferenced objects.
+        git_histories_removed: Cached Git histories unused for too long.
+        temp_files_removed: Leftovers of interrupted ingests and writes.
+        bytes_reclaimed: Total size of everything removed.
+    """
+
+    dry_run: bool = False
+    manifests_removed: int = 0
+    upload_archives_removed: int = 0
+    project_files_removed: int = 0
+    objects_referenced: int = 0
+    objects_removed: int = 0
+    file_results_removed: int = 0
+    git_histories_removed: int = 0
+    temp_files_removed: int = 0
+    bytes_reclaimed: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the report as a JSON-serializable dict."""
+        return asdict(self)
+
+
+def _resolve_grace_seconds() -> float:
+    """Return the grace period from ``ZIP2JOB_GC_GRACE_SECONDS``."""
+    try:
+        return max(float(os.getenv("ZIP2JOB_GC_GRACE_SECONDS", "")), 0.0)
+    except ValueError:
+        return _DEFAULT_GRACE_SECONDS
+
+
+def _resolve_git_cache_max_age_seconds() -> float:
+    """Return how long an unused Git history is kept, from ``ZIP2JOB_GIT_CACHE_MAX_AGE_SECONDS``."""
+    try:
+        return max(float(os.getenv("ZIP2JOB_GIT_CACHE_MAX_AGE_SECONDS", "")), 0.0)
+    except ValueError:
+        return _DEFAULT_GIT_CACHE_MAX_AGE_SECONDS
+
+
+def _iter_children(directory: Path) -> Iterator[os.DirEntry[str]]:
+    try:
+        with os.scandir(directory) as entries:
+            yield from entries
+    except FileNotFoundError:
+        return
+
+
+def _tree_size(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    return sum(child.stat().st_size for child in path.rglob("*") if child.is_file())
+
+
+class _Sweeper:
+    """Removes expired garbage and keeps the report's tallies."""
+
+    def __init__(self, report: GarbageCollectionReport, cutoff: float) -> None:
+        self.report = report
+        self.cutoff = cutoff
+
+    def expired(self, entry: os.DirEntry[str], cutoff: float | None = None) -> bool:
+        limit = self.cutoff if cutoff is None else cutoff
+        return entry.stat(follow_symlinks=False).st_mtime < limit
+
+    def remove(self, path: Path, counter: str) -> None:
+        """Remove ``path`` (file or tree) and count it under ``counter``."""
+        try:
+            size = _tree_size(path)
+            if not self.report.dry_run:
+                if path.is_dir():
+                    shutil.rmtree(path)
+                else:
+                    path.unlink()
+        except FileNotFoundError:
+            return
+        except OSError:
+            logger.warning("Could not remove %s", path, exc_info=True)
+            return
+        setattr(self.report, counter, getattr(self.report, counter) + 1)
+        self.report.bytes_reclaimed += size
+
+
+def collect_garbage(
+    live_upload_ids: Iterable[int],
+    live_project_ids: Iterable[int],
+    *,
+    grace_seconds: float | None = None,
+    dry_run: bool = False,
+) -> GarbageCollectionReport:
+    """Remove stored artifacts no longer referenced by any live upload or project.
+
+    Args:
+        live_upload_ids: Uploads still referenced by a project.
+        live_project_ids: Projects that still exist.
+        grace_seconds: Keep anything modified more recently than this.
+            Defaults to ``ZIP2JOB_GC_GRACE_SECONDS`` (one hour).
+        dry_run: Only report what would be removed.
+
+    Returns:
+        GarbageCollectionReport with the counts and bytes reclaimed.
+    """
+    live_uploads = set(live_upload_ids)
+    live_projects = set(live_project_ids)
+    grace = _resolve_grace_seconds() if grace_seconds is None else grace_seconds
+    report = GarbageCollectionReport(dry_run=dry_run)
+    sweeper = _Sweeper(report, time.time() - grace)
+
+    # A dry run only reads the store, so it does not need to block ingest
+    with store_lock(exclusive=not dry_run):
+        # Manifests of unreferenced uploads stay roots until they expire
+        root_uploads: set[int] = set()
+        for entry in _iter_children(get_manifests_root()):
+            match = _MANIFEST_NAME.match(entry.name)
+            if match is None:
+                continue
+            upload_id = int(match.group(1))
+            if upload_id in live_uploads or not sweeper.expired(entry):
+                root_uploads.add(upload_id)
+            else:
+                sweeper.remove(Path(entry.path), "manifests_removed")
+
+        references: Counter[str] = Counter()
+        complete = True
+        for upload_id in sorted(root_uploads):
+            manifest = open_manifest(upload_id, migrate=not dry_run)
+            if manifest is None:
+                # Unreadable or mid-write; its objects cannot be told apart
+                complete = False
+                continue
+            references.update(manifest.hashes())
+        report.objects_referenced = len(references)
+
+        if complete:
+            for prefix in _iter_children(get_objects_root()):
+                if not prefix.is_dir(follow_symlinks=False):
+                    continue
+                for entry in _iter_children(Path(prefix.path)):
+                    if not _OBJECT_NAME.match(entry.name):
+                        continue
+                    if entry.name not in references and sweeper.expired(entry):
+                        sweeper.remove(Path(entry.path), "objects_removed")
+            # Summaries are keyed by content hash, so they die with their object
+            for namespace in _iter_children(get_file_result_cache().root):
+                if not namespace.is_dir(follow_symlinks=False):
+                    continue
+                for prefix in _iter_children(Path(namespace.path)):
+                    if not prefix.is_dir(follow_symlinks=False):
+                        continue
+                    for entry in _iter_children(Path(prefix.path)):
+                        if not sweeper.expired(entry):
+                            continue
+                        if entry.name.endswith(".tmp"):
+                            sweeper.remove(Path(entry.path), "temp_files_removed")
+                            continue
+                        match = _FILE_RESULT_NAME.match(entry.name)
+                        if match is not None and match.group(1) not in references:
+                            sweeper.remove(Path(entry.path), "file_results_removed")
+        else:
+            logger.warning("Skipping the object sweep: some live manifests could not be read")
+
+        for temp_root in (get_ingest_temp_root(), get_upload_temp_root()):
+            for entry in _iter_children(temp_root):
+                if sweeper.expired(entry):
+                    sweeper.remove(Path(entry.path), "temp_files_removed")
+
+    for directory in (get_analysis_cache_root(), get_project_views_root()):
+        for entry in _iter_children(directory):
+            match = _PROJECT_FILE_NAME.match(entry.name)
+            if match is None or int(match.group(1)) in live_projects:
+                continue
+            if sweeper.expired(entry):
+                sweeper.remove(Path(entry.path), "project_files_removed")
+
+    # Histories are refreshed on every use, so their mtime is the last use
+    git_cutoff = time.time() - max(grace, _resolve_git_cache_max_age_seconds())
+    for entry in _iter_children(get_git_cache_root()):
+        if entry.name.endswith(".tmp"):
+            if sweeper.expired(entry):
+                sweeper.remove(Path(entry.path), "temp_files_removed")
+        elif entry.name.endswith(".json") and sweeper.expired(entry, git_cutoff):
+            sweeper.remove(Path(entry.path), "git_histories_removed")
+
+    for entry in _iter_children(get_upload_storage_root()):
+        if not entry.name.isdigit() or int(entry.name) in live_uploads:
+            continue
+        if sweeper.expired(entry):
+            sweeper.remove(Path(entry.path), "upload_archives_removed")
+
+    logger.info(
+        "Artifact GC%s: reclaimed %d bytes (%d objects, %d manifests, %d archives)",
+        " (dry run)" if dry_run else "",
+        report.bytes_reclaimed,
+        report.objects_removed,
+        report.manifests_removed,
+        report.upload_archives_removed,
+    )
+    return report
+
+
+def get_live_artifact_ids() -> tuple[set[int], set[int]]:
+    """Return the IDs of uploads referenced by a project and of existing projects."""
+    from capstone_project_team_5.data.db import get_session
+    from capstone_project_team_5.data.models import ArtifactSource, Project
+
+    with get_session() as session:
+        project_rows = session.query(Project.id, Project.upload_id).all()
+        source_upload_ids = {
+            upload_id for (upload_id,) in session.query(ArtifactSource.upload_id).all()
+        }
+    live_projects = {project_id for project_id, _upload_id in project_rows}
+    live_uploads = {upload_id for _project_id, upload_id in project_rows} | source_upload_ids
+    return live_uploads, live_projects
+
+
+def collect_unreferenced_artifacts(
+    *, grace_seconds: float | None = None, dry_run: bool = False
+) -> GarbageCollectionReport:
+    """Collect garbage using the database's projects and uploads as roots."""
+    live_uploads, live_projects = get_live_artifact_ids()
+    return collect_garbage(
+        live_uploads, live_projects, grace_seconds=grace_seconds, dry_run=dry_run
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point: run one collection and print its report."""
+    parser = argparse.ArgumentParser(
+        description="Remove stored upload artifacts that no project references."
+    )
+    parser.add_argument("--dry-run", action="store_true", help="only report what would be removed")
+    parser.add_argument(
+        "--grace-seconds",
+        type=float,
+        default=None,
+        help="keep anything newer than this (default: ZIP2JOB_GC_GRACE_SECONDS or 3600)",
+    )
+    args = parser.parse_args(argv)
+
+    from capstone_project_team_5.data.db import init_db
+
+    init_db()
+    report = collect_unreferenced_artifacts(grace_seconds=args.grace_seconds, dry_run=args.dry_run)
+    print(json.dumps(report.to_dict(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,21 +3,64 @@
 from __future__ import annotations
 
 import contextlib
+import errno
 import hashlib
 import json
+import logging
 import os
+import shutil
+import struct
+import sys
 import tempfile
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path, PurePosixPath
-from typing import Any, BinaryIO
-from zipfile import BadZipFile, ZipFile
+from typing import Any, BinaryIO, Literal
+from zipfile import BadZipFile, ZipFile, ZipInfo
 
+from capstone_project_team_5.file_result_cache import FileResultCache
 from capstone_project_team_5.models.upload import InvalidZipError
+from capstone_project_team_5.project_scan import ProjectScan
+from capstone_project_team_5.services.object_codec import (
+    copy_object,
+    encode_object,
+    object_codec,
+    read_object,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+MaterializeMode = Literal["auto", "hardlink", "reflink", "symlink", "copy"]
 
 _OBJECTS_DIR_NAME = "objects"
 _MANIFESTS_DIR_NAME = "manifests"
 _ANALYSIS_CACHE_DIR_NAME = "analysis_cache"
+_FILE_RESULTS_DIR_NAME = "files"
+_PROJECT_VIEWS_DIR_NAME = "project_views"
+_PROJECT_VIEW_VERSION = 1
+_TEMP_DIR_NAME = "tmp"
+_STORE_LOCK_NAME = ".store.lock"
 _STREAM_CHUNK_SIZE = 1024 * 1024
+_DEFAULT_INGEST_WORKERS = 4
+_MATERIALIZE_MODES = ("auto", "hardlink", "reflink", "symlink", "copy")
+_MANIFEST_SUFFIX = ".manifest"
+_MANIFEST_MAGIC = b"Z2JMAN\x00\x01"
+# upload_id, file count, created_at length, path blob length
+_MANIFEST_HEADER = struct.Struct("<qIII")
+_DIGEST_SIZE = hashlib.sha256().digest_size
+_DEFAULT_MANIFEST_CACHE_SIZE = 64
+_FICLONE = 0x40049409  # Linux ioctl: share extents with another file (btrfs, XFS, ...)
 
 
 def get_artifact_store_root() -> Path:
@@ -45,6 +88,46 @@ def get_analysis_cache_root() -> Path:
     return get_artifact_store_root() / _ANALYSIS_CACHE_DIR_NAME
 
 
+def get_ingest_temp_root() -> Path:
+    """Return the directory ingest spools archive members into."""
+    return get_artifact_store_root() / _TEMP_DIR_NAME
+
+
+def get_file_result_cache() -> FileResultCache:
+    """Return the cache of per-file analysis summaries, keyed by content hash."""
+    return FileResultCache(get_analysis_cache_root() / _FILE_RESULTS_DIR_NAME)
+
+
+def get_project_views_root() -> Path:
+    """Return the merged project views root directory."""
+    return get_artifact_store_root() / _PROJECT_VIEWS_DIR_NAME
+
+
+@contextlib.contextmanager
+def store_lock(*, exclusive: bool = False) -> Iterator[None]:
+    """Hold the store-wide lock across processes.
+
+    Ingest holds it shared while it checks for and adds objects, and
+    materialization while it links objects into a tree, so any number of
+    them proceed together. Garbage collection and the compression migration
+    hold it exclusively, so they never remove or rewrite an object that an
+    ingest has just decided to reuse or a tree is being linked to. Where
+    ``flock`` is unavailable (Windows) this is a no-op and collection relies
+    on its grace period alone.
+    """
+    if fcntl is None:
+        yield
+        return
+    root = get_artifact_store_root()
+    root.mkdir(parents=True, exist_ok=True)
+    with open(root / _STORE_LOCK_NAME, "a+b") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
 def _normalize_zip_path(name: str) -> str | None:
     normalized = name.replace("\\", "/").lstrip("/")
     if not normalized or normalized.endswith("/"):
@@ -55,15 +138,6 @@ def _normalize_zip_path(name: str) -> str | None:
     return "/".join(part for part in parts if part)
 
 
-def _hash_stream(source: BinaryIO) -> tuple[str, int]:
-    hasher = hashlib.sha256()
-    size = 0
-    for chunk in iter(lambda: source.read(_STREAM_CHUNK_SIZE), b""):
-        hasher.update(chunk)
-        size += len(chunk)
-    return hasher.hexdigest(), size
-
-
 def _write_stream_and_hash(source: BinaryIO, destination: BinaryIO) -> tuple[str, int]:
     hasher = hashlib.sha256()
     size = 0
@@ -71,8 +145,6 @@ def _write_stream_and_hash(source: BinaryIO, destination: BinaryIO) -> tuple[str
         destination.write(chunk)
         hasher.update(chunk)
         size += len(chunk)
-    destination.flush()
-    os.fsync(destination.fileno())
     return hasher.hexdigest(), size
 
 
@@ -81,15 +153,122 @@ def _object_path(content_hash: str) -> Path:
     return get_objects_root() / prefix / content_hash
 
 
+def _resolve_ingest_workers() -> int:
+    """Return the ingest thread count from ``ZIP2JOB_INGEST_WORKERS``."""
+    try:
+        return max(int(os.getenv("ZIP2JOB_INGEST_WORKERS", "")), 1)
+    except ValueError:
+        return _DEFAULT_INGEST_WORKERS
+
+
+class _ArchiveReaders:
+    """One open ``ZipFile`` per ingest thread, closed together at the end."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._opened: list[ZipFile] = []
+
+    def get(self) -> ZipFile:
+        archive = getattr(self._local, "archive", None)
+        if archive is None:
+            archive = self._local.archive = ZipFile(self._path)
+            with self._lock:
+                self._opened.append(archive)
+        return archive
+
+    def close(self) -> None:
+        for archive in self._opened:
+            archive.close()
+
+
+class _ClaimedHashes:
+    """Thread-safe set of hashes already being stored by this ingest."""
+
+    def __init__(self) -> None:
+        self._hashes: set[str] = set()
+        self._lock = threading.Lock()
+
+    def claim(self, content_hash: str) -> bool:
+        with self._lock:
+            if content_hash in self._hashes:
+                return False
+            self._hashes.add(content_hash)
+            return True
+
+
+def _spool_member(
+    readers: _ArchiveReaders, info: ZipInfo, temp_dir: Path, claimed: _ClaimedHashes
+) -> tuple[str, int, Path | None]:
+    """Decompress one member once, hashing it while spooling to a temp file.
+
+    Returns:
+        ``(content_hash, size, temp_path)``. ``temp_path`` holds the encoded
+        object to store, or is None when the content is already stored or is
+        being stored for another member.
+    """
+    with (
+        readers.get().open(info) as source,
+        tempfile.NamedTemporaryFile(mode="wb", dir=temp_dir, delete=False) as temp_file,
+    ):
+        content_hash, size = _write_stream_and_hash(source, temp_file)
+
+    temp_path = Path(temp_file.name)
+    if _object_path(content_hash).exists() or not claimed.claim(content_hash):
+        temp_path.unlink()
+        return content_hash, size, None
+    encoded_path = encode_object(temp_path, temp_dir)
+    if encoded_path is None:
+        return content_hash, size, temp_path
+    temp_path.unlink()
+    return content_hash, size, encoded_path
+
+
+def _store_directory_batch(directory: Path, pending: list[tuple[Path, Path]]) -> None:
+    """Move the new objects of one directory into place with a single directory fsync.
+
+    Each object's data is flushed before it becomes visible under its hash, so
+    an object that exists is always complete; the directory entry is flushed
+    once for the whole batch.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    for temp_path, object_path in pending:
+        with open(temp_path, "rb") as handle:
+            os.fsync(handle.fileno())
+        os.replace(temp_path, object_path)
+    # Directories cannot be opened for fsync on every platform (e.g. Windows).
+    with contextlib.suppress(OSError):
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
 def ingest_zip(zip_path: Path | str, upload_id: int) -> dict[str, Any]:
     """Ingest a zip file into the content store and write a manifest.
 
+    Members are ingested concurrently on a bounded thread pool
+    (``ZIP2JOB_INGEST_WORKERS``, default 4). Each member is decompressed once
+    and hashed while it is spooled to a temporary file; content that is
+    already stored is discarded, new content is compressed when worthwhile
+    (see ``object_codec``). New objects are then moved into the store in
+    one batch per object directory, before the manifest is written. The
+    shared ``store_lock`` is held throughout so garbage collection cannot
+    remove reused objects before the manifest references them.
+
     Returns the manifest content as a dict.
     """
     path = Path(zip_path)
     if path.suffix.lower() != ".zip" or not path.is_file():
         raise InvalidZipError(f"Expected a .zip file. Received: {path.name}")
 
+    with store_lock():
+        return _ingest_zip_locked(path, upload_id)
+
+
+def _ingest_zip_locked(path: Path, upload_id: int) -> dict[str, Any]:
     manifest: dict[str, Any] = {
         "upload_id": upload_id,
         "created_at": datetime.now(UTC).isoformat(),
@@ -98,150 +277,508 @@ def ingest_zip(zip_path: Path | str, upload_id: int) -> dict[str, Any]:
 
     objects_root = get_objects_root()
     objects_root.mkdir(parents=True, exist_ok=True)
+    temp_root = get_ingest_temp_root()
+    temp_root.mkdir(parents=True, exist_ok=True)
+    temp_dir = Path(tempfile.mkdtemp(prefix=f"ingest-{upload_id}-", dir=temp_root))
 
+    readers = _ArchiveReaders(path)
+    claimed = _ClaimedHashes()
+    executor = ThreadPoolExecutor(
+        max_workers=_resolve_ingest_workers(), thread_name_prefix="ingest"
+    )
     try:
-        with ZipFile(path) as archive:
-            for info in archive.infolist():
-                normalized = _normalize_zip_path(info.filename)
-                if normalized is None:
-                    continue
-                with archive.open(info) as source:
-                    content_hash, size = _hash_stream(source)
+        members = [
+            (normalized, info)
+            for info in readers.get().infolist()
+            if (normalized := _normalize_zip_path(info.filename)) is not None
+        ]
+        results = list(
+            executor.map(
+                lambda member: _spool_member(readers, member[1], temp_dir, claimed), members
+            )
+        )
+
+        batches: dict[Path, list[tuple[Path, Path]]] = defaultdict(list)
+        for content_hash, _size, temp_path in results:
+            if temp_path is not None:
                 object_path = _object_path(content_hash)
-                if not object_path.exists():
-                    object_path.parent.mkdir(parents=True, exist_ok=True)
-                    temp_path: Path | None = None
-                    try:
-                        with tempfile.NamedTemporaryFile(
-                            mode="wb",
-                            dir=object_path.parent,
-                            suffix=".tmp",
-                            delete=False,
-                        ) as temp_file:
-                            temp_path = Path(temp_file.name)
-                            with archive.open(info) as source:
-                                final_hash, final_size = _write_stream_and_hash(source, temp_file)
-                        if final_hash != content_hash:
-                            raise RuntimeError(
-                                "Content hash mismatch while streaming archive entry."
-                            )
-                        if object_path.exists():
-                            temp_path.unlink(missing_ok=True)
-                        else:
-                            os.replace(temp_path, object_path)
-                        size = final_size
-                        content_hash = final_hash
-                    except Exception:
-                        if temp_path is not None:
-                            with contextlib.suppress(FileNotFoundError):
-                                temp_path.unlink()
-                        raise
-
-                manifest["files"][normalized] = {
-                    "hash": content_hash,
-                    "size": size,
-                }
+                batches[object_path.parent].append((temp_path, object_path))
+        list(executor.map(lambda batch: _store_directory_batch(*batch), batches.items()))
     except BadZipFile as exc:
         raise InvalidZipError(f"{path.name} is not a valid ZIP archive") from exc
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        readers.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    for (normalized, _info), (content_hash, size, _temp_path) in zip(members, results, strict=True):
+        manifest["files"][normalized] = {
+            "hash": content_hash,
+            "size": size,
+        }
+
+    _write_manifest(Manifest.from_dict(manifest))
+    return manifest
+
+
+class _PathKeys:
+    """Read-only sequence view of a manifest's sorted paths, for ``bisect``."""
+
+    __slots__ = ("_blob", "_offsets")
+
+    def __init__(self, blob: bytes, offsets: array[int]) -> None:
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> bytes:
+        return self._blob[self._offsets[index] : self._offsets[index + 1]]
+
+
+class Manifest:
+    """Path-sorted, columnar manifest of one upload.
+
+    Paths are kept sorted as one UTF-8 blob with offsets, next to raw SHA-256
+    digests and sizes, so the files under a project prefix are found with a
+    binary search: O(log n + k) for k matching files, without parsing or
+    scanning the rest of the upload.
+    """
+
+    __slots__ = ("upload_id", "created_at", "timestamp", "_digests", "_sizes", "_offsets", "_paths")
+
+    def __init__(
+        self,
+        upload_id: int,
+        created_at: str,
+        digests: bytes,
+        sizes: array[int],
+        offsets: array[int],
+        paths: bytes,
+    ) -> None:
+        self.upload_id = upload_id
+        self.created_at = created_at
+        self.timestamp = _manifest_timestamp({"created_at": created_at})
+        self._digests = digests
+        self._sizes = sizes
+        self._offsets = offsets
+        self._paths = paths
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    @classmethod
+    def from_dict(cls, manifest: dict[str, Any]) -> Manifest:
+        """Build a manifest from the ``{"upload_id", "created_at", "files"}`` dict form.
+
+        Paths that are not normalized archive paths and entries without a
+        valid SHA-256 are dropped.
+        """
+        entries: dict[bytes, tuple[bytes, int]] = {}
+        for file_path, meta in (manifest.get("files") or {}).items():
+            safe_path = _normalize_zip_path(str(file_path))
+            try:
+                digest = bytes.fromhex(str(meta.get("hash", "")))
+            except ValueError:
+                continue
+            if safe_path is None or len(digest) != _DIGEST_SIZE:
+                continue
+            entries[safe_path.encode("utf-8")] = (digest, int(meta.get("size", 0)))
+
+        sizes = array("Q")
+        offsets = array("I", [0])
+        digests = bytearray()
+        paths = bytearray()
+        for encoded in sorted(entries):
+            digest, size = entries[encoded]
+            digests += digest
+            sizes.append(size)
+            paths += encoded
+            offsets.append(len(paths))
+        return cls(
+            int(manifest.get("upload_id", 0)),
+            str(manifest.get("created_at", "")),
+            bytes(digests),
+            sizes,
+            offsets,
+            bytes(paths),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the ``{"upload_id", "created_at", "files"}`` dict form."""
+        return {
+            "upload_id": self.upload_id,
+            "created_at": self.created_at,
+            "files": {
+                path: {"hash": content_hash, "size": size}
+                for path, content_hash, size in self.entries()
+            },
+        }
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Manifest:
+        """Parse the on-disk format written by :meth:`to_bytes`.
+
+        Raises:
+            ValueError: if ``data`` is not a complete manifest.
+        """
+        if data[: len(_MANIFEST_MAGIC)] != _MANIFEST_MAGIC:
+            raise ValueError("Not a content store manifest")
+        try:
+            upload_id, count, created_len, paths_len = _MANIFEST_HEADER.unpack_from(
+                data, len(_MANIFEST_MAGIC)
+            )
+        except struct.error as exc:
+            raise ValueError("Truncated manifest header") from exc
+
+        position = len(_MANIFEST_MAGIC) + _MANIFEST_HEADER.size
+        sections = []
+        for length in (created_len, count * _DIGEST_SIZE, count * 8, (count + 1) * 4, paths_len):
+            sections.append(data[position : position + length])
+            position += length
+        if position != len(data):
+            raise ValueError("Manifest size does not match its header")
+
+        created_at, digests, raw_sizes, raw_offsets, paths = sections
+        sizes = array("Q")
+        sizes.frombytes(raw_sizes)
+        offsets = array("I")
+        offsets.frombytes(raw_offsets)
+        if sys.byteorder == "big":
+            sizes.byteswap()
+            offsets.byteswap()
+        return cls(upload_id, created_at.decode("utf-8"), digests, sizes, offsets, paths)
 
-    manifests_root = get_manifests_root()
-    manifests_root.mkdir(parents=True, exist_ok=True)
-    manifest_path = manifests_root / f"{upload_id}.json"
+    def to_bytes(self) -> bytes:
+        """Serialize to the compact on-disk format (little-endian columns)."""
+        sizes = array("Q", self._sizes)
+        offsets = array("I", self._offsets)
+        if sys.byteorder == "big":
+            sizes.byteswap()
+            offsets.byteswap()
+        created_at = self.created_at.encode("utf-8")
+        header = _MANIFEST_HEADER.pack(self.upload_id, len(self), len(created_at), len(self._paths))
+        return b"".join(
+            (
+                _MANIFEST_MAGIC,
+                header,
+                created_at,
+                self._digests,
+                sizes.tobytes(),
+                offsets.tobytes(),
+                self._paths,
+            )
+        )
+
+    def _prefix_range(self, prefix: str) -> tuple[int, int]:
+        if not prefix:
+            return 0, len(self)
+        keys = _PathKeys(self._paths, self._offsets)
+        # Every path under "dir/" sorts in ["dir/", "dir0"): "0" follows "/".
+        low = prefix.encode("utf-8") + b"/"
+        high = low[:-1] + b"0"
+        return bisect_left(keys, low), bisect_left(keys, high)
+
+    def entries(self, prefix: str = "") -> Iterator[tuple[str, str, int]]:
+        """Yield ``(path, content_hash, size)`` for files under ``prefix``, sorted by path.
+
+        Args:
+            prefix: Directory inside the upload; yielded paths are relative to
+                it. An empty prefix yields every file.
+        """
+        prefix = prefix.strip("/")
+        start, end = self._prefix_range(prefix)
+        skip = len(prefix.encode("utf-8")) + 1 if prefix else 0
+        paths, offsets, digests, sizes = self._paths, self._offsets, self._digests, self._sizes
+        for index in range(start, end):
+            path = paths[offsets[index] + skip : offsets[index + 1]].decode("utf-8")
+            digest = digests[index * _DIGEST_SIZE : (index + 1) * _DIGEST_SIZE]
+            yield path, digest.hex(), sizes[index]
+
+    def count(self, prefix: str = "") -> int:
+        """Return the number of files under ``prefix``."""
+        start, end = self._prefix_range(prefix.strip("/"))
+        return end - start
+
+    def hashes(self) -> set[str]:
+        """Return the distinct content hashes (objects) the manifest references."""
+        digests = self._digests
+        return {
+            digests[offset : offset + _DIGEST_SIZE].hex()
+            for offset in range(0, len(digests), _DIGEST_SIZE)
+        }
+
+
+class _ManifestCache:
+    """Thread-safe LRU of parsed manifests, validated against the file's stat."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Path, tuple[tuple[int, int, int], Manifest]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, signature: tuple[int, int, int]) -> Manifest | None:
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is None or cached[0] != signature:
+                return None
+            self._entries.move_to_end(path)
+            return cached[1]
+
+    def put(self, path: Path, signature: tuple[int, int, int], manifest: Manifest) -> None:
+        with self._lock:
+            self._entries[path] = (signature, manifest)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _resolve_manifest_cache_size() -> int:
+    """Return the manifest LRU size from ``ZIP2JOB_MANIFEST_CACHE_SIZE``."""
+    try:
+        return max(int(os.getenv("ZIP2JOB_MANIFEST_CACHE_SIZE", "")), 1)
+    except ValueError:
+        return _DEFAULT_MANIFEST_CACHE_SIZE
+
+
+_manifest_cache = _ManifestCache(_resolve_manifest_cache_size())
+
+
+def _stat_signature(path: Path) -> tuple[int, int, int]:
+    stat = path.stat()
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def get_manifest_path(upload_id: int) -> Path:
+    """Return the path of the manifest for ``upload_id``."""
+    return get_manifests_root() / f"{upload_id}{_MANIFEST_SUFFIX}"
+
+
+def _write_manifest(manifest: Manifest) -> None:
+    manifest_path = get_manifest_path(manifest.upload_id)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
     temp_manifest = manifest_path.with_suffix(".tmp")
-    temp_manifest.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    temp_manifest.write_bytes(manifest.to_bytes())
     temp_manifest.replace(manifest_path)
+    _manifest_cache.put(manifest_path, _stat_signature(manifest_path), manifest)
+
+
+def _read_legacy_manifest(upload_id: int) -> Manifest | None:
+    """Read a JSON manifest written by older versions, leaving it in place."""
+    legacy_path = get_manifests_root() / f"{upload_id}.json"
+    try:
+        payload = json.loads(legacy_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    return Manifest.from_dict({**payload, "upload_id": upload_id})
+
+
+def _migrate_legacy_manifest(upload_id: int) -> Manifest | None:
+    """Convert a JSON manifest written by older versions to the binary format."""
+    manifest = _read_legacy_manifest(upload_id)
+    if manifest is None:
+        return None
+    legacy_path = get_manifests_root() / f"{upload_id}.json"
+    try:
+        _write_manifest(manifest)
+        legacy_path.unlink()
+    except OSError:
+        logger.warning("Could not migrate manifest %s", legacy_path, exc_info=True)
     return manifest
 
 
-def load_manifest(upload_id: int) -> dict[str, Any] | None:
-    """Load a manifest for the given upload ID."""
-    manifest_path = get_manifests_root() / f"{upload_id}.json"
-    if not manifest_path.exists():
+def open_manifest(upload_id: int, *, migrate: bool = True) -> Manifest | None:
+    """Return the manifest for ``upload_id``, served from an in-process LRU.
+
+    The cache holds the last ``ZIP2JOB_MANIFEST_CACHE_SIZE`` (default 64)
+    manifests and re-reads a file only when its stat changes. A legacy JSON
+    manifest is converted to the binary format on disk unless ``migrate`` is
+    False, in which case the store is left untouched.
+    """
+    manifest_path = get_manifest_path(upload_id)
+    try:
+        signature = _stat_signature(manifest_path)
+    except FileNotFoundError:
+        if not migrate:
+            return _read_legacy_manifest(upload_id)
+        return _migrate_legacy_manifest(upload_id)
+    except OSError:
         return None
+
+    manifest = _manifest_cache.get(manifest_path, signature)
+    if manifest is not None:
+        return manifest
     try:
-        return json.loads(manifest_path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
+        manifest = Manifest.from_bytes(manifest_path.read_bytes())
+    except (OSError, ValueError, UnicodeDecodeError):
+        logger.warning("Ignoring unreadable manifest %s", manifest_path, exc_info=True)
         return None
+    _manifest_cache.put(manifest_path, signature, manifest)
+    return manifest
+
+
+def load_manifest(upload_id: int) -> dict[str, Any] | None:
+    """Load a manifest for the given upload ID as a dict."""
+    manifest = open_manifest(upload_id)
+    return manifest.to_dict() if manifest is not None else None
+
+
+def _resolve_materialize_mode(mode: MaterializeMode | None) -> MaterializeMode:
+    """Return ``mode`` or the ``ZIP2JOB_MATERIALIZE_MODE`` setting (default ``auto``)."""
+    if mode is None:
+        mode = os.getenv("ZIP2JOB_MATERIALIZE_MODE", "auto").strip().lower()  # type: ignore[assignment]
+    if mode not in _MATERIALIZE_MODES:
+        raise ValueError(f"Unknown materialize mode: {mode!r}")
+    return mode
+
+
+def _reflink(source: Path, destination: Path) -> None:
+    """Clone ``source`` into ``destination`` sharing its data blocks (Linux FICLONE)."""
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, "reflinks are not supported on this platform")
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            destination.unlink(missing_ok=True)
+            raise
+
+
+def _is_linked_to(dest_path: Path, object_path: Path) -> bool:
+    """Return True when ``dest_path`` already is a link to ``object_path``."""
+    try:
+        if dest_path.is_symlink():
+            return Path(os.readlink(dest_path)) == object_path
+        return os.path.samefile(dest_path, object_path)
+    except OSError:
+        return False
+
+
+class _Materializer:
+    """Place store objects in a working tree, degrading to cheaper-to-support strategies.
+
+    ``auto`` tries a hardlink, then a reflink, then a streaming copy, and
+    remembers which strategies the destination filesystem rejected so later
+    files go straight to one that works.
+    """
+
+    def __init__(self, mode: MaterializeMode) -> None:
+        if mode == "auto":
+            self._strategies: list[str] = ["hardlink", "reflink", "copy"]
+        elif mode in ("hardlink", "reflink"):
+            self._strategies = [mode, "copy"]
+        else:
+            self._strategies = [mode]
 
+    def place(self, object_path: Path, dest_path: Path) -> None:
+        encoded = object_codec(object_path) is not None
+        if dest_path.exists() or dest_path.is_symlink():
+            if (
+                not encoded
+                and self._strategies[0] in ("hardlink", "symlink")
+                and _is_linked_to(dest_path, object_path)
+            ):
+                return
+            # Never write through an existing link into the object store.
+            dest_path.unlink()
 
-def materialize_project_tree(project_rel_path: str, upload_ids: list[int], dest_root: Path) -> Path:
-    """Materialize a merged project tree from multiple uploads."""
+        if encoded:
+            # Compressed objects cannot be shared; write their decoded content.
+            copy_object(object_path, dest_path)
+            return
+        while True:
+            strategy = self._strategies[0]
+            try:
+                if strategy == "hardlink":
+                    os.link(object_path, dest_path)
+                elif strategy == "reflink":
+                    _reflink(object_path, dest_path)
+                elif strategy == "symlink":
+                    dest_path.symlink_to(object_path)
+                else:
+                    shutil.copyfile(object_path, dest_path)
+                return
+            except OSError:
+                if len(self._strategies) == 1:
+                    raise
+                self._strategies.pop(0)
+
+
+def materialize_project_tree(
+    project_rel_path: str,
+    upload_ids: list[int],
+    dest_root: Path,
+    *,
+    mode: MaterializeMode | None = None,
+    view: ProjectView | None = None,
+) -> Path:
+    """Materialize a merged project tree from multiple uploads.
+
+    Files are placed without copying their bytes whenever the filesystem
+    allows it, and each path of the merged view is written once. Compressed
+    objects are always decoded into a regular file.
+
+    Args:
+        project_rel_path: Project path inside the uploads.
+        upload_ids: Uploads to merge, oldest first; later uploads win.
+        dest_root: Directory to materialize into.
+        mode: ``auto`` (hardlink, then reflink, then copy), ``hardlink``,
+            ``reflink``, ``symlink`` (read-only links into ``objects/``) or
+            ``copy``. Defaults to ``ZIP2JOB_MATERIALIZE_MODE`` or ``auto``.
+            Linked trees share storage with the content store and must be
+            treated as read-only.
+        view: Precomputed merged view of ``project_rel_path`` over
+            ``upload_ids``; merged from the manifests when omitted.
+
+    Returns:
+        The materialized project root.
+    """
+    materializer = _Materializer(_resolve_materialize_mode(mode))
     dest_root.mkdir(parents=True, exist_ok=True)
     project_rel_path = project_rel_path.strip("/")
     target_root = dest_root / project_rel_path if project_rel_path else dest_root
 
-    for upload_id in upload_ids:
-        manifest = load_manifest(upload_id)
-        if not manifest:
-            continue
-        files: dict[str, dict[str, Any]] = manifest.get("files", {})
-        for file_path, meta in files.items():
-            if project_rel_path:
-                prefix = f"{project_rel_path}/"
-                if not file_path.startswith(prefix):
-                    continue
-                relative = file_path[len(prefix) :]
-                if not relative:
-                    continue
-            else:
-                relative = file_path
-
-            safe_path = _normalize_zip_path(relative)
-            if safe_path is None:
-                continue
-            dest_path = target_root / safe_path
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+    if view is None:
+        view = ProjectView.build(project_rel_path, upload_ids)
 
-            content_hash = str(meta.get("hash", ""))
+    created_dirs: set[Path] = set()
+    # Objects must not be compressed in place between checking their codec
+    # and linking them
+    with store_lock():
+        for relative, (content_hash, _size, _timestamp) in view.files.items():
             if not content_hash:
                 continue
             object_path = _object_path(content_hash)
             if not object_path.exists():
                 continue
-            if dest_path.exists():
-                dest_path.unlink()
-            dest_path.write_bytes(object_path.read_bytes())
+            dest_path = target_root / relative
+            if dest_path.parent not in created_dirs:
+                dest_path.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(dest_path.parent)
+            materializer.place(object_path, dest_path)
 
     return target_root
 
 
-def _merge_project_files(
-    project_rel_path: str, upload_ids: list[int]
-) -> dict[str, tuple[str, int]]:
-    """Merge project files from multiple upload manifests.
-
-    Returns a dictionary mapping normalized file paths to (content_hash, size) tuples.
-    """
-    project_rel_path = project_rel_path.strip("/")
-    merged: dict[str, tuple[str, int]] = {}
-    for upload_id in upload_ids:
-        manifest = load_manifest(upload_id)
-        if not manifest:
-            continue
-        files: dict[str, dict[str, Any]] = manifest.get("files", {})
-        for file_path, meta in files.items():
-            if project_rel_path:
-                prefix = f"{project_rel_path}/"
-                if not file_path.startswith(prefix):
-                    continue
-                relative = file_path[len(prefix) :]
-            else:
-                relative = file_path
-            safe_path = _normalize_zip_path(relative)
-            if safe_path is None:
-                continue
-            content_hash = str(meta.get("hash", ""))
-            size = int(meta.get("size", 0))
-            merged[safe_path] = (content_hash, size)
-    return merged
+def _manifest_timestamp(manifest: dict[str, Any]) -> float:
+    try:
+        return datetime.fromisoformat(str(manifest.get("created_at", ""))).timestamp()
+    except ValueError:
+        return 0.0
 
 
-def compute_project_fingerprint(project_rel_path: str, upload_ids: list[int]) -> str:
-    """Compute a stable fingerprint for merged project content."""
-    merged = _merge_project_files(project_rel_path, upload_ids)
-    entries = sorted((path, data[0], data[1]) for path, data in merged.items())
+def _fingerprint_entries(entries: dict[str, tuple[str, int, float]]) -> str:
     hasher = hashlib.sha256()
-    for path, content_hash, size in entries:
+    for path in sorted(entries):
+        content_hash, size, _timestamp = entries[path]
         hasher.update(path.encode("utf-8"))
         hasher.update(b"\x00")
         hasher.update(content_hash.encode("utf-8"))
@@ -251,15 +788,201 @@ def compute_project_fingerprint(project_rel_path: str, upload_ids: list[int]) ->
     return hasher.hexdigest()
 
 
+@dataclass(frozen=True, slots=True)
+class ProjectView:
+    """Merged view of one project across the uploads it was assembled from.
+
+    Uploads are immutable once ingested, so a view is fully determined by the
+    project path and its ordered upload IDs and can be persisted per project:
+    cache checks then read one file instead of merging every manifest.
+    """
+
+    project_rel_path: str
+    upload_ids: tuple[int, ...]
+    # path -> (content_hash, size, timestamp of the winning upload)
+    files: dict[str, tuple[str, int, float]]
+    file_count: int
+    total_size: int
+    fingerprint: str
+    complete: bool = True
+
+    @classmethod
+    def build(cls, project_rel_path: str, upload_ids: list[int]) -> ProjectView:
+        """Merge the view from the upload manifests, later uploads winning.
+
+        ``complete`` is False when a manifest could not be opened; such a view
+        is never persisted.
+        """
+        project_rel_path = project_rel_path.strip("/")
+        merged: dict[str, tuple[str, int, float]] = {}
+        complete = True
+        for upload_id in upload_ids:
+            manifest = open_manifest(upload_id)
+            if manifest is None:
+                complete = False
+                continue
+            timestamp = manifest.timestamp
+            for path, content_hash, size in manifest.entries(project_rel_path):
+                merged[path] = (content_hash, size, timestamp)
+        return cls(
+            project_rel_path=project_rel_path,
+            upload_ids=tuple(upload_ids),
+            files=merged,
+            file_count=len(merged),
+            total_size=sum(size for _hash, size, _timestamp in merged.values()),
+            fingerprint=_fingerprint_entries(merged),
+            complete=complete,
+        )
+
+    def matches(self, project_rel_path: str, upload_ids: list[int]) -> bool:
+        """Return True when this view was built for ``project_rel_path`` over ``upload_ids``."""
+        return self.project_rel_path == project_rel_path.strip("/") and self.upload_ids == tuple(
+            upload_ids
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": _PROJECT_VIEW_VERSION,
+            "project_rel_path": self.project_rel_path,
+            "upload_ids": list(self.upload_ids),
+            "file_count": self.file_count,
+            "total_size": self.total_size,
+            "fingerprint": self.fingerprint,
+            "files": {path: list(entry) for path, entry in self.files.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> ProjectView:
+        """Rebuild a persisted view.
+
+        Raises:
+            ValueError: if ``payload`` is not a view of the current version.
+        """
+        if payload.get("version") != _PROJECT_VIEW_VERSION:
+            raise ValueError("Unsupported project view version")
+        try:
+            files = {
+                str(path): (str(entry[0]), int(entry[1]), float(entry[2]))
+                for path, entry in payload["files"].items()
+            }
+            return cls(
+                project_rel_path=str(payload["project_rel_path"]),
+                upload_ids=tuple(int(upload_id) for upload_id in payload["upload_ids"]),
+                files=files,
+                file_count=int(payload["file_count"]),
+                total_size=int(payload["total_size"]),
+                fingerprint=str(payload["fingerprint"]),
+            )
+        except (KeyError, IndexError, TypeError, AttributeError) as exc:
+            raise ValueError("Malformed project view") from exc
+
+
+def get_project_view_path(project_id: int) -> Path:
+    """Return the path of the persisted merged view for ``project_id``."""
+    return get_project_views_root() / f"project_{project_id}.json"
+
+
+def load_project_view(
+    project_id: int, project_rel_path: str, upload_ids: list[int]
+) -> ProjectView | None:
+    """Load the persisted view of a project if it covers exactly ``upload_ids``.
+
+    Never opens a manifest, so it also answers when manifests are missing.
+    """
+    view_path = get_project_view_path(project_id)
+    try:
+        view = ProjectView.from_dict(json.loads(view_path.read_text(encoding="utf-8")))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, AttributeError):
+        logger.warning("Ignoring unreadable project view %s", view_path, exc_info=True)
+        return None
+    return view if view.matches(project_rel_path, upload_ids) else None
+
+
+def get_project_view(project_id: int, project_rel_path: str, upload_ids: list[int]) -> ProjectView:
+    """Return the merged view of a project, building and persisting it on a miss."""
+    view = load_project_view(project_id, project_rel_path, upload_ids)
+    if view is not None:
+        return view
+    view = ProjectView.build(project_rel_path, upload_ids)
+    if view.complete:
+        view_path = get_project_view_path(project_id)
+        view_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = view_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(view.to_dict(), ensure_ascii=False), encoding="utf-8")
+        temp_path.replace(view_path)
+    return view
+
+
+def build_project_scan(
+    project_rel_path: str, upload_ids: list[int], *, view: ProjectView | None = None
+) -> ProjectScan | None:
+    """Index a merged project view that reads straight from the object store.
+
+    Analysis through the returned scan never materializes the project on disk.
+
+    Args:
+        project_rel_path: Project path inside the uploads.
+        upload_ids: Uploads to merge, oldest first; later uploads win.
+        view: Precomputed merged view; merged from the manifests when omitted.
+
+    Returns:
+        A virtual ProjectScan, or None when the merged tree contains a ``.git``
+        directory (Git history has to be read from a real checkout).
+    """
+    if view is None:
+        view = ProjectView.build(project_rel_path, upload_ids)
+    merged = view.files
+    if any(path == ".git" or path.startswith(".git/") for path in merged):
+        return None
+
+    hashes = {path: entry[0] for path, entry in merged.items()}
+    return ProjectScan.from_files(
+        project_rel_path.strip("/") or ".",
+        {path: (size, timestamp) for path, (_hash, size, timestamp) in merged.items()},
+        _ObjectStoreReader(get_objects_root(), hashes),
+        hashes=hashes,
+        file_cache=get_file_result_cache(),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _ObjectStoreReader:
+    """Read merged project files from the object store by relative path.
+
+    A plain picklable object (rather than a closure) so store-backed scans can
+    be handed to analysis worker processes.
+    """
+
+    objects_root: Path
+    hashes: dict[str, str]
+
+    def __call__(self, rel_path: str) -> bytes:
+        content_hash = self.hashes[rel_path]
+        if not content_hash:
+            raise FileNotFoundError(rel_path)
+        return read_object(self.objects_root / content_hash[:2] / content_hash)
+
+
+def compute_project_fingerprint(project_rel_path: str, upload_ids: list[int]) -> str:
+    """Compute a stable fingerprint for merged project content."""
+    return ProjectView.build(project_rel_path, upload_ids).fingerprint
+
+
 def compute_project_file_count(project_rel_path: str, upload_ids: list[int]) -> int:
     """Compute file count for the merged project view."""
-    merged = _merge_project_files(project_rel_path, upload_ids)
-    return len(merged)
+    return ProjectView.build(project_rel_path, upload_ids).file_count
+
+
+def get_analysis_cache_path(project_id: int) -> Path:
+    """Return the path of the cached analysis for ``project_id``."""
+    return get_analysis_cache_root() / f"project_{project_id}.json"
 
 
 def load_analysis_cache(project_id: int) -> dict[str, Any] | None:
     """Load cached analysis for a project."""
-    cache_path = get_analysis_cache_root() / f"project_{project_id}.json"
+    cache_path = get_analysis_cache_path(project_id)
     if not cache_path.exists():
         return None
     try:
@@ -270,9 +993,8 @@ def load_analysis_cache(project_id: int) -> dict[str, Any] | None:
 
 def write_analysis_cache(project_id: int, fingerprint: str, payload: dict[str, Any]) -> None:
     """Persist analysis cache for a project."""
-    cache_root = get_analysis_cache_root()
-    cache_root.mkdir(parents=True, exist_ok=True)
-    cache_path = cache_root / f"project_{project_id}.json"
+    cache_path = get_analysis_cache_path(project_id)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
     temp_path = cache_path.with_suffix(".tmp")
     cache_payload = {
         "project_id": project_id,
@@ -282,3 +1004,26 @@ def write_analysis_cache(project_id: int, fingerprint: str, payload: dict[str, A
     }
     temp_path.write_text(json.dumps(cache_payload, ensure_ascii=False, indent=2), encoding="utf-8")
     temp_path.replace(cache_path)
+
+
+def discard_project_artifacts(project_id: int) -> int:
+    """Remove the cached analysis and merged view of a deleted project.
+
+    The project's objects and manifests may be shared with other projects, so
+    they are left for garbage collection.
+
+    Returns:
+        Bytes freed.
+    """
+    freed = 0
+    for path in (get_analysis_cache_path(project_id), get_project_view_path(project_id)):
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        except OSError:
+            logger.warning("Could not remove project artifact %s", path, exc_info=True)
+            continue
+        freed += size
+    return freed
@@ -0,0 +1,144 @@
+"""Persistent cache of parsed Git histories for git-derived metrics.
+
+Entries live in ``analysis_cache/git`` under the artifact store, next to the
+per-project analysis cache. Each repository lineage (identified by its root
+commits) has one JSON entry holding the columnar ``GitHistory`` and the state
+it was loaded at: a hash of HEAD plus every ref.
+
+- Unchanged repository: the state matches and the history is returned without
+  running ``git log``.
+- New commits: only ``old tips..new refs`` is read and merged into the cached
+  table, so re-uploading a project with a few new commits costs time
+  proportional to those commits.
+- Rewritten or pruned history: the entry is rebuilt from a full ``git log``.
+
+Every use refreshes the entry's mtime, which ``artifact_gc`` uses to expire
+histories of repositories that are no longer analyzed.
+
+Author contributions, commit types, commit frequency, project dates and role
+signals are all derived from the cached history in memory. Weekly activity is
+relative to the current date, so it is recomputed from the history each time.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from capstone_project_team_5.services.content_store import get_analysis_cache_root
+from capstone_project_team_5.utils.git import GitHistory, run_git
+
+logger = logging.getLogger(__name__)
+
+_GIT_CACHE_DIR_NAME = "git"
+_CACHE_VERSION = 1
+
+
+def get_git_cache_root() -> Path:
+    """Return the directory holding cached Git histories."""
+    return get_analysis_cache_root() / _GIT_CACHE_DIR_NAME
+
+
+def get_repository_state(repo: Path | str) -> tuple[str | None, str]:
+    """Return ``(head, state)`` where ``state`` hashes HEAD and every ref.
+
+    Raises:
+        RuntimeError: if git fails, including for repositories without commits.
+    """
+    lines = sorted(line for line in run_git(repo, "show-ref", "--head").splitlines() if line)
+    head = next((line.split()[0] for line in lines if line.endswith(" HEAD")), None)
+    return head, hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+
+def _get_lineage(repo: Path | str) -> str:
+    """Identify a repository by its root commits, which survive new commits."""
+    roots = sorted(run_git(repo, "rev-list", "--max-parents=0", "--all").split())
+    return hashlib.sha256("\n".join(roots).encode("utf-8")).hexdigest()
+
+
+def _has_unreachable_commits(repo: Path | str, history: GitHistory) -> bool:
+    """Return True when cached commits are no longer reachable from any ref."""
+    tips = history.tips()
+    if not tips:
+        return False
+    return bool(run_git(repo, "rev-list", "--max-count=1", *tips, "--not", "--all").strip())
+
+
+def _read_entry(cache_path: Path) -> dict[str, Any] | None:
+    try:
+        entry = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(entry, dict) or entry.get("version") != _CACHE_VERSION:
+        return None
+    return entry
+
+
+def _write_entry(cache_path: Path, state: str, history: GitHistory) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    entry = {"version": _CACHE_VERSION, "state": state, "history": history.to_dict()}
+    temp_path: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=cache_path.parent,
+            suffix=".tmp",
+            delete=False,
+        ) as temp_file:
+            temp_path = Path(temp_file.name)
+            json.dump(entry, temp_file, ensure_ascii=False)
+        temp_path.replace(cache_path)
+    except OSError:
+        logger.warning("Could not write Git history cache %s", cache_path, exc_info=True)
+        if temp_path is not None:
+            with contextlib.suppress(FileNotFoundError):
+                temp_path.unlink()
+
+
+def load_git_history(repo: Path | str) -> GitHistory:
+    """Return the full history of ``repo``, reusing and updating the cache.
+
+    Args:
+        repo: Path to a Git working tree.
+
+    Returns:
+        The history of every ref, with HEAD reachability for the current HEAD.
+
+    Raises:
+        RuntimeError: if git cannot read the repository.
+    """
+    try:
+        head, state = get_repository_state(repo)
+        lineage = _get_lineage(repo)
+    except RuntimeError:
+        # No refs yet (or an unusual layout): nothing stable to key the cache on.
+        return GitHistory.load(repo)
+
+    cache_path = get_git_cache_root() / f"{lineage}.json"
+    entry = _read_entry(cache_path)
+    if entry is not None and entry["state"] == state:
+        # Mark the entry as used so garbage collection keeps it
+        with contextlib.suppress(OSError):
+            os.utime(cache_path)
+        return GitHistory.from_dict(entry["history"])
+
+    history: GitHistory | None = None
+    if entry is not None:
+        cached = GitHistory.from_dict(entry["history"])
+        try:
+            if not _has_unreachable_commits(repo, cached):
+                history = cached.updated(repo, head)
+        except RuntimeError:
+            logger.info("Cached Git history of %s is stale; reloading", repo, exc_info=True)
+
+    if history is None:
+        history = GitHistory.load(repo)
+    _write_entry(cache_path, state, history)
+    return history
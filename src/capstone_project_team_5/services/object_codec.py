@@ -0,0 +1,195 @@
+"""On-disk encoding of content store objects.
+
+Objects are addressed by the SHA-256 of their content but may be stored
+compressed. An encoded object starts with a fixed magic, a codec byte and the
+decoded size; any other file is the raw content itself, which keeps objects
+written before compression existed (and incompressible ones) readable and
+linkable as-is.
+
+Whether an object is compressed is decided by its size and type: small files
+gain nothing once rounded up to a filesystem block, content whose signature
+shows it is already compressed (images, archives, ...) is stored raw, and a
+compressed form is only kept when it saves at least a tenth of the size.
+Compression is on by default and is disabled with
+``ZIP2JOB_OBJECT_COMPRESSION=off``.
+
+Only zlib is used: it ships with Python, while zstd would need a new
+dependency. The codec byte leaves room for adding one later.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+from typing import BinaryIO
+
+CODEC_STORED = 0
+CODEC_ZLIB = 1
+
+_MAGIC = b"\x89Z2JOBJ\n"
+# codec, decoded size
+_HEADER = struct.Struct("<BQ")
+_PREFIX_SIZE = len(_MAGIC) + _HEADER.size
+# enough to see both the magic and the offset tags checked by is_precompressed
+_HEAD_SIZE = max(len(_MAGIC), 12)
+_CHUNK_SIZE = 1024 * 1024
+_MIN_COMPRESS_SIZE = 4096
+_FAST_LEVEL_SIZE = 8 * 1024 * 1024
+_MAX_KEPT_RATIO = 0.9
+_PRECOMPRESSED_SIGNATURES = (
+    b"\x89PNG",
+    b"\xff\xd8\xff",  # JPEG
+    b"GIF8",
+    b"PK\x03\x04",  # zip, jar, docx, xlsx, ...
+    b"\x1f\x8b",  # gzip
+    b"BZh",
+    b"\xfd7zXZ\x00",
+    b"7z\xbc\xaf\x27\x1c",
+    b"\x28\xb5\x2f\xfd",  # zstd
+    b"wOFF",
+    b"wOF2",
+    b"OggS",
+    b"ID3",
+    b"fLaC",
+)
+
+
+def compression_enabled() -> bool:
+    """Return whether new objects are compressed (``ZIP2JOB_OBJECT_COMPRESSION``)."""
+    return os.getenv("ZIP2JOB_OBJECT_COMPRESSION", "on").strip().lower() not in {
+        "0",
+        "false",
+        "no",
+        "off",
+    }
+
+
+def is_precompressed(head: bytes) -> bool:
+    """Return True when ``head`` starts like an already compressed format."""
+    if head.startswith(_PRECOMPRESSED_SIGNATURES):
+        return True
+    # RIFF/WebP and ISO media (mp4, mov, heic) keep their tag at an offset
+    return (head[:4] == b"RIFF" and head[8:12] == b"WEBP") or head[4:8] == b"ftyp"
+
+
+def _compression_level(size: int) -> int:
+    return 1 if size >= _FAST_LEVEL_SIZE else 6
+
+
+def _write_encoded(source: BinaryIO, destination: BinaryIO, codec: int, size: int) -> None:
+    destination.write(_MAGIC + _HEADER.pack(codec, size))
+    if codec == CODEC_STORED:
+        for chunk in iter(lambda: source.read(_CHUNK_SIZE), b""):
+            destination.write(chunk)
+        return
+    compressor = zlib.compressobj(_compression_level(size))
+    for chunk in iter(lambda: source.read(_CHUNK_SIZE), b""):
+        destination.write(compressor.compress(chunk))
+    destination.write(compressor.flush())
+
+
+def encode_object(
+    source_path: Path, temp_dir: Path, *, compress: bool | None = None
+) -> Path | None:
+    """Encode the raw content in ``source_path`` when it should not be stored as-is.
+
+    Args:
+        source_path: File holding the raw content; it is left untouched.
+        temp_dir: Directory for the encoded temporary file.
+        compress: Whether compression may be used; defaults to
+            :func:`compression_enabled`.
+
+    Returns:
+        A new temporary file holding the encoded object, or None when the
+        content is best stored raw.
+    """
+    if compress is None:
+        compress = compression_enabled()
+    size = source_path.stat().st_size
+    with open(source_path, "rb") as source:
+        head = source.read(_HEAD_SIZE)
+    # Raw content that looks encoded must be wrapped to be read back intact
+    escape = head[: len(_MAGIC)] == _MAGIC
+    if not escape and (not compress or size < _MIN_COMPRESS_SIZE or is_precompressed(head)):
+        return None
+
+    codec = CODEC_ZLIB if compress else CODEC_STORED
+    with (
+        open(source_path, "rb") as source,
+        tempfile.NamedTemporaryFile(mode="wb", dir=temp_dir, delete=False) as encoded,
+    ):
+        source.seek(0)
+        _write_encoded(source, encoded, codec, size)
+    encoded_path = Path(encoded.name)
+    if not escape and encoded_path.stat().st_size > size * _MAX_KEPT_RATIO:
+        encoded_path.unlink()
+        return None
+    return encoded_path
+
+
+def object_codec(path: Path) -> int | None:
+    """Return the codec of the object at ``path``, or None when it is stored raw."""
+    with open(path, "rb") as handle:
+        prefix = handle.read(_PREFIX_SIZE)
+    if len(prefix) < _PREFIX_SIZE or not prefix.startswith(_MAGIC):
+        return None
+    return _HEADER.unpack_from(prefix, len(_MAGIC))[0]
+
+
+def _decode(data: bytes, path: Path) -> bytes:
+    codec, size = _HEADER.unpack_from(data, len(_MAGIC))
+    body = memoryview(data)[_PREFIX_SIZE:]
+    try:
+        if codec == CODEC_STORED:
+            content = bytes(body)
+        elif codec == CODEC_ZLIB:
+            content = zlib.decompress(body, bufsize=max(size, 1))
+        else:
+            raise OSError(f"Unknown codec {codec} in object {path.name}")
+    except zlib.error as exc:
+        raise OSError(f"Corrupt object {path.name}") from exc
+    if len(content) != size:
+        raise OSError(f"Corrupt object {path.name}: expected {size} bytes")
+    return content
+
+
+def read_object(path: Path) -> bytes:
+    """Return the decoded content of the object at ``path``.
+
+    Raises:
+        OSError: if the object cannot be read or fails to decode.
+    """
+    data = path.read_bytes()
+    if len(data) < _PREFIX_SIZE or not data.startswith(_MAGIC):
+        return data
+    return _decode(data, path)
+
+
+def copy_object(path: Path, destination: Path) -> None:
+    """Write the decoded content of the object at ``path`` to ``destination``.
+
+    Decodes in chunks, so large objects are never held in memory.
+    """
+    with open(path, "rb") as source, open(destination, "wb") as target:
+        prefix = source.read(_PREFIX_SIZE)
+        if len(prefix) < _PREFIX_SIZE or not prefix.startswith(_MAGIC):
+            target.write(prefix)
+            codec = CODEC_STORED
+        else:
+            codec = _HEADER.unpack_from(prefix, len(_MAGIC))[0]
+        if codec == CODEC_STORED:
+            for chunk in iter(lambda: source.read(_CHUNK_SIZE), b""):
+                target.write(chunk)
+            return
+        if codec != CODEC_ZLIB:
+            raise OSError(f"Unknown codec {codec} in object {path.name}")
+        decompressor = zlib.decompressobj()
+        try:
+            for chunk in iter(lambda: source.read(_CHUNK_SIZE), b""):
+                target.write(decompressor.decompress(chunk))
+            target.write(decompressor.flush())
+        except zlib.error as exc:
+            raise OSError(f"Corrupt object {path.name}") from exc
@@ -0,0 +1,154 @@
+"""In-process cache of rendered public portfolio pages.
+
+Shared portfolio links are read far more often than portfolios change, so the
+rendered HTML is kept per portfolio together with a content version computed
+by the caller (see ``api.routes.portfolio``). A page is reused only while its
+version is unchanged; any edit that changes the version simply makes the next
+request render again. Each page is stored with precompressed bodies (gzip,
+plus brotli when the optional ``brotli`` package is installed) and ETags
+derived from its version, so a repeat hit is a dictionary lookup. Each body
+is a distinct representation and gets its own ETag (the identity one with
+the content-coding appended); a conditional request matching any of them is
+answered with 304.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None  # type: ignore[assignment]
+
+_DEFAULT_CACHE_SIZE = 256
+# content-codings a page is precompressed with, in order of preference
+_CODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def page_etag(portfolio_id: int, version: str, coding: str | None = None) -> str:
+    """Return the strong ETag of a portfolio page at ``version`` sent with ``coding``."""
+    digest = hashlib.sha256(version.encode("utf-8")).hexdigest()[:20]
+    suffix = f"-{coding}" if coding else ""
+    return f'"p{portfolio_id}-{digest}{suffix}"'
+
+
+def _identity_etag(etag: str) -> str:
+    for coding in _CODINGS:
+        if etag.endswith(f'-{coding}"'):
+            return etag.removesuffix(f'-{coding}"') + '"'
+    return etag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return True when an ``If-None-Match`` header matches any coding of ``etag``'s page."""
+    if not if_none_match:
+        return False
+    candidates = {
+        _identity_etag(candidate.strip().removeprefix("W/"))
+        for candidate in if_none_match.split(",")
+    }
+    return "*" in candidates or _identity_etag(etag) in candidates
+
+
+def _accepted_encodings(accept_encoding: str | None) -> set[str]:
+    accepted: set[str] = set()
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0 and name.strip():
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def negotiate_coding(accept_encoding: str | None) -> str | None:
+    """Return the content-coding a page is sent with for ``accept_encoding``."""
+    accepted = _accepted_encodings(accept_encoding)
+    for coding in _CODINGS:
+        if coding in accepted or "*" in accepted:
+            return coding
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedPage:
+    """A rendered page with its ETag and precompressed bodies."""
+
+    etag: str
+    body: bytes
+    # content-coding -> compressed body, in order of preference
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, etag: str, html: str | bytes) -> RenderedPage:
+        body = html.encode("utf-8") if isinstance(html, str) else html
+        encoded: dict[str, bytes] = {}
+        if brotli is not None:
+            encoded["br"] = brotli.compress(body)
+        encoded["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+        return cls(etag=etag, body=body, encoded=encoded)
+
+    def negotiate(self, accept_encoding: str | None) -> tuple[bytes, str | None]:
+        """Return the body to send for ``accept_encoding`` and its content-coding."""
+        coding = negotiate_coding(accept_encoding)
+        if coding is None:
+            return self.body, None
+        return self.encoded[coding], coding
+
+
+class PortfolioPageCache:
+    """Thread-safe LRU of rendered pages keyed by portfolio ID and content version."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[int, tuple[str, RenderedPage]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, portfolio_id: int, version: str) -> RenderedPage | None:
+        with self._lock:
+            cached = self._entries.get(portfolio_id)
+            if cached is None or cached[0] != version:
+                return None
+            self._entries.move_to_end(portfolio_id)
+            return cached[1]
+
+    def put(self, portfolio_id: int, version: str, html: str | bytes) -> RenderedPage:
+        """Store the page rendered for ``version`` and return it."""
+        page = RenderedPage.build(page_etag(portfolio_id, version), html)
+        with self._lock:
+            self._entries[portfolio_id] = (version, page)
+            self._entries.move_to_end(portfolio_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return page
+
+    def discard(self, portfolio_id: int) -> None:
+        with self._lock:
+            self._entries.pop(portfolio_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _resolve_cache_size() -> int:
+    """Return the cache size from ``ZIP2JOB_PORTFOLIO_PAGE_CACHE_SIZE``."""
+    try:
+        return max(int(os.getenv("ZIP2JOB_PORTFOLIO_PAGE_CACHE_SIZE", "")), 1)
+    except ValueError:
+        return _DEFAULT_CACHE_SIZE
+
+
+portfolio_page_cache = PortfolioPageCache(_resolve_cache_size())
@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from capstone_project_team_5.detection import identify_language_and_framework
+from capstone_project_team_5.project_scan import ProjectScan
 from capstone_project_team_5.services.test_analysis import analyze_tests
 from capstone_project_team_5.skill_detection import extract_project_tools_practices
 
@@ -83,29 +84,39 @@ class ProjectAnalysis:
     user_role_types: dict[str, str] | None = None  # Map primary role and secondary roles
 
 
-def analyze_project(project_path: Path, consent_tool: ConsentTool | None = None) -> ProjectAnalysis:
+def analyze_project(
+    project_path: Path,
+    consent_tool: ConsentTool | None = None,
+    scan: ProjectScan | None = None,
+) -> ProjectAnalysis:
     """Analyze a project using all available analyzers.
 
     This is the main entry point for project analysis. It:
-    1. Detects language/framework
-    2. Runs skill detection
-    3. Runs language-specific analyzer if available
-    4. Aggregates all results into a single ProjectAnalysis object
+    1. Scans the project tree once (unless a scan is supplied)
+    2. Detects language/framework
+    3. Runs skill detection
+    4. Runs language-specific analyzer if available
+    5. Aggregates all results into a single ProjectAnalysis object
+
+    Every step reads from the same ProjectScan instead of walking the tree itself.
 
     Args:
         project_path: Path to the project directory
         consent_tool: Optional ConsentTool for checking LLM permissions.
+        scan: Optional pre-built scan of ``project_path``.
 
     Returns:
         ProjectAnalysis with aggregated data from all sources
     """
     project_path = Path(project_path)
+    if scan is None:
+        scan = ProjectScan.build(project_path)
 
     # Step 1: Detect language and framework
-    language, framework = identify_language_and_framework(project_path)
+    language, framework = identify_language_and_framework(project_path, scan)
 
     # Step 2: Skill detection (always runs)
-    skills_map = extract_project_tools_practices(project_path, consent_tool)
+    skills_map = extract_project_tools_practices(project_path, consent_tool, scan)
     tools = skills_map.get("tools", set())
     practices = skills_map.get("practices", set())
 
@@ -120,23 +131,23 @@ def analyze_project(project_path: Path, consent_tool: ConsentTool | None = None)
 
     # Step 4: Run language-specific analyzer if available
     if language == "C/C++":
-        _analyze_cpp_project(analysis)
+        _analyze_cpp_project(analysis, scan)
     elif language == "Java":
-        _analyze_java_project(analysis)
+        _analyze_java_project(analysis, scan)
     elif language == "Python":
-        _analyze_python_project(analysis)
+        _analyze_python_project(analysis, scan)
     elif language == "JavaScript" or language == "TypeScript":
-        _analyze_js_project(analysis)
+        _analyze_js_project(analysis, scan)
 
-    _populate_test_metrics(analysis)
+    _populate_test_metrics(analysis, scan)
 
     return analysis
 
 
-def _populate_test_metrics(analysis: ProjectAnalysis) -> None:
+def _populate_test_metrics(analysis: ProjectAnalysis, scan: ProjectScan | None = None) -> None:
     """Populate aggregated testing metrics for the project."""
 
-    test_result = analyze_tests(analysis.project_path)
+    test_result = analyze_tests(analysis.project_path, scan)
     analysis.test_file_count = test_result.test_file_count
     analysis.test_case_count = test_result.test_case_count
     analysis.unit_test_count = test_result.unit_test_count
@@ -147,16 +158,17 @@ def _populate_test_metrics(analysis: ProjectAnalysis) -> None:
     analysis.language_analysis["test_files"] = [str(item.path) for item in test_result.files]
 
 
-def _analyze_cpp_project(analysis: ProjectAnalysis) -> None:
+def _analyze_cpp_project(analysis: ProjectAnalysis, scan: ProjectScan | None = None) -> None:
     """Run C/C++ specific analysis and update the ProjectAnalysis object.
 
     Args:
         analysis: ProjectAnalysis object to update with C/C++ specific data
+        scan: Optional pre-built scan of the project
     """
     try:
         from capstone_project_team_5.c_analyzer import analyze_c_project
 
-        summary = analyze_c_project(analysis.project_path)
+        summary = analyze_c_project(analysis.project_path, scan)
 
         # Store raw summary for C-specific bullet generation
         analysis.language_analysis["c_cpp_summary"] = summary
@@ -201,16 +213,17 @@ def _analyze_cpp_project(analysis: ProjectAnalysis) -> None:
         pass
 
 
-def _analyze_java_project(analysis: ProjectAnalysis) -> None:
+def _analyze_java_project(analysis: ProjectAnalysis, scan: ProjectScan | None = None) -> None:
     """Run Java specific analysis and update the ProjectAnalysis object.
 
     Args:
         analysis: ProjectAnalysis object to update with Java specific data
+        scan: Optional pre-built scan of the project
     """
     try:
         from capstone_project_team_5.java_analyzer import analyze_java_project
 
-        result = analyze_java_project(analysis.project_path)
+        result = analyze_java_project(analysis.project_path, scan)
 
         # Check for errors from analyzer
         if "error" in result:
@@ -261,11 +274,12 @@ def _analyze_java_project(analysis: ProjectAnalysis) -> None:
 
 
 # Future: Add more language analyzers following the same pattern
-def _analyze_python_project(analysis: ProjectAnalysis) -> None:
+def _analyze_python_project(analysis: ProjectAnalysis, scan: ProjectScan | None = None) -> None:
     """Run Python specific analysis and update the ProjectAnalysis object.
 
     Args:
         analysis: ProjectAnalysis object to update with Python specific data.
+        scan: Optional pre-built scan of the project.
 
     Populates:
     - language_analysis["python_result"] with the raw analyzer result.
@@ -279,7 +293,7 @@ def _analyze_python_project(analysis: ProjectAnalysis) -> None:
     try:
         from capstone_project_team_5.python_analyzer import analyze_python_project
 
-        result = analyze_python_project(analysis.project_path)
+        result = analyze_python_project(analysis.project_path, scan)
 
         # Check for errors from analyzer
         if "error" in result:
@@ -349,16 +363,19 @@ def _analyze_python_project(analysis: ProjectAnalysis) -> None:
         pass
 
 
-def _analyze_js_project(analysis: ProjectAnalysis) -> None:
+def _analyze_js_project(analysis: ProjectAnalysis, scan: ProjectScan | None = None) -> None:
     """Run JavaScript/TypeScript specific analysis and update the ProjectAnalysis object.
 
     Args:
         analysis: ProjectAnalysis object to update with JS/TS specific data
+        scan: Optional pre-built scan of the project
     """
     try:
         from capstone_project_team_5.js_code_analyzer import analyze_js_project
 
-        summary = analyze_js_project(analysis.project_path, analysis.language, analysis.framework)
+        summary = analyze_js_project(
+            analysis.project_path, analysis.language, analysis.framework, scan
+        )
 
         analysis.language_analysis["js_ts_summary"] = summary
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -75,6 +77,21 @@ def has_project_thumbnail(project_id: int) -> bool:
     return get_project_thumbnail_path(project_id) is not None
 
 
+def get_projects_with_thumbnails(project_ids: Iterable[int]) -> set[int]:
+    """Return which of ``project_ids`` have a thumbnail, listing the directory once."""
+    wanted = set(project_ids)
+    root = get_thumbnail_storage_root()
+    if not wanted or not root.exists():
+        return set()
+    found: set[int] = set()
+    with os.scandir(root) as entries:
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            if ext in THUMBNAIL_EXTENSIONS and stem.isdigit() and int(stem) in wanted:
+                found.add(int(stem))
+    return found
+
+
 def set_project_thumbnail(
     project_id: int,
     *,
@@ -0,0 +1,176 @@
+"""Compress the objects of an existing content store in place.
+
+Stores written before objects were compressed keep working unchanged, since
+raw objects stay readable. This migration rewrites each raw object that
+``object_codec`` would compress today and reports what it saved: the bytes on
+disk before and after, and how fast the migrated objects read raw versus
+decoded.
+
+The migration holds ``store_lock`` exclusively, like garbage collection:
+materialization holds it shared while it checks an object's codec and links
+the object into a tree, so no object is rewritten between the two. Trees
+already materialized keep working (hardlinks keep the old inode, copies are
+independent) except symlinked ones, which point at ``objects/<hash>`` and
+must not be in use while the migration runs. A dry run only reads, and takes
+the lock shared.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from capstone_project_team_5.services.content_store import (
+    get_ingest_temp_root,
+    get_objects_root,
+    store_lock,
+)
+from capstone_project_team_5.services.object_codec import encode_object, object_codec, read_object
+
+logger = logging.getLogger(__name__)
+
+_OBJECT_NAME = re.compile(r"^[0-9a-f]{64}$")
+
+
+@dataclass(slots=True)
+class CompressionReport:
+    """Outcome of one migration.
+
+    Attributes:
+        dry_run: Whether objects were only measured, not rewritten.
+        objects_scanned: Objects found in the store.
+        objects_compressed: Raw objects rewritten compressed.
+        bytes_before: Size of all objects on disk before the migration.
+        bytes_after: Size of all objects on disk after the migration.
+        bytes_decoded: Content size of the compressed objects.
+        raw_read_seconds: Time to read the compressed objects' raw form.
+        decoded_read_seconds: Time to read and decode their compressed form.
+    """
+
+    dry_run: bool = False
+    objects_scanned: int = 0
+    objects_compressed: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+    bytes_decoded: int = 0
+    raw_read_seconds: float = 0.0
+    decoded_read_seconds: float = 0.0
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the report, with savings and read throughput, as a JSON-serializable dict."""
+        megabytes = self.bytes_decoded / (1024 * 1024)
+        return {
+            **asdict(self),
+            "bytes_saved": self.bytes_saved,
+            "savings_ratio": round(self.bytes_saved / self.bytes_before, 4)
+            if self.bytes_before
+            else 0.0,
+            "raw_read_mb_per_s": round(megabytes / self.raw_read_seconds, 1)
+            if self.raw_read_seconds
+            else None,
+            "decoded_read_mb_per_s": round(megabytes / self.decoded_read_seconds, 1)
+            if self.decoded_read_seconds
+            else None,
+        }
+
+
+def _replace_object(encoded_path: Path, object_path: Path) -> None:
+    with open(encoded_path, "rb") as handle:
+        os.fsync(handle.fileno())
+    # Trees hardlinked to the raw object keep their own copy of the inode
+    os.replace(encoded_path, object_path)
+
+
+def compress_stored_objects(*, dry_run: bool = False) -> CompressionReport:
+    """Compress every raw object that would be compressed if ingested today.
+
+    Args:
+        dry_run: Only measure the savings; objects are left as they are.
+
+    Returns:
+        CompressionReport with the storage savings and read timings.
+    """
+    report = CompressionReport(dry_run=dry_run)
+    temp_root = get_ingest_temp_root()
+    temp_root.mkdir(parents=True, exist_ok=True)
+    temp_dir = Path(tempfile.mkdtemp(prefix="compress-", dir=temp_root))
+
+    try:
+        with store_lock(exclusive=not dry_run):
+            for object_path in sorted(get_objects_root().glob("*/*")):
+                if not _OBJECT_NAME.match(object_path.name):
+                    continue
+                try:
+                    size = object_path.stat().st_size
+                    report.objects_scanned += 1
+                    report.bytes_before += size
+                    encoded_path = (
+                        None
+                        if object_codec(object_path) is not None
+                        else encode_object(object_path, temp_dir, compress=True)
+                    )
+                except FileNotFoundError:
+                    continue
+                if encoded_path is None:
+                    report.bytes_after += size
+                    continue
+
+                started = time.perf_counter()
+                content = object_path.read_bytes()
+                report.raw_read_seconds += time.perf_counter() - started
+                started = time.perf_counter()
+                decoded = read_object(encoded_path)
+                report.decoded_read_seconds += time.perf_counter() - started
+                if decoded != content:
+                    raise OSError(f"Compressed object {object_path.name} does not round-trip")
+
+                report.objects_compressed += 1
+                report.bytes_decoded += len(content)
+                report.bytes_after += encoded_path.stat().st_size
+                if dry_run:
+                    encoded_path.unlink()
+                else:
+                    _replace_object(encoded_path, object_path)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    logger.info(
+        "Object compression%s: %d of %d objects, %d -> %d bytes",
+        " (dry run)" if dry_run else "",
+        report.objects_compressed,
+        report.objects_scanned,
+        report.bytes_before,
+        report.bytes_after,
+    )
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point: migrate the store and print the report."""
+    parser = argparse.ArgumentParser(
+        description="Compress the raw objects of an existing content store."
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="only measure the savings, change nothing"
+    )
+    args = parser.parse_args(argv)
+    report = compress_stored_objects(dry_run=args.dry_run)
+    print(json.dumps(report.to_dict(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
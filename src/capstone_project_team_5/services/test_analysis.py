@@ -5,7 +5,9 @@ import os
 import re
 from collections.abc import Iterator
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
+from typing import Any
 
 from capstone_project_team_5.constants.contribution_metrics_constants import (
     SKIP_DIRS as CONTRIBUTION_SKIP_DIRS,
@@ -16,6 +18,8 @@ from capstone_project_team_5.constants.contribution_metrics_constants import (
 from capstone_project_team_5.constants.skill_detection_constants import (
     SKIP_DIRS as SKILL_SKIP_DIRS,
 )
+from capstone_project_team_5.project_scan import ProjectScan, is_project_dir
+from capstone_project_team_5.utils.path_classifier import PathClassifier, PathRule
 
 
 @dataclass
@@ -86,12 +90,21 @@ _FIXTURE_FILE_HINTS = {
 }
 
 # Regexes derived from existing contribution constants plus extra heuristics
-_TEST_PATH_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in TEST_FILE_PATTERNS] + [
-    re.compile(r"\bSpec\.", re.IGNORECASE),
-    re.compile(r"/__specs__/", re.IGNORECASE),
-    re.compile(r"/integration[/\\]", re.IGNORECASE),
-    re.compile(r"/e2e[/\\]", re.IGNORECASE),
-]
+_TEST_PATH_CLASSIFIER = PathClassifier(
+    [
+        PathRule(
+            "test",
+            (
+                *TEST_FILE_PATTERNS,
+                r"\bSpec\.",
+                r"/__specs__/",
+                r"/integration[/\\]",
+                r"/e2e[/\\]",
+            ),
+        )
+    ],
+    ignore_case=True,
+)
 
 _INTEGRATION_HINTS = {"integration", "e2e", "acceptance", "functional", "system"}
 _UNIT_HINTS = {"unit", "unittest", "component"}
@@ -164,48 +177,87 @@ _GTEST_MACROS = re.compile(r"\bTEST(?:_[FP])?\s*\(|\bTEST_[A-Z]+\s*\(", re.IGNOR
 _GO_TEST_FUNC = re.compile(r"\bfunc\s+(?:\([^)]+\)\s*)?Test\w+\s*\(", re.IGNORECASE)
 
 
-def analyze_tests(project_root: Path | str) -> TestAnalysisResult:
-    """Analyze tests across any language within the provided project root."""
+def analyze_tests(project_root: Path | str, scan: ProjectScan | None = None) -> TestAnalysisResult:
+    """Analyze tests across any language within the provided project root.
+
+    When ``scan`` is given, candidate files come from its index instead of a
+    fresh directory walk, and contents are read through it (so virtual scans
+    never touch the disk).
+    """
 
     root = Path(project_root)
     result = TestAnalysisResult()
 
-    if not root.exists() or not root.is_dir():
+    if not is_project_dir(root, scan):
         return result
 
-    for file_path in _iter_candidate_test_files(root):
+    for file_path in _iter_candidate_test_files(root, scan):
         if _is_fixture_like(file_path):
             continue
 
+        language = _detect_language(file_path)
+
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
+            if scan is not None:
+                # Counts depend only on content and language, so they are cached
+                content_summary = scan.cached_result(
+                    file_path,
+                    _file_cache_namespace(language),
+                    partial(_summarize_test_source, language),
+                )
+            else:
+                content = file_path.read_text(encoding="utf-8", errors="ignore")
+                content_summary = _summarize_test_content(language, content)
         except (OSError, UnicodeDecodeError):
             continue
 
-        language = _detect_language(file_path)
-        test_count = _count_tests(language, content)
+        test_count = content_summary["test_count"]
 
         if test_count == 0:
             continue
 
         category = _infer_test_category(file_path)
-        frameworks = _detect_frameworks(content)
 
         summary = TestFileSummary(
             path=file_path,
             language=language,
             test_count=test_count,
             category=category,
-            frameworks=frameworks,
+            frameworks=set(content_summary["frameworks"]),
         )
         result.register_file(summary)
 
     return result
 
 
-def _iter_candidate_test_files(root: Path) -> Iterator[Path]:
+def _file_cache_namespace(language: str) -> str:
+    """Return the file result cache namespace for test files of ``language``."""
+
+    return "tests-v1-" + re.sub(r"[^a-z0-9]+", "-", language.lower()).strip("-")
+
+
+def _summarize_test_source(language: str, data: bytes) -> dict[str, Any]:
+    return _summarize_test_content(language, data.decode("utf-8", errors="ignore"))
+
+
+def _summarize_test_content(language: str, content: str) -> dict[str, Any]:
+    """Return the content-derived test metrics of one file."""
+
+    test_count = _count_tests(language, content)
+    frameworks = _detect_frameworks(content) if test_count else set()
+    return {"test_count": test_count, "frameworks": sorted(frameworks)}
+
+
+def _iter_candidate_test_files(root: Path, scan: ProjectScan | None = None) -> Iterator[Path]:
     """Yield files that are likely to contain tests based on path heuristics."""
 
+    if scan is not None:
+        for entry in scan.iter_files(skip_dirs=_SKIP_DIRS):
+            file_path = scan.absolute_path(entry)
+            if _looks_like_test_path(file_path):
+                yield file_path
+        return
+
     for dirpath, dirnames, filenames in os.walk(root):
         dirnames[:] = [name for name in dirnames if name.lower() not in _SKIP_DIRS]
 
@@ -227,9 +279,8 @@ def _looks_like_test_path(path: Path) -> bool:
     if filename in {"package-lock.json", "pnpm-lock.yaml", "yarn.lock"}:
         return False
 
-    for regex in _TEST_PATH_REGEXES:
-        if regex.search(normalized):
-            return True
+    if _TEST_PATH_CLASSIFIER.classify(normalized) is not None:
+        return True
 
     return filename.startswith("test") or filename.endswith("_test.py")
 
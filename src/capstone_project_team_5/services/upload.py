@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -16,6 +18,7 @@ from capstone_project_team_5.models.upload import (
     InvalidZipError,
     ZipUploadResult,
 )
+from capstone_project_team_5.project_scan import ProjectScan
 
 
 def _get_ignore_patterns() -> set[str]:
@@ -35,7 +38,7 @@ def _is_ignored(segments: list[str], ignore_patterns: set[str]) -> bool:
     Returns:
         True if any segment should be ignored.
     """
-    return any(part in ignore_patterns for part in segments)
+    return not ignore_patterns.isdisjoint(segments)
 
 
 def _ensure_zip_file(path: Path) -> None:
@@ -184,11 +187,60 @@ def _is_media_file(filename: str) -> bool:
     return any(lowered.endswith(ext) for ext in media_extensions)
 
 
+@dataclass(slots=True)
+class _PathTrieNode:
+    """Directory node of the prefix index built over archive entries.
+
+    Attributes:
+        children: Sub-directories keyed by segment name.
+        file_count: Files below this directory that are not inside a ``.git``
+            directory at or below it.
+        has_git: True when this directory directly contains ``.git``.
+    """
+
+    children: dict[str, _PathTrieNode] = field(default_factory=dict)
+    file_count: int = 0
+    has_git: bool = False
+
+
+def _index_entries(files: Iterable[tuple[str, list[str]]]) -> _PathTrieNode:
+    """Build the directory prefix index for *files* in a single pass.
+
+    Each file is counted towards every ancestor directory deeper than its last
+    ``.git`` segment, which is exactly the set of projects that would count it.
+    """
+
+    root = _PathTrieNode()
+    for _, segments in files:
+        if ".git" in segments:
+            first_git = segments.index(".git")
+            last_git = len(segments) - 1 - segments[::-1].index(".git")
+        else:
+            first_git = last_git = -1
+
+        node = root
+        for depth, segment in enumerate(segments[:-1], start=1):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _PathTrieNode()
+            node = child
+            if depth > last_git:
+                node.file_count += 1
+            if depth == first_git:
+                node.has_git = True
+    return root
+
+
 def _discover_projects(names: list[str], ignore_patterns: set[str]) -> list[DetectedProject]:
-    """Discover individual projects contained within the uploaded ZIP."""
+    """Discover individual projects contained within the uploaded ZIP.
+
+    Runs in time linear in the size of the namelist: file counts, Git detection
+    and the root doc/media pseudo-projects all come from one prefix index.
+    """
 
     detection_ignore = {pattern for pattern in ignore_patterns if pattern != ".git"}
     files, directories = _collect_zip_entries(names, detection_ignore)
+    index = _index_entries(files)
 
     top_level_dirs = {
         segments[0] for _, segments in files if len(segments) > 1 and segments[0] != ".git"
@@ -213,20 +265,20 @@ def _discover_projects(names: list[str], ignore_patterns: set[str]) -> list[Dete
         elif _is_media_file(filename):
             root_media_files.append(filename)
 
-    git_project_paths: set[str] = set()
+    git_project_paths: set[str] = {
+        "/".join(segments[:-1])
+        for _, segments in directories
+        if len(segments) > 1 and segments[-1] == ".git"
+    }
 
-    for _, segments in directories:
-        if segments and segments[-1] == ".git":
-            candidate = "/".join(segments[:-1])
-            if candidate:
-                git_project_paths.add(candidate)
+    def _collect_git_paths(node: _PathTrieNode, path: str) -> None:
+        for segment, child in node.children.items():
+            child_path = f"{path}/{segment}" if path else segment
+            if child.has_git:
+                git_project_paths.add(child_path)
+            _collect_git_paths(child, child_path)
 
-    for _, segments in files:
-        if ".git" in segments:
-            idx = segments.index(".git")
-            candidate = "/".join(segments[:idx])
-            if candidate:
-                git_project_paths.add(candidate)
+    _collect_git_paths(index, "")
 
     project_paths = {path for path in top_level_dirs if path}
     project_paths.update(git_project_paths)
@@ -235,19 +287,13 @@ def _discover_projects(names: list[str], ignore_patterns: set[str]) -> list[Dete
 
     for project_path in sorted(project_paths):
         project_segments = project_path.split("/")
-        project_files: list[list[str]] = []
-
-        for _, segments in files:
-            if len(segments) <= len(project_segments):
-                continue
-            if segments[: len(project_segments)] != project_segments:
-                continue
-            rel_segments = segments[len(project_segments) :]
-            if ".git" in rel_segments:
-                continue
-            project_files.append(rel_segments)
-
-        file_count = len(project_files)
+        node: _PathTrieNode | None = index
+        for segment in project_segments:
+            node = node.children.get(segment)
+            if node is None:
+                break
+
+        file_count = node.file_count if node is not None else 0
         if file_count == 0:
             continue
 
@@ -286,6 +332,31 @@ def _discover_projects(names: list[str], ignore_patterns: set[str]) -> list[Dete
     return discovered
 
 
+def _extract_projects(archive: ZipFile, rel_paths: Iterable[str], dest_root: Path) -> None:
+    """Extract only the members of the given projects (including ``.git``) to disk.
+
+    Members are matched against their own ancestor directories, so a single
+    pass over the namelist covers every project.
+
+    Args:
+        archive: Open archive containing the projects.
+        rel_paths: Project directories inside the archive.
+        dest_root: Directory to extract into.
+    """
+    wanted = {rel_path.strip("/") for rel_path in rel_paths}
+    members: list[str] = []
+    for name in archive.namelist():
+        normalized = name.lstrip("/")
+        slash = normalized.find("/")
+        while slash != -1:
+            if normalized[:slash] in wanted:
+                members.append(name)
+                break
+            slash = normalized.find("/", slash + 1)
+    if members:
+        archive.extractall(dest_root, members=members)
+
+
 def inspect_zip(
     zip_path: Path | str,
 ) -> tuple[ZipUploadResult, dict[str, bool], dict[str, tuple[date | None, date | None]]]:
@@ -308,43 +379,81 @@ def inspect_zip(
 
     ignore_patterns = _get_ignore_patterns()
 
-    # Determine collaboration flags using the extracted archive contents.
+    # Determine collaboration flags and dates. Non-Git projects are read straight
+    # from the archive; only Git projects are extracted, since their history can
+    # only be read by running git against a real checkout. When the archive is
+    # itself a repository (``.git`` at its root), every top-level project lives
+    # inside it and is extracted together with the root ``.git``.
     collab_flags: dict[str, bool] = {}
     project_dates: dict[str, tuple[date | None, date | None]] = {}
 
-    with TemporaryDirectory() as temp_dir_str:
-        extract_root = Path(temp_dir_str)
-        with ZipFile(path) as archive:
-            names = archive.namelist()
-            tree = _build_tree(names, ignore_patterns)
-            file_count = _count_files(tree)
-            projects = _discover_projects(names, ignore_patterns)
-            archive.extractall(extract_root)
-
-        for project in projects:
-            if not project.rel_path:
-                # Pseudo-projects like "docs" and "media" are treated as individual.
-                collab_flags[project.rel_path] = False
-                continue
-
-            project_root = extract_root.joinpath(*project.rel_path.split("/"))
-            if project_root.is_dir():
-                try:
-                    collab_flags[project.rel_path] = CollabDetector.is_collaborative(project_root)
-                except Exception:
-                    collab_flags[project.rel_path] = False
+    with ZipFile(path) as archive:
+        names = archive.namelist()
+        tree = _build_tree(names, ignore_patterns)
+        file_count = _count_files(tree)
+        projects = _discover_projects(names, ignore_patterns)
+        in_root_repo = any(name.lstrip("/").startswith(".git/") for name in names)
+
+        git_paths = [
+            project.rel_path
+            for project in projects
+            if project.rel_path and (project.has_git_repo or in_root_repo)
+        ]
+        scans = ProjectScan.from_zip_projects(
+            archive,
+            [
+                project.rel_path
+                for project in projects
+                if project.rel_path and not (project.has_git_repo or in_root_repo)
+            ],
+        )
+
+        with TemporaryDirectory() if git_paths else nullcontext() as temp_dir_str:
+            if git_paths:
+                _extract_projects(
+                    archive, [*git_paths, ".git"] if in_root_repo else git_paths, Path(temp_dir_str)
+                )
 
-                try:
-                    from capstone_project_team_5.contribution_metrics import ContributionMetrics
+            for project in projects:
+                if not project.rel_path:
+                    # Pseudo-projects like "docs" and "media" are treated as individual.
+                    collab_flags[project.rel_path] = False
+                    continue
 
-                    project_dates[project.rel_path] = ContributionMetrics.get_project_dates(
-                        project_root
-                    )
-                except Exception:
+                if not (project.has_git_repo or in_root_repo):
+                    # Git dates are unavailable without a repository.
+                    project_dates[project.rel_path] = (None, None)
+                    scan = scans[project.rel_path]
+                    try:
+                        collab_flags[project.rel_path] = CollabDetector.is_collaborative(
+                            scan.root, scan
+                        )
+                    except Exception:
+                        collab_flags[project.rel_path] = False
+                    continue
+
+                project_root = Path(temp_dir_str).joinpath(*project.rel_path.split("/"))
+                if project_root.is_dir():
+                    try:
+                        collab_flags[project.rel_path] = CollabDetector.is_collaborative(
+                            project_root
+                        )
+                    except Exception:
+                        collab_flags[project.rel_path] = False
+
+                    try:
+                        from capstone_project_team_5.contribution_metrics import (
+                            ContributionMetrics,
+                        )
+
+                        project_dates[project.rel_path] = ContributionMetrics.get_project_dates(
+                            project_root
+                        )
+                    except Exception:
+                        project_dates[project.rel_path] = (None, None)
+                else:
+                    collab_flags[project.rel_path] = False
                     project_dates[project.rel_path] = (None, None)
-            else:
-                collab_flags[project.rel_path] = False
-                project_dates[project.rel_path] = (None, None)
 
     result = ZipUploadResult(
         filename=path.name,
@@ -1,4 +1,10 @@
-"""Helpers for storing and retrieving uploaded ZIP archives."""
+"""Helpers for storing and retrieving uploaded ZIP archives.
+
+Uploads are always ingested into the content store. Keeping the original
+archive as well is optional (``ZIP2JOB_KEEP_UPLOAD_ARCHIVES``, on by default):
+it only serves to re-ingest an upload whose manifest went missing. Turning it
+off makes the content store the single copy of every upload.
+"""
 
 from __future__ import annotations
 
@@ -17,15 +23,50 @@ def get_upload_storage_root() -> Path:
     return project_root / ".zip2job_uploads"
 
 
+def get_upload_temp_root() -> Path:
+    """Return the directory uploads are streamed into before being stored.
+
+    It sits under the storage root so a kept archive is moved into place with
+    a rename instead of a copy.
+    """
+    return get_upload_storage_root() / "tmp"
+
+
+def keep_upload_archives() -> bool:
+    """Return whether original archives are kept next to the content store."""
+    return os.getenv("ZIP2JOB_KEEP_UPLOAD_ARCHIVES", "1").strip().lower() not in {
+        "0",
+        "false",
+        "no",
+        "off",
+    }
+
+
 def get_upload_zip_path(upload_id: int, filename: str) -> Path:
     """Return the expected path for a stored upload ZIP."""
     safe_name = Path(filename).name
     return get_upload_storage_root() / str(upload_id) / safe_name
 
 
-def store_upload_zip(upload_id: int, filename: str, source_path: Path) -> Path:
-    """Persist a ZIP archive for later analysis."""
+def store_upload_zip(
+    upload_id: int, filename: str, source_path: Path, *, move: bool = False
+) -> Path:
+    """Persist a ZIP archive for later analysis.
+
+    Args:
+        upload_id: Upload the archive belongs to.
+        filename: Original archive name.
+        source_path: Archive to store.
+        move: Move ``source_path`` into place (a rename on the same file
+            system) instead of copying it.
+
+    Returns:
+        Path of the stored archive.
+    """
     target_path = get_upload_zip_path(upload_id, filename)
     target_path.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(source_path, target_path)
+    if move:
+        shutil.move(source_path, target_path)
+    else:
+        shutil.copy2(source_path, target_path)
     return target_path
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from itertools import chain
 from pathlib import Path
 
 from capstone_project_team_5.consent_tool import ConsentTool
@@ -13,8 +16,51 @@ from capstone_project_team_5.constants.skill_detection_constants import (
     TOOL_FILE_NAMES,
     TOOL_FILE_PATH_PATTERNS,
 )
+from capstone_project_team_5.project_scan import ProjectScan, is_project_dir
 from capstone_project_team_5.services.llm_providers import LLMError
 from capstone_project_team_5.services.llm_service import LLMService
+from capstone_project_team_5.utils.aho_corasick import AhoCorasick
+
+_TOOL = "tools"
+_PRACTICE = "practices"
+
+
+def _tagged(
+    kind: str, rules: dict[str, set[str]], *, prefixes: bool | None = None
+) -> Iterator[tuple[str, tuple[str, str]]]:
+    """Yield ``(entry, (kind, skill))`` for rule entries, optionally only path prefixes."""
+    for skill, entries in rules.items():
+        for entry in entries:
+            if prefixes is None or prefixes == ("/" in entry):
+                yield entry, (kind, skill)
+
+
+def _index(*pairs: Iterable[tuple[str, tuple[str, str]]]) -> dict[str, frozenset[tuple[str, str]]]:
+    """Map each entry to the skills it identifies."""
+    index: dict[str, set[tuple[str, str]]] = defaultdict(set)
+    for entry, skill in chain(*pairs):
+        index[entry].add(skill)
+    return {entry: frozenset(skills) for entry, skills in index.items()}
+
+
+# Compiled once, so per-file cost depends on the path, not the number of rules.
+# Paths are matched lowercased; as before, rules with uppercase never match them.
+_SKILLS_BY_FILE_NAME = _index(_tagged(_TOOL, TOOL_FILE_NAMES))
+_SKILLS_BY_LOWER_FILE_NAME = _index(_tagged(_PRACTICE, PRACTICES_FILE_NAMES))
+_SKILLS_BY_PATH_PART = _index(
+    _tagged(_TOOL, TOOL_DIRECTORY_PATTERNS, prefixes=False),
+    _tagged(_PRACTICE, PRACTICES_PATH_PATTERNS, prefixes=False),
+)
+_FILE_NAME_MATCHER = AhoCorasick(
+    chain(_tagged(_TOOL, TOOL_FILE_NAME_PATTERNS), _tagged(_PRACTICE, PRACTICES_FILE_PATTERNS))
+)
+_PATH_MATCHER = AhoCorasick(
+    ((pattern.lower(), skill) for pattern, skill in _tagged(_TOOL, TOOL_FILE_PATH_PATTERNS)),
+    anchored=chain(
+        _tagged(_TOOL, TOOL_DIRECTORY_PATTERNS, prefixes=True),
+        _tagged(_PRACTICE, PRACTICES_PATH_PATTERNS, prefixes=True),
+    ),
+)
 
 
 class SkillDetector:
@@ -29,104 +75,70 @@ class SkillDetector:
         return path.name.lower() in SKIP_DIRS
 
     @staticmethod
-    def _detect_tools_locally(file_name: str, rel_path: str) -> set[str]:
+    def _detect_locally(file_name: str, rel_path: str) -> tuple[set[str], set[str]]:
         """
-        Detect development tools based on file name and path.
+        Detect development tools and practices based on file name and path.
 
         Args:
             file_name: Original file name
             rel_path: Relative path
 
         Returns:
-            Set of detected tool names
+            Tuple of (tools, practices) sets
         """
-        tools = set()
-
         file_name_lower = file_name.lower()
         rel_path_lower = rel_path.lower()
 
-        # Check exact file names
-        for tool, file_names in TOOL_FILE_NAMES.items():
-            if file_name in file_names:
-                tools.add(tool)
-
-        # Check file name patterns
-        for tool, patterns in TOOL_FILE_NAME_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in file_name_lower:
-                    tools.add(tool)
-
-        # Check file path patterns
-        for tool, patterns in TOOL_FILE_PATH_PATTERNS.items():
-            for pattern in patterns:
-                if pattern.lower() in rel_path_lower:
-                    tools.add(tool)
-
-        # Check directory patterns
-        path_parts_lower = set(rel_path_lower.split("/"))
-        for tool, dir_names in TOOL_DIRECTORY_PATTERNS.items():
-            for dir_name in dir_names:
-                if "/" in dir_name:
-                    if rel_path_lower.startswith(dir_name):
-                        tools.add(tool)
-                        break
-                else:
-                    if dir_name in path_parts_lower:
-                        tools.add(tool)
-                        break
+        found = set(_SKILLS_BY_FILE_NAME.get(file_name, ()))
+        found.update(_SKILLS_BY_LOWER_FILE_NAME.get(file_name_lower, ()))
+        found |= _FILE_NAME_MATCHER.find(file_name_lower)
+        found |= _PATH_MATCHER.find(rel_path_lower)
+        for part in rel_path_lower.split("/"):
+            found.update(_SKILLS_BY_PATH_PART.get(part, ()))
 
-        return tools
+        tools = {skill for kind, skill in found if kind == _TOOL}
+        practices = {skill for kind, skill in found if kind == _PRACTICE}
+        return tools, practices
 
     @staticmethod
-    def _detect_practices_locally(file_name: str, rel_path: str) -> set[str]:
+    def _detect_tools_locally(file_name: str, rel_path: str) -> set[str]:
         """
-        Detect software development practices based on file name and path.
+        Detect development tools based on file name and path.
 
         Args:
             file_name: Original file name
             rel_path: Relative path
 
         Returns:
-            Set of detected practice names
+            Set of detected tool names
         """
-        practices = set()
+        return SkillDetector._detect_locally(file_name, rel_path)[0]
 
-        file_name_lower = file_name.lower()
-        rel_path_lower = rel_path.lower()
+    @staticmethod
+    def _detect_practices_locally(file_name: str, rel_path: str) -> set[str]:
+        """
+        Detect software development practices based on file name and path.
 
-        # Check exact file names
-        for practice, file_names in PRACTICES_FILE_NAMES.items():
-            if file_name_lower in file_names:
-                practices.add(practice)
-
-        # Check file patterns
-        for practice, patterns in PRACTICES_FILE_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in file_name_lower:
-                    practices.add(practice)
-
-        # Check path patterns
-        path_parts_lower = set(rel_path_lower.split("/"))
-        for practice, patterns in PRACTICES_PATH_PATTERNS.items():
-            for pattern in patterns:
-                if "/" in pattern:
-                    if rel_path_lower.startswith(pattern):
-                        practices.add(practice)
-                        break
-                else:
-                    if pattern in path_parts_lower:
-                        practices.add(practice)
-                        break
+        Args:
+            file_name: Original file name
+            rel_path: Relative path
 
-        return practices
+        Returns:
+            Set of detected practice names
+        """
+        return SkillDetector._detect_locally(file_name, rel_path)[1]
 
     @staticmethod
-    def _detect_tools_practices_locally(root: Path) -> tuple[set[str], set[str]]:
+    def _detect_tools_practices_locally(
+        root: Path, scan: ProjectScan | None = None
+    ) -> tuple[set[str], set[str]]:
         """
         Scan all files in the project to detect tools and practices.
 
         Args:
             root: Root directory of the project
+            scan: Optional pre-built scan of the project; when given, its file
+                index is used instead of walking the directory again.
 
         Returns:
             Tuple of (tools, practices) sets
@@ -134,6 +146,15 @@ class SkillDetector:
         tools = set()
         practices = set()
 
+        if scan is not None:
+            for entry in scan.iter_files(skip_dirs=SKIP_DIRS):
+                file_tools, file_practices = SkillDetector._detect_locally(
+                    entry.name, entry.rel_path
+                )
+                tools.update(file_tools)
+                practices.update(file_practices)
+            return tools, practices
+
         def scan_directory(directory: Path) -> None:
             """Recursively scan directory, skipping excluded dirs."""
             try:
@@ -148,10 +169,11 @@ class SkillDetector:
                         rel_path = str(item.relative_to(root)).replace("\\", "/")
 
                         # Detect tools and practices
-                        tools.update(SkillDetector._detect_tools_locally(file_name, rel_path))
-                        practices.update(
-                            SkillDetector._detect_practices_locally(file_name, rel_path)
+                        file_tools, file_practices = SkillDetector._detect_locally(
+                            file_name, rel_path
                         )
+                        tools.update(file_tools)
+                        practices.update(file_practices)
             except (PermissionError, OSError, FileNotFoundError):
                 # Skip directories we can't access due to permissions or I/O errors
                 pass
@@ -207,6 +229,41 @@ class SkillDetector:
 
         return "\n".join(tree_lines)
 
+    @staticmethod
+    def _generate_directory_tree_from_scan(scan: ProjectScan, max_depth: int = 5) -> str:
+        """
+        Generate the same directory tree string as ``_generate_directory_tree``
+        from a scan index instead of the filesystem.
+
+        Args:
+            scan: Scan of the project
+            max_depth: Maximum depth to traverse
+
+        Returns:
+            String representation of the directory tree
+        """
+        tree: dict = {}
+        for entry in scan.iter_files(skip_dirs=SKIP_DIRS):
+            node = tree
+            for part in entry.dir_parts:
+                node = node.setdefault(part, {})
+            node[entry.name] = None
+
+        def render(node: dict, prefix: str, depth: int) -> list[str]:
+            if depth >= max_depth:
+                return []
+            lines: list[str] = []
+            items = sorted(node.items(), key=lambda kv: (kv[1] is None, kv[0].lower()))
+            for name, child in items:
+                if child is None:
+                    lines.append(f"{prefix}{name}")
+                    continue
+                lines.append(f"{prefix}{name}/")
+                lines.extend(render(child, prefix + "  ", depth + 1))
+            return lines
+
+        return "\n".join(render(tree, "", 0))
+
     @staticmethod
     def _generate_llm_call_config(directory_tree: str) -> tuple[str, str, float, int]:
         """
@@ -284,6 +341,7 @@ class SkillDetector:
         existing_tools: set[str],
         existing_practices: set[str],
         consent_tool: ConsentTool | None = None,
+        scan: ProjectScan | None = None,
     ) -> tuple[set[str], set[str]]:
         """
         Use LLM to identify additional tools and practices from the directory structure.
@@ -293,12 +351,17 @@ class SkillDetector:
             existing_tools: Tools already detected by pattern matching
             existing_practices: Practices already detected by pattern matching
             consent_tool: Optional ConsentTool for getting model preferences.
+            scan: Optional pre-built scan; required to describe virtual projects
+                that have no directory on disk.
 
         Returns:
             Tuple of (tools, practices) sets identified by LLM
         """
         try:
-            tree = SkillDetector._generate_directory_tree(root)
+            if scan is not None and scan.is_virtual:
+                tree = SkillDetector._generate_directory_tree_from_scan(scan)
+            else:
+                tree = SkillDetector._generate_directory_tree(root)
 
             # Skip LLM call if directory tree is empty
             if not tree or not tree.strip():
@@ -339,13 +402,18 @@ class SkillDetector:
             return set(), set()
 
     @staticmethod
-    def detect_skills(root: Path, consent_tool: ConsentTool | None = None) -> dict[str, set[str]]:
+    def detect_skills(
+        root: Path,
+        consent_tool: ConsentTool | None = None,
+        scan: ProjectScan | None = None,
+    ) -> dict[str, set[str]]:
         """
         Detect development tools and practices in the project.
 
         Args:
             root: Root directory of the project
             consent_tool: Optional ConsentTool instance for checking LLM permissions.
+            scan: Optional pre-built scan of the project.
 
         Returns:
             Dictionary with 'tools' and 'practices' keys containing sets of detected items
@@ -355,18 +423,18 @@ class SkillDetector:
             "practices": set(),
         }
 
-        if not root.exists() or not root.is_dir():
+        if not is_project_dir(root, scan):
             return skills
 
         # Detect tools and practices locally
-        local_tools, local_practices = SkillDetector._detect_tools_practices_locally(root)
+        local_tools, local_practices = SkillDetector._detect_tools_practices_locally(root, scan)
         skills["tools"].update(local_tools)
         skills["practices"].update(local_practices)
 
         if consent_tool is not None and consent_tool.is_llm_allowed():
             # use LLM to identify any additional tools/practices
             llm_tools, llm_practices = SkillDetector._detect_tools_practices_llm(
-                root, skills["tools"], skills["practices"], consent_tool
+                root, skills["tools"], skills["practices"], consent_tool, scan
             )
             skills["tools"].update(llm_tools)
             skills["practices"].update(llm_practices)
@@ -375,7 +443,9 @@ class SkillDetector:
 
 
 def extract_project_tools_practices(
-    project_root: Path, consent_tool: ConsentTool | None = None
+    project_root: Path,
+    consent_tool: ConsentTool | None = None,
+    scan: ProjectScan | None = None,
 ) -> dict[str, set[str]]:
     """
     Extracts project skills: tools and practices from the given project root directory.
@@ -383,8 +453,9 @@ def extract_project_tools_practices(
     Args:
         project_root: Path to the project root directory
         consent_tool: Optional ConsentTool instance for checking LLM permissions.
+        scan: Optional pre-built scan of the project root.
 
     Returns:
         Dictionary with skills: 'tools' and 'practices' keys containing sets of detected items
     """
-    return SkillDetector.detect_skills(Path(project_root), consent_tool)
+    return SkillDetector.detect_skills(Path(project_root), consent_tool, scan)
@@ -0,0 +1,94 @@
+"""Aho–Corasick matching of many literal patterns in one pass.
+
+The automaton is compiled into a deterministic transition table, so finding
+every pattern in a text costs one dictionary lookup per character no matter
+how many patterns there are.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+
+
+class AhoCorasick[T]:
+    """Finds the labels of all patterns occurring in a text.
+
+    Each pattern carries a label; several patterns may share one. Anchored
+    patterns only match at the start of the text, like ``str.startswith``.
+    """
+
+    def __init__(
+        self,
+        patterns: Iterable[tuple[str, T]],
+        *,
+        anchored: Iterable[tuple[str, T]] = (),
+    ) -> None:
+        goto: list[dict[str, int]] = [{}]
+        # per state: (pattern length or None when unanchored, label)
+        outputs: list[list[tuple[int | None, T]]] = [[]]
+
+        def add(pattern: str, output: tuple[int | None, T]) -> None:
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(output)
+
+        unanchored_count = 0
+        for pattern, label in patterns:
+            if pattern:
+                add(pattern, (None, label))
+                unanchored_count += 1
+        for pattern, label in anchored:
+            if pattern:
+                add(pattern, (len(pattern), label))
+
+        # Breadth-first, so each state's failure target is already complete
+        delta: list[dict[str, int]] = [dict(goto[0]) for _ in goto]
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            outputs[state] = [*outputs[state], *outputs[fail[state]]]
+            for char, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(char, 0)
+                queue.append(child)
+
+        self._delta = delta
+        self._outputs = [tuple(output) for output in outputs]
+        self._accepting = frozenset(state for state, output in enumerate(outputs) if output)
+        # Without unanchored patterns only the trie path from the start can match
+        self._goto = None if unanchored_count else goto
+
+    def find(self, text: str) -> set[T]:
+        """Return the labels of every pattern found in ``text``."""
+        found: set[T] = set()
+        accepting = self._accepting
+        state = 0
+        if self._goto is not None:
+            goto = self._goto
+            for end, char in enumerate(text, 1):
+                state = goto[state].get(char)
+                if state is None:
+                    break
+                if state in accepting:
+                    found.update(label for length, label in self._outputs[state] if length == end)
+            return found
+
+        delta = self._delta
+        for end, char in enumerate(text, 1):
+            state = delta[state].get(char, 0)
+            if state in accepting:
+                found.update(
+                    label
+                    for length, label in self._outputs[state]
+                    if length is None or length == end
+                )
+        return found
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import codecs
 import datetime
 import re
 import subprocess
+import tempfile
+from array import array
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from contextlib import suppress
 from dataclasses import dataclass
 from math import ceil
 from pathlib import Path
+from typing import Any
 
 # ---------------------------------------------------------------------------
 # Data Models
@@ -76,6 +81,53 @@ def run_git(repo: Path | str, *args: str) -> str:
         raise RuntimeError(f"git command failed ({' '.join(args)}): {exc.stderr.strip()}") from exc
 
 
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def stream_git(
+    repo: Path | str,
+    *args: str,
+    separator: str = "\n",
+    chunk_size: int = _STREAM_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Run a git command inside `repo` and yield its stdout record by record.
+
+    Output is read from the pipe in ``chunk_size`` pieces and split on
+    ``separator`` as it arrives, so memory stays bounded by one chunk plus
+    the longest record rather than the whole output. Empty records are
+    skipped. Closing the iterator early terminates git.
+
+    Raises:
+        RuntimeError: if the command exits with a non-zero status. Records
+            produced before the failure have already been yielded.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    with tempfile.TemporaryFile() as stderr:
+        proc = subprocess.Popen(
+            ["git", "-C", str(Path(repo)), *args],
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+        )
+        try:
+            pending = ""
+            while chunk := proc.stdout.read1(chunk_size):
+                *records, pending = (pending + decoder.decode(chunk)).split(separator)
+                yield from (record for record in records if record)
+            pending += decoder.decode(b"", final=True)
+            if pending:
+                yield pending
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()
+            returncode = proc.wait()
+
+        if returncode != 0:
+            stderr.seek(0)
+            message = stderr.read().decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"git command failed ({' '.join(args)}): {message}")
+
+
 # ---------------------------------------------------------------------------
 # Parsing
 # ---------------------------------------------------------------------------
@@ -97,80 +149,462 @@ def parse_numstat(output: str) -> list[NumstatEntry]:
 
 
 # ---------------------------------------------------------------------------
-# Contribution Summaries
+# Commit History
 # ---------------------------------------------------------------------------
 
+# One record per commit: RS, then unit-separated header fields, then the
+# NUL-terminated ``--numstat -z`` entries for that commit.
+_LOG_FIELDS = ("%H", "%P", "%D", "%an", "%ae", "%cN", "%at", "%ad", "%ct", "%s")
+_LOG_FORMAT = "%x1e" + "%x1f".join(_LOG_FIELDS)
+_CONVENTIONAL_TYPE_RE = re.compile(r"^(?P<type>\w+)(\([\w-]+\))?:")
+_BINARY = -1
 
-def get_author_contributions(repo: Path | str, rev_range: str = "HEAD") -> list[AuthorContribution]:
-    """Summarize total commits, insertions, and deletions per author."""
-    output = run_git(repo, "log", "--numstat", "--pretty=format:%H%x09%an%x09%ct", rev_range)
 
-    totals: dict[str, list[int]] = defaultdict(lambda: [0, 0, 0])  # commits, added, deleted
+def _parse_offset(value: str) -> int:
+    """Convert a ``+HHMM``/``-HHMM`` offset to minutes east of UTC."""
+    if len(value) != 5 or value[0] not in "+-" or not value[1:].isdigit():
+        return 0
+    minutes = int(value[1:3]) * 60 + int(value[3:5])
+    return -minutes if value[0] == "-" else minutes
+
+
+def _is_head_decoration(decoration: str) -> bool:
+    return any(ref == "HEAD" or ref.startswith("HEAD -> ") for ref in decoration.split(", "))
+
+
+class GitHistory:
+    """In-memory, columnar table of a repository's commit history.
+
+    Built from a single ``git log --numstat`` pass over every ref, so all
+    git-derived metrics for a project (contributions, commit types, weekly
+    activity, commit dates, changed files, role signals) are answered from
+    memory instead of spawning one ``git log`` per metric.
+
+    Commits are stored newest first (``git log`` order) in parallel columns,
+    and per-commit file changes are stored in flat arrays addressed through
+    ``file_offsets``. Author, committer and path strings are interned so a
+    long history holds each distinct value once.
+
+    Revision selection accepts ``"HEAD"`` (commits reachable from HEAD) and
+    ``"--all"`` (every loaded commit), mirroring the ranges used by the
+    module-level helpers. A history loaded with ``with_files=False`` skips
+    ``--numstat`` and reports no file changes.
 
-    current_author: str | None = None
-    commit_added = 0
-    commit_deleted = 0
+    A full history can be serialized with ``to_dict`` and brought up to date
+    with ``updated`` by reading only the commits added since it was loaded.
+    """
+
+    __slots__ = (
+        "rev_range",
+        "head",
+        "hashes",
+        "authors",
+        "emails",
+        "committers",
+        "author_times",
+        "author_offsets",
+        "commit_times",
+        "subjects",
+        "parents",
+        "parent_counts",
+        "on_head",
+        "file_offsets",
+        "file_paths",
+        "file_added",
+        "file_deleted",
+        "paths",
+    )
 
-    header_re = re.compile(r"^[0-9a-f]{7,40}$")
+    def __init__(self, rev_range: str = "--all") -> None:
+        self.rev_range = rev_range
+        self.head: str | None = None
+        self.hashes: list[str] = []
+        self.authors: list[str] = []
+        self.emails: list[str] = []
+        self.committers: list[str] = []
+        self.author_times = array("q")
+        self.author_offsets = array("h")
+        self.commit_times = array("q")
+        self.subjects: list[str] = []
+        self.parents: list[str] = []
+        self.parent_counts = array("B")
+        self.on_head = bytearray()
+        self.file_offsets = array("I", [0])
+        self.file_paths = array("I")
+        self.file_added = array("i")
+        self.file_deleted = array("i")
+        self.paths: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    @classmethod
+    def load(
+        cls, repo: Path | str, rev_range: str = "--all", *, with_files: bool = True
+    ) -> GitHistory:
+        """Read the history of ``repo`` with a single, streamed ``git log`` invocation.
+
+        Commits are parsed into the table as they arrive from the pipe; the raw
+        log output is never held in memory as a whole.
+
+        Args:
+            repo: Repository path.
+            rev_range: Revisions to load; defaults to every ref.
+            with_files: Also load per-commit file changes (``--numstat``).
+
+        Raises:
+            RuntimeError: if git fails (for example outside a repository).
+        """
+        history = cls(rev_range)
+        history._read(repo, rev_range, with_files=with_files)
+        history._mark_head()
+        return history
+
+    def updated(self, repo: Path | str, head: str | None = None) -> GitHistory:
+        """Return this full history extended with the commits added since it was loaded.
+
+        Only ``--all --not <known tips>`` is read from git, so the cost is
+        proportional to the number of new commits. HEAD reachability is
+        recomputed for the combined table.
+
+        Args:
+            repo: Repository path.
+            head: Current HEAD commit, when known. Needed if HEAD moved to a
+                commit that was already loaded.
+
+        Raises:
+            RuntimeError: if git fails, for example because a known tip no
+                longer exists after a history rewrite.
+            ValueError: if this history was not loaded from ``--all``.
+        """
+        if self.rev_range != "--all":
+            raise ValueError("only histories of every ref can be updated")
+
+        newer = GitHistory(self.rev_range)
+        newer._read(repo, "--all", "--not", *self.tips())
+        merged = newer._concat(self)
+        merged.head = head or newer.head or self.head
+        merged._mark_head()
+        return merged
+
+    def tips(self) -> list[str]:
+        """Return commits that are not a parent of any other loaded commit."""
+        parent_hashes = {sha for parents in self.parents for sha in parents.split()}
+        return [sha for sha in self.hashes if sha not in parent_hashes]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation of the table."""
+        data: dict[str, Any] = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            data[name] = list(value) if isinstance(value, array | bytearray) else value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> GitHistory:
+        """Rebuild a history from the output of ``to_dict``."""
+        history = cls(data["rev_range"])
+        for name in cls.__slots__:
+            current = getattr(history, name)
+            value = data[name]
+            if isinstance(current, array):
+                value = array(current.typecode, value)
+            elif isinstance(current, bytearray):
+                value = bytearray(value)
+            setattr(history, name, value)
+        return history
+
+    # -- construction -------------------------------------------------------
+
+    def _read(self, repo: Path | str, *revisions: str, with_files: bool = True) -> None:
+        args = ["log", "-z", f"--format={_LOG_FORMAT}", "--date=format:%z", *revisions]
+        if with_files:
+            args.insert(1, "--numstat")
+        self._parse(stream_git(repo, *args, separator="\x1e"))
+
+    def _parse(self, records: Iterable[str]) -> None:
+        strings: dict[str, str] = {}
+        path_ids: dict[str, int] = {}
+
+        for record in records:
+            header, _, stats = record.partition("\0")
+            fields = header.split("\x1f")
+            if len(fields) != len(_LOG_FIELDS):
+                continue
+            sha, parent_s, decoration, author, email, committer, at, offset, ct, subject = fields
+            try:
+                author_time, commit_time = int(at), int(ct)
+            except ValueError:
+                continue
 
-    def _flush() -> None:
-        nonlocal current_author, commit_added, commit_deleted
-        if current_author is None:
+            if self.head is None and _is_head_decoration(decoration):
+                self.head = sha
+            self.hashes.append(sha)
+            self.authors.append(strings.setdefault(author, author))
+            self.emails.append(strings.setdefault(email, email))
+            self.committers.append(strings.setdefault(committer, committer))
+            self.author_times.append(author_time)
+            self.author_offsets.append(_parse_offset(offset))
+            self.commit_times.append(commit_time)
+            self.subjects.append(subject)
+            self.parents.append(parent_s)
+            self.parent_counts.append(min(len(parent_s.split()), 255))
+
+            tokens = stats.lstrip("\n").split("\0")
+            i = 0
+            while i < len(tokens):
+                parts = tokens[i].split("\t")
+                i += 1
+                if len(parts) != 3:
+                    continue
+                added_s, deleted_s, path = parts
+                if not path:
+                    # Renames and copies are followed by the old and new paths.
+                    if i + 1 >= len(tokens):
+                        break
+                    path = tokens[i + 1]
+                    i += 2
+                path_id = path_ids.get(path)
+                if path_id is None:
+                    path_id = path_ids[path] = len(self.paths)
+                    self.paths.append(path)
+                binary = added_s == "-" or deleted_s == "-"
+                try:
+                    added = _BINARY if binary else int(added_s)
+                    deleted = _BINARY if binary else int(deleted_s)
+                except ValueError:
+                    continue
+                self.file_paths.append(path_id)
+                self.file_added.append(added)
+                self.file_deleted.append(deleted)
+            self.file_offsets.append(len(self.file_paths))
+
+    def _concat(self, older: GitHistory) -> GitHistory:
+        """Return a new table with this history's commits followed by ``older``'s."""
+        merged = GitHistory(older.rev_range)
+        for name in ("hashes", "authors", "emails", "committers", "subjects", "parents"):
+            setattr(merged, name, getattr(self, name) + getattr(older, name))
+        for name in ("author_times", "author_offsets", "commit_times", "parent_counts"):
+            setattr(merged, name, getattr(self, name) + getattr(older, name))
+
+        merged.paths = list(older.paths)
+        path_ids = {path: i for i, path in enumerate(merged.paths)}
+        for path in self.paths:
+            if path not in path_ids:
+                path_ids[path] = len(merged.paths)
+                merged.paths.append(path)
+        remap = array("I", (path_ids[path] for path in self.paths))
+
+        shift = len(self.file_paths)
+        merged.file_offsets = self.file_offsets + array(
+            "I", (offset + shift for offset in older.file_offsets[1:])
+        )
+        merged.file_paths = array("I", (remap[i] for i in self.file_paths)) + older.file_paths
+        merged.file_added = self.file_added + older.file_added
+        merged.file_deleted = self.file_deleted + older.file_deleted
+        return merged
+
+    def _mark_head(self) -> None:
+        """Flag the commits reachable from HEAD by walking parent links."""
+        self.on_head = bytearray(len(self.hashes))
+        if self.rev_range == "HEAD":
+            self.on_head = bytearray(b"\x01" * len(self.hashes))
+            return
+        if self.head is None:
             return
-        totals[current_author][1] += commit_added
-        totals[current_author][2] += commit_deleted
-        commit_added = 0
-        commit_deleted = 0
+        index = {sha: i for i, sha in enumerate(self.hashes)}
+        pending = [self.head]
+        while pending:
+            i = index.get(pending.pop())
+            if i is None or self.on_head[i]:
+                continue
+            self.on_head[i] = 1
+            pending.extend(self.parents[i].split())
+
+    # -- selection ----------------------------------------------------------
+
+    def commit_indices(
+        self,
+        rev_range: str = "HEAD",
+        *,
+        include_merges: bool = True,
+        author: str | None = None,
+    ) -> list[int]:
+        """Return the indices of the selected commits, newest first.
+
+        Args:
+            rev_range: ``"HEAD"``, ``"--all"`` or the range the history was loaded with.
+            include_merges: Keep merge commits when True (``--no-merges`` otherwise).
+            author: Pattern matched against ``"Name <email>"`` like ``git log --author``.
+
+        Raises:
+            ValueError: if ``rev_range`` cannot be answered from this history.
+        """
+        if rev_range == "HEAD":
+            selected = [i for i, flag in enumerate(self.on_head) if flag]
+        elif rev_range in (self.rev_range, "--all") and self.rev_range in (rev_range, "--all"):
+            selected = list(range(len(self.hashes)))
+        else:
+            raise ValueError(f"history loaded for {self.rev_range!r} cannot answer {rev_range!r}")
+
+        if not include_merges:
+            selected = [i for i in selected if self.parent_counts[i] <= 1]
+        if author is not None:
+            try:
+                pattern = re.compile(author)
+            except re.error:
+                pattern = re.compile(re.escape(author))
+            selected = [
+                i for i in selected if pattern.search(f"{self.authors[i]} <{self.emails[i]}>")
+            ]
+        return selected
+
+    def earliest_commits(self, limit: int, rev_range: str = "HEAD") -> list[int]:
+        """Return the indices of the first ``limit`` commits, oldest first."""
+        selected = self.commit_indices(rev_range)
+        return selected[: -limit - 1 : -1] if limit > 0 else []
+
+    def numstat(self, indices: list[int]) -> Iterator[NumstatEntry]:
+        """Yield the text-file changes of the given commits (binary files skipped)."""
+        for i in indices:
+            for j in range(self.file_offsets[i], self.file_offsets[i + 1]):
+                added = self.file_added[j]
+                if added != _BINARY:
+                    yield NumstatEntry(self.paths[self.file_paths[j]], added, self.file_deleted[j])
+
+    def changed_files(self, indices: list[int]) -> list[str]:
+        """Return the paths touched by the given commits, including binary files."""
+        return [
+            self.paths[self.file_paths[j]]
+            for i in indices
+            for j in range(self.file_offsets[i], self.file_offsets[i + 1])
+        ]
+
+    def author_date(self, index: int) -> datetime.datetime:
+        """Return the author date of a commit in the author's own timezone."""
+        tz = datetime.timezone(datetime.timedelta(minutes=self.author_offsets[index]))
+        return datetime.datetime.fromtimestamp(self.author_times[index], tz=tz)
+
+    # -- metrics ------------------------------------------------------------
+
+    def author_contributions(self, rev_range: str = "HEAD") -> list[AuthorContribution]:
+        """Summarize total commits, insertions, and deletions per author."""
+        totals: dict[str, list[int]] = defaultdict(lambda: [0, 0, 0])
+        for i in self.commit_indices(rev_range):
+            entry = totals[self.authors[i]]
+            entry[0] += 1
+            for j in range(self.file_offsets[i], self.file_offsets[i + 1]):
+                if self.file_added[j] != _BINARY:
+                    entry[1] += self.file_added[j]
+                    entry[2] += self.file_deleted[j]
+
+        contributions = [
+            AuthorContribution(a, c, add, del_) for a, (c, add, del_) in totals.items()
+        ]
+        contributions.sort(key=lambda ac: ac.added + ac.deleted, reverse=True)
+        return contributions
+
+    def commit_type_counts(self, rev_range: str = "HEAD") -> dict[str, dict[str, int]]:
+        """Classify commits by Conventional Commit type (feat, fix, docs, etc.)."""
+        stats: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        for i in self.commit_indices(rev_range):
+            match = _CONVENTIONAL_TYPE_RE.match(self.subjects[i].strip().lower())
+            stats[self.authors[i]][match.group("type") if match else "other"] += 1
+        return stats
+
+    def weekly_activity(self, weeks: int = 12) -> dict[str, list[int]]:
+        """Return per-author commit counts on HEAD for the last ``weeks`` weeks."""
+        now = datetime.datetime.now(datetime.UTC)
+        start = now - datetime.timedelta(weeks=weeks)
+
+        weekly: dict[str, list[int]] = {}
+        for i in self.commit_indices("HEAD"):
+            counts = weekly.setdefault(self.authors[i], [0] * weeks)
+            t = datetime.datetime.fromtimestamp(self.commit_times[i], tz=datetime.UTC)
+            if t < start:
+                continue
+            idx = int((t - start).days / 7)
+            if 0 <= idx < weeks:
+                counts[idx] += 1
+        return weekly
+
+    def weekly_activity_window(
+        self, start: datetime.date, end: datetime.date
+    ) -> tuple[list[datetime.date], dict[str, list[int]]]:
+        """Return week bins from ``start`` to ``end`` and per-author HEAD commit counts."""
+        bins: list[datetime.date] = []
+        cur = start
+        while cur <= end:
+            bins.append(cur)
+            cur += datetime.timedelta(days=7)
+
+        counts: dict[str, list[int]] = {}
+        for i in self.commit_indices("HEAD"):
+            t = datetime.datetime.fromtimestamp(self.commit_times[i], tz=datetime.UTC)
+            monday = _week_monday(t.date())
+            if not (start <= monday <= end):
+                continue
+            counts.setdefault(self.authors[i], [0] * len(bins))[(monday - start).days // 7] += 1
+        return bins, counts
+
+    def commit_frequency(self, author: str | None = None) -> dict[str, int]:
+        """Return a ``{YYYY-MM-DD: commit_count}`` map of HEAD commits by author date."""
+        lower_author = author.strip().lower() if author else None
+        counts: dict[str, int] = {}
+        for i in self.commit_indices("HEAD"):
+            if lower_author is not None and self.authors[i].strip().lower() != lower_author:
+                continue
+            date_key = self.author_date(i).date().isoformat()
+            counts[date_key] = counts.get(date_key, 0) + 1
+        return counts
 
-    for line in output.splitlines():
-        if not line:
-            continue
-        parts = line.split("\t")
-        # Detect commit header: hash\tauthor\ttimestamp
-        if len(parts) == 3 and header_re.fullmatch(parts[0]) is not None and parts[2].isdigit():
-            # Finish previous commit aggregation
-            _flush()
-            current_author = parts[1]
-            totals[current_author][0] += 1  # increment commit count
-            continue
+    def commit_dates(self, rev_range: str = "HEAD") -> list[datetime.datetime]:
+        """Return tz-aware author dates for the selected commits, newest first."""
+        return [self.author_date(i) for i in self.commit_indices(rev_range)]
 
-        # Otherwise, expect numstat line: added\tdeleted\tpath
-        if len(parts) >= 3:
-            a_s, d_s = parts[0], parts[1]
-            if a_s != "-" and d_s != "-":
-                with suppress(ValueError):
-                    commit_added += int(a_s)
-                    commit_deleted += int(d_s)
 
-    # Flush last commit
-    _flush()
+def _resolve_history(
+    repo: Path | str,
+    history: GitHistory | None,
+    rev_range: str = "HEAD",
+    *,
+    with_files: bool = False,
+) -> GitHistory:
+    """Return ``history`` or load one that can answer ``rev_range``."""
+    if history is not None:
+        return history
+    return GitHistory.load(
+        repo, "--all" if rev_range in ("HEAD", "--all") else rev_range, with_files=with_files
+    )
 
-    contributions = [AuthorContribution(a, c, add, del_) for a, (c, add, del_) in totals.items()]
-    contributions.sort(key=lambda ac: ac.added + ac.deleted, reverse=True)
-    return contributions
+
+# ---------------------------------------------------------------------------
+# Contribution Summaries
+# ---------------------------------------------------------------------------
 
 
-def get_commit_type_counts(repo: Path | str, rev_range: str = "HEAD") -> dict[str, dict[str, int]]:
-    """Classify commits by Conventional Commit type (feat, fix, docs, etc.)."""
-    log_output = run_git(repo, "log", "--pretty=format:%an%x09%s", rev_range)
-    pattern = re.compile(r"^(?P<type>\w+)(\([\w-]+\))?:")
-    stats: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+def get_author_contributions(
+    repo: Path | str, rev_range: str = "HEAD", *, history: GitHistory | None = None
+) -> list[AuthorContribution]:
+    """Summarize total commits, insertions, and deletions per author."""
+    history = _resolve_history(repo, history, rev_range, with_files=True)
+    return history.author_contributions(rev_range)
 
-    for line in log_output.splitlines():
-        if "\t" not in line:
-            continue
-        author, subject = line.split("\t", 1)
-        match = pattern.match(subject.strip().lower())
-        commit_type = match.group("type") if match else "other"
-        stats[author][commit_type] += 1
 
-    return stats
+def get_commit_type_counts(
+    repo: Path | str, rev_range: str = "HEAD", *, history: GitHistory | None = None
+) -> dict[str, dict[str, int]]:
+    """Classify commits by Conventional Commit type (feat, fix, docs, etc.)."""
+    return _resolve_history(repo, history, rev_range).commit_type_counts(rev_range)
 
 
-def summarize_conventional_contributions(repo: Path | str, rev_range: str = "HEAD") -> list[str]:
+def summarize_conventional_contributions(
+    repo: Path | str, rev_range: str = "HEAD", *, history: GitHistory | None = None
+) -> list[str]:
     """Produce a per-author summary combining numeric and commit-type data."""
-    contributions = {a.author: a for a in get_author_contributions(repo, rev_range)}
-    type_counts = get_commit_type_counts(repo, rev_range)
+    history = _resolve_history(repo, history, rev_range, with_files=True)
+    contributions = {a.author: a for a in history.author_contributions(rev_range)}
+    type_counts = history.commit_type_counts(rev_range)
 
     lines: list[str] = []
     for author, contrib in contributions.items():
@@ -188,34 +622,11 @@ def summarize_conventional_contributions(repo: Path | str, rev_range: str = "HEA
 # ---------------------------------------------------------------------------
 
 
-def get_weekly_activity(repo: Path | str, weeks: int = 12) -> dict[str, list[int]]:
+def get_weekly_activity(
+    repo: Path | str, weeks: int = 12, *, history: GitHistory | None = None
+) -> dict[str, list[int]]:
     """Return per-author commit counts for the last `weeks` weeks."""
-    log_output = run_git(repo, "log", "--pretty=format:%an|%ct")
-    commits_by_author: dict[str, list[datetime.datetime]] = defaultdict(list)
-
-    for line in log_output.splitlines():
-        if "|" not in line:
-            continue
-        author, ts = line.split("|", 1)
-        try:
-            dt = datetime.datetime.fromtimestamp(int(ts), tz=datetime.UTC)
-        except ValueError:
-            continue
-        commits_by_author[author].append(dt)
-    now = datetime.datetime.now(datetime.UTC)
-    start = now - datetime.timedelta(weeks=weeks)
-
-    weekly: dict[str, list[int]] = {}
-    for author, times in commits_by_author.items():
-        counts = [0] * weeks
-        for t in times:
-            if t < start:
-                continue
-            idx = int((t - start).days / 7)
-            if 0 <= idx < weeks:
-                counts[idx] += 1
-        weekly[author] = counts
-    return weekly
+    return _resolve_history(repo, history).weekly_activity(weeks)
 
 
 def render_weekly_activity_chart(activity: dict[str, list[int]]) -> list[str]:
@@ -255,6 +666,7 @@ def get_weekly_activity_window(
     week: datetime.date | None = None,
     start_week: datetime.date | None = None,
     end_week: datetime.date | None = None,
+    history: GitHistory | None = None,
 ) -> tuple[list[datetime.date], dict[str, list[int]]]:
     """Return (week_bins, per_author_counts) for a single week or a date range."""
     if week is not None:
@@ -267,35 +679,7 @@ def get_weekly_activity_window(
     if end < start:
         start, end = end, start
 
-    bins: list[datetime.date] = []
-    cur = start
-    while cur <= end:
-        bins.append(cur)
-        cur += datetime.timedelta(days=7)
-
-    log_output = run_git(repo, "log", "--pretty=format:%an|%ct")
-    counts: dict[str, list[int]] = {}
-
-    for line in log_output.splitlines():
-        if "|" not in line:
-            continue
-        author, ts = line.split("|", 1)
-        try:
-            t = datetime.datetime.fromtimestamp(int(ts), tz=datetime.UTC)
-        except ValueError:
-            continue
-        monday = _week_monday(t.date())
-        if not (start <= monday <= end):
-            continue
-        idx = (monday - start).days // 7
-        counts.setdefault(author, [0] * len(bins))
-        counts[author][idx] += 1
-
-    for arr in counts.values():
-        if len(arr) < len(bins):
-            arr.extend([0] * (len(bins) - len(arr)))
-
-    return bins, counts
+    return _resolve_history(repo, history).weekly_activity_window(start, end)
 
 
 def render_weekly_activity_chart_for_range(
@@ -304,10 +688,11 @@ def render_weekly_activity_chart_for_range(
     week: datetime.date | None = None,
     start_week: datetime.date | None = None,
     end_week: datetime.date | None = None,
+    history: GitHistory | None = None,
 ) -> list[str]:
     """Wrapper around `get_weekly_activity_window` that renders its output."""
     _, activity = get_weekly_activity_window(
-        repo, week=week, start_week=start_week, end_week=end_week
+        repo, week=week, start_week=start_week, end_week=end_week, history=history
     )
     return render_weekly_activity_chart(activity)
 
@@ -318,78 +703,61 @@ Lightweight wrappers for common git queries
 
 
 def list_changed_files(
-    repo: Path | str, *, all: bool = True, include_merges: bool = False
+    repo: Path | str,
+    *,
+    all: bool = True,
+    include_merges: bool = False,
+    history: GitHistory | None = None,
 ) -> list[str]:
     """Return the list of changed file paths across commits.
 
     Parameters:
         repo: Repository path.
-        all: Include all refs (adds ``--all``) when True.
-        include_merges: Include merges when True; otherwise adds ``--no-merges``.
+        all: Include all refs when True; otherwise only commits reachable from HEAD.
+        include_merges: Include merges when True; otherwise merges are skipped.
+        history: Pre-loaded history to answer from instead of running git.
 
     Returns:
         A list of file paths, including duplicates when files are changed in
-        multiple commits. Blank lines are filtered out.
+        multiple commits.
     """
-    args: list[str] = ["log", "--name-only", "--pretty=format:"]
-    if not include_merges:
-        args.append("--no-merges")
-    if all:
-        args.append("--all")
-    output = run_git(repo, *args)
-    return [line.strip() for line in output.splitlines() if line.strip()]
+    rev_range = "--all" if all else "HEAD"
+    history = _resolve_history(repo, history, rev_range, with_files=True)
+    return history.changed_files(history.commit_indices(rev_range, include_merges=include_merges))
 
 
 def get_commit_frequency_by_author(
     repo: Path | str,
     author: str | None = None,
+    *,
+    history: GitHistory | None = None,
 ) -> dict[str, int]:
     """Return a ``{YYYY-MM-DD: commit_count}`` map for the given repo.
 
     When *author* is provided only commits whose author name matches
     (case-insensitive) are counted.  Pass ``None`` to count all commits.
     """
-    output = run_git(repo, "log", "--pretty=format:%ad|%an", "--date=short", "HEAD")
-    counts: dict[str, int] = {}
-    lower_author = author.strip().lower() if author else None
-    for line in output.splitlines():
-        if "|" not in line:
-            continue
-        date_key, commit_author = line.split("|", 1)
-        date_key = date_key.strip()
-        if lower_author is not None and commit_author.strip().lower() != lower_author:
-            continue
-        if len(date_key) == 10:  # YYYY-MM-DD
-            counts[date_key] = counts.get(date_key, 0) + 1
-    return counts
+    return _resolve_history(repo, history).commit_frequency(author)
 
 
-def list_commit_dates(repo: Path | str, *, rev_range: str = "HEAD") -> list[datetime.datetime]:
-    """Return commit datetimes for ``rev_range`` parsed as tz-aware values.
+def list_commit_dates(
+    repo: Path | str, *, rev_range: str = "HEAD", history: GitHistory | None = None
+) -> list[datetime.datetime]:
+    """Return commit datetimes for ``rev_range`` as tz-aware values.
 
-    Uses ``--date=iso-strict`` to emit ISO-8601 strings with offsets, which are
-    parsed via ``datetime.fromisoformat``.
+    Dates are author dates in the author's own UTC offset, as printed by
+    ``git log --date=iso-strict``.
     """
-    output = run_git(repo, "log", "--pretty=format:%ad", "--date=iso-strict", rev_range)
-    dates: list[datetime.datetime] = []
-    for line in output.splitlines():
-        s = line.strip()
-        if not s:
-            continue
-        try:
-            dt = datetime.datetime.fromisoformat(s)
-        except ValueError:
-            # Skip unparsable lines defensively
-            continue
-        dates.append(dt)
-    return dates
+    return _resolve_history(repo, history, rev_range).commit_dates(rev_range)
 
 
 __all__ = [
     "NumstatEntry",
     "AuthorContribution",
+    "GitHistory",
     "is_git_repo",
     "run_git",
+    "stream_git",
     "parse_numstat",
     "get_author_contributions",
     "get_commit_type_counts",
@@ -0,0 +1,137 @@
+"""Compiled first-match classification of file paths.
+
+Contribution metrics, role-type detection and test analysis all label paths
+with an ordered list of rules, where the first rule that matches wins. Paths
+repeat heavily (one entry per file per commit), so :class:`PathClassifier`
+compiles the rules once and caches results per distinct path:
+
+- Patterns that only test the extension (``\\.py$``, ``\\.docx?$``) and the
+  rules' extension and file name sets become hash table lookups.
+- All other patterns are joined into one regex per rule prefix, whose
+  alternation branches keep the rules' order. Only the rules ranked before
+  the best table hit need to be tried, so a path is scanned at most once.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+
+_DEFAULT_CACHE_SIZE = 65536
+# ``\.ext$`` and ``\.ext?$`` (optional last character)
+_EXTENSION_PATTERN = re.compile(r"\\\.(\w*?)(\w\?)?\$")
+
+
+@dataclass(frozen=True, slots=True)
+class PathRule:
+    """One classification rule; a path matching any of its criteria gets ``category``.
+
+    Attributes:
+        category: Label returned for matching paths.
+        patterns: Regexes searched anywhere in the path.
+        suffixes: Lowercase extensions, compared like ``Path(path).suffix.lower()``.
+        names: Exact file names, compared like ``Path(path).name``.
+    """
+
+    category: str
+    patterns: tuple[str, ...] = ()
+    suffixes: frozenset[str] = frozenset()
+    names: frozenset[str] = frozenset()
+
+
+def _extension_keys(pattern: str) -> tuple[str, ...] | None:
+    """Return the path endings a pure extension pattern matches, if it is one."""
+    match = _EXTENSION_PATTERN.fullmatch(pattern)
+    if match is None or not (match.group(1) or match.group(2)):
+        return None
+    stem, optional = match.group(1), match.group(2)
+    if optional is None:
+        return ("." + stem,)
+    return ("." + stem, "." + stem + optional[0])
+
+
+def _combine(branches: list[tuple[int, list[str]]], flags: int) -> re.Pattern[str] | None:
+    """Join rules' patterns into one regex whose named group is the matching rule."""
+    if not branches:
+        return None
+    alternation = "|".join(
+        f"(?=.*?(?:{'|'.join(patterns)}))(?P<r{index}>)" for index, patterns in branches
+    )
+    return re.compile(f"(?:{alternation})", flags | re.DOTALL)
+
+
+class PathClassifier:
+    """Returns the category of the first rule matching a path, or None."""
+
+    def __init__(
+        self,
+        rules: Iterable[PathRule],
+        *,
+        ignore_case: bool = False,
+        cache_size: int = _DEFAULT_CACHE_SIZE,
+    ) -> None:
+        self._rules = tuple(rules)
+        self._ignore_case = ignore_case
+        flags = re.IGNORECASE if ignore_case else 0
+
+        self._endings: dict[str, int] = {}
+        self._suffixes: dict[str, int] = {}
+        self._names: dict[str, int] = {}
+        residual: list[tuple[int, list[str]]] = []
+        for index, rule in enumerate(self._rules):
+            patterns = []
+            for pattern in rule.patterns:
+                keys = _extension_keys(pattern)
+                if keys is None:
+                    patterns.append(pattern)
+                    continue
+                for key in keys:
+                    self._endings.setdefault(key.lower() if ignore_case else key, index)
+            for suffix in rule.suffixes:
+                self._suffixes.setdefault(suffix, index)
+            for name in rule.names:
+                self._names.setdefault(name, index)
+            if patterns:
+                residual.append((index, patterns))
+
+        # _prefix_regexes[k] tries only the rules ranked before rule k
+        self._prefix_regexes = [
+            _combine([branch for branch in residual if branch[0] < limit], flags)
+            for limit in range(len(self._rules) + 1)
+        ]
+        # Non-ASCII endings may case-fold differently from the table keys, and
+        # ``$`` also matches before a trailing newline
+        self._full_regex = _combine(
+            [
+                (index, list(rule.patterns))
+                for index, rule in enumerate(self._rules)
+                if rule.patterns
+            ],
+            flags,
+        )
+        self.classify = lru_cache(maxsize=cache_size)(self._classify)
+
+    def _classify(self, path: str) -> str | None:
+        """Return the category of the first rule matching ``path``, or None."""
+        best = len(self._rules)
+        regex = None
+        dot = path.rfind(".")
+        if dot >= 0 and path.find("/", dot) < 0:
+            ending = path[dot:]
+            if ending.isascii() and not ending.endswith("\n"):
+                best = self._endings.get(ending.lower() if self._ignore_case else ending, best)
+            else:
+                regex = self._full_regex
+            if dot > 0 and path[dot - 1] != "/":
+                best = min(best, self._suffixes.get(ending.lower(), best))
+        best = min(best, self._names.get(path[path.rfind("/") + 1 :], best))
+
+        if regex is None:
+            regex = self._prefix_regexes[best]
+        if regex is not None:
+            match = regex.match(path)
+            if match is not None:
+                best = min(best, int(match.lastgroup[1:]))
+        return self._rules[best].category if best < len(self._rules) else None
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 import json
+import logging
+import multiprocessing
 import os
-from collections.abc import Sequence
+import pickle
+import threading
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +18,7 @@ from capstone_project_team_5.contribution_metrics import ContributionMetrics
 from capstone_project_team_5.detection import identify_language_and_framework
 from capstone_project_team_5.file_walker import DirectoryWalker
 from capstone_project_team_5.models.upload import DetectedProject
+from capstone_project_team_5.project_scan import ProjectScan
 from capstone_project_team_5.role_detector import detect_user_role
 from capstone_project_team_5.role_type_detection import detect_enhanced_user_role
 from capstone_project_team_5.services.bullet_generator import (
@@ -21,18 +28,20 @@ from capstone_project_team_5.services.bullet_generator import (
 from capstone_project_team_5.services.code_analysis_persistence import (
     save_code_analysis_to_db,
 )
+from capstone_project_team_5.services.content_store import get_file_result_cache
+from capstone_project_team_5.services.git_cache import load_git_history
 from capstone_project_team_5.services.project_analysis import ProjectAnalysis, analyze_project
 from capstone_project_team_5.skill_detection import extract_project_tools_practices
 from capstone_project_team_5.utils.git import (
     AuthorContribution,
-    get_author_contributions,
-    get_commit_frequency_by_author,
+    GitHistory,
     get_current_git_identity,
-    get_weekly_activity,
     is_git_repo,
     render_weekly_activity_chart,
 )
 
+logger = logging.getLogger(__name__)
+
 _EXTENSION_LANGUAGE_MAP: dict[str, str] = {
     ".py": "Python",
     ".js": "JavaScript",
@@ -122,238 +131,481 @@ def _ai_bullet_permission(consent_tool: ConsentTool) -> tuple[bool, str | None]:
     return True, None
 
 
+def resolve_analysis_workers(max_workers: int | None = None) -> int:
+    """Return how many projects to analyze concurrently.
+
+    Args:
+        max_workers: Explicit worker count. When None, ``ZIP2JOB_ANALYSIS_PARALLELISM``
+            is used, falling back to the number of CPUs.
+    """
+    if max_workers is None:
+        try:
+            max_workers = int(os.getenv("ZIP2JOB_ANALYSIS_PARALLELISM", ""))
+        except ValueError:
+            max_workers = os.cpu_count() or 1
+    return max(max_workers, 1)
+
+
+def _analyze_project_isolated(
+    project_path: Path, consent_tool: ConsentTool | None, scan: ProjectScan
+) -> ProjectAnalysis | None:
+    """Run ``analyze_project``, returning None instead of raising on failure."""
+    try:
+        return analyze_project(project_path, consent_tool, scan)
+    except Exception:
+        logger.exception("Analysis of %s failed", project_path)
+        return None
+
+
+def _can_ship_to_process(scan: ProjectScan) -> bool:
+    """True if ``scan`` can be pickled for a worker process."""
+    if scan.reader is None:
+        return True
+    try:
+        pickle.dumps(scan.reader)
+    except Exception:
+        # e.g. archive-backed scans that read through an open ZipFile
+        return False
+    return True
+
+
+_worker_state = threading.local()
+
+
+class AnalysisWorkers:
+    """Worker pools for analyzing several projects at once.
+
+    CPU-bound analyzers (``analyze_project``: AST parsing, skill and test
+    detection) run in a process pool so they scale with cores. The rest of a
+    project's analysis (git subprocesses, bullet generation, database writes)
+    runs on a thread pool, where it mostly waits on I/O. Pools are created on
+    first use, so a single-project run never starts any processes.
+
+    Use as a context manager so the pools are shut down afterwards.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self.max_workers = resolve_analysis_workers(max_workers)
+        self._lock = threading.Lock()
+        self._processes: ProcessPoolExecutor | None = None
+        self._threads: ThreadPoolExecutor | None = None
+
+    def __enter__(self) -> AnalysisWorkers:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Wait for outstanding work and release the pools."""
+        with self._lock:
+            threads, self._threads = self._threads, None
+            processes, self._processes = self._processes, None
+        if threads is not None:
+            threads.shutdown()
+        if processes is not None:
+            processes.shutdown()
+
+    def analyze(
+        self, project_path: Path, consent_tool: ConsentTool | None, scan: ProjectScan
+    ) -> ProjectAnalysis | None:
+        """Run ``analyze_project`` in a worker process when possible.
+
+        Falls back to the calling thread when running serially, when the scan
+        cannot be pickled, or when the process pool fails.
+
+        Returns:
+            The analysis, or None if the analyzers raised.
+        """
+        if self.max_workers > 1 and _can_ship_to_process(scan):
+            try:
+                return (
+                    self._process_pool()
+                    .submit(_analyze_project_isolated, project_path, consent_tool, scan)
+                    .result()
+                )
+            except Exception:
+                logger.warning(
+                    "Worker process failed for %s; analyzing in-process",
+                    project_path,
+                    exc_info=True,
+                )
+        return _analyze_project_isolated(project_path, consent_tool, scan)
+
+    def map[T, R](self, fn: Callable[[T], R], items: Sequence[T]) -> list[R | None]:
+        """Apply ``fn`` to every item on the thread pool.
+
+        Results are returned in the order of ``items``. An item whose call
+        raises yields None and does not affect the others. Calls made from
+        inside a worker run inline so nested maps cannot exhaust the pool.
+        """
+        if self.max_workers <= 1 or len(items) <= 1 or getattr(_worker_state, "active", False):
+            return [_call_isolated(fn, item) for item in items]
+        pool = self._thread_pool()
+        futures = [pool.submit(_call_in_worker, fn, item) for item in items]
+        return [future.result() for future in futures]
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._processes is None:
+                # Spawn rather than fork: callers (the API, the TUI) run threads.
+                self._processes = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._processes
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="project-analysis"
+                )
+            return self._threads
+
+
+_shared_workers: AnalysisWorkers | None = None
+_shared_workers_lock = threading.Lock()
+
+
+def get_shared_analysis_workers() -> AnalysisWorkers:
+    """Return the process-wide worker pools, creating them on first use.
+
+    Long-lived callers such as the API share these pools instead of starting
+    new processes for every request. Their pools start lazily as usual and are
+    released by ``shutdown_shared_analysis_workers``.
+    """
+    global _shared_workers
+    with _shared_workers_lock:
+        if _shared_workers is None:
+            _shared_workers = AnalysisWorkers()
+        return _shared_workers
+
+
+def shutdown_shared_analysis_workers() -> None:
+    """Shut down the pools behind ``get_shared_analysis_workers``, if started."""
+    global _shared_workers
+    with _shared_workers_lock:
+        workers, _shared_workers = _shared_workers, None
+    if workers is not None:
+        workers.shutdown()
+
+
+def _call_isolated[T, R](fn: Callable[[T], R], item: T) -> R | None:
+    try:
+        return fn(item)
+    except Exception:
+        logger.exception("Project analysis failed")
+        return None
+
+
+def _call_in_worker[T, R](fn: Callable[[T], R], item: T) -> R | None:
+    _worker_state.active = True
+    try:
+        return _call_isolated(fn, item)
+    finally:
+        _worker_state.active = False
+
+
 def analyze_projects_structured(
     extract_root: Path,
     projects: Sequence[DetectedProject],
     consent_tool: ConsentTool,
     current_user: str | None = None,
+    scans: Mapping[str, ProjectScan] | None = None,
+    max_workers: int | None = None,
+    workers: AnalysisWorkers | None = None,
 ) -> list[dict[str, Any]]:
-    """Compute structured per-project analysis for all detected projects."""
-
-    ai_allowed, ai_warning_global = _ai_bullet_permission(consent_tool)
-    analyses: list[dict[str, Any]] = []
-    ai_available = bool(os.getenv("GEMINI_API_KEY"))
-
+    """Compute structured per-project analysis for all detected projects.
+
+    ``scans`` maps project ``rel_path`` to a pre-built scan. Projects with a
+    scan are analyzed through it instead of from ``extract_root``, which lets
+    callers analyze virtual (archive- or store-backed) projects that were never
+    written to disk.
+
+    Projects are analyzed concurrently (see ``AnalysisWorkers``). Results keep
+    the order of ``projects``; a project whose analysis fails is left out
+    without affecting the others.
+
+    Args:
+        extract_root: Directory the projects were extracted to.
+        projects: Projects to analyze.
+        consent_tool: Active consent tool with external service preferences.
+        current_user: Username to attach saved analyses to.
+        scans: Optional pre-built scans keyed by project ``rel_path``.
+        max_workers: Worker count; defaults to ``ZIP2JOB_ANALYSIS_PARALLELISM``
+            or the number of CPUs. ``1`` analyzes projects one at a time.
+        workers: Shared worker pools to run on instead of creating new ones.
+    """
+
+    targets: list[tuple[DetectedProject, Path, ProjectScan | None]] = []
     for project in projects:
+        scan = scans.get(project.rel_path) if scans else None
+        if scan is not None:
+            targets.append((project, scan.root, scan))
+            continue
         project_path = _resolve_project_path(extract_root, project.rel_path)
         if project_path is None or not project_path.is_dir():
             continue
+        targets.append((project, project_path, None))
 
-        project_analysis: ProjectAnalysis | None = None
-        try:
-            project_analysis = analyze_project(project_path, consent_tool)
-        except Exception:
-            project_analysis = None
+    ai_allowed, ai_warning_global = _ai_bullet_permission(consent_tool)
+    ai_available = bool(os.getenv("GEMINI_API_KEY"))
 
-        try:
-            walk_result = DirectoryWalker.walk(project_path)
-        except ValueError:
-            continue
+    with ExitStack() as stack:
+        if workers is None:
+            workers = stack.enter_context(AnalysisWorkers(max_workers if len(targets) > 1 else 1))
+        results = workers.map(
+            lambda target: _analyze_structured_project(
+                *target,
+                consent_tool=consent_tool,
+                current_user=current_user,
+                ai_allowed=ai_allowed,
+                ai_warning_global=ai_warning_global,
+                ai_available=ai_available,
+                workers=workers,
+            ),
+            targets,
+        )
 
-        if project_analysis is None:
-            # Skip project if analysis failed - don't retry
-            continue
-        analysis = project_analysis
-        language = analysis.language
-        framework = analysis.framework
-        tools = set(analysis.tools)
-        practices = set(analysis.practices)
+    return [analysis for analysis in results if analysis is not None]
 
-        all_langs = _detect_languages_from_walk(walk_result)
-        other_languages = sorted(lang for lang in all_langs if lang != language)
 
-        summary = DirectoryWalker.get_summary(walk_result)
-        total_size = _format_bytes(summary["total_size_bytes"])
+def _load_git_history(project_path: Path) -> GitHistory | None:
+    """Load the full Git history of a project, or None when git cannot read it.
 
-        collab_summary = CollabDetector.collaborator_summary(project_path)
-        collaborators_display = CollabDetector.format_collaborators(collab_summary)
+    The history comes from the persistent Git cache, so an unchanged repository
+    is not re-read and a repository with new commits only reads those commits.
+    """
+    try:
+        return load_git_history(project_path)
+    except RuntimeError:
+        logger.warning("Could not read Git history of %s", project_path, exc_info=True)
+        return None
 
-        duration_timedelta, duration_display = ContributionMetrics.get_project_duration(
-            project_path
-        )
-        contribution_metrics, metrics_source = ContributionMetrics.get_project_contribution_metrics(
-            project_path
-        )
 
-        score, breakdown = ContributionMetrics.calculate_importance_score(
-            contribution_metrics, duration_timedelta, project.file_count
-        )
+def _analyze_structured_project(
+    project: DetectedProject,
+    project_path: Path,
+    scan: ProjectScan | None,
+    *,
+    consent_tool: ConsentTool,
+    current_user: str | None,
+    ai_allowed: bool,
+    ai_warning_global: str | None,
+    ai_available: bool,
+    workers: AnalysisWorkers,
+) -> dict[str, Any] | None:
+    """Build the structured analysis of one project, or None if analysis failed."""
 
-        resume_bullets: list[str] = []
-        resume_source = "Local"
-        ai_warning: str | None = ai_warning_global if not ai_allowed else None
+    if scan is None:
+        # One filesystem walk per project, shared by every detector below
+        scan = ProjectScan.build(project_path, file_cache=get_file_result_cache())
 
-        try:
-            resume_bullets, resume_source = generate_resume_bullets(
-                project_path,
-                max_bullets=6,
-                use_ai=ai_allowed,
-                ai_available=ai_available,
-                analysis=analysis,
-            )
-        except Exception as exc:
-            ai_warning = f"Resume bullets error: {exc}"
+    project_analysis = workers.analyze(project_path, consent_tool, scan)
 
-        git_is_repo = is_git_repo(project_path)
-        git_current_author: str | None = None
-        git_author_contribs: list[dict[str, int | str]] = []
-        git_current_contrib: dict[str, int] | None = None
-        git_activity_chart: list[str] = []
-        git_commit_frequency: dict[str, int] = {}
+    walk_result = DirectoryWalker.from_scan(scan)
 
-        if git_is_repo:
-            current_name, _current_email = get_current_git_identity(project_path)
-            git_current_author = current_name
+    if project_analysis is None:
+        # Skip project if analysis failed - don't retry
+        return None
+    analysis = project_analysis
+    language = analysis.language
+    framework = analysis.framework
+    tools = set(analysis.tools)
+    practices = set(analysis.practices)
 
-            try:
-                contributions: list[AuthorContribution] = get_author_contributions(project_path)
-            except RuntimeError:
-                contributions = []
+    all_langs = _detect_languages_from_walk(walk_result)
+    other_languages = sorted(lang for lang in all_langs if lang != language)
 
-            # Detect user role based on Git contributions
-            user_role_info = detect_user_role(
-                project_path, current_name, contributions, collab_summary[0]
-            )
-            if user_role_info:
-                analysis.user_role = user_role_info.role
-                analysis.user_contribution_percentage = user_role_info.contribution_percentage
-                analysis.role_justification = user_role_info.justification
-
-            user_role_types = detect_enhanced_user_role(
-                project_path=project_path,
-                current_user=current_name,
-                author_contributions=contributions,
-            )
+    summary = DirectoryWalker.get_summary(walk_result)
+    total_size = _format_bytes(summary["total_size_bytes"])
 
-            if user_role_types:
-                analysis.user_role_types = {
-                    "primary_role": user_role_types.primary_role,
-                    "secondary_roles": (
-                        ", ".join(user_role_types.secondary_roles)
-                        if user_role_types.secondary_roles
-                        else ""
-                    ),
-                }
+    git_is_repo = not scan.is_virtual and is_git_repo(project_path)
+    # One `git log` pass per repository, shared by every git-derived metric below
+    git_history = _load_git_history(project_path) if git_is_repo else None
 
-            for ac in contributions:
-                git_author_contribs.append(
-                    {
-                        "author": ac.author,
-                        "commits": ac.commits,
-                        "added": ac.added,
-                        "deleted": ac.deleted,
-                    }
-                )
-                if (
-                    current_name is not None
-                    and ac.author.strip().lower() == current_name.strip().lower()
-                ):
-                    git_current_contrib = {
-                        "commits": ac.commits,
-                        "added": ac.added,
-                        "deleted": ac.deleted,
-                    }
+    collab_summary = CollabDetector.collaborator_summary(project_path, scan, git_history)
+    collaborators_display = CollabDetector.format_collaborators(collab_summary)
 
-            try:
-                activity = get_weekly_activity(project_path, weeks=12)
-                git_activity_chart = render_weekly_activity_chart(activity)
-            except RuntimeError:
-                git_activity_chart = []
+    duration_timedelta, duration_display = ContributionMetrics.get_project_duration(
+        project_path, scan, git_history
+    )
+    contribution_metrics, metrics_source = ContributionMetrics.get_project_contribution_metrics(
+        project_path, scan, git_history
+    )
 
-            try:
-                git_commit_frequency = get_commit_frequency_by_author(
-                    project_path, author=git_current_author
-                )
-            except RuntimeError:
-                git_commit_frequency = {}
-
-        git_data: dict = {
-            "is_repo": git_is_repo,
-            "current_author": git_current_author,
-            "author_contributions": git_author_contribs,
-            "current_author_contribution": git_current_contrib,
-            "activity_chart": git_activity_chart,
-            "commit_frequency": git_commit_frequency,
-        }
-
-        save_code_analysis_to_db(
-            project.name,
-            project.rel_path,
-            analysis,
-            username=current_user,
-            extra_metrics={"git": git_data},
+    score, breakdown = ContributionMetrics.calculate_importance_score(
+        contribution_metrics, duration_timedelta, project.file_count
+    )
+
+    resume_bullets: list[str] = []
+    resume_source = "Local"
+    ai_warning: str | None = ai_warning_global if not ai_allowed else None
+
+    try:
+        resume_bullets, resume_source = generate_resume_bullets(
+            project_path,
+            max_bullets=6,
+            use_ai=ai_allowed,
+            ai_available=ai_available,
+            analysis=analysis,
+        )
+    except Exception as exc:
+        ai_warning = f"Resume bullets error: {exc}"
+
+    git_current_author: str | None = None
+    git_author_contribs: list[dict[str, int | str]] = []
+    git_current_contrib: dict[str, int] | None = None
+    git_activity_chart: list[str] = []
+    git_commit_frequency: dict[str, int] = {}
+
+    if git_history is not None:
+        current_name, _current_email = get_current_git_identity(project_path)
+        git_current_author = current_name
+
+        contributions: list[AuthorContribution] = git_history.author_contributions()
+
+        # Detect user role based on Git contributions
+        user_role_info = detect_user_role(
+            project_path, current_name, contributions, collab_summary[0], git_history
         )
-        skill_timeline = _get_skill_timeline_for_project(project.name, project.rel_path)
-
-        analyses.append(
-            {
-                "name": project.name,
-                "rel_path": project.rel_path,
-                "language": language,
-                "framework": framework,
-                "other_languages": other_languages,
-                "practices": sorted(practices),
-                "tools": sorted(tools),
-                "duration": duration_display,
-                "duration_timedelta": duration_timedelta,
-                "collaborators_display": collaborators_display,
-                "collaborators_raw": {
-                    "count": collab_summary[0],
-                    "identities": sorted(collab_summary[1]),
-                },
-                "file_summary": {
-                    "total_files": summary["total_files"],
-                    "total_size": total_size,
-                    "total_size_bytes": summary["total_size_bytes"],
-                },
-                "contribution": {
-                    "metrics": contribution_metrics,
-                    "source": metrics_source,
-                },
-                "contribution_summary": ContributionMetrics.format_contribution_metrics(
-                    contribution_metrics, metrics_source
+        if user_role_info:
+            analysis.user_role = user_role_info.role
+            analysis.user_contribution_percentage = user_role_info.contribution_percentage
+            analysis.role_justification = user_role_info.justification
+
+        user_role_types = detect_enhanced_user_role(
+            project_path=project_path,
+            current_user=current_name,
+            author_contributions=contributions,
+            history=git_history,
+        )
+
+        if user_role_types:
+            analysis.user_role_types = {
+                "primary_role": user_role_types.primary_role,
+                "secondary_roles": (
+                    ", ".join(user_role_types.secondary_roles)
+                    if user_role_types.secondary_roles
+                    else ""
                 ),
-                "score": score,
-                "score_breakdown": breakdown,
-                "ai_bullets": [],
-                "ai_warning": ai_warning,
-                "resume_bullets": resume_bullets,
-                "resume_bullet_source": resume_source,
-                "skill_timeline": skill_timeline,
-                "git": git_data,
-                "user_role": analysis.user_role,
-                "user_contribution_percentage": analysis.user_contribution_percentage,
-                "role_justification": analysis.role_justification,
             }
-        )
 
-    return analyses
+        for ac in contributions:
+            git_author_contribs.append(
+                {
+                    "author": ac.author,
+                    "commits": ac.commits,
+                    "added": ac.added,
+                    "deleted": ac.deleted,
+                }
+            )
+            if (
+                current_name is not None
+                and ac.author.strip().lower() == current_name.strip().lower()
+            ):
+                git_current_contrib = {
+                    "commits": ac.commits,
+                    "added": ac.added,
+                    "deleted": ac.deleted,
+                }
+
+        git_activity_chart = render_weekly_activity_chart(git_history.weekly_activity(weeks=12))
+        git_commit_frequency = git_history.commit_frequency(author=git_current_author)
+
+    git_data: dict = {
+        "is_repo": git_is_repo,
+        "current_author": git_current_author,
+        "author_contributions": git_author_contribs,
+        "current_author_contribution": git_current_contrib,
+        "activity_chart": git_activity_chart,
+        "commit_frequency": git_commit_frequency,
+    }
+
+    save_code_analysis_to_db(
+        project.name,
+        project.rel_path,
+        analysis,
+        username=current_user,
+        extra_metrics={"git": git_data},
+    )
+    skill_timeline = _get_skill_timeline_for_project(project.name, project.rel_path)
+
+    return {
+        "name": project.name,
+        "rel_path": project.rel_path,
+        "language": language,
+        "framework": framework,
+        "other_languages": other_languages,
+        "practices": sorted(practices),
+        "tools": sorted(tools),
+        "duration": duration_display,
+        "duration_timedelta": duration_timedelta,
+        "collaborators_display": collaborators_display,
+        "collaborators_raw": {
+            "count": collab_summary[0],
+            "identities": sorted(collab_summary[1]),
+        },
+        "file_summary": {
+            "total_files": summary["total_files"],
+            "total_size": total_size,
+            "total_size_bytes": summary["total_size_bytes"],
+        },
+        "contribution": {
+            "metrics": contribution_metrics,
+            "source": metrics_source,
+        },
+        "contribution_summary": ContributionMetrics.format_contribution_metrics(
+            contribution_metrics, metrics_source
+        ),
+        "score": score,
+        "score_breakdown": breakdown,
+        "ai_bullets": [],
+        "ai_warning": ai_warning,
+        "resume_bullets": resume_bullets,
+        "resume_bullet_source": resume_source,
+        "skill_timeline": skill_timeline,
+        "git": git_data,
+        "user_role": analysis.user_role,
+        "user_contribution_percentage": analysis.user_contribution_percentage,
+        "role_justification": analysis.role_justification,
+    }
 
 
 def analyze_root_structured(extract_root: Path, consent_tool: ConsentTool) -> dict[str, Any]:
     """Compute a structured analysis summary for the extraction root."""
 
+    scan = ProjectScan.build(extract_root, file_cache=get_file_result_cache())
+
     project_analysis: ProjectAnalysis | None = None
     try:
-        project_analysis = analyze_project(extract_root, consent_tool)
+        project_analysis = analyze_project(extract_root, consent_tool, scan)
     except Exception:
         project_analysis = None
 
-    walk_result = DirectoryWalker.walk(extract_root)
-    language, framework = identify_language_and_framework(extract_root)
-    skills = extract_project_tools_practices(extract_root, consent_tool)
-    tools = set(skills.get("tools", set()))
-    practices = set(skills.get("practices", set()))
+    walk_result = DirectoryWalker.from_scan(scan)
+    if project_analysis is not None:
+        language, framework = project_analysis.language, project_analysis.framework
+        tools = set(project_analysis.tools)
+        practices = set(project_analysis.practices)
+    else:
+        language, framework = identify_language_and_framework(extract_root, scan)
+        skills = extract_project_tools_practices(extract_root, consent_tool, scan)
+        tools = set(skills.get("tools", set()))
+        practices = set(skills.get("practices", set()))
 
     ai_allowed, ai_warning = _ai_bullet_permission(consent_tool)
     ai_available = bool(os.getenv("GEMINI_API_KEY"))
 
-    collab_summary = CollabDetector.collaborator_summary(extract_root)
+    collab_summary = CollabDetector.collaborator_summary(extract_root, scan)
     collaborators_display = CollabDetector.format_collaborators(collab_summary)
 
-    duration_timedelta, duration_display = ContributionMetrics.get_project_duration(extract_root)
+    duration_timedelta, duration_display = ContributionMetrics.get_project_duration(
+        extract_root, scan
+    )
     contribution_metrics, metrics_source = ContributionMetrics.get_project_contribution_metrics(
-        extract_root
+        extract_root, scan
     )
     contribution_summary = ContributionMetrics.format_contribution_metrics(
         contribution_metrics, metrics_source
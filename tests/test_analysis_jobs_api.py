@@ -0,0 +1,179 @@
+"""Tests for background analysis jobs and their polling/cancel endpoints."""
+
+from __future__ import annotations
+
+import io
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import pytest
+from conftest import auth_headers
+from fastapi.testclient import TestClient
+
+from capstone_project_team_5.api.main import app
+from capstone_project_team_5.api.routes import projects as projects_routes
+from capstone_project_team_5.data.db import get_session
+from capstone_project_team_5.data.models import AnalysisJob, AnalysisJobProject, CodeAnalysis, User
+from capstone_project_team_5.services import analysis_jobs
+from capstone_project_team_5.services.content_store import load_analysis_cache
+
+
+def _client(username: str = "jobuser") -> TestClient:
+    with get_session() as session:
+        if session.query(User).filter(User.username == username).first() is None:
+            session.add(User(username=username, password_hash="hash"))
+    return TestClient(app, headers=auth_headers(username))
+
+
+def _upload(client: TestClient, names: list[str]) -> list[int]:
+    buffer = io.BytesIO()
+    with ZipFile(buffer, "w", ZIP_DEFLATED) as archive:
+        for name in names:
+            archive.writestr(f"{name}/main.py", b"def main():\n    return 1\n")
+    response = client.post(
+        "/api/projects/upload",
+        files={"file": ("jobs.zip", buffer.getvalue(), "application/zip")},
+    )
+    assert response.status_code == 201
+    return [project["id"] for project in response.json()["projects"]]
+
+
+def _wait_for_job(client: TestClient, job_id: int, timeout: float = 30.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(f"/api/jobs/{job_id}").json()
+        if job["status"] not in ("queued", "running"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_background_analyze_all_reports_progress_and_persists_results(api_db: None) -> None:
+    client = _client()
+    project_ids = _upload(client, ["alpha", "beta"])
+
+    response = client.post("/api/projects/analyze", params={"background": True})
+
+    assert response.status_code == 202
+    queued = response.json()
+    assert queued["total"] == 2
+    assert [item["project_id"] for item in queued["projects"]] == project_ids
+
+    job = _wait_for_job(client, queued["id"])
+    assert job["status"] == "completed"
+    assert job["completed"] == 2
+    assert {item["status"] for item in job["projects"]} == {"analyzed"}
+
+    with get_session() as session:
+        analyzed = {row.project_id for row in session.query(CodeAnalysis).all()}
+    assert set(project_ids) <= analyzed
+    assert all(load_analysis_cache(project_id) for project_id in project_ids)
+
+    # A second run hits the analysis cache for every project.
+    rerun = client.post("/api/projects/analyze", params={"background": True}).json()
+    rerun = _wait_for_job(client, rerun["id"])
+    assert {item["reason"] for item in rerun["projects"]} == {
+        "Merged content fingerprint unchanged."
+    }
+
+
+def test_background_single_project_analysis(api_db: None) -> None:
+    client = _client()
+    [project_id] = _upload(client, ["solo"])
+
+    response = client.post(f"/api/projects/{project_id}/analyze", params={"background": True})
+
+    assert response.status_code == 202
+    job = _wait_for_job(client, response.json()["id"])
+    assert job["status"] == "completed"
+    assert job["projects"][0]["project_id"] == project_id
+    assert job["projects"][0]["status"] == "analyzed"
+
+
+def test_cancel_running_job_skips_remaining_projects(
+    api_db: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = _client()
+    project_ids = _upload(client, ["one", "two", "three"])
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking_handler(project_id, username, use_ai, force):
+        started.set()
+        assert release.wait(timeout=10)
+        return "analyzed", None
+
+    monkeypatch.setattr(projects_routes, "_analyze_project_job", blocking_handler)
+
+    job_id = client.post("/api/projects/analyze", params={"background": True}).json()["id"]
+    assert started.wait(timeout=10)
+
+    cancelled = client.post(f"/api/jobs/{job_id}/cancel")
+    assert cancelled.status_code == 200
+    assert cancelled.json()["cancel_requested"] is True
+    release.set()
+
+    job = _wait_for_job(client, job_id)
+    assert job["status"] == "cancelled"
+    statuses = {item["project_id"]: item["status"] for item in job["projects"]}
+    assert statuses == {
+        project_ids[0]: "analyzed",
+        project_ids[1]: "cancelled",
+        project_ids[2]: "cancelled",
+    }
+
+
+def test_jobs_are_scoped_to_their_owner(api_db: None) -> None:
+    owner = _client("job-owner")
+    other = _client("job-other")
+    [project_id] = _upload(owner, ["owned"])
+
+    job_id = owner.post(f"/api/projects/{project_id}/analyze", params={"background": True}).json()[
+        "id"
+    ]
+
+    assert other.get(f"/api/jobs/{job_id}").status_code == 404
+    assert other.post(f"/api/jobs/{job_id}/cancel").status_code == 404
+    assert (
+        other.post(f"/api/projects/{project_id}/analyze", params={"background": True}).status_code
+        == 404
+    )
+    _wait_for_job(owner, job_id)
+
+
+def test_resume_requeues_only_jobs_with_expired_leases(api_db: None) -> None:
+    client = _client()
+    now = datetime.now(UTC)
+    with get_session() as session:
+        user = session.query(User).filter(User.username == "jobuser").one()
+        jobs = {}
+        for name, lease in (
+            ("abandoned", now - timedelta(minutes=1)),
+            ("live", now + timedelta(hours=1)),
+        ):
+            job = AnalysisJob(
+                user_id=user.id,
+                status="running",
+                worker_id=f"{name}-worker",
+                lease_expires_at=lease,
+            )
+            job.projects = [AnalysisJobProject(project_id=1, position=0, status="running")]
+            session.add(job)
+            session.flush()
+            jobs[name] = job.id
+
+    analyzed: list[int] = []
+
+    def handler(project_id, username, use_ai, force):
+        analyzed.append(project_id)
+        return "analyzed", None
+
+    assert analysis_jobs.resume_analysis_jobs(handler) == 1
+    abandoned = _wait_for_job(client, jobs["abandoned"])
+    assert abandoned["status"] == "completed"
+    assert [item["status"] for item in abandoned["projects"]] == ["analyzed"]
+    assert analyzed == [1]
+    live = client.get(f"/api/jobs/{jobs['live']}").json()
+    assert live["status"] == "running"
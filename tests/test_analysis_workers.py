@@ -0,0 +1,147 @@
+"""Tests for parallel multi-project analysis."""
+
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+
+from capstone_project_team_5.consent_tool import ConsentTool
+from capstone_project_team_5.models.upload import DetectedProject
+from capstone_project_team_5.project_scan import ProjectScan
+from capstone_project_team_5.services.content_store import build_project_scan, ingest_zip
+from capstone_project_team_5.workflows import analysis_pipeline
+from capstone_project_team_5.workflows.analysis_pipeline import (
+    AnalysisWorkers,
+    analyze_projects_structured,
+    get_shared_analysis_workers,
+    resolve_analysis_workers,
+    shutdown_shared_analysis_workers,
+)
+
+_COMPARED_KEYS = ("name", "rel_path", "language", "framework", "tools", "practices", "score")
+
+
+@pytest.fixture(autouse=True)
+def _no_db(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(analysis_pipeline, "save_code_analysis_to_db", lambda *a, **k: None)
+    monkeypatch.setattr(analysis_pipeline, "_get_skill_timeline_for_project", lambda *a: [])
+
+
+@pytest.fixture
+def extract_root(tmp_path: Path) -> Path:
+    """Three small projects in different languages."""
+    root = tmp_path / "extract"
+    (root / "py_app").mkdir(parents=True)
+    (root / "py_app" / "main.py").write_text("class App:\n    def run(self):\n        return 1\n")
+    (root / "py_app" / "test_main.py").write_text("def test_run():\n    assert True\n")
+    (root / "js_app").mkdir()
+    (root / "js_app" / "package.json").write_text('{"dependencies": {"react": "^18.0.0"}}')
+    (root / "js_app" / "index.js").write_text("function add(a, b) { return a + b; }\n")
+    (root / "java_app").mkdir()
+    (root / "java_app" / "Main.java").write_text("public class Main { void run() {} }\n")
+    return root
+
+
+def _detected(root: Path) -> list[DetectedProject]:
+    return [
+        DetectedProject(
+            name=name,
+            rel_path=name,
+            has_git_repo=False,
+            file_count=sum(1 for p in (root / name).rglob("*") if p.is_file()),
+        )
+        for name in ("py_app", "js_app", "java_app")
+    ]
+
+
+def _comparable(results: list[dict]) -> list[tuple]:
+    return [tuple(result[key] for key in _COMPARED_KEYS) for result in results]
+
+
+def test_resolve_analysis_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ZIP2JOB_ANALYSIS_PARALLELISM", "3")
+    assert resolve_analysis_workers() == 3
+    assert resolve_analysis_workers(0) == 1
+    monkeypatch.setenv("ZIP2JOB_ANALYSIS_PARALLELISM", "many")
+    assert resolve_analysis_workers() >= 1
+
+
+def test_shared_workers_are_reused_until_shut_down() -> None:
+    shared = get_shared_analysis_workers()
+    assert get_shared_analysis_workers() is shared
+
+    shutdown_shared_analysis_workers()
+    assert get_shared_analysis_workers() is not shared
+    shutdown_shared_analysis_workers()
+
+
+def test_parallel_results_match_serial_and_keep_order(extract_root: Path) -> None:
+    projects = _detected(extract_root)
+
+    serial = analyze_projects_structured(extract_root, projects, ConsentTool(), max_workers=1)
+    parallel = analyze_projects_structured(extract_root, projects, ConsentTool(), max_workers=2)
+
+    assert [result["name"] for result in parallel] == ["py_app", "js_app", "java_app"]
+    assert _comparable(parallel) == _comparable(serial)
+    assert parallel[0]["language"] == "Python"
+
+
+def test_failing_project_does_not_affect_others(
+    extract_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    original = analysis_pipeline._analyze_structured_project
+
+    def flaky(project, *args, **kwargs):
+        if project.name == "js_app":
+            raise RuntimeError("boom")
+        return original(project, *args, **kwargs)
+
+    monkeypatch.setattr(analysis_pipeline, "_analyze_structured_project", flaky)
+
+    results = analyze_projects_structured(
+        extract_root, _detected(extract_root), ConsentTool(), max_workers=2
+    )
+
+    assert [result["name"] for result in results] == ["py_app", "java_app"]
+
+
+def test_archive_scans_fall_back_to_in_process_analysis(extract_root: Path, tmp_path: Path) -> None:
+    zip_path = tmp_path / "upload.zip"
+    with ZipFile(zip_path, "w") as archive:
+        for file_path in (extract_root / "py_app").rglob("*"):
+            archive.write(file_path, f"py_app/{file_path.name}")
+
+    with ZipFile(zip_path) as archive, AnalysisWorkers(2) as workers:
+        scan = ProjectScan.from_zip(archive, "py_app")
+        analysis = workers.analyze(scan.root, ConsentTool(), scan)
+
+    assert analysis is not None
+    assert analysis.language == "Python"
+
+
+def test_store_backed_scans_can_be_sent_to_worker_processes(
+    extract_root: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    monkeypatch.setenv("ZIP2JOB_ARTIFACT_DIR", str(tmp_path / "artifacts"))
+    zip_path = tmp_path / "upload.zip"
+    with ZipFile(zip_path, "w") as archive:
+        for file_path in (extract_root / "py_app").rglob("*"):
+            archive.write(file_path, f"py_app/{file_path.name}")
+    ingest_zip(zip_path, upload_id=1)
+
+    scan = build_project_scan("py_app", [1])
+    assert scan is not None
+    restored = pickle.loads(pickle.dumps(scan))
+
+    assert restored.read_text("main.py") == scan.read_text("main.py")
+    with AnalysisWorkers(2) as workers:
+        analysis = workers.analyze(scan.root, ConsentTool(), scan)
+    assert analysis is not None
+    assert analysis.test_case_count == 1
+    assert "analyzing in-process" not in caplog.text
@@ -0,0 +1,164 @@
+"""Tests for garbage collection of stored upload artifacts."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+
+from capstone_project_team_5.services.artifact_gc import collect_garbage
+from capstone_project_team_5.services.content_store import (
+    discard_project_artifacts,
+    get_analysis_cache_path,
+    get_file_result_cache,
+    get_ingest_temp_root,
+    get_manifest_path,
+    get_manifests_root,
+    get_objects_root,
+    get_project_view,
+    get_project_view_path,
+    ingest_zip,
+    open_manifest,
+    write_analysis_cache,
+)
+from capstone_project_team_5.services.git_cache import get_git_cache_root
+from capstone_project_team_5.services.upload_storage import store_upload_zip
+
+
+@pytest.fixture(autouse=True)
+def storage_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ZIP2JOB_ARTIFACT_DIR", str(tmp_path / "artifacts"))
+    monkeypatch.setenv("ZIP2JOB_UPLOAD_DIR", str(tmp_path / "uploads"))
+
+
+def _object(data: bytes) -> Path:
+    content_hash = hashlib.sha256(data).hexdigest()
+    return get_objects_root() / content_hash[:2] / content_hash
+
+
+def _upload(tmp_path: Path, upload_id: int, files: dict[str, bytes]) -> Path:
+    zip_path = tmp_path / f"{upload_id}.zip"
+    with ZipFile(zip_path, "w") as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    ingest_zip(zip_path, upload_id)
+    return store_upload_zip(upload_id, zip_path.name, zip_path)
+
+
+def _age(path: Path, seconds: float = 7200) -> None:
+    for target in [path, *path.rglob("*")] if path.is_dir() else [path]:
+        stat = target.stat()
+        os.utime(target, (stat.st_atime - seconds, stat.st_mtime - seconds))
+
+
+def test_collects_unreferenced_uploads_and_keeps_shared_objects(tmp_path: Path) -> None:
+    _upload(tmp_path, 1, {"proj/shared.py": b"shared\n", "proj/kept.py": b"kept\n"})
+    dead_archive = _upload(tmp_path, 2, {"proj/shared.py": b"shared\n", "proj/gone.py": b"gone!\n"})
+    get_project_view(7, "proj", [1])
+    write_analysis_cache(8, "fingerprint", {})
+    for path in (get_objects_root(), get_manifest_path(2), dead_archive.parent):
+        _age(path)
+    _age(get_analysis_cache_path(8))
+    archive_size = dead_archive.stat().st_size
+
+    report = collect_garbage([1], [7], grace_seconds=3600)
+
+    assert report.manifests_removed == 1
+    assert report.objects_removed == 1
+    assert report.objects_referenced == 2
+    assert report.upload_archives_removed == 1
+    assert report.project_files_removed == 1
+    assert report.bytes_reclaimed >= len(b"gone!\n") + archive_size
+    assert not get_manifest_path(2).exists()
+    assert not _object(b"gone!\n").exists()
+    assert _object(b"shared\n").exists() and _object(b"kept\n").exists()
+    assert not dead_archive.exists()
+    assert not get_analysis_cache_path(8).exists()
+    assert get_project_view_path(7).exists()
+
+
+def test_recent_garbage_is_kept_and_dry_run_removes_nothing(tmp_path: Path) -> None:
+    _upload(tmp_path, 1, {"proj/a.py": b"a\n"})
+    stale = get_ingest_temp_root() / "ingest-9-crashed"
+    stale.mkdir(parents=True)
+    (stale / "member").write_bytes(b"partial")
+
+    recent = collect_garbage([], [], grace_seconds=3600)
+    assert (recent.manifests_removed, recent.objects_removed, recent.bytes_reclaimed) == (0, 0, 0)
+    assert recent.objects_referenced == 1
+
+    for path in (get_objects_root(), get_manifest_path(1), stale):
+        _age(path)
+    dry_run = collect_garbage([], [], grace_seconds=3600, dry_run=True)
+    assert (dry_run.manifests_removed, dry_run.objects_removed) == (1, 1)
+    assert dry_run.temp_files_removed == 1
+    assert get_manifest_path(1).exists() and _object(b"a\n").exists() and stale.exists()
+
+    collected = collect_garbage([], [], grace_seconds=3600)
+    assert collected.bytes_reclaimed == dry_run.bytes_reclaimed
+    assert not get_manifest_path(1).exists() and not _object(b"a\n").exists()
+    assert not stale.exists()
+
+
+def test_collects_file_results_of_unreferenced_objects(tmp_path: Path) -> None:
+    _upload(tmp_path, 1, {"proj/kept.py": b"kept\n"})
+    cache = get_file_result_cache()
+    kept_hash = hashlib.sha256(b"kept\n").hexdigest()
+    gone_hash = hashlib.sha256(b"gone\n").hexdigest()
+    cache.put("python-v1", kept_hash, {"lines": 1})
+    cache.put("python-v1", gone_hash, {"lines": 1})
+    _age(cache.root)
+
+    report = collect_garbage([1], [], grace_seconds=3600)
+
+    assert report.file_results_removed == 1
+    assert cache.get("python-v1", kept_hash) == {"lines": 1}
+    assert cache.get("python-v1", gone_hash) is None
+
+
+def test_expires_git_histories_unused_for_the_max_age(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ZIP2JOB_GIT_CACHE_MAX_AGE_SECONDS", str(24 * 3600))
+    git_root = get_git_cache_root()
+    git_root.mkdir(parents=True)
+    recent = git_root / f"{'a' * 64}.json"
+    stale = git_root / f"{'b' * 64}.json"
+    for path in (recent, stale):
+        path.write_text("{}", encoding="utf-8")
+    _age(recent, seconds=7200)
+    _age(stale, seconds=2 * 24 * 3600)
+
+    report = collect_garbage([], [], grace_seconds=3600)
+
+    assert report.git_histories_removed == 1
+    assert recent.exists()
+    assert not stale.exists()
+
+
+def test_dry_run_leaves_legacy_manifests_unmigrated(tmp_path: Path) -> None:
+    _upload(tmp_path, 1, {"proj/a.py": b"a\n"})
+    legacy_path = get_manifests_root() / "1.json"
+    legacy_path.write_text(json.dumps(open_manifest(1).to_dict()), encoding="utf-8")
+    get_manifest_path(1).unlink()
+
+    report = collect_garbage([1], [], grace_seconds=3600, dry_run=True)
+
+    assert report.objects_referenced == 1
+    assert legacy_path.exists()
+    assert not get_manifest_path(1).exists()
+
+
+def test_discard_project_artifacts_removes_cache_and_view(tmp_path: Path) -> None:
+    _upload(tmp_path, 1, {"proj/a.py": b"a\n"})
+    get_project_view(3, "proj", [1])
+    write_analysis_cache(3, "fingerprint", {"ok": True})
+
+    assert discard_project_artifacts(3) > 0
+    assert not get_project_view_path(3).exists()
+    assert not get_analysis_cache_path(3).exists()
+    assert discard_project_artifacts(3) == 0
@@ -0,0 +1,326 @@
+"""Tests for the content-addressed artifact store."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, BadZipFile, ZipFile
+
+import pytest
+
+from capstone_project_team_5.models.upload import InvalidZipError
+from capstone_project_team_5.services import content_store
+from capstone_project_team_5.services.content_store import (
+    Manifest,
+    build_project_scan,
+    compute_project_file_count,
+    compute_project_fingerprint,
+    get_artifact_store_root,
+    get_manifest_path,
+    get_manifests_root,
+    get_objects_root,
+    get_project_view,
+    get_project_view_path,
+    ingest_zip,
+    load_manifest,
+    load_project_view,
+    materialize_project_tree,
+    open_manifest,
+)
+
+
+@pytest.fixture(autouse=True)
+def artifact_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    root = tmp_path / "artifacts"
+    monkeypatch.setenv("ZIP2JOB_ARTIFACT_DIR", str(root))
+    monkeypatch.setenv("ZIP2JOB_INGEST_WORKERS", "3")
+    return root
+
+
+def _make_zip(path: Path, files: dict[str, bytes]) -> Path:
+    with ZipFile(path, "w", ZIP_DEFLATED) as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    return path
+
+
+def _stored_objects() -> list[Path]:
+    return sorted(p for p in get_objects_root().rglob("*") if p.is_file())
+
+
+def _ingest_uploads(tmp_path: Path) -> None:
+    _make_zip(tmp_path / "one.zip", {"proj/a.py": b"old\n", "proj/pkg/b.py": b"b\n"})
+    _make_zip(tmp_path / "two.zip", {"proj/a.py": b"new\n"})
+    ingest_zip(tmp_path / "one.zip", upload_id=1)
+    ingest_zip(tmp_path / "two.zip", upload_id=2)
+
+
+def test_ingest_reads_each_member_once_and_dedupes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    files = {f"proj/src/file_{i}.py": f"print({i})\n".encode() for i in range(20)}
+    files["proj/copy_a.txt"] = b"same content\n"
+    files["proj/copy_b.txt"] = b"same content\n"
+    zip_path = _make_zip(tmp_path / "upload.zip", files)
+
+    opened: list[str] = []
+    original_open = ZipFile.open
+
+    def counting_open(self, name, *args, **kwargs):
+        opened.append(getattr(name, "filename", name))
+        return original_open(self, name, *args, **kwargs)
+
+    monkeypatch.setattr(ZipFile, "open", counting_open)
+    manifest = ingest_zip(zip_path, upload_id=1)
+
+    assert sorted(opened) == sorted(files)
+    assert list(manifest["files"]) == list(files)
+    for name, data in files.items():
+        entry = manifest["files"][name]
+        assert entry == {"hash": hashlib.sha256(data).hexdigest(), "size": len(data)}
+    assert len(_stored_objects()) == 21
+    assert not any((get_artifact_store_root() / "tmp").iterdir())
+
+
+def test_reingest_keeps_existing_objects(tmp_path: Path) -> None:
+    zip_path = _make_zip(tmp_path / "upload.zip", {"proj/a.py": b"a\n", "proj/b.py": b"b\n"})
+    ingest_zip(zip_path, upload_id=1)
+    before = {path: path.stat().st_mtime_ns for path in _stored_objects()}
+
+    ingest_zip(zip_path, upload_id=2)
+
+    assert {path: path.stat().st_mtime_ns for path in _stored_objects()} == before
+
+
+def test_corrupt_member_raises_and_cleans_up(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    zip_path = _make_zip(tmp_path / "upload.zip", {"proj/a.py": b"a\n" * 1000})
+
+    def corrupt(*_args: object) -> tuple[str, int]:
+        raise BadZipFile("Bad CRC-32")
+
+    monkeypatch.setattr(content_store, "_write_stream_and_hash", corrupt)
+
+    with pytest.raises(InvalidZipError):
+        ingest_zip(zip_path, upload_id=1)
+
+    assert _stored_objects() == []
+    assert not any((get_artifact_store_root() / "tmp").iterdir())
+
+
+def test_materialize_hardlinks_merged_view_and_skips_linked_files(tmp_path: Path) -> None:
+    _ingest_uploads(tmp_path)
+    dest = tmp_path / "tree"
+
+    root = materialize_project_tree("proj", [1, 2], dest, mode="hardlink")
+
+    assert root == dest / "proj"
+    assert (root / "a.py").read_bytes() == b"new\n"
+    assert (root / "pkg" / "b.py").read_bytes() == b"b\n"
+    object_path = get_objects_root() / hashlib.sha256(b"new\n").hexdigest()[:2]
+    assert os.path.samefile(root / "a.py", next(object_path.iterdir()))
+
+    inode = (root / "a.py").stat().st_ino
+    mtime = (root / "a.py").stat().st_mtime_ns
+    materialize_project_tree("proj", [1, 2], dest, mode="hardlink")
+    assert (root / "a.py").stat().st_ino == inode
+    assert (root / "a.py").stat().st_mtime_ns == mtime
+
+
+def test_materialize_falls_back_to_copy_without_touching_objects(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _ingest_uploads(tmp_path)
+    link_calls: list[object] = []
+
+    def no_links(*args: object) -> None:
+        link_calls.append(args)
+        raise OSError(18, "Invalid cross-device link")
+
+    monkeypatch.setattr(content_store.os, "link", no_links)
+    monkeypatch.setattr(content_store, "_reflink", no_links)
+
+    root = materialize_project_tree("proj", [1, 2], tmp_path / "tree", mode="auto")
+
+    # Each strategy fails once and is not retried for the remaining files.
+    assert len(link_calls) == 2
+    assert (root / "a.py").read_bytes() == b"new\n"
+    objects = {path.stat().st_ino for path in _stored_objects()}
+    assert (root / "a.py").stat().st_ino not in objects
+
+    (root / "a.py").write_bytes(b"edited\n")
+    assert sorted(path.read_bytes() for path in _stored_objects()) == [b"b\n", b"new\n", b"old\n"]
+
+
+def test_materialize_replaces_stale_links_and_supports_symlinks(tmp_path: Path) -> None:
+    _ingest_uploads(tmp_path)
+    dest = tmp_path / "tree"
+    root = materialize_project_tree("proj", [1], dest, mode="symlink")
+    assert (root / "a.py").is_symlink()
+    assert (root / "a.py").read_bytes() == b"old\n"
+
+    materialize_project_tree("proj", [1, 2], dest, mode="copy")
+
+    assert not (root / "a.py").is_symlink()
+    assert (root / "a.py").read_bytes() == b"new\n"
+    assert b"old\n" in [path.read_bytes() for path in _stored_objects()]
+
+
+def test_compressible_objects_are_stored_compressed_and_read_transparently(
+    tmp_path: Path,
+) -> None:
+    source = b"".join(f"def handler_{i}(request):\n    return {i}\n".encode() for i in range(400))
+    png = b"\x89PNG\r\n\x1a\n" + os.urandom(8192)
+    lookalike = b"\x89Z2JOBJ\n" + b"\x01" * 9 + b"raw bytes"
+    files = {"proj/big.py": source, "proj/logo.png": png, "proj/odd.bin": lookalike}
+    ingest_zip(_make_zip(tmp_path / "upload.zip", files), upload_id=1)
+
+    def stored(data: bytes) -> Path:
+        content_hash = hashlib.sha256(data).hexdigest()
+        return get_objects_root() / content_hash[:2] / content_hash
+
+    assert stored(source).stat().st_size < len(source) // 4
+    assert stored(png).read_bytes() == png
+    assert stored(lookalike).read_bytes() != lookalike
+
+    scan = build_project_scan("proj", [1])
+    assert scan is not None
+    for path, data in files.items():
+        assert scan.read_bytes(path.removeprefix("proj/")) == data
+
+    root = materialize_project_tree("proj", [1], tmp_path / "tree", mode="hardlink")
+    assert (root / "big.py").read_bytes() == source
+    assert not os.path.samefile(root / "big.py", stored(source))
+    assert os.path.samefile(root / "logo.png", stored(png))
+    assert (root / "odd.bin").read_bytes() == lookalike
+
+
+def test_formats_tagged_past_the_magic_are_stored_raw(tmp_path: Path) -> None:
+    webp = b"RIFF\x00\x20\x00\x00WEBPVP8 " + b"\x00" * 8192
+    mp4 = b"\x00\x00\x00\x18ftypisom" + b"\x00" * 8192
+    ingest_zip(_make_zip(tmp_path / "upload.zip", {"p/a.webp": webp, "p/b.mp4": mp4}), upload_id=1)
+
+    assert sorted(path.read_bytes() for path in _stored_objects()) == sorted([webp, mp4])
+
+
+def test_compression_can_be_disabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ZIP2JOB_OBJECT_COMPRESSION", "off")
+    source = b"x = 1\n" * 2000
+    ingest_zip(_make_zip(tmp_path / "upload.zip", {"proj/a.py": source}), upload_id=1)
+
+    assert [path.read_bytes() for path in _stored_objects()] == [source]
+
+
+def test_materialize_rejects_unknown_mode(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ZIP2JOB_MATERIALIZE_MODE", "teleport")
+    with pytest.raises(ValueError, match="teleport"):
+        materialize_project_tree("proj", [], tmp_path / "tree")
+
+
+def test_manifest_prefix_lookup_is_a_binary_search(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    files = {f"big/file_{i:05d}.txt": b"x" for i in range(2000)}
+    files |= {"app/a.py": b"a", "app/sub/b.py": b"b", "app-x/c.py": b"c", "app0": b"d"}
+    files |= {"apps/e.py": b"e", "ünï/f.py": b"f"}
+    ingest_zip(_make_zip(tmp_path / "upload.zip", files), upload_id=1)
+    manifest = open_manifest(1)
+    assert manifest is not None
+
+    probes: list[int] = []
+    original = content_store._PathKeys.__getitem__
+
+    def counting(self, index: int) -> bytes:
+        probes.append(index)
+        return original(self, index)
+
+    monkeypatch.setattr(content_store._PathKeys, "__getitem__", counting)
+
+    assert [path for path, _hash, _size in manifest.entries("app")] == ["a.py", "sub/b.py"]
+    assert len(probes) < 40
+    assert manifest.count("/app/") == 2
+    assert list(manifest.entries("ünï")) == [("f.py", hashlib.sha256(b"f").hexdigest(), 1)]
+    assert manifest.count("missing") == 0
+    assert len(manifest) == manifest.count() == len(files)
+
+
+def test_manifest_round_trips_through_binary_format(tmp_path: Path) -> None:
+    files = {"proj/b.py": b"bb", "proj/a.py": b"a"}
+    returned = ingest_zip(_make_zip(tmp_path / "upload.zip", files), upload_id=7)
+
+    raw = get_manifest_path(7).read_bytes()
+    assert b"proj/a.py" in raw and b"{" not in raw
+    assert Manifest.from_bytes(raw).to_dict() == returned
+    assert load_manifest(7) == returned
+    with pytest.raises(ValueError):
+        Manifest.from_bytes(raw[:-1])
+
+
+def test_open_manifest_is_cached_until_the_file_changes(tmp_path: Path) -> None:
+    ingest_zip(_make_zip(tmp_path / "one.zip", {"proj/a.py": b"a"}), upload_id=1)
+    first = open_manifest(1)
+    assert open_manifest(1) is first
+
+    ingest_zip(_make_zip(tmp_path / "two.zip", {"proj/a.py": b"a", "proj/b.py": b"b"}), upload_id=1)
+
+    assert open_manifest(1) is not first
+    assert compute_project_file_count("proj", [1]) == 2
+    get_manifest_path(1).unlink()
+    assert open_manifest(1) is None
+
+
+def test_legacy_json_manifest_is_migrated() -> None:
+    legacy = {
+        "upload_id": 3,
+        "created_at": "2025-01-01T00:00:00+00:00",
+        "files": {
+            "proj/a.py": {"hash": hashlib.sha256(b"a").hexdigest(), "size": 1},
+            "proj/../escape.py": {"hash": hashlib.sha256(b"e").hexdigest(), "size": 1},
+        },
+    }
+    get_manifests_root().mkdir(parents=True)
+    legacy_path = get_manifests_root() / "3.json"
+    legacy_path.write_text(json.dumps(legacy), encoding="utf-8")
+
+    manifest = open_manifest(3)
+
+    assert manifest is not None
+    assert list(manifest.entries("proj")) == [("a.py", hashlib.sha256(b"a").hexdigest(), 1)]
+    assert manifest.created_at == legacy["created_at"]
+    assert get_manifest_path(3).exists()
+    assert not legacy_path.exists()
+
+
+def test_project_view_is_persisted_per_upload_set(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _ingest_uploads(tmp_path)
+
+    view = get_project_view(5, "proj", [1, 2])
+
+    assert view.file_count == 2
+    assert view.total_size == len(b"new\n") + len(b"b\n")
+    assert view.files["a.py"][0] == hashlib.sha256(b"new\n").hexdigest()
+    assert view.fingerprint == compute_project_fingerprint("proj", [1, 2])
+    assert get_project_view_path(5).is_file()
+
+    def fail_open(_upload_id: int) -> None:
+        raise AssertionError("manifest opened for a stored view")
+
+    monkeypatch.setattr(content_store, "open_manifest", fail_open)
+    assert get_project_view(5, "proj", [1, 2]) == view
+    assert load_project_view(5, "proj", [1]) is None
+    assert load_project_view(5, "other", [1, 2]) is None
+
+
+def test_project_view_with_missing_manifest_is_not_persisted(tmp_path: Path) -> None:
+    _ingest_uploads(tmp_path)
+
+    view = get_project_view(5, "proj", [1, 2, 99])
+
+    assert not view.complete
+    assert view.file_count == 2
+    assert not get_project_view_path(5).exists()
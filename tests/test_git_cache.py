@@ -0,0 +1,126 @@
+"""Tests for the persistent Git history cache."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from capstone_project_team_5.services.git_cache import get_git_cache_root, load_git_history
+from capstone_project_team_5.utils import git as git_utils
+from capstone_project_team_5.utils.git import GitHistory
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _run(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+
+
+def _commit(repo: Path, filename: str, content: str, message: str, author: str = "Ana") -> None:
+    (repo / filename).write_text(content, encoding="utf-8")
+    _run(repo, "add", filename)
+    env = os.environ | {
+        "GIT_AUTHOR_NAME": author,
+        "GIT_AUTHOR_EMAIL": f"{author.lower()}@example.com",
+        "GIT_COMMITTER_NAME": author,
+        "GIT_COMMITTER_EMAIL": f"{author.lower()}@example.com",
+    }
+    subprocess.run(
+        ["git", "commit", "-q", "-m", message],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        env=env,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("ZIP2JOB_ARTIFACT_DIR", str(tmp_path / "artifacts"))
+    root = tmp_path / "repo"
+    root.mkdir()
+    _run(root, "init", "-q", "--initial-branch=main")
+    _commit(root, "app.py", "print(1)\n", "feat: app")
+    _commit(root, "README.md", "# app\n", "docs: readme", author="Ben")
+    return root
+
+
+def _summary(history: GitHistory) -> tuple:
+    head = history.commit_indices("HEAD")
+    return (
+        sorted(history.hashes),
+        sorted(history.hashes[i] for i in head),
+        sorted((c.author, c.commits, c.added, c.deleted) for c in history.author_contributions()),
+        sorted(history.changed_files(history.commit_indices("--all"))),
+    )
+
+
+def _count_log_calls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, ...]]:
+    calls: list[tuple[str, ...]] = []
+    original = git_utils.stream_git
+
+    def recording(repo, *args, **kwargs):
+        calls.append(args)
+        return original(repo, *args, **kwargs)
+
+    monkeypatch.setattr(git_utils, "stream_git", recording)
+    return calls
+
+
+def test_unchanged_repository_is_served_from_cache(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = load_git_history(repo)
+    (entry,) = get_git_cache_root().glob("*.json")
+    os.utime(entry, (0, 0))
+
+    calls = _count_log_calls(monkeypatch)
+    second = load_git_history(repo)
+
+    assert calls == []
+    assert entry.stat().st_mtime > 0
+    assert _summary(second) == _summary(first)
+    assert second.commit_type_counts() == first.commit_type_counts()
+
+
+def test_new_commits_are_read_incrementally(repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    load_git_history(repo)
+    _commit(repo, "util.py", "x = 1\n", "feat: util", author="Cy")
+    _commit(repo, "app.py", "print(2)\n", "fix: app")
+
+    calls = _count_log_calls(monkeypatch)
+    history = load_git_history(repo)
+
+    assert len(calls) == 1
+    assert "--not" in calls[0]
+    assert len(history) == 4
+    assert _summary(history) == _summary(GitHistory.load(repo))
+
+
+def test_head_moving_to_a_known_commit_updates_reachability(repo: Path) -> None:
+    _run(repo, "checkout", "-q", "-b", "feature")
+    _commit(repo, "feature.py", "y = 2\n", "feat: feature")
+    assert len(load_git_history(repo).commit_indices("HEAD")) == 3
+
+    _run(repo, "checkout", "-q", "main")
+    history = load_git_history(repo)
+
+    assert len(history.commit_indices("HEAD")) == 2
+    assert _summary(history) == _summary(GitHistory.load(repo))
+
+
+def test_rewritten_history_is_reloaded(repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    load_git_history(repo)
+    _run(repo, "reset", "-q", "--hard", "HEAD~1")
+    _commit(repo, "notes.md", "notes\n", "docs: notes")
+
+    calls = _count_log_calls(monkeypatch)
+    history = load_git_history(repo)
+
+    assert len(calls) == 1
+    assert "--not" not in calls[0]
+    assert _summary(history) == _summary(GitHistory.load(repo))
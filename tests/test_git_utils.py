@@ -8,16 +8,21 @@ from pathlib import Path
 
 import pytest
 
+from capstone_project_team_5.utils import git as git_utils
 from capstone_project_team_5.utils.git import (
+    GitHistory,
     NumstatEntry,
     get_author_contributions,
+    get_commit_frequency_by_author,
     get_commit_type_counts,
+    get_weekly_activity,
     get_weekly_activity_window,
     list_changed_files,
     list_commit_dates,
     parse_numstat,
     render_weekly_activity_chart,
     run_git,
+    stream_git,
     summarize_conventional_contributions,
 )
 
@@ -276,3 +281,130 @@ def test_list_commit_dates_tz_and_dst(tmp_path: Path) -> None:
     first, second = sorted(dates)[:2]
     assert str(first.utcoffset()) in {"-1 day, 19:00:00", "-1 day, 20:00:00", "-05:00:00", "-05:00"}
     assert str(second.utcoffset()) in {"-1 day, 20:00:00", "-04:00:00", "-04:00"}
+
+
+def _history_repo(repo: Path) -> Path:
+    """Two authors on main, a side branch, a binary file and a rename."""
+    t0 = datetime(2025, 1, 6, 12, 0, tzinfo=UTC)
+    _commit(
+        repo,
+        filename="setup.py",
+        content="a\nb\n",
+        message="chore: init",
+        author="Alice",
+        email="alice@example.com",
+        when=t0,
+    )
+    (repo / "logo.png").write_bytes(b"\x00\x01\x02")
+    _commit(
+        repo,
+        filename="logo.png",
+        content="",
+        message="feat: logo",
+        author="Bob",
+        email="bob@example.com",
+        when=t0 + timedelta(days=1),
+    )
+    _run(["git", "mv", "setup.py", "build.py"], cwd=repo)
+    _commit(
+        repo,
+        filename="build.py",
+        content="a\nb\nc\n",
+        message="fix: rename",
+        author="Alice",
+        email="alice@example.com",
+        when=t0 + timedelta(days=2),
+    )
+    _run(["git", "checkout", "-q", "-b", "side"], cwd=repo)
+    _commit(
+        repo,
+        filename="side.txt",
+        content="s\n",
+        message="docs: side",
+        author="Carol",
+        email="carol@example.com",
+        when=t0 + timedelta(days=3),
+    )
+    _run(["git", "checkout", "-q", "main"], cwd=repo)
+    return repo
+
+
+@pytest.mark.skipif(not _git_available(), reason="git not installed")
+def test_git_history_matches_individual_git_queries(tmp_path: Path) -> None:
+    repo = _history_repo(_init_repo(tmp_path))
+
+    history = GitHistory.load(repo)
+
+    assert len(history) == 4
+    assert len(history.commit_indices("HEAD")) == 3
+    contribs = {c.author: c for c in history.author_contributions()}
+    assert set(contribs) == {"Alice", "Bob"}
+    assert (contribs["Alice"].commits, contribs["Alice"].added) == (2, 3)
+    assert (contribs["Bob"].added, contribs["Bob"].deleted) == (0, 0)
+
+    name_only = run_git(repo, "log", "--name-only", "--no-merges", "--all", "--format=")
+    expected_files = [line for line in name_only.splitlines() if line]
+    assert history.changed_files(history.commit_indices("--all")) == expected_files
+
+    iso_dates = run_git(repo, "log", "--format=%ad", "--date=iso-strict", "--all")
+    assert history.commit_dates("--all") == [
+        datetime.fromisoformat(line) for line in iso_dates.splitlines()
+    ]
+    assert history.commit_frequency("alice") == {"2025-01-06": 1, "2025-01-08": 1}
+    assert history.commit_type_counts()["Alice"] == {"chore": 1, "fix": 1}
+    assert history.changed_files(history.earliest_commits(1)) == ["setup.py"]
+    assert history.changed_files(history.commit_indices(author="Bob")) == ["logo.png"]
+
+
+@pytest.mark.skipif(not _git_available(), reason="git not installed")
+def test_git_helpers_answer_from_loaded_history(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo = _history_repo(_init_repo(tmp_path))
+    history = GitHistory.load(repo)
+    expected = (
+        get_author_contributions(repo),
+        get_commit_type_counts(repo),
+        get_weekly_activity(repo),
+        get_commit_frequency_by_author(repo),
+        list_changed_files(repo),
+        list_commit_dates(repo, rev_range="--all"),
+    )
+
+    def fail(*_args: str) -> str:
+        raise AssertionError("git should not run when a history is supplied")
+
+    monkeypatch.setattr(git_utils, "run_git", fail)
+
+    assert (
+        get_author_contributions(repo, history=history),
+        get_commit_type_counts(repo, history=history),
+        get_weekly_activity(repo, history=history),
+        get_commit_frequency_by_author(repo, history=history),
+        list_changed_files(repo, history=history),
+        list_commit_dates(repo, rev_range="--all", history=history),
+    ) == expected
+
+
+@pytest.mark.skipif(not _git_available(), reason="git not installed")
+def test_stream_git_splits_records_across_chunks(tmp_path: Path) -> None:
+    repo = _history_repo(_init_repo(tmp_path))
+    args = ("log", "--all", "--numstat", "--format=%x1e%H%x09%an%x09%s")
+
+    records = list(stream_git(repo, *args, separator="\x1e", chunk_size=7))
+
+    expected = [record for record in run_git(repo, *args).split("\x1e") if record]
+    assert records == expected
+    assert len(records) == 4
+
+
+@pytest.mark.skipif(not _git_available(), reason="git not installed")
+def test_stream_git_reports_failures_and_stops_early(tmp_path: Path) -> None:
+    with pytest.raises(RuntimeError, match="git command failed"):
+        list(stream_git(tmp_path, "log"))
+
+    (tmp_path / "repo").mkdir()
+    repo = _history_repo(_init_repo(tmp_path / "repo"))
+    lines = stream_git(repo, "log", "--all", "--format=%H")
+    assert len(next(lines)) == 40
+    lines.close()
@@ -3,6 +3,8 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import esprima
+
 from capstone_project_team_5.js_code_analyzer import (
     JSProjectSummary,
     JSTSAnalyzer,
@@ -696,3 +698,63 @@ def test_data_structures_and_algorithms(tmp_path):
         "Filtering" in summary.algorithms_used
         or "Mapping/Transformation" in summary.algorithms_used
     )
+
+
+def test_each_file_is_parsed_once_in_the_right_mode(tmp_path, monkeypatch):
+    """Module syntax decides the parse mode up front; TypeScript is stripped first."""
+
+    create_package_json(tmp_path / "package.json", dependencies={})
+    create_code_file(
+        tmp_path / "src" / "greet.ts",
+        """
+        import type { User } from './types';
+        interface Props { name: string }
+
+        export function greet(user: User): string {
+            return user.name as string;
+        }
+        """,
+    )
+    create_code_file(
+        tmp_path / "src" / "legacy.js",
+        """
+        function loadLater() {
+            return import('./lazy').then(module => module.default);
+        }
+        """,
+    )
+
+    calls = []
+    for name in ("parseModule", "parseScript"):
+        parse = getattr(esprima, name)
+        monkeypatch.setattr(
+            esprima,
+            name,
+            lambda code, options, parse=parse, name=name: (
+                calls.append(name) or parse(code, options)
+            ),
+        )
+
+    summary = analyze_js_project(tmp_path, "TypeScript", None)
+
+    assert sorted(calls) == ["parseModule", "parseScript"]
+    assert summary.total_functions == 3
+    assert summary.total_exports == 1
+    assert summary.total_imports == 0
+    assert summary.uses_promises is True
+
+
+def test_minified_and_oversized_files_are_not_parsed(tmp_path, monkeypatch):
+    """Bundles and files over the size limit still count as files but are not parsed."""
+
+    monkeypatch.setenv("ZIP2JOB_JS_AST_MAX_FILE_CHARS", "400")
+    create_package_json(tmp_path / "package.json", dependencies={})
+    create_code_file(tmp_path / "src" / "app.js", "function app() {\n    return 1;\n}\n")
+    create_code_file(tmp_path / "src" / "lib.min.js", "function a(){}\n")
+    create_code_file(tmp_path / "src" / "bundle.js", "function b(){return 1};" * 30)
+    create_code_file(tmp_path / "src" / "big.js", "function c() {}\n" * 30)
+
+    summary = analyze_js_project(tmp_path, "JavaScript", None)
+
+    assert summary.total_files == 4
+    assert summary.total_functions == 1
@@ -0,0 +1,123 @@
+"""Tests for the compiled path classifier and the classifiers built on it."""
+
+from __future__ import annotations
+
+import random
+import re
+from pathlib import Path
+
+from capstone_project_team_5.constants.contribution_metrics_constants import (
+    CONTRIBUTION_CATEGORIES,
+)
+from capstone_project_team_5.constants.roles import DIRECTORY_PATTERNS, FILE_CATEGORIES
+from capstone_project_team_5.contribution_metrics import ContributionMetrics
+from capstone_project_team_5.role_type_detection import categorize_file
+from capstone_project_team_5.utils.path_classifier import PathClassifier, PathRule
+
+
+def _reference_contribution_category(filepath: str) -> str:
+    for category, patterns in CONTRIBUTION_CATEGORIES.items():
+        if any(re.search(pattern, filepath, re.IGNORECASE) for pattern in patterns):
+            return category
+    return "other"
+
+
+def _reference_role_category(file_path: str) -> str | None:
+    path_lower = file_path.lower()
+    suffix = Path(file_path).suffix.lower()
+    if any(pattern in path_lower for pattern in FILE_CATEGORIES["testing"]):
+        return "testing"
+    if "models/" in path_lower:
+        if suffix in {".py", ".go", ".java", ".rb", ".php", ".rs", ".kt", ".js", ".ts"}:
+            return "backend"
+        if suffix in {".h5", ".hdf5", ".pkl", ".pickle", ".pt", ".pth", ".onnx", ".joblib"}:
+            return "data"
+    if suffix == ".sql":
+        if any(d in path_lower for d in ["data/", "datasets/", "notebooks/", "analytics/"]):
+            return "data"
+        return "backend"
+    for category, patterns in DIRECTORY_PATTERNS.items():
+        if any(pattern in path_lower for pattern in patterns):
+            return category
+    for category, extensions in FILE_CATEGORIES.items():
+        if category != "testing" and (suffix in extensions or Path(file_path).name in extensions):
+            return category
+    return None
+
+
+def _path_corpus(count: int, seed: int = 7) -> list[str]:
+    """Random paths built from the fragments the rules look for."""
+    rng = random.Random(seed)
+    directories = [
+        "src",
+        "lib",
+        "tests",
+        "Test",
+        "__tests__",
+        "docs",
+        "models",
+        "data",
+        "notebooks",
+        "src/components",
+        "src/api",
+        ".github/workflows",
+        "terraform",
+        "latest",
+        "spec",
+        "e2e",
+        "design",
+        "integration",
+        "a.b",
+    ]
+    stems = ["main", "test_util", "util_test", "README", "LICENSE", "x.spec", "Dockerfile", ""]
+    extensions = [""] + sorted(
+        {
+            entry
+            for entries in FILE_CATEGORIES.values()
+            for entry in entries
+            if entry.startswith(".")
+        }
+        | {".py", ".R", ".Py", ".docx", ".np", ".npz", ".env", ".example", ".sql", ".db", ".h5"}
+    )
+    names = sorted({name for entries in FILE_CATEGORIES.values() for name in entries})
+    paths = []
+    for _ in range(count):
+        parts = rng.sample(directories, rng.randint(0, 3))
+        if rng.random() < 0.2:
+            name = rng.choice(names)
+        else:
+            name = rng.choice(stems) + rng.choice(extensions)
+        path = "/".join([*parts, name])
+        if rng.random() < 0.1:
+            path = path.upper()
+        paths.append(path)
+    return paths
+
+
+def test_contribution_categories_match_the_reference_regexes() -> None:
+    for path in _path_corpus(5000) + [".gitignore", "a/.env.example", "x.python-version"]:
+        assert ContributionMetrics._get_file_category(path) == _reference_contribution_category(
+            path
+        ), path
+
+
+def test_role_categories_match_the_reference_rules() -> None:
+    for path in _path_corpus(5000) + [".py", "models/.py", "data/.sql", "..sql", "a.py\n"]:
+        assert categorize_file(path) == _reference_role_category(path), path
+
+
+def test_rule_order_wins_over_table_lookups() -> None:
+    classifier = PathClassifier(
+        [
+            PathRule("docs", (r"(^|/)docs/",)),
+            PathRule("code", (r"\.py$", r"\.ipynb?$")),
+            PathRule("config", names=frozenset({"setup.py"}), suffixes=frozenset({".cfg"})),
+        ]
+    )
+
+    assert classifier.classify("docs/conf.py") == "docs"
+    assert classifier.classify("pkg/setup.py") == "code"
+    assert classifier.classify("notebook.ipyn") == "code"
+    assert classifier.classify("setup.cfg") == "config"
+    assert classifier.classify(".cfg") is None
+    assert classifier.classify("README") is None
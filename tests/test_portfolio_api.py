@@ -1,15 +1,31 @@
 from __future__ import annotations
 
 import io
+from collections.abc import Iterator
+from contextlib import contextmanager
 from uuid import uuid4
 from zipfile import ZIP_DEFLATED, ZipFile
 
+import pytest
 from conftest import auth_headers
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 
 from capstone_project_team_5.api.main import app
+from capstone_project_team_5.api.routes import portfolio as portfolio_routes
 from capstone_project_team_5.data.db import get_session
-from capstone_project_team_5.data.models import Portfolio, PortfolioItem, User
+from capstone_project_team_5.data.models import (
+    CodeAnalysis,
+    Portfolio,
+    PortfolioItem,
+    Project,
+    ProjectSkill,
+    Skill,
+    UploadRecord,
+    User,
+    UserCodeAnalysis,
+)
 
 
 def _create_zip_bytes(entries: list[tuple[str, bytes]]) -> bytes:
@@ -505,3 +521,303 @@ def test_reorder_portfolio_items() -> None:
     items = client.get(f"/api/portfolio/{portfolio_id}").json()
     titles = [i["title"] for i in items]
     assert titles == ["C", "B", "A"]
+
+
+# ── Rendering ──────────────────────────────────────────────────────────────────
+
+
+def _seed_portfolio_items(portfolio_id: int, username: str, count: int) -> None:
+    """Attach ``count`` analyzed projects, each with a skill, to a portfolio."""
+    tag = uuid4().hex[:8]
+    with get_session() as session:
+        user = session.query(User).filter(User.username == username).one()
+        upload = UploadRecord(filename=f"{tag}.zip", size_bytes=1, file_count=count)
+        session.add(upload)
+        session.flush()
+        for index in range(count):
+            project = Project(
+                upload_id=upload.id, name=f"{tag}-{index}", rel_path=f"{tag}-{index}", file_count=1
+            )
+            skill = Skill(name=f"skill-{tag}-{index}", skill_type="tool")
+            session.add_all([project, skill])
+            session.flush()
+            session.add(ProjectSkill(project_id=project.id, skill_id=skill.id))
+            for summary in ("stale summary", f"latest summary {tag}-{index}"):
+                session.add(
+                    CodeAnalysis(
+                        project_id=project.id,
+                        language="Python",
+                        metrics_json='{"git": {"commit_frequency": {"2025-01-02": 1}}}',
+                        summary_text=summary,
+                    )
+                )
+                session.flush()
+            session.add(
+                PortfolioItem(
+                    project_id=project.id,
+                    portfolio_id=portfolio_id,
+                    user_id=user.id,
+                    title=f"Item {index}",
+                    content="{}",
+                    display_order=index,
+                )
+            )
+
+
+@contextmanager
+def _recorded_statements() -> Iterator[list[str]]:
+    """Collect the SQL statements executed inside the block (executemany counts once)."""
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
+
+
+def _count_render_queries(client: TestClient, portfolio_id: int) -> tuple[int, str]:
+    with _recorded_statements() as statements:
+        response = client.get(f"/api/portfolio/{portfolio_id}/preview")
+    assert response.status_code == 200
+    return len(statements), response.text
+
+
+def test_portfolio_render_query_count_is_independent_of_item_count() -> None:
+    client = TestClient(app)
+    small = _create_portfolio(client, "render-user-small")
+    large = _create_portfolio(client, "render-user-large")
+    _seed_portfolio_items(small, "render-user-small", 2)
+    _seed_portfolio_items(large, "render-user-large", 12)
+
+    small_queries, _ = _count_render_queries(client, small)
+    large_queries, html = _count_render_queries(client, large)
+
+    assert large_queries == small_queries
+    assert "latest summary" in html
+    assert "stale summary" not in html
+    assert "12 commits" in html
+
+
+def test_shared_portfolio_is_cached_with_etag_and_precompressed_body(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = TestClient(app)
+    portfolio_id = _create_portfolio(client, "cache-user-1", "Cached Portfolio")
+    _seed_portfolio_items(portfolio_id, "cache-user-1", 2)
+    token = client.post(f"/api/portfolio/{portfolio_id}/share").json()["share_token"]
+    url = f"/api/portfolio/shared/{token}"
+    renders: list[int] = []
+    render = portfolio_routes._render_portfolio_for_id
+
+    def counting_render(rendered_id: int, session: object) -> object:
+        renders.append(rendered_id)
+        return render(rendered_id, session)
+
+    monkeypatch.setattr(portfolio_routes, "_render_portfolio_for_id", counting_render)
+
+    first = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "gzip"
+    assert "Cached Portfolio" in first.text
+    etag = first.headers["etag"]
+
+    second = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in second.headers
+    assert second.text == first.text
+
+    not_modified = client.get(url, headers={"Accept-Encoding": "identity", "If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == second.headers["etag"]
+    assert renders == [portfolio_id]
+
+
+def test_shared_portfolio_etag_differs_per_content_coding() -> None:
+    client = TestClient(app)
+    portfolio_id = _create_portfolio(client, "cache-user-4")
+    token = client.post(f"/api/portfolio/{portfolio_id}/share").json()["share_token"]
+    url = f"/api/portfolio/shared/{token}"
+
+    gzipped = client.get(url, headers={"Accept-Encoding": "gzip"})
+    identity = client.get(url, headers={"Accept-Encoding": "identity"})
+
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["etag"].endswith('-gzip"')
+    assert identity.headers["etag"] != gzipped.headers["etag"]
+
+
+def test_shared_portfolio_etag_changes_with_portfolio_content() -> None:
+    client = TestClient(app)
+    username = "cache-user-2"
+    portfolio_id = _create_portfolio(client, username)
+    _seed_portfolio_items(portfolio_id, username, 2)
+    token = client.post(f"/api/portfolio/{portfolio_id}/share").json()["share_token"]
+    url = f"/api/portfolio/shared/{token}"
+
+    def etag() -> str:
+        response = client.get(url)
+        assert response.status_code == 200
+        return response.headers["etag"]
+
+    etags = [etag()]
+    client.patch(f"/api/portfolio/{portfolio_id}", json={"template": "timeline"})
+    etags.append(etag())
+    client.patch(f"/api/portfolio/{portfolio_id}", json={"color_theme": "light"})
+    etags.append(etag())
+    client.post(f"/api/portfolio/{portfolio_id}/blocks", json={"title": "Intro", "markdown": "Hi"})
+    etags.append(etag())
+    item_ids = [item["id"] for item in client.get(f"/api/portfolio/{portfolio_id}").json()]
+    client.post(f"/api/portfolio/{portfolio_id}/reorder", json={"item_ids": item_ids[::-1]})
+    etags.append(etag())
+    with get_session() as session:
+        project_id = (
+            session.query(PortfolioItem.project_id)
+            .filter(
+                PortfolioItem.portfolio_id == portfolio_id, PortfolioItem.project_id.isnot(None)
+            )
+            .first()[0]
+        )
+        session.add(
+            CodeAnalysis(
+                project_id=project_id,
+                language="Python",
+                metrics_json="{}",
+                summary_text="freshly analyzed",
+            )
+        )
+    etags.append(etag())
+
+    assert len(set(etags)) == len(etags)
+    assert "freshly analyzed" in client.get(url).text
+
+
+def test_shared_portfolio_etag_changes_when_an_analysis_is_edited() -> None:
+    username = "cache-user-3"
+    client = TestClient(app, headers=_auth(username))
+    portfolio_id = _create_portfolio(client, username)
+    _seed_portfolio_items(portfolio_id, username, 1)
+    token = client.post(f"/api/portfolio/{portfolio_id}/share").json()["share_token"]
+    url = f"/api/portfolio/shared/{token}"
+    with get_session() as session:
+        user = session.query(User).filter(User.username == username).one()
+        analysis = (
+            session.query(CodeAnalysis)
+            .join(PortfolioItem, PortfolioItem.project_id == CodeAnalysis.project_id)
+            .filter(PortfolioItem.portfolio_id == portfolio_id)
+            .order_by(CodeAnalysis.id.desc())
+            .first()
+        )
+        session.add(UserCodeAnalysis(user_id=user.id, analysis_id=analysis.id))
+        project_id, analysis_id = analysis.project_id, analysis.id
+
+    first = client.get(url)
+    assert first.status_code == 200
+    response = client.patch(
+        f"/api/projects/{project_id}/analyses/{analysis_id}",
+        json={"summary_text": "edited summary"},
+    )
+    assert response.status_code == 200
+    second = client.get(url)
+
+    assert second.headers["etag"] != first.headers["etag"]
+    assert "edited summary" in second.text
+
+
+# ── Bulk edits ─────────────────────────────────────────────────────────────────
+
+
+def _create_blocks(client: TestClient, portfolio_id: int, count: int) -> list[int]:
+    return [
+        client.post(
+            f"/api/portfolio/{portfolio_id}/blocks", json={"title": f"B{index}", "markdown": ""}
+        ).json()["id"]
+        for index in range(count)
+    ]
+
+
+def test_reorder_writes_all_positions_with_one_update() -> None:
+    client = TestClient(app)
+    statement_counts = []
+    for username, count in (("bulk-reorder-small", 3), ("bulk-reorder-large", 30)):
+        portfolio_id = _create_portfolio(client, username)
+        block_ids = _create_blocks(client, portfolio_id, count)
+        with _recorded_statements() as statements:
+            response = client.post(
+                f"/api/portfolio/{portfolio_id}/reorder", json={"item_ids": block_ids[::-1]}
+            )
+        assert response.status_code == 204
+        assert [s for s in statements if s.lstrip().upper().startswith("UPDATE")] != []
+        statement_counts.append(len(statements))
+        items = client.get(f"/api/portfolio/{portfolio_id}").json()
+        assert [item["id"] for item in items] == block_ids[::-1]
+
+    assert statement_counts[0] == statement_counts[1]
+
+
+def test_reorder_ignores_items_of_other_portfolios() -> None:
+    client = TestClient(app)
+    mine = _create_portfolio(client, "bulk-owner-1")
+    other = _create_portfolio(client, "bulk-owner-2")
+    my_blocks = _create_blocks(client, mine, 2)
+    [foreign] = _create_blocks(client, other, 1)
+
+    response = client.post(
+        f"/api/portfolio/{mine}/reorder", json={"item_ids": [foreign, *my_blocks[::-1]]}
+    )
+
+    assert response.status_code == 204
+    with get_session() as session:
+        assert session.get(PortfolioItem, foreign).display_order == 0
+    assert [item["id"] for item in client.get(f"/api/portfolio/{mine}").json()] == my_blocks[::-1]
+
+
+def test_batch_update_edits_many_items_in_constant_statements() -> None:
+    client = TestClient(app)
+    statement_counts = []
+    for username, count in (("batch-small", 2), ("batch-large", 20)):
+        portfolio_id = _create_portfolio(client, username)
+        block_ids = _create_blocks(client, portfolio_id, count)
+        edits = [
+            {"id": item_id, "title": f"T{index}", "markdown": f"M{index}", "display_order": -index}
+            for index, item_id in enumerate(block_ids)
+        ]
+        with _recorded_statements() as statements:
+            response = client.patch(f"/api/portfolio/{portfolio_id}/items", json={"items": edits})
+        assert response.status_code == 200
+        statement_counts.append(len(statements))
+
+        payload = response.json()
+        assert [item["id"] for item in payload] == block_ids
+        assert payload[1]["title"] == "T1" and payload[1]["markdown"] == "M1"
+        assert all(item["is_user_edited"] for item in payload)
+        listed = client.get(f"/api/portfolio/{portfolio_id}").json()
+        assert [item["id"] for item in listed] == block_ids[::-1]
+
+    assert statement_counts[0] == statement_counts[1]
+
+
+def test_batch_update_rejects_foreign_or_duplicate_items_without_changes() -> None:
+    client = TestClient(app)
+    mine = _create_portfolio(client, "batch-owner-1")
+    other = _create_portfolio(client, "batch-owner-2")
+    [block] = _create_blocks(client, mine, 1)
+    [foreign] = _create_blocks(client, other, 1)
+
+    response = client.patch(
+        f"/api/portfolio/{mine}/items",
+        json={"items": [{"id": block, "title": "changed"}, {"id": foreign, "title": "stolen"}]},
+    )
+    assert response.status_code == 404
+    assert str(foreign) in response.json()["detail"]
+
+    duplicate = client.patch(
+        f"/api/portfolio/{mine}/items",
+        json={"items": [{"id": block, "title": "a"}, {"id": block, "title": "b"}]},
+    )
+    assert duplicate.status_code == 400
+    titles = {item["title"] for item in client.get(f"/api/portfolio/{mine}").json()}
+    assert titles == {"B0"}
@@ -0,0 +1,164 @@
+"""Tests and benchmark for single-pass project discovery in ZIP uploads."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from zipfile import ZIP_STORED, ZipFile
+
+import pytest
+
+from capstone_project_team_5.models.upload import DetectedProject
+from capstone_project_team_5.services.upload import (
+    _collect_zip_entries,
+    _discover_projects,
+    _extract_projects,
+    _get_ignore_patterns,
+    _is_doc_file,
+    _is_media_file,
+)
+
+BENCHMARK_PROJECTS = 250
+BENCHMARK_FILES_PER_PROJECT = 400
+
+
+def _reference_discover(names: list[str], ignore_patterns: set[str]) -> list[DetectedProject]:
+    """Straightforward O(projects x files) discovery used as the expected result."""
+    detection_ignore = {pattern for pattern in ignore_patterns if pattern != ".git"}
+    files, _ = _collect_zip_entries(names, detection_ignore)
+
+    top_level = {segments[0] for _, segments in files if len(segments) > 1}
+    top_level.discard(".git")
+    git_paths = {
+        "/".join(segments[: segments.index(".git")])
+        for _, segments in files
+        if ".git" in segments and segments.index(".git") > 0
+    }
+
+    discovered: list[DetectedProject] = []
+    for project_path in sorted(top_level | git_paths):
+        prefix = project_path.split("/")
+        count = sum(
+            1
+            for _, segments in files
+            if len(segments) > len(prefix)
+            and segments[: len(prefix)] == prefix
+            and ".git" not in segments[len(prefix) :]
+        )
+        if count:
+            discovered.append(
+                DetectedProject(
+                    name=prefix[-1],
+                    rel_path=project_path,
+                    has_git_repo=project_path in git_paths,
+                    file_count=count,
+                )
+            )
+
+    root_files = [segments[0] for _, segments in files if len(segments) == 1]
+    docs = [name for name in root_files if name != ".git" and _is_doc_file(name)]
+    media = [
+        name
+        for name in root_files
+        if name != ".git" and not _is_doc_file(name) and _is_media_file(name)
+    ]
+    if docs:
+        discovered.append(
+            DetectedProject(name="docs", rel_path="", has_git_repo=False, file_count=len(docs))
+        )
+    if media:
+        discovered.append(
+            DetectedProject(name="media", rel_path="", has_git_repo=False, file_count=len(media))
+        )
+    return discovered
+
+
+@pytest.fixture(scope="module")
+def synthetic_monorepo_zip(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a 100k+ entry archive of nested Git projects inside a monorepo."""
+    zip_path = tmp_path_factory.mktemp("benchmark") / "monorepo.zip"
+    with ZipFile(zip_path, "w", ZIP_STORED) as archive:
+        archive.writestr("README.md", b"")
+        for project in range(BENCHMARK_PROJECTS):
+            archive.writestr(f"mono/pkg{project}/.git/HEAD", b"")
+            for index in range(BENCHMARK_FILES_PER_PROJECT):
+                archive.writestr(f"mono/pkg{project}/src/mod{index % 20}/file{index}.py", b"")
+    return zip_path
+
+
+def test_matches_reference_on_edge_cases() -> None:
+    names = [
+        "README.md",
+        "logo.png",
+        ".git/config",
+        "alpha/main.py",
+        "alpha/.git/HEAD",
+        "alpha/nested/.git/HEAD",
+        "alpha/nested/app.js",
+        "alpha/nested/sub/.git/objects/ab/cd",
+        "alpha/nested/sub/lib.c",
+        "alpha/node_modules/pkg/index.js",
+        "beta/docs/",
+        "beta/docs/guide.md",
+        "gamma/.git",
+        "only-git/.git/HEAD",
+    ]
+    ignore_patterns = _get_ignore_patterns()
+
+    assert _discover_projects(names, ignore_patterns) == _reference_discover(names, ignore_patterns)
+
+
+def test_nested_git_projects_do_not_count_each_others_files() -> None:
+    names = [
+        "outer/.git/HEAD",
+        "outer/a.py",
+        "outer/inner/.git/HEAD",
+        "outer/inner/b.py",
+    ]
+
+    projects = {p.rel_path: p for p in _discover_projects(names, _get_ignore_patterns())}
+
+    assert projects["outer"].has_git_repo
+    assert projects["outer"].file_count == 2
+    assert projects["outer/inner"].has_git_repo
+    assert projects["outer/inner"].file_count == 1
+
+
+def test_extract_projects_writes_only_requested_projects(tmp_path: Path) -> None:
+    zip_path = tmp_path / "upload.zip"
+    with ZipFile(zip_path, "w") as archive:
+        archive.writestr("repo/.git/HEAD", "ref: refs/heads/main\n")
+        archive.writestr("repo/main.py", "print('hi')\n")
+        archive.writestr("plain/notes.md", "# notes\n")
+
+    dest = tmp_path / "out"
+    with ZipFile(zip_path) as archive:
+        _extract_projects(archive, ["repo"], dest)
+
+    assert (dest / "repo" / ".git" / "HEAD").is_file()
+    assert (dest / "repo" / "main.py").is_file()
+    assert not (dest / "plain").exists()
+
+
+def test_discovery_benchmark_on_100k_entry_archive(synthetic_monorepo_zip: Path) -> None:
+    with ZipFile(synthetic_monorepo_zip) as archive:
+        names = archive.namelist()
+    assert len(names) > 100_000
+
+    started = time.perf_counter()
+    projects = _discover_projects(names, _get_ignore_patterns())
+    elapsed = time.perf_counter() - started
+
+    by_path = {project.rel_path: project for project in projects}
+    # Packages, the enclosing "mono" directory and the root "docs" pseudo-project
+    assert len(by_path) == BENCHMARK_PROJECTS + 2
+    assert not by_path["mono"].has_git_repo
+    assert by_path["mono"].file_count == BENCHMARK_PROJECTS * BENCHMARK_FILES_PER_PROJECT
+    assert by_path[""].name == "docs"
+    assert all(
+        by_path[f"mono/pkg{project}"].has_git_repo
+        and by_path[f"mono/pkg{project}"].file_count == BENCHMARK_FILES_PER_PROJECT
+        for project in range(BENCHMARK_PROJECTS)
+    )
+    # The previous per-project rescan took several seconds on this archive.
+    assert elapsed < 3.0
@@ -0,0 +1,348 @@
+"""Tests for the single-pass project scan index."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+
+from capstone_project_team_5.c_analyzer import CFileAnalyzer, analyze_c_project
+from capstone_project_team_5.consent_tool import ConsentTool
+from capstone_project_team_5.contribution_metrics import ContributionMetrics
+from capstone_project_team_5.detection import identify_language_and_framework
+from capstone_project_team_5.file_result_cache import FileResultCache
+from capstone_project_team_5.file_walker import DirectoryWalker
+from capstone_project_team_5.java_analyzer import JavaAnalyzer, analyze_java_project
+from capstone_project_team_5.models.upload import DetectedProject
+from capstone_project_team_5.project_scan import ProjectScan
+from capstone_project_team_5.python_analyzer import PythonAnalyzer, analyze_python_project
+from capstone_project_team_5.services.content_store import build_project_scan, ingest_zip
+from capstone_project_team_5.services.project_analysis import analyze_project
+from capstone_project_team_5.services.test_analysis import analyze_tests
+from capstone_project_team_5.services.upload import inspect_zip
+from capstone_project_team_5.skill_detection import extract_project_tools_practices
+from capstone_project_team_5.workflows.analysis_pipeline import analyze_projects_structured
+
+
+@pytest.fixture
+def sample_project(tmp_path: Path) -> Path:
+    """Create a small Python project with a dependency directory to prune."""
+    (tmp_path / "pyproject.toml").write_text('[project]\ndependencies = ["fastapi"]\n')
+    (tmp_path / "Dockerfile").write_text("FROM python:3.13\n")
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "app.py").write_text("def main():\n    return 1\n")
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_app.py").write_text("def test_main():\n    assert True\n")
+    node_modules = tmp_path / "node_modules" / "left-pad"
+    node_modules.mkdir(parents=True)
+    (node_modules / "index.js").write_text("module.exports = 1;\n")
+    return tmp_path
+
+
+def test_build_indexes_files_and_prunes_skip_dirs(sample_project: Path) -> None:
+    scan = ProjectScan.build(sample_project)
+
+    paths = [entry.rel_path for entry in scan.files]
+    assert paths == sorted(paths)
+    assert "src/app.py" in paths
+    assert "tests/test_app.py" in paths
+    assert not any(path.startswith("node_modules/") for path in paths)
+
+    entry = scan.get("src/app.py")
+    assert entry is not None
+    assert entry.suffix == ".py"
+    assert entry.size_bytes == (sample_project / "src" / "app.py").stat().st_size
+    assert scan.absolute_path(entry) == sample_project / "src" / "app.py"
+
+
+def test_queries(sample_project: Path) -> None:
+    scan = ProjectScan.build(sample_project)
+
+    assert scan.has_file("pyproject.toml")
+    assert not scan.has_file("package.json")
+    assert scan.has_suffix(".PY")
+    assert not scan.has_suffix(".js")
+    assert [e.rel_path for e in scan.with_suffix(".py")] == ["src/app.py", "tests/test_app.py"]
+    assert [e.rel_path for e in scan.iter_files(skip_dirs={"Tests"})] == [
+        "Dockerfile",
+        "pyproject.toml",
+        "src/app.py",
+    ]
+
+
+def test_missing_root_yields_empty_scan(tmp_path: Path) -> None:
+    scan = ProjectScan.build(tmp_path / "missing")
+
+    assert len(scan) == 0
+    assert scan.total_size_bytes == 0
+
+
+def test_consumers_match_filesystem_walk(sample_project: Path) -> None:
+    """Detectors fed a scan should agree with their standalone behaviour."""
+    scan = ProjectScan.build(sample_project)
+
+    assert identify_language_and_framework(sample_project, scan) == ("Python", "FastAPI")
+    assert extract_project_tools_practices(
+        sample_project, scan=scan
+    ) == extract_project_tools_practices(sample_project)
+    assert analyze_tests(sample_project, scan).test_case_count == 1
+    assert ContributionMetrics._get_non_git_contribution_metrics(
+        sample_project, scan
+    ) == ContributionMetrics._get_non_git_contribution_metrics(sample_project)
+
+    walked = DirectoryWalker.walk(sample_project)
+    from_scan = DirectoryWalker.from_scan(scan)
+    assert sorted(f.path for f in from_scan.files) == sorted(f.path for f in walked.files)
+    assert from_scan.total_size_bytes == walked.total_size_bytes
+
+
+def test_consumers_keep_their_own_skip_dirs_in_monorepos(tmp_path: Path) -> None:
+    web = tmp_path / "packages" / "web"
+    (web / "src").mkdir(parents=True)
+    (web / "package.json").write_text('{"dependencies": {"react": "^18.0.0"}}')
+    (web / "src" / "App.js").write_text("export const App = () => null;\n")
+    for directory in ("vendor", "build"):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "lib.c").write_text("int add(int a, int b) { return a + b; }\n")
+
+    scan = ProjectScan.build(tmp_path)
+
+    assert identify_language_and_framework(tmp_path, scan) == ("JavaScript", "React")
+    assert analyze_c_project(tmp_path, scan).total_files == 2
+    assert ContributionMetrics._get_non_git_contribution_metrics(
+        tmp_path, scan
+    ) == ContributionMetrics._get_non_git_contribution_metrics(tmp_path)
+    assert extract_project_tools_practices(tmp_path, scan=scan) == extract_project_tools_practices(
+        tmp_path
+    )
+
+
+def test_analyze_project_builds_scan_once(
+    sample_project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[Path] = []
+    original_build = ProjectScan.build.__func__
+
+    def counting_build(cls, root, skip_dirs=None):
+        calls.append(Path(root))
+        return original_build(cls, root, skip_dirs)
+
+    monkeypatch.setattr(ProjectScan, "build", classmethod(counting_build))
+
+    analysis = analyze_project(sample_project)
+
+    assert calls == [sample_project]
+    assert analysis.language == "Python"
+    assert analysis.test_case_count == 1
+
+
+def _zip_project(project: Path, zip_path: Path, prefix: str) -> Path:
+    with ZipFile(zip_path, "w") as archive:
+        for file_path in sorted(project.rglob("*")):
+            if file_path.is_file():
+                archive.write(file_path, f"{prefix}/{file_path.relative_to(project).as_posix()}")
+    return zip_path
+
+
+def test_from_zip_reads_members_without_extracting(sample_project: Path, tmp_path: Path) -> None:
+    zip_path = _zip_project(sample_project, tmp_path / "upload.zip", "proj")
+
+    with ZipFile(zip_path) as archive:
+        scan = ProjectScan.from_zip(archive, "proj")
+
+        assert scan.is_virtual
+        assert not scan.root.exists()
+        assert [e.rel_path for e in scan.with_suffix(".py")] == ["src/app.py", "tests/test_app.py"]
+        assert not any(e.rel_path.startswith("node_modules/") for e in scan.files)
+        assert scan.read_text("src/app.py").startswith("def main()")
+        assert scan.read_text(scan.absolute_path("src/app.py")).startswith("def main()")
+        with pytest.raises(FileNotFoundError):
+            scan.read_bytes("missing.py")
+
+        analysis = analyze_project(scan.root, scan=scan)
+
+    disk_analysis = analyze_project(sample_project)
+    assert analysis.language == disk_analysis.language == "Python"
+    assert analysis.framework == disk_analysis.framework
+    assert analysis.tools == disk_analysis.tools
+    assert analysis.practices == disk_analysis.practices
+    assert analysis.test_case_count == 1
+
+
+def test_analyze_projects_structured_accepts_virtual_scans(
+    sample_project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        "capstone_project_team_5.workflows.analysis_pipeline.save_code_analysis_to_db",
+        lambda *args, **kwargs: None,
+    )
+    monkeypatch.setattr(
+        "capstone_project_team_5.workflows.analysis_pipeline._get_skill_timeline_for_project",
+        lambda *args, **kwargs: [],
+    )
+    zip_path = _zip_project(sample_project, tmp_path / "upload.zip", "proj")
+    detected = [DetectedProject(name="proj", rel_path="proj", has_git_repo=False, file_count=4)]
+
+    with ZipFile(zip_path) as archive:
+        scan = ProjectScan.from_zip(archive, "proj")
+        results = analyze_projects_structured(
+            tmp_path / "never-created", detected, ConsentTool(), scans={"proj": scan}
+        )
+
+    assert not (tmp_path / "never-created").exists()
+    assert len(results) == 1
+    assert results[0]["language"] == "Python"
+    assert results[0]["git"]["is_repo"] is False
+    assert results[0]["file_summary"]["total_files"] == len(scan)
+
+
+def test_inspect_zip_does_not_extract_non_git_projects(
+    sample_project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    zip_path = _zip_project(sample_project, tmp_path / "upload.zip", "proj")
+
+    def fail_extract(*args, **kwargs):
+        raise AssertionError("non-git projects must not be extracted")
+
+    monkeypatch.setattr(ZipFile, "extractall", fail_extract)
+
+    result, collab_flags, project_dates = inspect_zip(zip_path)
+
+    assert [project.rel_path for project in result.projects] == ["proj"]
+    assert collab_flags == {"proj": False}
+    assert project_dates == {"proj": (None, None)}
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_inspect_zip_reads_history_of_a_repository_at_the_archive_root(
+    sample_project: Path, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    env = os.environ | {
+        "GIT_AUTHOR_NAME": "Ana",
+        "GIT_AUTHOR_EMAIL": "ana@example.com",
+        "GIT_COMMITTER_NAME": "Ana",
+        "GIT_COMMITTER_EMAIL": "ana@example.com",
+    }
+    for args in (("init", "-q"), ("add", "src", "tests"), ("commit", "-q", "-m", "feat: app")):
+        subprocess.run(["git", *args], cwd=sample_project, check=True, env=env, capture_output=True)
+    zip_path = tmp_path_factory.mktemp("archives") / "repo.zip"
+    with ZipFile(zip_path, "w") as archive:
+        for file_path in sorted(sample_project.rglob("*")):
+            if file_path.is_file():
+                archive.write(file_path, file_path.relative_to(sample_project).as_posix())
+
+    result, collab_flags, project_dates = inspect_zip(zip_path)
+
+    assert {"src", "tests"} <= {project.rel_path for project in result.projects}
+    for rel_path in ("src", "tests"):
+        start, end = project_dates[rel_path]
+        assert start is not None and end is not None
+        assert collab_flags[rel_path] is False
+
+
+def test_build_project_scan_reads_from_object_store(
+    sample_project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("ZIP2JOB_ARTIFACT_DIR", str(tmp_path / "artifacts"))
+    zip_path = _zip_project(sample_project, tmp_path / "upload.zip", "proj")
+    ingest_zip(zip_path, upload_id=1)
+
+    scan = build_project_scan("proj", [1])
+
+    assert scan is not None
+    assert scan.is_virtual
+    assert scan.has_file("pyproject.toml")
+    assert scan.read_text("src/app.py") == (sample_project / "src" / "app.py").read_text()
+    assert identify_language_and_framework(scan.root, scan) == ("Python", "FastAPI")
+
+
+def test_build_project_scan_defers_git_projects(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("ZIP2JOB_ARTIFACT_DIR", str(tmp_path / "artifacts"))
+    zip_path = tmp_path / "upload.zip"
+    with ZipFile(zip_path, "w") as archive:
+        archive.writestr("repo/.git/HEAD", "ref: refs/heads/main\n")
+        archive.writestr("repo/main.py", "print('hi')\n")
+    ingest_zip(zip_path, upload_id=1)
+
+    assert build_project_scan("repo", [1]) is None
+
+
+def test_cached_result_summarizes_each_content_once(tmp_path: Path) -> None:
+    for name in ("one", "two"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "same.py").write_text("x = 1\n")
+    (tmp_path / "two" / "other.py").write_text("y = 2\n")
+    cache = FileResultCache(tmp_path / "cache")
+    summarized: list[bytes] = []
+
+    def summarize(data: bytes) -> dict:
+        summarized.append(data)
+        return {"size": len(data)}
+
+    first = ProjectScan.build(tmp_path / "one", file_cache=cache)
+    second = ProjectScan.build(tmp_path / "two", file_cache=cache)
+
+    assert first.cached_result("same.py", "test-v1", summarize) == {"size": 6}
+    assert second.cached_result("same.py", "test-v1", summarize) == {"size": 6}
+    assert second.cached_result("other.py", "test-v1", summarize) == {"size": 6}
+    assert first.cached_result("same.py", "test-v2", summarize) == {"size": 6}
+    assert summarized == [b"x = 1\n", b"y = 2\n", b"x = 1\n"]
+
+
+def test_analyzers_merge_cached_file_results(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "shapes.py").write_text(
+        "class Shape:\n"
+        "    def area(self):\n"
+        "        raise NotImplementedError\n\n"
+        "class Square(Shape):\n"
+        "    def area(self):\n"
+        "        return [1, 2]\n"
+    )
+    (project / "fact.py").write_text("def fact(n):\n    return 1 if n < 2 else n * fact(n - 1)\n")
+    (project / "Stack.java").write_text(
+        "public class Stack extends Base {\n"
+        "    private int size;\n"
+        "    int size() { return size; }\n"
+        "}\n"
+    )
+    (project / "main.c").write_text("#include <stdio.h>\nint main(void) { return 0; }\n")
+    (project / "test_fact.py").write_text("def test_fact():\n    assert True\n")
+    cache = FileResultCache(tmp_path / "cache")
+
+    def analyze() -> tuple:
+        scan = ProjectScan.build(project, file_cache=cache)
+        return (
+            analyze_python_project(project, scan),
+            analyze_c_project(project, scan),
+            analyze_java_project(project, scan),
+            analyze_tests(project, scan),
+        )
+
+    uncached = analyze()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached files must not be analyzed again")
+
+    monkeypatch.setattr(PythonAnalyzer, "_summarize_code", fail)
+    monkeypatch.setattr(JavaAnalyzer, "_analyze_source", fail)
+    monkeypatch.setattr(CFileAnalyzer, "_summarize_content", staticmethod(fail))
+    cached = analyze()
+
+    assert cached == uncached
+    assert cached[0]["oop_principles"]["Polymorphism"] is True
+    assert "Recursion" in cached[0]["algorithms"]
+    assert cached[1].has_main
+    assert cached[2]["oop_principles"]["Inheritance"] is True
+    assert cached[3].test_case_count == 1
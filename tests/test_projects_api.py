@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import io
 import json
+import threading
 from pathlib import Path
 from zipfile import ZIP_DEFLATED, ZipFile
 
@@ -11,6 +12,7 @@ from conftest import auth_headers
 from fastapi.testclient import TestClient
 
 from capstone_project_team_5.api.main import app
+from capstone_project_team_5.api.routes import projects as projects_routes
 from capstone_project_team_5.data.db import get_session
 from capstone_project_team_5.data.models import (
     ArtifactSource,
@@ -20,8 +22,18 @@ from capstone_project_team_5.data.models import (
     User,
     UserCodeAnalysis,
 )
-from capstone_project_team_5.services.content_store import get_manifests_root, get_objects_root
-from capstone_project_team_5.services.upload_storage import get_upload_zip_path
+from capstone_project_team_5.services.artifact_gc import collect_unreferenced_artifacts
+from capstone_project_team_5.services.content_store import (
+    compute_project_fingerprint,
+    get_analysis_cache_path,
+    get_ingest_temp_root,
+    get_manifest_path,
+    get_objects_root,
+)
+from capstone_project_team_5.services.upload_storage import (
+    get_upload_temp_root,
+    get_upload_zip_path,
+)
 
 
 def _create_zip_bytes(entries: list[tuple[str, bytes]]) -> bytes:
@@ -521,6 +533,42 @@ def test_dedupes_identical_file_content_across_uploads(api_db: None, tmp_path: P
     assert len(object_files) == 1
 
 
+def test_upload_moves_streamed_archive_into_storage(api_db: None) -> None:
+    client = TestClient(app, headers=_auth())
+    zip_bytes = _create_zip_bytes([("kept/main.py", b"print('kept')\n")])
+    response = client.post(
+        "/api/projects/upload",
+        files={"file": ("kept.zip", zip_bytes, "application/zip")},
+    )
+    assert response.status_code == 201
+
+    upload_id = response.json()["upload_id"]
+    assert get_upload_zip_path(upload_id, "kept.zip").read_bytes() == zip_bytes
+    assert not any(get_upload_temp_root().iterdir())
+
+
+def test_upload_without_kept_archive_uses_content_store_only(
+    api_db: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("ZIP2JOB_KEEP_UPLOAD_ARCHIVES", "0")
+    client = TestClient(app, headers=_auth())
+    zip_bytes = _create_zip_bytes([("lean/main.py", b"print('lean')\n")])
+    response = client.post(
+        "/api/projects/upload",
+        files={"file": ("lean.zip", zip_bytes, "application/zip")},
+    )
+    assert response.status_code == 201
+
+    upload_id = response.json()["upload_id"]
+    project_id = response.json()["projects"][0]["id"]
+    assert not get_upload_zip_path(upload_id, "lean.zip").parent.exists()
+    assert not any(get_upload_temp_root().iterdir())
+    assert get_manifest_path(upload_id).exists()
+
+    analyze_response = client.post(f"/api/projects/{project_id}/analyze")
+    assert analyze_response.status_code == 200
+
+
 def test_analysis_skips_when_fingerprint_unchanged(api_db: None) -> None:
     client = TestClient(app, headers=_auth())
     zip_bytes = _create_zip_bytes([("proj/main.py", b"print('v1')\n")])
@@ -578,15 +626,12 @@ def test_analyze_all_ignores_invalid_cached_payload(
     )
     assert upload_response.status_code == 201
     project_id = upload_response.json()["projects"][0]["id"]
+    fingerprint = compute_project_fingerprint("proj", [upload_response.json()["upload_id"]])
 
-    monkeypatch.setattr(
-        "capstone_project_team_5.api.routes.projects.compute_project_fingerprint",
-        lambda _rel_path, _upload_ids: "same-fingerprint",
-    )
     monkeypatch.setattr(
         "capstone_project_team_5.api.routes.projects.load_analysis_cache",
         lambda pid: (
-            {"fingerprint": "same-fingerprint", "payload": "invalid"} if pid == project_id else None
+            {"fingerprint": fingerprint, "payload": "invalid"} if pid == project_id else None
         ),
     )
 
@@ -629,6 +674,46 @@ def test_delete_project_removes_record() -> None:
     assert detail_response.status_code == 404
 
 
+def test_delete_project_frees_storage_after_collection(
+    api_db: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("ZIP2JOB_GC_GRACE_SECONDS", "0")
+    client = TestClient(app, headers=_auth())
+    zip_bytes = _create_zip_bytes([("projectG/main.py", b"print('g')\n")])
+    upload_response = client.post(
+        "/api/projects/upload",
+        files={"file": ("g.zip", zip_bytes, "application/zip")},
+    )
+    assert upload_response.status_code == 201
+    upload_id = upload_response.json()["upload_id"]
+    project_id = upload_response.json()["projects"][0]["id"]
+    assert client.post(f"/api/projects/{project_id}/analyze").status_code == 200
+    assert get_analysis_cache_path(project_id).exists()
+
+    assert collect_unreferenced_artifacts().manifests_removed == 0
+    assert get_manifest_path(upload_id).exists()
+
+    assert client.delete(f"/api/projects/{project_id}").status_code == 204
+    assert not get_analysis_cache_path(project_id).exists()
+
+    dry_run = collect_unreferenced_artifacts(dry_run=True)
+    assert dry_run.dry_run is True
+    assert get_manifest_path(upload_id).exists()
+
+    collected = collect_unreferenced_artifacts()
+    assert collected.manifests_removed == 1
+    assert collected.objects_removed == 1
+    assert collected.upload_archives_removed == 1
+    assert collected.bytes_reclaimed == dry_run.bytes_reclaimed > 0
+    assert not get_manifest_path(upload_id).exists()
+    assert not any(p.is_file() for p in get_objects_root().rglob("*"))
+
+
+def test_storage_collection_is_not_exposed_over_http() -> None:
+    client = TestClient(app, headers=_auth())
+    assert client.post("/api/projects/storage/gc").status_code in (404, 405)
+
+
 def test_delete_project_not_found_returns_404() -> None:
     client = TestClient(app, headers=_auth())
     response = client.delete("/api/projects/99999")
@@ -662,6 +747,30 @@ def test_analyze_project_updates_importance_score() -> None:
     assert detail_response.json()["importance_score"] is not None
 
 
+def test_git_projects_are_materialized_next_to_the_store(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = TestClient(app, headers=_auth())
+    project_id = _upload_single_project(client, "git_project")
+    with get_session() as session:
+        session.get(Project, project_id).has_git_repo = True
+    destinations: list[Path] = []
+    materialize = projects_routes.materialize_project_tree
+
+    def recording_materialize(rel_path, upload_ids, destination, **kwargs):
+        destinations.append(Path(destination))
+        return materialize(rel_path, upload_ids, destination, **kwargs)
+
+    monkeypatch.setattr(projects_routes, "materialize_project_tree", recording_materialize)
+
+    response = client.post(f"/api/projects/{project_id}/analyze")
+
+    assert response.status_code == 200
+    [destination] = destinations
+    assert destination.parent == get_ingest_temp_root()
+    assert not destination.exists()
+
+
 def test_analyze_all_updates_all_projects(api_db: None) -> None:
     client = TestClient(app, headers=_auth())
     zip_bytes = _create_zip_bytes(
@@ -721,7 +830,7 @@ def test_analyze_all_reports_missing_zip(api_db: None) -> None:
     zip_path = get_upload_zip_path(upload_id, filename)
     if zip_path.exists():
         zip_path.unlink()
-    manifest_path = get_manifests_root() / f"{upload_id}.json"
+    manifest_path = get_manifest_path(upload_id)
     if manifest_path.exists():
         manifest_path.unlink()
 
@@ -884,3 +993,44 @@ def test_project_detail_update_delete_are_scoped_to_owner(api_db: None) -> None:
 
     owner_get = owner_client.get(f"/api/projects/{owner_project_id}")
     assert owner_get.status_code == 200
+
+
+def test_upload_processing_does_not_block_event_loop(
+    api_db: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from capstone_project_team_5.api.routes import projects as projects_routes
+
+    started = threading.Event()
+    release = threading.Event()
+    original_inspect = projects_routes.inspect_zip
+
+    def slow_inspect_zip(*args, **kwargs):
+        started.set()
+        assert release.wait(timeout=10)
+        return original_inspect(*args, **kwargs)
+
+    monkeypatch.setattr(projects_routes, "inspect_zip", slow_inspect_zip)
+    headers = _auth()
+    zip_bytes = _create_zip_bytes([("slowproj/main.py", b"print('hello')\n")])
+    responses: list[int] = []
+
+    with TestClient(app) as client:
+        uploader = threading.Thread(
+            target=lambda: responses.append(
+                client.post(
+                    "/api/projects/upload",
+                    files={"file": ("slow.zip", zip_bytes, "application/zip")},
+                    headers=headers,
+                ).status_code
+            )
+        )
+        uploader.start()
+        try:
+            assert started.wait(timeout=10)
+            # The upload is parked inside inspect_zip; other requests must still be served.
+            assert client.get("/health").status_code == 200
+        finally:
+            release.set()
+            uploader.join(timeout=10)
+
+    assert responses == [201]
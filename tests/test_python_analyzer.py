@@ -1,3 +1,7 @@
+import pytest
+
+from capstone_project_team_5 import python_analyzer
+from capstone_project_team_5.project_scan import ProjectScan
 from capstone_project_team_5.python_analyzer import PythonAnalyzer
 
 # ---------------------------------------------------------
@@ -216,3 +220,121 @@ class Base:
 
     # Verify it appears in skills
     assert "Abstraction" in result2["skills_demonstrated"]
+
+
+# ---------------------------------------------------------
+# TEST — Files summarized in worker processes
+# ---------------------------------------------------------
+
+
+def test_worker_processes_give_the_same_result(tmp_path, monkeypatch):
+    for index in range(6):
+        (tmp_path / f"shape{index}.py").write_text(
+            f"""
+from collections import deque
+
+class Shape{index}(Base):
+    def area(self):
+        self._cache = deque()
+        return sorted(self._cache)
+
+def fact{index}(n):
+    return 1 if n < 2 else n * fact{index}(n - 1)
+"""
+        )
+    (tmp_path / "broken.py").write_text("def broken(:\n    import requests\n")
+
+    monkeypatch.setenv("ZIP2JOB_PYTHON_ANALYSIS_WORKERS", "1")
+    serial = PythonAnalyzer(tmp_path).analyze()
+
+    monkeypatch.setenv("ZIP2JOB_PYTHON_ANALYSIS_WORKERS", "2")
+    monkeypatch.setattr(python_analyzer, "_MIN_FILES_FOR_PROCESSES", 2)
+    analyzer = PythonAnalyzer(tmp_path)
+    monkeypatch.setattr(
+        analyzer, "_summarize_file", lambda path: pytest.fail("summarized in-process")
+    )
+    parallel = analyzer.analyze()
+
+    assert parallel == serial
+    assert parallel["metrics"]["files_analyzed"] == 7
+    assert parallel["metrics"]["classes_count"] == 6
+    assert {"Recursion", "Sorting"} <= set(parallel["algorithms"])
+    assert "deque" in parallel["data_structures"]
+    assert parallel["integrations"] == {"http": ["Requests"]}
+
+    pool = python_analyzer._get_summary_pool()
+    assert PythonAnalyzer(tmp_path, ProjectScan.build(tmp_path)).analyze() == serial
+    assert python_analyzer._get_summary_pool() is pool
+
+
+# ---------------------------------------------------------
+# TEST — Design patterns and complexity from one traversal
+# ---------------------------------------------------------
+
+
+def test_design_patterns_and_complexity(tmp_path):
+    (tmp_path / "patterns.py").write_text(
+        """
+class Config:
+    _instance = None
+
+    @classmethod
+    def get(cls):
+        def create():
+            return cls._instance
+        return create()
+
+class Sorter:
+    strategy = None
+
+    def run(self, items):
+        return self.strategy.apply(items)
+
+class EventBus:
+    observers = []
+
+    def subscribe(self, observer):
+        self.observers.append(observer)
+
+    def notify_all(self):
+        for observer in self.observers:
+            observer()
+
+class LogWrapper:
+    def __call__(self, func):
+        return func
+
+def make(kind):
+    if kind and kind != "x":
+        return Sorter()
+    return EventBus()
+
+def build(self):
+    return self
+
+def outer(n):
+    def inner():
+        return outer(n - 1)
+    return [inner() for _ in range(n)] if n else None
+"""
+    )
+    # Nested deeper than the interpreter's recursion limit
+    (tmp_path / "deep.py").write_text("total = 1" + " + 1" * 3000 + "\n")
+
+    result = PythonAnalyzer(tmp_path).analyze()
+
+    assert result["design_patterns"] == [
+        "Decorator",
+        "Factory",
+        "Observer",
+        "Singleton",
+        "Strategy",
+    ]
+    assert result["algorithms"] == ["Recursion"]
+    assert result["metrics"]["files_analyzed"] == 2
+    assert result["metrics"]["classes_count"] == 4
+    # get, create, run, subscribe, notify_all, __call__, make, build, outer, inner
+    assert result["metrics"]["methods_count"] == 10
+    # make: if + and; notify_all: for; outer: comprehension + ternary
+    assert result["metrics"]["max_function_complexity"] == 3
+    assert result["metrics"]["avg_function_complexity"] == 15 / 10
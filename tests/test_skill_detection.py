@@ -3,7 +3,9 @@ from __future__ import annotations
 from pathlib import Path
 
 from capstone_project_team_5.consent_tool import ConsentTool
+from capstone_project_team_5.constants import skill_detection_constants as rules
 from capstone_project_team_5.skill_detection import SkillDetector, extract_project_tools_practices
+from capstone_project_team_5.utils.aho_corasick import AhoCorasick
 
 
 def test_empty_directory_returns_empty_skills(tmp_path: Path) -> None:
@@ -153,3 +155,87 @@ def test_detect_skills_skips_llm_when_llm_not_allowed(tmp_path: Path) -> None:
 
     # Local detection should still work
     assert "PyTest" in skills["tools"]
+
+
+def _reference_skills(file_name: str, rel_path: str) -> tuple[set[str], set[str]]:
+    """Rule-by-rule detection the compiled matchers must reproduce."""
+    name_lower, path_lower = file_name.lower(), rel_path.lower()
+    parts = set(path_lower.split("/"))
+
+    def in_path(pattern: str) -> bool:
+        return path_lower.startswith(pattern) if "/" in pattern else pattern in parts
+
+    tools = {tool for tool, names in rules.TOOL_FILE_NAMES.items() if file_name in names}
+    tools |= {
+        tool
+        for tool, patterns in rules.TOOL_FILE_NAME_PATTERNS.items()
+        if any(pattern in name_lower for pattern in patterns)
+    }
+    tools |= {
+        tool
+        for tool, patterns in rules.TOOL_FILE_PATH_PATTERNS.items()
+        if any(pattern.lower() in path_lower for pattern in patterns)
+    }
+    tools |= {
+        tool
+        for tool, patterns in rules.TOOL_DIRECTORY_PATTERNS.items()
+        if any(in_path(pattern) for pattern in patterns)
+    }
+    practices = {
+        practice for practice, names in rules.PRACTICES_FILE_NAMES.items() if name_lower in names
+    }
+    practices |= {
+        practice
+        for practice, patterns in rules.PRACTICES_FILE_PATTERNS.items()
+        if any(pattern in name_lower for pattern in patterns)
+    }
+    practices |= {
+        practice
+        for practice, patterns in rules.PRACTICES_PATH_PATTERNS.items()
+        if any(in_path(pattern) for pattern in patterns)
+    }
+    return tools, practices
+
+
+def test_compiled_matchers_agree_with_every_rule() -> None:
+    """Every rule entry, used as a name, directory or prefix, is detected as before."""
+    entries = sorted(
+        {
+            entry
+            for table in (
+                rules.TOOL_FILE_NAMES,
+                rules.TOOL_FILE_NAME_PATTERNS,
+                rules.TOOL_FILE_PATH_PATTERNS,
+                rules.TOOL_DIRECTORY_PATTERNS,
+                rules.PRACTICES_FILE_NAMES,
+                rules.PRACTICES_FILE_PATTERNS,
+                rules.PRACTICES_PATH_PATTERNS,
+            )
+            for values in table.values()
+            for entry in values
+        }
+    )
+    for entry in entries:
+        for file_name, rel_path in (
+            (entry, entry),
+            (entry.upper(), f"src/{entry.upper()}"),
+            (f"x{entry}.txt", f"{entry}/x{entry}.txt"),
+            ("main.py", f"{entry}/lib/main.py"),
+        ):
+            file_name = file_name.rsplit("/", 1)[-1]
+            expected = _reference_skills(file_name, rel_path)
+            assert SkillDetector._detect_tools_locally(file_name, rel_path) == expected[0]
+            assert SkillDetector._detect_practices_locally(file_name, rel_path) == expected[1]
+
+
+def test_aho_corasick_finds_overlapping_and_anchored_patterns() -> None:
+    matcher = AhoCorasick(
+        [("he", "he"), ("she", "she"), ("hers", "hers"), ("his", "his")],
+        anchored=[("ushe", "prefix"), ("she", "she-prefix")],
+    )
+
+    assert matcher.find("ushers") == {"he", "she", "hers", "prefix"}
+    assert matcher.find("shis") == {"his"}
+    assert matcher.find("she") == {"he", "she", "she-prefix"}
+    assert AhoCorasick([], anchored=[("ci/", "CI")]).find("ci/build.yml") == {"CI"}
+    assert AhoCorasick([], anchored=[("ci/", "CI")]).find("src/ci/build.yml") == set()
@@ -0,0 +1,76 @@
+"""Tests for compressing the objects of an existing content store."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+
+from capstone_project_team_5.services.content_store import (
+    get_objects_root,
+    ingest_zip,
+    materialize_project_tree,
+    store_lock,
+)
+from capstone_project_team_5.services.store_compression import compress_stored_objects
+
+SOURCE = b"".join(f"print('line {i}')\n".encode() for i in range(1000))
+
+
+@pytest.fixture(autouse=True)
+def raw_store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ZIP2JOB_ARTIFACT_DIR", str(tmp_path / "artifacts"))
+    monkeypatch.setenv("ZIP2JOB_OBJECT_COMPRESSION", "off")
+    zip_path = tmp_path / "upload.zip"
+    with ZipFile(zip_path, "w") as archive:
+        archive.writestr("proj/big.py", SOURCE)
+        archive.writestr("proj/small.py", b"x = 1\n")
+    ingest_zip(zip_path, upload_id=1)
+    monkeypatch.delenv("ZIP2JOB_OBJECT_COMPRESSION")
+
+
+def _object(data: bytes) -> Path:
+    content_hash = hashlib.sha256(data).hexdigest()
+    return get_objects_root() / content_hash[:2] / content_hash
+
+
+def test_dry_run_reports_savings_without_rewriting() -> None:
+    report = compress_stored_objects(dry_run=True)
+
+    assert (report.objects_scanned, report.objects_compressed) == (2, 1)
+    assert report.bytes_before == len(SOURCE) + len(b"x = 1\n")
+    assert 0 < report.bytes_after < report.bytes_before
+    assert report.to_dict()["savings_ratio"] > 0.5
+    assert _object(SOURCE).read_bytes() == SOURCE
+
+
+def test_migration_compresses_objects_once(tmp_path: Path) -> None:
+    report = compress_stored_objects()
+
+    assert report.objects_compressed == 1
+    assert report.bytes_decoded == len(SOURCE)
+    assert _object(SOURCE).stat().st_size == report.bytes_after - len(b"x = 1\n")
+    root = materialize_project_tree("proj", [1], tmp_path / "tree")
+    assert (root / "big.py").read_bytes() == SOURCE
+
+    again = compress_stored_objects()
+    assert again.objects_compressed == 0
+    assert again.bytes_before == again.bytes_after == report.bytes_after
+
+
+def test_migration_waits_for_materialization_to_release_the_store() -> None:
+    finished = threading.Event()
+    migration = threading.Thread(target=lambda: (compress_stored_objects(), finished.set()))
+
+    # Materialization holds the lock shared while it links objects
+    with store_lock():
+        migration.start()
+        assert not finished.wait(timeout=0.5)
+        assert _object(SOURCE).read_bytes() == SOURCE
+    migration.join(timeout=10)
+
+    assert finished.is_set()
+    assert _object(SOURCE).read_bytes() != SOURCE